@@ -0,0 +1,66 @@
+# Benchmark da análise contínua (parser.AnaliseContinua, tokens empurrados com feed)
+# Em programas gerados com os tokens já reconhecidos, compara a análise contínua, que recebe um token
+# por feed(), com a análise do código inteiro pelo parser genérico (parse com tokens=): o custo por
+# token de cada uma e o tempo até o primeiro comando e o primeiro diagnóstico ficarem disponíveis.
+# Na análise inteira, os dois só aparecem no fim; na contínua, logo depois dos tokens que os formam,
+# então a compilação se sobrepõe à geração do código
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_analise_continua
+import gc
+import time
+from tascal_compiler import arvore
+from tascal_compiler.parser import parser, ContextoCompilacao, AnaliseContinua
+from tascal_compiler.diagnosticos import Diagnostico
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa, gera_programa_com_erros
+
+def tokens(codigo): # Lexer (com o código, para as colunas dos nós) e os tokens do código
+    lexer = ContextoCompilacao().lexer
+    lexer.input(codigo)
+    return lexer, list(lexer)
+
+def inteira(codigo, lexer, lista): # Tempo total da análise do código inteiro
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        parser.parse(lexer=lexer, context=ContextoCompilacao(), tokens=lista)
+        return time.perf_counter() - inicio
+    finally:
+        gc.enable()
+
+def continua(codigo, lexer, lista): # Tempo total e tempos até o primeiro comando e o primeiro diagnóstico
+    primeiros = {}
+    def emite(item):
+        tipo = Diagnostico if isinstance(item, Diagnostico) else arvore.No
+        if tipo not in primeiros and not isinstance(item, arvore.Declaracao):
+            primeiros[tipo] = time.perf_counter() - inicio
+    contexto = ContextoCompilacao()
+    contexto.lexer = lexer
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        analise = AnaliseContinua(contexto, emite=emite)
+        feed = analise.feed
+        for token in lista:
+            feed(token)
+        analise.finish()
+        return time.perf_counter() - inicio, primeiros.get(arvore.No), primeiros.get(Diagnostico)
+    finally:
+        gc.enable()
+
+def ms(segundos):
+    return "-" if segundos is None else f"{segundos * 1e3:.2f}"
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DA ANÁLISE CONTÍNUA  ")
+    print("========================================\n")
+    print(f"{'programa':<18} {'tokens':>7} {'inteira (ns/token)':>19} {'contínua (ns/token)':>20} "
+          f"{'inteira (ms)':>13} {'1º comando (ms)':>16} {'1º diagnóstico (ms)':>20}")
+    for nome, codigo in (("válido", gera_programa(5000, semente=0)), ("com erros", gera_programa_com_erros(5000, semente=0))):
+        lexer, lista = tokens(codigo)
+        tempo_inteira = min(inteira(codigo, lexer, lista) for _ in range(7))
+        tempo_continua, comando, diagnostico = min(continua(codigo, lexer, lista) for _ in range(7))
+        print(f"{nome:<18} {len(lista):>7} {tempo_inteira / len(lista) * 1e9:>19.0f} "
+              f"{tempo_continua / len(lista) * 1e9:>20.0f} {ms(tempo_inteira):>13} {ms(comando):>16} {ms(diagnostico):>20}")
+
+if __name__ == "__main__":
+    main()
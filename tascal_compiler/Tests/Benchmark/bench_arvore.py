@@ -0,0 +1,92 @@
+# Benchmark da árvore sintática (arvore.py) construída pelo parser
+# Mede o custo de construção da árvore (tokens por segundo da análise completa, com as
+# ações semânticas) e a memória ocupada por nó, comparando os nós com __slots__ com
+# nós equivalentes que guardam os atributos em um __dict__
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_arvore
+import gc
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from tascal_compiler import arvore
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.lexer import lexico
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+class NoComDict: # Nó sem __slots__, com os mesmos atributos de um nó binário, para comparação
+    def __init__(self, esquerda, direita, tipo, linha, coluna):
+        self.esquerda = esquerda
+        self.direita = direita
+        self.tipo = tipo
+        self.linha = linha
+        self.coluna = coluna
+
+def analisa(codigo): # Análise completa em um contexto novo
+    return ContextoCompilacao().compila(codigo)
+
+def conta_nos(raiz): # Quantidade de nós de cada classe
+    contagem = Counter()
+    pendentes = [raiz]
+    while pendentes:
+        no = pendentes.pop()
+        contagem[type(no).__name__] += 1
+        pendentes.extend(no.filhos())
+    return contagem
+
+def mede_tempo(codigo, repeticoes): # Melhor tempo (em segundos) de uma análise completa
+    melhor = float("inf")
+    gc.disable() # Evita que coletas de lixo distorçam as medições
+    try:
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            analisa(codigo)
+            melhor = min(melhor, time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+    return melhor
+
+def mede_memoria(codigo): # Bytes alocados que continuam vivos junto com a árvore devolvida
+    gc.collect()
+    tracemalloc.start()
+    raiz = analisa(codigo)
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return raiz, atual
+
+def bytes_por_instancia(classe, quantidade=100000): # Memória média de um nó binário da classe
+    gc.collect()
+    tracemalloc.start()
+    nos = [classe(None, None, "integer", 1, 1) for _ in range(quantidade)]
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (atual - sys.getsizeof(nos)) / len(nos)
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DA ÁRVORE SINTÁTICA  ")
+    print("========================================\n")
+
+    slots = bytes_por_instancia(arvore.Soma)
+    com_dict = bytes_por_instancia(NoComDict)
+    print(f"nó binário com __slots__: {slots:.1f} bytes")
+    print(f"nó binário com __dict__:  {com_dict:.1f} bytes ({com_dict / slots:.2f}x)\n")
+
+    print(f"{'comandos':>10} {'tokens':>10} {'nós':>10} {'tempo (ms)':>11} {'tok/s':>10} "
+          f"{'µs/nó':>7} {'bytes/nó':>9}")
+    for n_comandos in (1000, 5000, 20000):
+        codigo = gera_programa(n_comandos, semente=n_comandos)
+        lexico.lineno = 1
+        lexico.input(codigo)
+        n_tokens = sum(1 for _ in lexico)
+        tempo = mede_tempo(codigo, 5)
+        raiz, memoria = mede_memoria(codigo)
+        n_nos = sum(conta_nos(raiz).values())
+        print(f"{n_comandos:>10} {n_tokens:>10} {n_nos:>10} {tempo * 1e3:>11.1f} {n_tokens / tempo:>10,.0f} "
+              f"{tempo / n_nos * 1e6:>7.2f} {memoria / n_nos:>9.1f}")
+
+    print("\nNós por classe (20000 comandos):")
+    for classe, quantidade in conta_nos(raiz).most_common():
+        print(f"  {classe:<14} {quantidade:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# Benchmark do lexer por autômato (automato.py) contra o lexer do PLY (lexer.py)
+# Mede, em um programa gerado, o lexer token a token, a tokenização colunar (tokenize_all) e
+# a análise completa pelo parser especializado com cada um dos dois motores léxicos
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_automato
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler import parser_especializado
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+from tascal_compiler.Tests.Benchmark.medicao import melhores_tempos
+
+MOTORES = ('ply', 'afd')
+
+def token_a_token(codigo, motor_lexico):
+    lexer = ContextoCompilacao(motor_lexico=motor_lexico).lexer
+    lexer.input(codigo)
+    return sum(1 for _ in lexer)
+
+def colunar(codigo, motor_lexico):
+    return len(ContextoCompilacao(motor_lexico=motor_lexico).lexer.tokenize_all(codigo))
+
+def analise(codigo, motor_lexico):
+    ContextoCompilacao(motor_lexico=motor_lexico).compila(codigo, parse=parser_especializado.parse, colunar=True)
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DO LEXER POR AUTÔMATO  ")
+    print("========================================\n")
+    codigo = gera_programa(20000, semente=0)
+    quantidade = colunar(codigo, 'ply')
+    print(f"Programa gerado: {len(codigo) / 1e6:.1f} MB, {quantidade} tokens\n")
+    print(f"{'etapa':<28} {'PLY (ns/token)':>15} {'AFD (ns/token)':>15} {'ganho':>8}")
+    for nome, etapa in (("token a token", token_a_token), ("tokenize_all", colunar),
+                        ("lexer + parser especializado", analise)):
+        ply, afd = melhores_tempos([lambda m=motor: etapa(codigo, m) for motor in MOTORES])
+        print(f"{nome:<28} {ply / quantidade * 1e9:>15.0f} {afd / quantidade * 1e9:>15.0f} {ply / afd:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Benchmark da máquina de pilha (bytecode.py) contra o interpretador da árvore (interpretador.py)
+# Cada programa é compilado uma única vez (árvore e bytecode) e executado várias vezes;
+# mede-se apenas a execução. Mede os programas de teste P*.tascal, o laço de Fibonacci do
+# P10 com entradas grandes e o laço longo de bench_interpretador
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_bytecode
+import gc
+import io
+import os
+import glob
+import time
+from tascal_compiler.parser import compila
+from tascal_compiler import bytecode, interpretador
+from tascal_compiler.Tests.Benchmark.bench_interpretador import PASTA_PROGRAMAS, ENTRADAS, LACO
+
+def mede(executa, programa, entrada, repeticoes): # Melhor tempo (s) de uma execução
+    melhor = float("inf")
+    gc.disable() # Evita que coletas de lixo distorçam as medições
+    try:
+        for _ in range(repeticoes):
+            entrada_io, saida_io = io.StringIO(entrada), io.StringIO()
+            inicio = time.perf_counter()
+            executa(programa, entrada_io, saida_io)
+            melhor = min(melhor, time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+    return melhor
+
+def linha(nome, tamanho, tempo_arvore, tempo_vm):
+    print(f"{nome:<16} {tamanho:>10} {tempo_arvore * 1e3:>12.3f} {tempo_vm * 1e3:>12.3f} "
+          f"{tempo_arvore / tempo_vm:>9.2f}x")
+
+def compara(codigo, entrada, repeticoes): # Tamanho do bytecode e tempos da árvore e da VM
+    arvore, _ = compila(codigo)
+    tempo_arvore = mede(interpretador.executa, arvore, entrada, repeticoes)
+    codigo_vm = bytecode.compila(arvore)
+    return len(codigo_vm.instrucoes), tempo_arvore, mede(bytecode.executa, codigo_vm, entrada, repeticoes)
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DO BYTECODE  ")
+    print("========================================\n")
+    print(f"{'programa':<16} {'bytecode':>10} {'árvore (ms)':>12} {'VM (ms)':>12} {'ganho':>10}")
+
+    total_arvore = total_vm = 0
+    for arquivo in sorted(glob.glob(os.path.join(PASTA_PROGRAMAS, "P[0-9]*.tascal"))):
+        with open(arquivo, "r", encoding="utf-8") as f:
+            _, tempo_arvore, tempo_vm = compara(f.read(), ENTRADAS.get(os.path.basename(arquivo), ""), 200)
+        total_arvore += tempo_arvore
+        total_vm += tempo_vm
+    linha("P* (total)", 0, total_arvore, total_vm)
+
+    with open(os.path.join(PASTA_PROGRAMAS, "P10.tascal"), "r", encoding="utf-8") as f:
+        p10 = f.read()
+    linha("P10 (n=10**18)", *compara(p10, f"{10 ** 18}\n", 200))
+    linha("P10 (n=10**200)", *compara(p10, f"{10 ** 200}\n", 20))
+    linha("laço 200000", *compara(LACO, "", 3))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Benchmark do tradutor do Tascal para Python (compilador_python.py)
+# Compara o tempo de execução do interpretador da árvore, da máquina de pilha (bytecode.py)
+# e do code object gerado nos laços de bench_bytecode, e o tempo de obter um programa
+# executável sem cache (lexer, parser, tradução e compile) e com o code object já no cache
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_compilador_python
+import os
+import time
+import tempfile
+from tascal_compiler.parser import compila
+from tascal_compiler import bytecode, interpretador, compilador_python
+from tascal_compiler.Tests.Benchmark.bench_interpretador import PASTA_PROGRAMAS, LACO
+from tascal_compiler.Tests.Benchmark.bench_bytecode import mede
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+def melhor_tempo(funcao, repeticoes): # Melhor tempo (s) de funcao()
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+def execucao(nome, codigo, entrada, repeticoes):
+    arvore, _ = compila(codigo)
+    tempo_arvore = mede(interpretador.executa, arvore, entrada, repeticoes)
+    tempo_vm = mede(bytecode.executa, bytecode.compila(arvore), entrada, repeticoes)
+    tempo_python = mede(compilador_python.executa, compilador_python.gera_codigo(arvore), entrada, repeticoes)
+    print(f"{nome:<16} {tempo_arvore * 1e3:>12.3f} {tempo_vm * 1e3:>12.3f} {tempo_python * 1e3:>12.3f} "
+          f"{tempo_arvore / tempo_python:>9.2f}x")
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DO TRADUTOR PARA PYTHON  ")
+    print("========================================\n")
+    print(f"{'programa':<16} {'árvore (ms)':>12} {'VM (ms)':>12} {'Python (ms)':>12} {'ganho':>10}")
+    with open(os.path.join(PASTA_PROGRAMAS, "P10.tascal"), "r", encoding="utf-8") as f:
+        p10 = f.read()
+    execucao("P10 (n=10**18)", p10, f"{10 ** 18}\n", 200)
+    execucao("P10 (n=10**200)", p10, f"{10 ** 200}\n", 20)
+    execucao("laço 200000", LACO, "", 3)
+
+    print(f"\n{'programa':<16} {'sem cache (ms)':>15} {'do cache (ms)':>15} {'ganho':>10}")
+    for comandos in (300, 2000):
+        codigo = gera_programa(comandos, semente=0)
+        with tempfile.TemporaryDirectory() as pasta:
+            sem_cache = melhor_tempo(lambda: compilador_python.compila_com_cache(codigo), 3)
+            compilador_python.compila_com_cache(codigo, pasta)
+            do_cache = melhor_tempo(lambda: compilador_python.compila_com_cache(codigo, pasta), 20)
+        print(f"{f'gerado {comandos}':<16} {sem_cache * 1e3:>15.3f} {do_cache * 1e3:>15.3f} "
+              f"{sem_cache / do_cache:>9.0f}x")
+
+if __name__ == "__main__":
+    main()
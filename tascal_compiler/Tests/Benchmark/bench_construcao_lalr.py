@@ -0,0 +1,51 @@
+# Benchmark da construção das tabelas LALR pelo yacc
+# Mede, na gramática do Tascal e em gramáticas sintéticas com várias cópias dela (gerador_gramaticas),
+# o tempo de FIRST/FOLLOW, o da construção completa das tabelas (LRTable: itens LR(0), lookaheads
+# LALR, tabelas de ações e de desvios e a compactação) e, para o Tascal, o de yacc.yacc() sem a
+# tabela em cache, que é o custo de regenerar o parsetab.py depois de mudar a gramática
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_construcao_lalr
+import gc
+import time
+from tascal_compiler import yacc
+from tascal_compiler import parser as gramatica
+from tascal_compiler.Tests.Benchmark.gerador_gramaticas import regras_tascal, gramatica_tascal
+
+def melhor_tempo(prepara, mede, repeticoes):
+    # Melhor tempo (s) de mede(prepara()), sem contar prepara e com o coletor de lixo desligado
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        entrada = prepara()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            mede(entrada)
+            melhor = min(melhor, time.perf_counter() - inicio)
+        finally:
+            gc.enable()
+    return melhor
+
+def conjuntos(g): # FIRST e FOLLOW de uma gramática nova
+    g.compute_first()
+    g.compute_follow()
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DA CONSTRUÇÃO DAS TABELAS LALR  ")
+    print("========================================\n")
+    info = regras_tascal()
+    print(f"{'cópias':>6} {'produções':>9} {'estados':>8} {'FIRST/FOLLOW (ms)':>17} {'tabelas (ms)':>12}")
+    for copias in (1, 10):
+        prepara = lambda: gramatica_tascal(copias, info=info)
+        g = prepara()
+        estados = len(yacc.LRTable(g).lr_action)
+        repeticoes = 9 if copias == 1 else 3
+        tempo_conjuntos = melhor_tempo(prepara, conjuntos, repeticoes)
+        tempo_tabelas = melhor_tempo(prepara, yacc.LRTable, repeticoes)
+        print(f"{copias:>6} {len(g.Productions):>9} {estados:>8} {tempo_conjuntos * 1e3:>17.2f} {tempo_tabelas * 1e3:>12.2f}")
+
+    tempo = melhor_tempo(lambda: None, lambda _: yacc.yacc(module=gramatica, tabmodule='tabela_inexistente',
+                                                          write_tables=False, errorlog=yacc.NullLogger()), 9)
+    print(f"\nyacc.yacc() do Tascal sem parsetab: {tempo * 1e3:.2f} ms")
+
+if __name__ == "__main__":
+    main()
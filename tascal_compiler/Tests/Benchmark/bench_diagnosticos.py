@@ -0,0 +1,40 @@
+# Benchmark do registro de diagnósticos em programas com muitos erros
+# Usa programas gerados sem a seção var, de modo que cada uso de variável é um erro
+# semântico (SEM002), e mede o tempo da compilação (registro dos diagnósticos, com
+# deduplicação e limite por código) separado do tempo de formatação das mensagens
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_diagnosticos
+import gc
+import time
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa_sem_declaracoes
+
+def mede(codigo, repeticoes): # Melhores tempos (em segundos) de compilação e de formatação
+    melhor_compilacao = melhor_formatacao = float("inf")
+    gc.disable() # Evita que coletas de lixo distorçam as medições
+    try:
+        for _ in range(repeticoes):
+            contexto = ContextoCompilacao()
+            inicio = time.perf_counter()
+            contexto.compila(codigo)
+            meio = time.perf_counter()
+            contexto.diagnosticos.formata()
+            fim = time.perf_counter()
+            melhor_compilacao = min(melhor_compilacao, meio - inicio)
+            melhor_formatacao = min(melhor_formatacao, fim - meio)
+    finally:
+        gc.enable()
+    return melhor_compilacao, melhor_formatacao, contexto.diagnosticos
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DOS DIAGNÓSTICOS  ")
+    print("========================================\n")
+    print(f"{'comandos':>10} {'ocorrências':>12} {'guardados':>10} {'compilação (ms)':>16} {'formatação (ms)':>16}")
+    for n_comandos in (1000, 5000, 20000):
+        codigo = gera_programa_sem_declaracoes(n_comandos, semente=n_comandos)
+        compilacao, formatacao, diagnosticos = mede(codigo, 5)
+        ocorrencias = len(diagnosticos) + sum(diagnosticos.repetidos.values()) + sum(diagnosticos.excedentes.values())
+        print(f"{n_comandos:>10} {ocorrencias:>12} {len(diagnosticos):>10} {compilacao * 1e3:>16.1f} {formatacao * 1e3:>16.2f}")
+
+if __name__ == "__main__":
+    main()
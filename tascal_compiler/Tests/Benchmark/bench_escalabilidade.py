@@ -0,0 +1,78 @@
+# Benchmark de escalabilidade do parser em programas muito longos
+# Mede o tempo por elemento e a profundidade máxima da pilha do parser para:
+#   - blocos com N comandos (lista_comandos)
+#   - uma única lista de N identificadores em var (lista_id)
+#   - N grupos de declaração (declaracao_variaveis)
+#   - um write com N expressões (lista_expressoes)
+# Com as listas recursivas à esquerda, o tempo por elemento deve ficar constante
+# e a pilha não deve crescer com N
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_escalabilidade
+import gc
+import time
+from tascal_compiler.parser import parser, ContextoCompilacao
+
+class LexerMedidor: # Repassa os tokens do lexer e registra a profundidade da pilha do parser
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.profundidade = 0
+
+    def input(self, dados):
+        self.lexdata = dados # Usado pelo parser para calcular as colunas dos nós
+        self.lexer.lineno = 1
+        self.lexer.input(dados)
+
+    def column(self, lexpos): # Coluna de uma posição, usada pelo parser nos nós
+        return self.lexer.column(lexpos)
+
+    def token(self):
+        self.profundidade = max(self.profundidade, len(parser.statestack))
+        return self.lexer.token()
+
+def programa_comandos(n): # Bloco com n atribuições
+    comandos = ";\n".join(f"  x := x + {k}" for k in range(n))
+    return f"program c;\nvar x: integer;\nbegin\n{comandos}\nend.\n"
+
+def programa_lista_id(n): # Uma lista com n identificadores
+    nomes = ", ".join(f"v{k}" for k in range(n))
+    return f"program l;\nvar {nomes}: integer;\nbegin\n  read({nomes})\nend.\n"
+
+def programa_declaracoes(n): # n grupos de declaração
+    grupos = "\n".join(f"  v{k}: integer;" for k in range(n))
+    return f"program d;\nvar\n{grupos}\nbegin\n  v0 := 1\nend.\n"
+
+def programa_write(n): # Um write com n expressões
+    expressoes = ", ".join(f"x + {k}" for k in range(n))
+    return f"program w;\nvar x: integer;\nbegin\n  write({expressoes})\nend.\n"
+
+def mede(codigo): # Melhor tempo de análise (em segundos) e profundidade máxima da pilha
+    melhor = float("inf")
+    profundidade = 0
+    gc.disable()
+    try:
+        for _ in range(3):
+            contexto = ContextoCompilacao()
+            lexer = LexerMedidor(contexto.lexer)
+            inicio = time.perf_counter()
+            parser.parse(codigo, lexer=lexer, context=contexto)
+            melhor = min(melhor, time.perf_counter() - inicio)
+            profundidade = max(profundidade, lexer.profundidade)
+    finally:
+        gc.enable()
+    return melhor, profundidade
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DE ESCALABILIDADE  ")
+    print("========================================\n")
+    casos = [("comandos", programa_comandos), ("lista_id", programa_lista_id),
+             ("declaracoes", programa_declaracoes), ("write", programa_write)]
+    for nome, gera in casos:
+        print(f"--- {nome} ---")
+        print(f"{'N':>8} {'tempo (ms)':>12} {'µs/elemento':>12} {'pilha máx.':>11}")
+        for n in (1000, 4000, 16000, 64000):
+            tempo, profundidade = mede(gera(n))
+            print(f"{n:>8} {tempo * 1e3:>12.1f} {tempo / n * 1e6:>12.2f} {profundidade:>11}")
+        print()
+
+if __name__ == "__main__":
+    main()
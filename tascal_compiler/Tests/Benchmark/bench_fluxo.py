@@ -0,0 +1,59 @@
+# Benchmark da leitura em fluxo do lexer por autômato (Automato.tokens_stream)
+# Mede, em um programa gerado gravado em arquivo, a memória de pico e o tempo por token de
+# ler o arquivo inteiro e tokenizá-lo com input(), e de tokenizá-lo em fluxo a partir do
+# arquivo (binário) e de um mmap, com alguns tamanhos de bloco
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_fluxo
+import os
+import mmap
+import tempfile
+import tracemalloc
+from tascal_compiler.automato import Automato
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+from tascal_compiler.Tests.Benchmark.medicao import melhores_tempos
+
+TAMANHOS_BLOCO = (1 << 12, 1 << 16, 1 << 20)
+
+def pico_memoria(funcao): # Pico de memória alocada (bytes) durante funcao()
+    tracemalloc.start()
+    try:
+        funcao()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def inteiro(arquivo): # Lê o arquivo inteiro e o tokeniza com input()
+    with open(arquivo, "r", encoding="utf-8") as f:
+        lexer = Automato()
+        lexer.input(f.read())
+    return sum(1 for _ in lexer)
+
+def de_arquivo(arquivo, tamanho_bloco):
+    with open(arquivo, "rb") as f:
+        return sum(1 for _ in Automato().tokens_stream(f, tamanho_bloco))
+
+def de_mmap(arquivo, tamanho_bloco):
+    with open(arquivo, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return sum(1 for _ in Automato().tokens_stream(m, tamanho_bloco))
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DO LEXER EM FLUXO  ")
+    print("========================================\n")
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, "programa.tascal")
+        with open(arquivo, "w", encoding="utf-8") as f:
+            f.write(gera_programa(20000, semente=0))
+        quantidade = inteiro(arquivo)
+        print(f"Programa gerado: {os.path.getsize(arquivo) / 1e6:.1f} MB, {quantidade} tokens\n")
+
+        etapas = [("arquivo inteiro + input()", lambda: inteiro(arquivo))]
+        for tamanho in TAMANHOS_BLOCO:
+            etapas.append((f"fluxo do arquivo, {tamanho >> 10} KiB", lambda t=tamanho: de_arquivo(arquivo, t)))
+            etapas.append((f"fluxo do mmap, {tamanho >> 10} KiB", lambda t=tamanho: de_mmap(arquivo, t)))
+        tempos = melhores_tempos([funcao for _, funcao in etapas], 3)
+        print(f"{'leitura':<28} {'pico (KiB)':>11} {'ns/token':>9}")
+        for (nome, funcao), tempo in zip(etapas, tempos):
+            print(f"{nome:<28} {pico_memoria(funcao) / 1024:>11.0f} {tempo / quantidade * 1e9:>9.0f}")
+
+if __name__ == "__main__":
+    main()
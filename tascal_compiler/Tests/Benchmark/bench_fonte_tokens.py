@@ -0,0 +1,51 @@
+# Benchmark das fontes de tokens do parser (parse(..., tokens=...))
+# Analisa um programa gerado cujos tokens já foram reconhecidos (como tokens guardados em cache ou
+# vindos de outra etapa), sem contar o lexer, a partir de duas fontes: uma lista de tokens e os
+# arrays de lexer.tokenize_all. Cada fonte é lida de duas formas:
+# - lexer falso: um objeto com token() que repassa os tokens da fonte, como era preciso antes de
+#   tokens=, com uma chamada de função Python por token (e, nos arrays, um LexToken por token)
+# - tokens=: a fonte entregue ao parser, que lê a lista com next() e os arrays direto, sem
+#   chamada Python por token
+# Mostra o tempo por token do parser genérico do yacc e do parser especializado em cada caso e o
+# custo por token que deixa de ser pago. O tempo por token inclui as ações semânticas (os nós da árvore)
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_fonte_tokens
+from tascal_compiler.parser import parser, ContextoCompilacao
+from tascal_compiler import parser_especializado
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+from tascal_compiler.Tests.Benchmark.medicao import melhores_tempos
+
+class LexerFalso: # Repassa ao parser tokens já reconhecidos, um por chamada de token()
+    def __init__(self, tokens, lexer):
+        self.proximo = iter(tokens).__next__
+        self.lexer = lexer
+
+    def token(self):
+        try:
+            return self.proximo()
+        except StopIteration:
+            return None
+
+    def column(self, lexpos):
+        return self.lexer.column(lexpos)
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DAS FONTES DE TOKENS  ")
+    print("========================================\n")
+    codigo = gera_programa(500, semente=0)
+    contexto = ContextoCompilacao()
+    arrays = contexto.lexer.tokenize_all(codigo) # O lexer fica com o código, para as colunas dos nós
+    lista = list(arrays)
+    print(f"Programa gerado: {len(codigo) / 1e3:.0f} kB, {len(lista)} tokens\n")
+
+    print(f"{'parser':<14} {'fonte':<8} {'lexer falso (ns/token)':>23} {'tokens= (ns/token)':>19} {'economia (ns/token)':>20}")
+    for nome, parse in (("genérico", parser.parse), ("especializado", parser_especializado.parse)):
+        for rotulo, fonte in (("lista", lista), ("colunar", arrays)):
+            falso, direto = melhores_tempos([
+                lambda: parse(lexer=LexerFalso(fonte, contexto.lexer), context=ContextoCompilacao()),
+                lambda: parse(lexer=contexto.lexer, context=ContextoCompilacao(), tokens=fonte)], 60)
+            falso, direto = falso / len(lista) * 1e9, direto / len(lista) * 1e9
+            print(f"{nome:<14} {rotulo:<8} {falso:>23.0f} {direto:>19.0f} {falso - direto:>20.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Benchmark da reanálise incremental (incremental.Documento) em programas de tamanhos crescentes
+# Para cada tamanho, mede a compilação completa (melhor de 3) e a mediana da latência de três tipos
+# de edição em posições sorteadas do bloco principal: trocar um número (na mesma linha), inserir uma
+# quebra de linha e inserir um comando. Em cada posição, a edição e a que a desfaz são repetidas;
+# "local" é a mediana das repetições, e "salto" a da primeira edição depois de ir para outra posição,
+# que ainda leva o corte das posições dos tokens (ver incremental.ListaDeslocada) até lá. As edições
+# locais na mesma linha não dependem do tamanho do programa; as que mudam o número de linhas ainda
+# somam a diferença à linha de todos os nós seguintes da árvore (sem relexar nem reanalisar nada)
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_incremental
+import re
+import gc
+import time
+import random
+from statistics import median
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.incremental import Documento
+from tascal_compiler import parser_especializado
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+TAMANHOS = (1000, 4000, 16000)
+EDICOES = 100
+
+def compilacao_completa(codigo, repeticoes=3): # Melhor tempo (s) da compilação completa
+    melhor = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            ContextoCompilacao().compila(codigo, parse=parser_especializado.parse)
+            melhor = min(melhor, time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+    return melhor
+
+def latencias(documento, edicoes, repeticoes=3):
+    # Tempos (s) da primeira edição em cada posição e das repetições seguintes (a edição e a que a
+    # desfaz), e os tokens relexados e reanalisados
+    saltos, locais, relexados, reanalisados = [], [], [], []
+    gc.disable()
+    try:
+        for inicio, removidos, inserido in edicoes:
+            desfaz = (inicio, len(inserido), documento.codigo[inicio:inicio + removidos])
+            for repeticao in range(repeticoes):
+                for edicao in ((inicio, removidos, inserido), desfaz):
+                    comeco = time.perf_counter()
+                    documento.edita(*edicao)
+                    tempo = time.perf_counter() - comeco
+                    if not documento.incremental:
+                        raise RuntimeError(f"edição {edicao!r} não foi incremental")
+                    (locais if repeticao or edicao is desfaz else saltos).append(tempo)
+                    relexados.append(documento.relexados)
+                    reanalisados.append(documento.reanalisados)
+    finally:
+        gc.enable()
+    return saltos, locais, relexados, reanalisados
+
+def sorteia(codigo, rnd): # Edições sorteadas no bloco principal: (nome, [(início, removidos, inserido)])
+    corpo = codigo.index("begin")
+    numeros = [m for m in re.compile(r"(?<=:= )\d+").finditer(codigo, corpo)]
+    pontos = [m.end() for m in re.compile(";").finditer(codigo, corpo)]
+    return [
+        ("troca um número", [(m.start(), len(m.group()), str(rnd.randint(0, 9999)))
+                             for m in rnd.sample(numeros, min(EDICOES, len(numeros)))]),
+        ("quebra de linha", [(p, 0, "\n") for p in rnd.sample(pontos, EDICOES)]),
+        ("insere um comando", [(p, 0, "\n  i1 := i2 + 3;") for p in rnd.sample(pontos, EDICOES)]),
+    ]
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DA REANÁLISE INCREMENTAL  ")
+    print("========================================\n")
+    print(f"{'comandos':>8} {'caracteres':>10} {'edição':<18} {'completa (ms)':>13} {'local (us)':>10} "
+          f"{'% da completa':>13} {'salto (us)':>10} {'relexados':>9} {'reanalisados':>12}")
+    for tamanho in TAMANHOS:
+        codigo = gera_programa(tamanho, semente=0)
+        completa = compilacao_completa(codigo)
+        documento = Documento(codigo, parse=parser_especializado.parse)
+        for nome, edicoes in sorteia(codigo, random.Random(tamanho)):
+            saltos, locais, relexados, reanalisados = latencias(documento, edicoes)
+            local = median(locais)
+            print(f"{tamanho:>8} {len(codigo):>10} {nome:<18} {completa * 1e3:>13.1f} {local * 1e6:>10.0f} "
+                  f"{local / completa * 100:>12.2f}% {median(saltos) * 1e6:>10.0f} "
+                  f"{median(relexados):>9.0f} {median(reanalisados):>12.0f}")
+
+if __name__ == "__main__":
+    main()
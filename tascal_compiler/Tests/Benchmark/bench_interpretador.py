@@ -0,0 +1,83 @@
+# Benchmark do interpretador (interpretador.py), em comandos executados por segundo
+# Cada programa é compilado uma única vez e executado várias vezes; mede-se apenas a
+# execução. Os programas de teste P*.tascal são muito curtos, então também são medidos
+# um laço longo e programas gerados (interrompidos pelo limite de instruções)
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_interpretador
+import gc
+import io
+import os
+import glob
+import time
+from tascal_compiler.parser import compila
+from tascal_compiler.interpretador import Interpretador, LimiteInstrucoesExcedido
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+PASTA_PROGRAMAS = os.path.join(os.path.dirname(__file__), "..", "Parser", "ProgramasTascalTeste")
+ENTRADAS = {"P4.tascal": "7 2\n", "P9.tascal": "3 4\n", "P10.tascal": "1000000\n"} # Entradas dos programas com read
+
+LACO = """program laco;
+var i, s, pares: integer;
+    par: boolean;
+begin
+  i := 0; s := 0; pares := 0;
+  while i < 200000 do
+  begin
+    par := i div 2 * 2 = i;
+    if par and (i > 0) then
+      pares := pares + 1
+    else
+      s := s + i;
+    i := i + 1
+  end;
+  write(s, pares)
+end.
+"""
+
+def mede(arvore, entrada, repeticoes, limite_instrucoes=None): # Melhor tempo (s) e instruções de uma execução
+    melhor = float("inf")
+    gc.disable() # Evita que coletas de lixo distorçam as medições
+    try:
+        for _ in range(repeticoes):
+            interpretador = Interpretador(arvore, io.StringIO(entrada), io.StringIO(), limite_instrucoes)
+            inicio = time.perf_counter()
+            try:
+                interpretador.executa()
+            except LimiteInstrucoesExcedido:
+                pass
+            melhor = min(melhor, time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+    return melhor, interpretador.instrucoes
+
+def linha(nome, tempo, instrucoes):
+    print(f"{nome:<16} {instrucoes:>12} {tempo * 1e3:>12.3f} {instrucoes / tempo:>16,.0f}")
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DO INTERPRETADOR  ")
+    print("========================================\n")
+    print(f"{'programa':<16} {'instruções':>12} {'tempo (ms)':>12} {'instruções/s':>16}")
+
+    tempo_total = instrucoes_total = 0
+    for arquivo in sorted(glob.glob(os.path.join(PASTA_PROGRAMAS, "P[0-9]*.tascal"))):
+        nome = os.path.basename(arquivo)
+        with open(arquivo, "r", encoding="utf-8") as f:
+            arvore, _ = compila(f.read())
+        tempo, instrucoes = mede(arvore, ENTRADAS.get(nome, ""), 200)
+        linha(nome, tempo, instrucoes)
+        tempo_total += tempo
+        instrucoes_total += instrucoes
+    linha("P* (total)", tempo_total, instrucoes_total)
+    print()
+
+    arvore, _ = compila(LACO)
+    tempo, instrucoes = mede(arvore, "", 3)
+    linha("laço 200000", tempo, instrucoes)
+
+    for semente in range(3):
+        arvore, _ = compila(gera_programa(2000, semente=semente))
+        tempo, instrucoes = mede(arvore, "3 1 4 1 5 9 2 6\n" * 2000, 3, limite_instrucoes=1000000)
+        linha(f"gerado{semente}", tempo, instrucoes)
+
+if __name__ == "__main__":
+    main()
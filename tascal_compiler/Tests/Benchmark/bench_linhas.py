@@ -0,0 +1,80 @@
+# Benchmark do cálculo preguiçoso das linhas no lexer (lazy_lines em lexer.py)
+# Compara as regras atuais de lexer.py (quebras de linha ignoradas como espaços, linha de cada
+# token calculada a partir do lexpos por busca binária no índice das quebras de linha) com as
+# mesmas regras, mas com o t_newline antigo: uma função Python chamada a cada sequência de
+# quebras de linha, que soma a linha do lexer. Os dois lexers são montados do mesmo jeito
+# (lex.lex sobre um módulo com as regras). Mede o lexer token a token, tokenize_all, o lexer
+# token a token pedindo a linha de todos os tokens (o pior caso do cálculo preguiçoso) e a
+# análise completa pelo parser especializado, em que cada nó da árvore pede linha e coluna
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_linhas
+import sys
+import types
+from tascal_compiler import lex, lexer, parser_especializado
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.diagnosticos import Diagnosticos
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+from tascal_compiler.Tests.Benchmark.medicao import melhores_tempos
+
+def t_newline(t): # Regra antiga: quebra de linha
+    r'\n+'
+    t.lexer.lineno += len(t.value)
+
+def monta_lexer(callback): # Lexer com as regras de lexer.py; com callback=True, usa o t_newline antigo
+    modulo = types.ModuleType("lexer_t_newline" if callback else "lexer_indice")
+    modulo.__file__ = __file__
+    for nome, valor in vars(lexer).items():
+        if nome in ("tokens", "reserved", "reserved_guard") or nome.startswith("t_"):
+            setattr(modulo, nome, valor)
+    if callback:
+        modulo.t_newline = t_newline
+        modulo.t_ignore = ' \t'
+    else:
+        modulo.lazy_lines = True
+    lexico = lex.lex(module=modulo)
+    lexico.diagnosticos = Diagnosticos()
+    return lexico
+
+def token_a_token(lexico, codigo):
+    lexico.lineno = 1
+    lexico.input(codigo)
+    for _ in lexico:
+        pass
+
+def colunar(lexico, codigo):
+    lexico.lineno = 1
+    lexico.tokenize_all(codigo)
+
+def com_linhas(lexico, codigo):
+    lexico.lineno = 1
+    lexico.input(codigo)
+    for token in lexico:
+        token.lineno
+
+def analise(lexico, codigo):
+    contexto = ContextoCompilacao()
+    contexto.lexer = lexico.clone()
+    contexto.lexer.diagnosticos = contexto.diagnosticos
+    contexto.compila(codigo, parse=parser_especializado.parse)
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DAS LINHAS PREGUIÇOSAS  ")
+    print("========================================\n")
+    antigo = monta_lexer(True)
+    atual = monta_lexer(False)
+    codigo = gera_programa(10000, semente=0)
+    esperado = [(t.type, t.value, t.lineno, t.lexpos) for t in (antigo.input(codigo) or antigo)]
+    iguais = esperado == [(t.type, t.value, t.lineno, t.lexpos) for t in (atual.input(codigo) or atual)]
+    quantidade = len(esperado)
+    print(f"Programa gerado: {codigo.count(chr(10))} linhas, {quantidade} tokens\n")
+    print(f"{'etapa':<30} {'t_newline (ns/token)':>21} {'índice (ns/token)':>18} {'ganho':>8}")
+    for nome, etapa in (("token a token", token_a_token), ("tokenize_all", colunar),
+                        ("token a token + lineno", com_linhas), ("lexer + parser especializado", analise)):
+        tempo_antigo, tempo_atual = melhores_tempos([lambda: etapa(antigo, codigo), lambda: etapa(atual, codigo)], 9)
+        print(f"{nome:<30} {tempo_antigo / quantidade * 1e9:>21.0f} {tempo_atual / quantidade * 1e9:>18.0f} "
+              f"{tempo_antigo / tempo_atual:>7.2f}x")
+    print("\nOs dois lexers devolvem os mesmos tokens." if iguais else "\nOs tokens divergem!")
+    sys.exit(0 if iguais else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# Benchmark do executor de MEPA (mepa.py)
+# Compara o tempo de execução do interpretador da árvore, da máquina de pilha (bytecode.py) e do
+# código MEPA pré-decodificado nos laços de bench_bytecode, e mede a geração e a montagem do
+# texto MEPA de programas grandes, em instruções por segundo
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_mepa
+import os
+from tascal_compiler.parser import compila
+from tascal_compiler import bytecode, interpretador, mepa
+from tascal_compiler.Tests.Benchmark.bench_interpretador import PASTA_PROGRAMAS, LACO
+from tascal_compiler.Tests.Benchmark.bench_bytecode import mede
+from tascal_compiler.Tests.Benchmark.bench_compilador_python import melhor_tempo
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+def execucao(nome, codigo, entrada, repeticoes):
+    arvore, _ = compila(codigo)
+    tempo_arvore = mede(interpretador.executa, arvore, entrada, repeticoes)
+    tempo_vm = mede(bytecode.executa, bytecode.compila(arvore), entrada, repeticoes)
+    tempo_mepa = mede(mepa.executa, mepa.gera(arvore).monta(), entrada, repeticoes)
+    print(f"{nome:<16} {tempo_arvore * 1e3:>12.3f} {tempo_vm * 1e3:>12.3f} {tempo_mepa * 1e3:>12.3f} "
+          f"{tempo_arvore / tempo_mepa:>9.2f}x")
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DO EXECUTOR DE MEPA  ")
+    print("========================================\n")
+    print(f"{'programa':<16} {'árvore (ms)':>12} {'VM (ms)':>12} {'MEPA (ms)':>12} {'ganho':>10}")
+    with open(os.path.join(PASTA_PROGRAMAS, "P10.tascal"), "r", encoding="utf-8") as f:
+        p10 = f.read()
+    execucao("P10 (n=10**18)", p10, f"{10 ** 18}\n", 200)
+    execucao("P10 (n=10**200)", p10, f"{10 ** 200}\n", 20)
+    execucao("laço 200000", LACO, "", 3)
+
+    print(f"\n{'programa':<16} {'instruções':>12} {'geração/s':>14} {'montagem/s':>14}")
+    for comandos in (300, 2000):
+        arvore, _ = compila(gera_programa(comandos, semente=0))
+        codigo = mepa.gera(arvore)
+        texto = codigo.texto()
+        tempo_geracao = melhor_tempo(lambda: mepa.gera(arvore), 3)
+        tempo_montagem = melhor_tempo(lambda: mepa.monta(texto), 3)
+        quantidade = len(codigo.instrucoes)
+        print(f"{f'gerado {comandos}':<16} {quantidade:>12} {quantidade / tempo_geracao:>14,.0f} "
+              f"{quantidade / tempo_montagem:>14,.0f}")
+
+if __name__ == "__main__":
+    main()
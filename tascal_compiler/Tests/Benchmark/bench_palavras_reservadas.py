@@ -0,0 +1,74 @@
+# Benchmark das palavras reservadas na regex mestre do lexer
+# Compara as regras atuais de lexer.py (palavras reservadas como grupos da regex mestre e t_ID
+# como regra de texto) com as mesmas regras, mas com o t_ID antigo: uma função Python chamada a
+# cada identificador, que consulta palavras_reservadas. Os dois lexers são montados do mesmo
+# jeito (lex.lex sobre um módulo com as regras). Confere que os dois devolvem os mesmos tokens
+# e mede o tempo por token em entradas densas em palavras reservadas, em identificadores e em
+# um programa gerado
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_palavras_reservadas
+import sys
+import types
+from tascal_compiler import lex, lexer
+from tascal_compiler.diagnosticos import Diagnosticos
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+from tascal_compiler.Tests.Benchmark.medicao import melhores_tempos
+
+def t_ID(t): # Regra antiga: identificador, trocado pela palavra reservada correspondente
+    r'[A-Za-z][A-Za-z0-9_]*'
+    t.type = lexer.palavras_reservadas.get(t.value, 'ID')
+    return t
+
+def monta_lexer(callback): # Lexer com as regras de lexer.py; com callback=True, usa o t_ID antigo
+    modulo = types.ModuleType("lexer_com_callback" if callback else "lexer_regex")
+    modulo.__file__ = __file__
+    for nome, valor in vars(lexer).items():
+        if nome in ("tokens", "lazy_lines") or (nome.startswith("t_") and nome != "t_ID"):
+            setattr(modulo, nome, valor)
+    if callback:
+        modulo.t_ID = t_ID
+    else:
+        modulo.t_ID = lexer.t_ID
+        modulo.reserved = lexer.reserved
+        modulo.reserved_guard = lexer.reserved_guard
+    lexico = lex.lex(module=modulo)
+    lexico.diagnosticos = Diagnosticos()
+    return lexico
+
+def tokens(lexico, codigo): # Lista de (tipo, valor, linha, posição)
+    lexico.lineno = 1
+    lexico.input(codigo)
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in lexico]
+
+def percorre(lexico, codigo): # Tokeniza o código, sem guardar os tokens
+    lexico.lineno = 1
+    lexico.input(codigo)
+    for _ in lexico:
+        pass
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DAS PALAVRAS RESERVADAS  ")
+    print("========================================\n")
+    antigo = monta_lexer(True)
+    atual = monta_lexer(False)
+    linha = "if not a and b or c then begin while x do read(y) end else write(true, false);\n"
+    entradas = {
+        "palavras reservadas": "program k; var a, b, c, x: boolean; y: integer; begin\n" + linha * 10000 + "end.\n",
+        "identificadores": " ".join(f"ident{k} x_{k} programa{k} dox" for k in range(25000)),
+        "programa gerado": gera_programa(10000, semente=0),
+    }
+    todos = True
+    print(f"{'entrada':<22} {'tokens':>8} {'t_ID (ns/token)':>16} {'regex (ns/token)':>17} {'ganho':>8}")
+    for nome, codigo in entradas.items():
+        esperado = tokens(antigo, codigo)
+        todos &= esperado == tokens(atual, codigo)
+        tempo_antigo, tempo_atual = melhores_tempos([lambda: percorre(antigo, codigo),
+                                                     lambda: percorre(atual, codigo)], 15)
+        quantidade = len(esperado)
+        print(f"{nome:<22} {quantidade:>8} {tempo_antigo / quantidade * 1e9:>16.0f} "
+              f"{tempo_atual / quantidade * 1e9:>17.0f} {tempo_antigo / tempo_atual:>7.2f}x")
+    print("\nOs dois lexers devolvem os mesmos tokens." if todos else "\nOs tokens divergem!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Benchmark do laço de análise: parser genérico do yacc x parser especializado
+# Os tokens são gerados uma única vez e reproduzidos para os dois parsers, de modo que
+# apenas o laço de análise (e as ações semânticas) é medido, em tokens por segundo
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_parser_especializado
+import gc
+import time
+from bisect import bisect_left
+from tascal_compiler.parser import parser, ContextoCompilacao
+from tascal_compiler.lexer import lexico
+from tascal_compiler.lex import newline_offsets
+from tascal_compiler import parser_especializado
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+class LexerReproducao: # "Lexer" que apenas devolve uma lista de tokens já reconhecidos
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.lineno = 1
+
+    def input(self, dados): # Reinicia a reprodução; token() devolve None ao final da lista
+        self.lexdata = dados # Código-fonte dos tokens, usado pelo parser para calcular as colunas
+        self.quebras = newline_offsets(dados)
+        proximo = iter(self.tokens).__next__
+        def token():
+            try:
+                return proximo()
+            except StopIteration:
+                return None
+        self.token = token
+
+    def line(self, lexpos): # Linha e coluna (a partir de 1) da posição lexpos, como em lex.Lexer
+        return bisect_left(self.quebras, lexpos) + 1
+
+    def column(self, lexpos):
+        i = bisect_left(self.quebras, lexpos)
+        return lexpos - (self.quebras[i - 1] if i else -1)
+
+def tokeniza(codigo): # Reconhece todos os tokens do programa uma única vez
+    lexico.lineno = 1
+    lexico.input(codigo)
+    return list(lexico)
+
+def mede(parse, codigo, tokens, repeticoes): # Melhor tempo (em segundos) de uma análise completa
+    lexer = LexerReproducao(tokens)
+    melhor = float("inf")
+    gc.disable() # Evita que coletas de lixo distorçam as medições
+    try:
+        for _ in range(repeticoes):
+            contexto = ContextoCompilacao()
+            inicio = time.perf_counter()
+            parse(codigo, lexer=lexer, context=contexto)
+            melhor = min(melhor, time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+    return melhor
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DO LAÇO DE ANÁLISE  ")
+    print("========================================\n")
+    print(f"{'comandos':>10} {'tokens':>10} {'genérico (tok/s)':>18} {'especializado (tok/s)':>22} {'ganho':>7}")
+    for n_comandos in (1000, 5000, 20000):
+        codigo = gera_programa(n_comandos, semente=n_comandos)
+        tokens = tokeniza(codigo)
+        generico = mede(parser.parse, codigo, tokens, 10)
+        especializado = mede(parser_especializado.parse, codigo, tokens, 10)
+        print(f"{n_comandos:>10} {len(tokens):>10} {len(tokens) / generico:>18,.0f} "
+              f"{len(tokens) / especializado:>22,.0f} {generico / especializado:>6.2f}x")
+
+if __name__ == "__main__":
+    main()
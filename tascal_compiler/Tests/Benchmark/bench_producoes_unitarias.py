@@ -0,0 +1,60 @@
+# Benchmark da eliminação das produções unitárias (passthrough em parser.py)
+# Compara o parser genérico do yacc com as tabelas originais (passthrough=()) e com as tabelas sem
+# as reduções unitárias, nos mesmos tokens já reconhecidos: conta as reduções (chamadas de funções
+# p_*) e mede o tempo de análise, ambos divididos pelo número de expressões do programa (cada
+# expressão completa, também as entre parênteses, passa uma vez por "expressao -> expressao_and")
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_producoes_unitarias
+from tascal_compiler import yacc
+from tascal_compiler import parser as gramatica
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+from tascal_compiler.Tests.Benchmark.bench_parser_especializado import LexerReproducao, tokeniza
+from tascal_compiler.Tests.Benchmark.medicao import melhores_tempos
+
+def constroi(passthrough=None): # Parser novo, com as tabelas originais (passthrough=()) ou sem as reduções unitárias
+    return yacc.yacc(module=gramatica, passthrough=passthrough, write_tables=False, errorlog=yacc.NullLogger())
+
+def reducoes(parser, codigo, tokens): # Número de reduções de cada produção em uma análise
+    contagem = [0] * len(parser.productions)
+    originais = [producao.callable for producao in parser.productions]
+    def conta(numero, funcao):
+        def contada(p):
+            contagem[numero] += 1
+            funcao(p)
+        return contada
+    for numero, producao in enumerate(parser.productions):
+        if producao.callable:
+            producao.callable = conta(numero, producao.callable)
+    try:
+        parser.parse(codigo, lexer=LexerReproducao(tokens), context=ContextoCompilacao())
+    finally:
+        for producao, funcao in zip(parser.productions, originais):
+            producao.callable = funcao
+    return contagem
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DAS PRODUÇÕES UNITÁRIAS  ")
+    print("========================================\n")
+    original = constroi(passthrough=())
+    eliminado = constroi()
+    print(f"estados: {len(original.action)} nas tabelas originais, {len(eliminado.action)} sem as reduções unitárias\n")
+    expressao = [p.str for p in original.productions].index("expressao -> expressao_and")
+    print(f"{'comandos':>8} {'expressões':>10} {'reduções/expr. (orig.)':>22} {'(elim.)':>8} "
+          f"{'original (us/expr.)':>19} {'eliminado (us/expr.)':>20} {'economia':>9}")
+    for n_comandos in (1000, 5000, 20000):
+        codigo = gera_programa(n_comandos, semente=n_comandos)
+        tokens = tokeniza(codigo)
+        contagem = reducoes(original, codigo, tokens)
+        expressoes = contagem[expressao]
+        antes = sum(contagem) / expressoes
+        depois = sum(reducoes(eliminado, codigo, tokens)) / expressoes
+        lexer = LexerReproducao(tokens)
+        analises = [lambda p=p: p(codigo, lexer=lexer, context=ContextoCompilacao())
+                    for p in (original.parse, eliminado.parse)]
+        tempo_original, tempo_eliminado = (t / expressoes for t in melhores_tempos(analises, 15))
+        print(f"{n_comandos:>8} {expressoes:>10} {antes:>22.2f} {depois:>8.2f} {tempo_original * 1e6:>19.2f} "
+              f"{tempo_eliminado * 1e6:>20.2f} {(1 - tempo_eliminado / tempo_original) * 100:>8.1f}%")
+
+if __name__ == "__main__":
+    main()
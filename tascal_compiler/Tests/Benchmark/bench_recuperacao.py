@@ -0,0 +1,77 @@
+# Benchmark da recuperação de erros léxicos em entradas adversárias
+# Mede o tempo por caractere, com recupera_erros_lexicos=True, dos dois motores léxicos em
+# entradas de tamanho dobrando: muitos '{' sem fim, uma sequência ilegal longa e símbolos
+# ilegais espalhados entre tokens. Para comparação, mede também uma recuperação ingênua (as
+# regras antigas, com o t_COMMENT só para comentários fechados e um t_error que pula um
+# caractere), em que cada '{' procura o '}' até o fim do código e cada erro copia o resto do
+# código. Com tempo linear, o tempo por caractere não cresce com o tamanho; o fator de
+# crescimento mostrado é o tempo do tamanho maior dividido pelo do menor, por caractere
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_recuperacao
+import types
+from tascal_compiler import lex, lexer
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.diagnosticos import Diagnosticos
+from tascal_compiler.Tests.Benchmark.medicao import melhores_tempos
+
+TAMANHOS = (4000, 8000, 16000, 32000)
+
+ENTRADAS = { # Nome -> função que gera uma entrada de (aproximadamente) n caracteres
+    "'{' sem fim": lambda n: "{" * n,
+    "'x {' sem fim": lambda n: "x {" * (n // 3),
+    "sequência ilegal longa": lambda n: "#" * n,
+    "ilegais espalhados": lambda n: "a # " * (n // 4),
+}
+
+def t_COMMENT(t): # Regra antiga: só comentários fechados
+    r'\{[^}]*\}'
+    t.lexer.diagnosticos.registra('LEX002', t.lineno, lexer.coluna(t))
+
+def t_error(t): # Recuperação ingênua: registra e pula um caractere
+    t.lexer.diagnosticos.registra('LEX001', t.lineno, lexer.coluna(t), t.value[0])
+    t.lexer.skip(1)
+
+def monta_ingenuo(): # Lexer com as regras de lexer.py, sem o t_ILEGAL e com as regras antigas acima
+    modulo = types.ModuleType("lexer_ingenuo")
+    modulo.__file__ = __file__
+    for nome, valor in vars(lexer).items():
+        if nome in ("tokens", "reserved", "reserved_guard", "lazy_lines") or nome.startswith("t_"):
+            setattr(modulo, nome, valor)
+    del modulo.t_ILEGAL
+    modulo.t_COMMENT = t_COMMENT
+    modulo.t_error = t_error
+    lexico = lex.lex(module=modulo)
+    lexico.recupera_erros = True
+    return lexico
+
+def ingenuo(lexico, codigo):
+    lexico.diagnosticos = Diagnosticos()
+    lexico.input(codigo)
+    for _ in lexico:
+        pass
+
+def recuperacao(motor, codigo):
+    lexer = ContextoCompilacao(motor_lexico=motor, recupera_erros_lexicos=True).lexer
+    lexer.input(codigo)
+    for _ in lexer:
+        pass
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DA RECUPERAÇÃO DE ERROS  ")
+    print("========================================\n")
+    lexico_ingenuo = monta_ingenuo()
+    nomes = ("ingênuo", "ply", "afd")
+    print(f"{'entrada':<24} {'tamanho':>8} " + " ".join(f"{nome + ' (ns/car.)':>16}" for nome in nomes))
+    for nome, gera in ENTRADAS.items():
+        por_caractere = []
+        for tamanho in TAMANHOS:
+            codigo = gera(tamanho)
+            tempos = melhores_tempos([lambda: ingenuo(lexico_ingenuo, codigo),
+                                      lambda: recuperacao('ply', codigo), lambda: recuperacao('afd', codigo)], 3)
+            por_caractere.append([t / len(codigo) * 1e9 for t in tempos])
+            print(f"{nome:<24} {len(codigo):>8} " + " ".join(f"{t:>16.1f}" for t in por_caractere[-1]))
+        crescimento = [maior / menor for maior, menor in zip(por_caractere[-1], por_caractere[0])]
+        print(f"{'  crescimento':<24} {TAMANHOS[-1] // TAMANHOS[0]:>7}x " + " ".join(f"{c:>15.1f}x" for c in crescimento))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# Benchmark das tabelas LALR do Tascal em três formatos
+# - dicionários: dicionários por estado, indexados pelo nome do símbolo (o formato antigo de lr_action/lr_goto)
+# - compactadas: os vetores de deslocamento de linhas (base/check/valor) de LRTable.compress_tables,
+#   indexados pelo número do símbolo, que o parser genérico do yacc usa
+# - densas: uma lista por estado com uma posição por símbolo, como no parser especializado
+# Mostra a memória de cada formato (só dos dicionários e listas; os nomes e os inteiros pequenos são
+# compartilhados) e o custo das consultas, medido por um reconhecedor LR sem ações semânticas que
+# percorre os tokens de um programa gerado: cada token consulta a tabela de ações, e cada redução
+# desempilha os estados e consulta a tabela de desvios (goto)
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_tabelas
+import sys
+from tascal_compiler.parser import parser
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+from tascal_compiler.Tests.Benchmark.bench_parser_especializado import tokeniza
+from tascal_compiler.Tests.Benchmark.medicao import melhores_tempos
+
+def memoria(*objetos): # Bytes dos dicionários e listas (sem contar as chaves e os inteiros compartilhados)
+    total = 0
+    pendentes = list(objetos)
+    while pendentes:
+        objeto = pendentes.pop()
+        total += sys.getsizeof(objeto)
+        if isinstance(objeto, dict):
+            pendentes.extend(v for v in objeto.values() if isinstance(v, (dict, list)))
+        elif isinstance(objeto, list):
+            pendentes.extend(v for v in objeto if isinstance(v, (dict, list)))
+    return total
+
+def densas(): # Tabelas densas (listas por estado), como as de yacc.write_parser_module
+    termids = {nome: i for i, nome in enumerate(parser.terminals)}
+    ntids = {nome: i for i, nome in enumerate(parser.nonterminals)}
+    acoes, desvios = [], []
+    for estado in range(len(parser.action)):
+        linha = [None] * (len(parser.terminals) + 1)
+        for nome, v in parser.action[estado].items():
+            linha[termids[nome]] = v
+        acoes.append(linha)
+        linha = [None] * len(parser.nonterminals)
+        for nome, v in parser.goto[estado].items():
+            linha[ntids[nome]] = v
+        desvios.append(linha)
+    return acoes, desvios
+
+def reconhece_dicionarios(tipos): # Reconhecedor com as tabelas em dicionários; devolve o número de ações
+    acoes, desvios, padrao = parser.action, parser.goto, parser.defaulted_states
+    producoes = [(p.len, p.name) for p in parser.productions]
+    pilha = [0]
+    estado = 0
+    i = 0
+    tipo = tipos[0]
+    passos = 0
+    while True:
+        passos += 1
+        if estado not in padrao:
+            t = acoes[estado].get(tipo)
+        else:
+            t = padrao[estado]
+        if t > 0:
+            pilha.append(t)
+            estado = t
+            i += 1
+            tipo = tipos[i]
+        elif t < 0:
+            comprimento, nome = producoes[-t]
+            if comprimento:
+                del pilha[-comprimento:]
+            estado = desvios[pilha[-1]][nome]
+            pilha.append(estado)
+        else:
+            return passos
+
+def reconhece_compactadas(tipos): # Reconhecedor com os vetores compactados do parser genérico
+    termid, nterms = parser.termids.get, len(parser.terminals)
+    abase, acheck, avalor = parser.action_base, parser.action_check, parser.action_value
+    gbase, gvalor = parser.goto_base, parser.goto_value
+    padrao, prodgoto = parser.defaulted, parser.prodgoto
+    comprimentos = [p.len for p in parser.productions]
+    pilha = [0]
+    estado = 0
+    i = 0
+    tid = termid(tipos[0], nterms)
+    passos = 0
+    while True:
+        passos += 1
+        t = padrao[estado]
+        if t is None:
+            j = abase[estado] + tid
+            t = avalor[j] if acheck[j] == estado else None
+        if t > 0:
+            pilha.append(t)
+            estado = t
+            i += 1
+            tid = termid(tipos[i], nterms)
+        elif t < 0:
+            comprimento = comprimentos[-t]
+            if comprimento:
+                del pilha[-comprimento:]
+            estado = gvalor[gbase[pilha[-1]] + prodgoto[-t]]
+            pilha.append(estado)
+        else:
+            return passos
+
+def reconhece_densas(tipos, acoes, desvios): # Reconhecedor com as tabelas densas
+    termid, nterms = {nome: i for i, nome in enumerate(parser.terminals)}.get, len(parser.terminals)
+    padrao, prodgoto = parser.defaulted, parser.prodgoto
+    comprimentos = [p.len for p in parser.productions]
+    pilha = [0]
+    estado = 0
+    i = 0
+    tid = termid(tipos[0], nterms)
+    passos = 0
+    while True:
+        passos += 1
+        t = padrao[estado]
+        if t is None:
+            t = acoes[estado][tid]
+        if t > 0:
+            pilha.append(t)
+            estado = t
+            i += 1
+            tid = termid(tipos[i], nterms)
+        elif t < 0:
+            comprimento = comprimentos[-t]
+            if comprimento:
+                del pilha[-comprimento:]
+            estado = desvios[pilha[-1]][prodgoto[-t]]
+            pilha.append(estado)
+        else:
+            return passos
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DAS TABELAS LALR  ")
+    print("========================================\n")
+    acoes, desvios = densas()
+    estados = len(parser.action)
+    entradas = sum(len(linha) for linha in parser.action.values()) + sum(len(linha) for linha in parser.goto.values())
+    formatos = {
+        "dicionários": memoria(parser.action, parser.goto, parser.defaulted_states),
+        "compactadas": memoria(parser.action_base, parser.action_check, parser.action_value, parser.goto_base,
+                               parser.goto_check, parser.goto_value, parser.defaulted),
+        "densas": memoria(acoes, desvios, parser.defaulted),
+    }
+    print(f"{estados} estados, {len(parser.terminals)} terminais, {len(parser.nonterminals)} não-terminais, "
+          f"{entradas} entradas; {len(parser.action_value)} + {len(parser.goto_value)} posições compactadas\n")
+    print(f"{'formato':<12} {'memória (bytes)':>16}")
+    for nome, bytes_ in formatos.items():
+        print(f"{nome:<12} {bytes_:>16,}")
+
+    print(f"\n{'comandos':>8} {'tokens':>8} {'ações':>8} " + " ".join(f"{nome + ' (ns/ação)':>24}" for nome in formatos))
+    for n_comandos in (1000, 20000):
+        tipos = [token.type for token in tokeniza(gera_programa(n_comandos, semente=n_comandos))] + ['$end']
+        passos = reconhece_dicionarios(tipos)
+        if passos != reconhece_compactadas(tipos) or passos != reconhece_densas(tipos, acoes, desvios):
+            raise RuntimeError("os reconhecedores discordam")
+        tempos = melhores_tempos([lambda: reconhece_dicionarios(tipos), lambda: reconhece_compactadas(tipos),
+                                  lambda: reconhece_densas(tipos, acoes, desvios)], 7)
+        print(f"{n_comandos:>8} {len(tipos) - 1:>8} {passos:>8} " + " ".join(f"{t / passos * 1e9:>24.1f}" for t in tempos))
+
+if __name__ == "__main__":
+    main()
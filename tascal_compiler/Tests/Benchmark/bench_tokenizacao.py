@@ -0,0 +1,54 @@
+# Benchmark da tokenização colunar (lex.Lexer.tokenize_all)
+# Compara, em um programa gerado de alguns MB, o lexer token a token (um LexToken por token)
+# com a tokenização de uma só vez em arrays, e a análise completa do parser especializado
+# lendo os tokens do lexer ou dos arrays
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_tokenizacao
+import gc
+import time
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler import parser_especializado
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+def melhor_tempo(funcao, repeticoes=3): # Melhor tempo (s) de funcao(), com o coletor de lixo desligado
+    melhor = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            funcao()
+            melhor = min(melhor, time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+    return melhor
+
+def token_a_token(codigo):
+    lexer = ContextoCompilacao().lexer
+    lexer.input(codigo)
+    return sum(1 for _ in lexer)
+
+def colunar(codigo):
+    return len(ContextoCompilacao().lexer.tokenize_all(codigo))
+
+def analise(codigo, colunar):
+    ContextoCompilacao().compila(codigo, parse=parser_especializado.parse, colunar=colunar)
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DA TOKENIZAÇÃO COLUNAR  ")
+    print("========================================\n")
+    codigo = gera_programa(40000, semente=0)
+    quantidade = colunar(codigo)
+    print(f"Programa gerado: {len(codigo) / 1e6:.1f} MB, {quantidade} tokens\n")
+    print(f"{'etapa':<28} {'token a token (s)':>18} {'colunar (s)':>12} {'ganho':>8}")
+    lexer_stream = melhor_tempo(lambda: token_a_token(codigo))
+    lexer_colunar = melhor_tempo(lambda: colunar(codigo))
+    print(f"{'lexer':<28} {lexer_stream:>18.3f} {lexer_colunar:>12.3f} {lexer_stream / lexer_colunar:>7.2f}x")
+    analise_stream = melhor_tempo(lambda: analise(codigo, False))
+    analise_colunar = melhor_tempo(lambda: analise(codigo, True))
+    print(f"{'lexer + parser especializado':<28} {analise_stream:>18.3f} {analise_colunar:>12.3f} "
+          f"{analise_stream / analise_colunar:>7.2f}x")
+    print(f"\nPor token: {lexer_stream / quantidade * 1e9:.0f} ns token a token, "
+          f"{lexer_colunar / quantidade * 1e9:.0f} ns colunar")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# Benchmark da execução vetorizada (vetorizado.py)
+# Compara o tempo de rodar um programa sobre milhares de entradas, uma a uma no interpretador
+# da árvore e de uma só vez em um lote vetorizado, em entradas (pistas) por segundo
+# Requer o NumPy; sem ele, o benchmark é ignorado
+# Exemplo: py -m tascal_compiler.Tests.Benchmark.bench_vetorizado
+import io
+import os
+import random
+import importlib.util
+from tascal_compiler.parser import compila
+from tascal_compiler import interpretador
+from tascal_compiler.Tests.Benchmark.bench_interpretador import PASTA_PROGRAMAS
+from tascal_compiler.Tests.Benchmark.bench_compilador_python import melhor_tempo
+
+TEM_NUMPY = importlib.util.find_spec("numpy") is not None
+if TEM_NUMPY: # vetorizado importa o NumPy
+    from tascal_compiler import vetorizado
+
+def uma_a_uma(programa, entradas): # Executa cada entrada no interpretador da árvore
+    for entrada in entradas:
+        interpretador.executa(programa, io.StringIO(entrada), io.StringIO())
+
+def execucao(nome, programa, entradas, amostra=2000):
+    tempo_arvore = melhor_tempo(lambda: uma_a_uma(programa, entradas[:amostra]), 3) / amostra
+    tempo_lote = melhor_tempo(lambda: vetorizado.executa_lote(programa, entradas).saidas(), 3) / len(entradas)
+    print(f"{nome:<16} {len(entradas):>9} {1 / tempo_arvore:>14,.0f} {1 / tempo_lote:>14,.0f} "
+          f"{tempo_arvore / tempo_lote:>9.1f}x")
+
+def main():
+    print("========================================")
+    print("  BENCHMARK DA EXECUÇÃO VETORIZADA  ")
+    print("========================================\n")
+    if not TEM_NUMPY:
+        print("NumPy não instalado: benchmark da execução vetorizada ignorado.")
+        return
+    rnd = random.Random(0)
+    print(f"{'programa':<16} {'pistas':>9} {'árvore/s':>14} {'lote/s':>14} {'ganho':>10}")
+    for nome, entradas in (("P4.tascal", [f"{rnd.randint(-10 ** 6, 10 ** 6)} {rnd.randint(1, 99)}"
+                                          for _ in range(200000)]),
+                           ("P9.tascal", [f"{rnd.randint(-999, 999)} {rnd.randint(-999, 999)}"
+                                          for _ in range(200000)]),
+                           ("P10.tascal", [str(rnd.randint(0, 10 ** 9)) for _ in range(50000)])):
+        with open(os.path.join(PASTA_PROGRAMAS, nome), "r", encoding="utf-8") as f:
+            programa, _ = compila(f.read())
+        execucao(nome, programa, entradas)
+
+if __name__ == "__main__":
+    main()
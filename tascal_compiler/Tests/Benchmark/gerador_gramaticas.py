@@ -0,0 +1,51 @@
+# Gerador de gramáticas usadas pelos testes e benchmarks da construção das tabelas LALR
+# - gramatica_tascal(copias): a gramática do Tascal (parser.py) como um yacc.Grammar; com copias > 1,
+#   é uma gramática sintética com várias cópias do Tascal, cada uma com seus próprios tokens e
+#   não-terminais (sufixo _i), unidas por uma regra inicial "inicio : programa_i"
+# - gramatica_aleatoria(rnd): uma gramática pequena e aleatória, produtiva e sem símbolos
+#   inalcançáveis, com recursões, produções vazias e conflitos
+from tascal_compiler import yacc
+from tascal_compiler import parser as gramatica
+
+def regras_tascal(): # Tokens, precedências e regras do Tascal, lidos de parser.py como o yacc os lê
+    info = yacc.ParserReflect({nome: getattr(gramatica, nome) for nome in dir(gramatica)}, log=yacc.NullLogger())
+    info.get_all()
+    info.validate_all()
+    return info
+
+def gramatica_tascal(copias=1, passthrough=None, info=None): # yacc.Grammar com as regras do Tascal
+    info = info or regras_tascal()
+    nome = (lambda simbolo, i: simbolo) if copias == 1 else (lambda simbolo, i: f"{simbolo}_{i}")
+    g = yacc.Grammar([nome(t, i) for i in range(copias) for t in info.tokens])
+    for i in range(copias):
+        for termo, associatividade, nivel in info.preclist:
+            g.set_precedence(nome(termo, i), associatividade, nivel)
+    if copias > 1:
+        inicial = info.grammar[0][1][2]
+        for i in range(copias):
+            g.add_production('inicio', [nome(inicial, i)])
+    for i in range(copias):
+        for funcao, (arquivo, linha, regra, simbolos) in info.grammar:
+            g.add_production(nome(regra, i), [s if s == '%prec' else nome(s, i) for s in simbolos], funcao, arquivo, linha)
+    g.set_start()
+    g.set_passthrough(info.passthrough if passthrough is None and copias == 1 else passthrough or ())
+    return g
+
+def gramatica_aleatoria(rnd): # yacc.Grammar aleatória, ou None se a sorteada não servir
+    nao_terminais = [f"N{i}" for i in range(rnd.randint(1, 6))]
+    terminais = [f"t{i}" for i in range(rnd.randint(1, 5))]
+    regras = []
+    for regra in nao_terminais:
+        for _ in range(rnd.randint(1, 3)):
+            simbolos = [rnd.choice(nao_terminais + terminais) for _ in range(rnd.randint(0, 4))]
+            if (regra, simbolos) not in regras:
+                regras.append((regra, simbolos))
+    g = yacc.Grammar(terminais)
+    for n, (regra, simbolos) in enumerate(regras):
+        g.add_production(regra, simbolos, f"p_{n}", "aleatoria", n + 1)
+    if g.undefined_symbols():
+        return None
+    g.set_start()
+    if g.find_unreachable() or g.infinite_cycles():
+        return None
+    return g
@@ -0,0 +1,99 @@
+# Gerador de programas Tascal grandes usados pelos benchmarks
+# Os programas são determinísticos (semente fixa) e válidos sintática e semanticamente,
+# misturando atribuições, if/else, while, read, write e blocos aninhados
+import random
+
+def gera_expressao_inteira(rnd, inteiras, profundidade=0): # Gera uma expressão do tipo integer
+    if profundidade > 2 or rnd.random() < 0.4:
+        if rnd.random() < 0.6:
+            return rnd.choice(inteiras)
+        return str(rnd.randint(0, 999))
+    op = rnd.choice(['+', '-', '*', 'div'])
+    esquerda = gera_expressao_inteira(rnd, inteiras, profundidade + 1)
+    direita = gera_expressao_inteira(rnd, inteiras, profundidade + 1)
+    if op == 'div':
+        direita = str(rnd.randint(1, 9))
+    if rnd.random() < 0.2:
+        return f"({esquerda} {op} {direita})"
+    return f"{esquerda} {op} {direita}"
+
+def gera_expressao_booleana(rnd, inteiras, booleanas, profundidade=0): # Gera uma expressão do tipo boolean
+    sorteio = rnd.random()
+    if profundidade > 1 or sorteio < 0.3:
+        return rnd.choice(booleanas + ['true', 'false'])
+    if sorteio < 0.7:
+        op = rnd.choice(['<', '<=', '>', '>=', '=', '<>'])
+        return f"{gera_expressao_inteira(rnd, inteiras, 2)} {op} {gera_expressao_inteira(rnd, inteiras, 2)}"
+    if sorteio < 0.85:
+        return f"not ({gera_expressao_booleana(rnd, inteiras, booleanas, profundidade + 1)})"
+    op = rnd.choice(['and', 'or'])
+    esquerda = gera_expressao_booleana(rnd, inteiras, booleanas, profundidade + 1)
+    direita = gera_expressao_booleana(rnd, inteiras, booleanas, profundidade + 1)
+    return f"({esquerda}) {op} ({direita})"
+
+def gera_comando(rnd, inteiras, booleanas, linhas, recuo, profundidade): # Gera um comando (e seus subcomandos)
+    espaco = '  ' * recuo
+    sorteio = rnd.random()
+    if profundidade < 3 and sorteio < 0.08:
+        linhas.append(f"{espaco}if {gera_expressao_booleana(rnd, inteiras, booleanas)} then")
+        gera_comando(rnd, inteiras, booleanas, linhas, recuo + 1, profundidade + 1)
+        linhas.append(f"{espaco}else")
+        gera_comando(rnd, inteiras, booleanas, linhas, recuo + 1, profundidade + 1)
+    elif profundidade < 3 and sorteio < 0.12:
+        # Laço que sempre termina: contador decrescente
+        contador = rnd.choice(inteiras)
+        linhas.append(f"{espaco}while {contador} > 0 do")
+        linhas.append(f"{espaco}begin")
+        gera_comando(rnd, inteiras, booleanas, linhas, recuo + 1, profundidade + 1)
+        linhas[-1] += ';'
+        linhas.append(f"{espaco}  {contador} := {contador} - 1")
+        linhas.append(f"{espaco}end")
+    elif profundidade < 3 and sorteio < 0.16:
+        linhas.append(f"{espaco}begin")
+        for _ in range(rnd.randint(1, 4)):
+            gera_comando(rnd, inteiras, booleanas, linhas, recuo + 1, profundidade + 1)
+            linhas[-1] += ';'
+        linhas[-1] = linhas[-1][:-1]
+        linhas.append(f"{espaco}end")
+    elif sorteio < 0.22:
+        linhas.append(f"{espaco}read({', '.join(rnd.sample(inteiras, 2))})")
+    elif sorteio < 0.30:
+        linhas.append(f"{espaco}write({gera_expressao_inteira(rnd, inteiras)}, {rnd.choice(booleanas)})")
+    elif sorteio < 0.40:
+        linhas.append(f"{espaco}{rnd.choice(booleanas)} := {gera_expressao_booleana(rnd, inteiras, booleanas)}")
+    else:
+        linhas.append(f"{espaco}{rnd.choice(inteiras)} := {gera_expressao_inteira(rnd, inteiras)}")
+
+def gera_programa(n_comandos, n_variaveis=20, semente=0): # Gera um programa com n_comandos comandos no bloco principal
+    rnd = random.Random(semente)
+    inteiras = [f"i{k}" for k in range(n_variaveis)]
+    booleanas = [f"b{k}" for k in range(max(2, n_variaveis // 4))]
+    linhas = [f"program gerado{semente};", "var"]
+    linhas.append(f"  {', '.join(inteiras)}: integer;")
+    linhas.append(f"  {', '.join(booleanas)}: boolean;")
+    linhas.append("begin")
+    for _ in range(n_comandos):
+        gera_comando(rnd, inteiras, booleanas, linhas, 1, 0)
+        linhas[-1] += ';'
+    linhas[-1] = linhas[-1][:-1]
+    linhas.append("end.")
+    return "\n".join(linhas) + "\n"
+
+def gera_programa_com_erros(n_comandos, semente=0): # Gera um programa com erros semânticos e sintáticos espalhados
+    rnd = random.Random(semente)
+    linhas = gera_programa(n_comandos, semente=semente).split("\n")
+    for k in range(5, len(linhas) - 2):
+        sorteio = rnd.random()
+        if sorteio < 0.05:
+            linhas[k] = linhas[k].replace("i1", "naodeclarada", 1)
+        elif sorteio < 0.07:
+            linhas[k] = linhas[k].replace(":=", ":= true and", 1)
+    if n_comandos > 10:
+        linhas[len(linhas) // 2] += " )"
+    return "\n".join(linhas)
+
+def gera_programa_sem_declaracoes(n_comandos, semente=0): # Programa cujas variáveis nunca são declaradas
+    # Cada uso de variável gera um erro semântico: exercita o registro de diagnósticos
+    linhas = gera_programa(n_comandos, semente=semente).split("\n")
+    del linhas[1:4] # Remove "var" e as duas linhas de declaração
+    return "\n".join(linhas)
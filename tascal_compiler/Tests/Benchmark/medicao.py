@@ -0,0 +1,17 @@
+# Medição de tempo comum aos benchmarks
+import gc
+import time
+
+def melhores_tempos(funcoes, repeticoes=5):
+    # Melhor tempo (s) de cada função, alternando-as a cada repetição e com o coletor de lixo desligado
+    melhores = [float("inf")] * len(funcoes)
+    gc.disable()
+    try:
+        for _ in range(repeticoes):
+            for i, funcao in enumerate(funcoes):
+                inicio = time.perf_counter()
+                funcao()
+                melhores[i] = min(melhores[i], time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+    return melhores
@@ -0,0 +1,70 @@
+# Script de teste diferencial da máquina de pilha (bytecode.py) contra o interpretador da árvore
+# Executa os mesmos programas e casos de test_interpretador.py e programas gerados nas duas
+# implementações e confere que produzem a mesma saída e os mesmos erros (mensagem e linha).
+# Quando algum dos dois é interrompido pelo limite de instruções (contadas de formas diferentes),
+# exige-se apenas que a saída mais curta seja um prefixo da mais longa
+# Exemplo: py -m tascal_compiler.Tests.Interpretador.test_bytecode
+import io
+import os
+import sys
+import glob
+from tascal_compiler.parser import compila
+from tascal_compiler import bytecode, interpretador
+from tascal_compiler.interpretador import ErroExecucao, LimiteInstrucoesExcedido
+from tascal_compiler.Tests.Interpretador.test_interpretador import PASTA_PROGRAMAS, PROGRAMAS, CASOS
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+def roda(executa, programa, entrada, limite_instrucoes): # Saída e erro (ou None) de uma execução
+    saida = io.StringIO()
+    try:
+        executa(programa, io.StringIO(entrada), saida, limite_instrucoes)
+    except ErroExecucao as e:
+        return saida.getvalue(), e
+    return saida.getvalue(), None
+
+def compara(codigo, entrada, limite_instrucoes=100000, traduz=bytecode.compila, executa=bytecode.executa):
+    # None se a árvore e o programa traduzido (por padrão, bytecode) concordam, senão a diferença
+    arvore, diagnosticos = compila(codigo)
+    if arvore is None or diagnosticos.tem_erros():
+        return "erros de compilação: " + "; ".join(diagnosticos.formata())
+    saida_arvore, erro_arvore = roda(interpretador.executa, arvore, entrada, limite_instrucoes)
+    saida_vm, erro_vm = roda(executa, traduz(arvore), entrada, limite_instrucoes)
+    if isinstance(erro_arvore, LimiteInstrucoesExcedido) or isinstance(erro_vm, LimiteInstrucoesExcedido):
+        curta, longa = sorted((saida_arvore, saida_vm), key=len)
+        return None if longa.startswith(curta) else f"saídas divergem: {saida_arvore!r} x {saida_vm!r}"
+    if saida_arvore != saida_vm:
+        return f"saídas divergem: {saida_arvore!r} x {saida_vm!r}"
+    if str(erro_arvore) != str(erro_vm):
+        return f"erros divergem: {erro_arvore} x {erro_vm}"
+    return None
+
+def confere(nome, diferenca): # Imprime o resultado de um caso, devolve True se passou
+    print(f"{'OK' if diferenca is None else 'DIFERENTE':<12}{nome}")
+    if diferenca is not None:
+        print(f"  {diferenca}")
+    return diferenca is None
+
+def main():
+    print("========================================")
+    print("  TESTE DIFERENCIAL DO BYTECODE TASCAL  ")
+    print("========================================\n")
+    todos = True
+    for arquivo in sorted(glob.glob(os.path.join(PASTA_PROGRAMAS, "P[0-9]*.tascal"))):
+        nome = os.path.basename(arquivo)
+        with open(arquivo, "r", encoding="utf-8") as f:
+            codigo = f.read()
+        entrada, _ = PROGRAMAS[nome]
+        todos &= confere(nome, compara(codigo, entrada))
+    for nome, codigo, entrada, _ in CASOS:
+        todos &= confere(nome, compara(codigo, entrada))
+    todos &= confere("inteiros grandes",
+                     compara("program g; var x: integer; begin x := 3000000000; write(x * x, -x div 7) end.", ""))
+    for semente in range(10):
+        todos &= confere(f"gerado{semente}", compara(gera_programa(300, semente=semente),
+                                                     "3 1 4 1 5 9 2 6\n" * 300, 200000))
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# Script de teste do tradutor do Tascal para Python (compilador_python.py)
+# Executa os mesmos programas e casos de test_bytecode.py no code object gerado e no
+# interpretador da árvore, conferindo saídas e erros, e testa o cache de code objects:
+# acerto sem análise, invalidação quando o código muda, arquivo corrompido e programas com erros.
+# Confere também a tradução linearizada de expressões profundas demais para o compile() do CPython
+# Exemplo: py -m tascal_compiler.Tests.Interpretador.test_compilador_python
+import io
+import os
+import sys
+import glob
+import marshal
+import tempfile
+from tascal_compiler import compilador_python
+from tascal_compiler.parser import compila
+from tascal_compiler.interpretador import ErroExecucao
+from tascal_compiler.Tests.Interpretador.test_bytecode import compara, confere
+from tascal_compiler.Tests.Interpretador.test_interpretador import PASTA_PROGRAMAS, PROGRAMAS, CASOS
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+def compara_python(codigo, entrada, limite_instrucoes=100000):
+    return compara(codigo, entrada, limite_instrucoes, compilador_python.gera_codigo, compilador_python.executa)
+
+def saida_de(codigo, entrada): # Saída do code object
+    saida = io.StringIO()
+    compilador_python.executa(codigo, io.StringIO(entrada), saida)
+    return saida.getvalue()
+
+def casos_cache(): # Lista de (nome, diferença ou None)
+    resultados = []
+    with open(os.path.join(PASTA_PROGRAMAS, "P10.tascal"), "r", encoding="utf-8") as f:
+        p10 = f.read()
+    with tempfile.TemporaryDirectory() as pasta:
+        codigo, diagnosticos = compilador_python.compila_com_cache(p10, pasta)
+        resultados.append(("cache: primeira compilação analisa o programa",
+                           None if codigo is not None and diagnosticos is not None else "não compilou"))
+        codigo, diagnosticos = compilador_python.compila_com_cache(p10, pasta)
+        resultados.append(("cache: segunda compilação vem do cache",
+                           None if diagnosticos is None else "o programa foi analisado de novo"))
+        esperado = PROGRAMAS["P10.tascal"][1]
+        obtido = saida_de(codigo, "10\n")
+        resultados.append(("cache: code object carregado executa igual",
+                           None if obtido == esperado else f"{obtido!r} x {esperado!r}"))
+
+        _, diagnosticos = compilador_python.compila_com_cache(p10.replace("write(a)", "write(b)"), pasta)
+        resultados.append(("cache: código alterado é compilado de novo",
+                           None if diagnosticos is not None else "usou o code object antigo"))
+
+        for arquivo in glob.glob(os.path.join(pasta, "*.tpyc")):
+            with open(arquivo, "wb") as f:
+                f.write(b"\x00corrompido")
+        codigo, diagnosticos = compilador_python.compila_com_cache(p10, pasta)
+        obtido = saida_de(codigo, "10\n") if codigo is not None else None
+        resultados.append(("cache: arquivo corrompido é refeito",
+                           None if diagnosticos is not None and obtido == esperado else f"{obtido!r}"))
+
+        for arquivo in glob.glob(os.path.join(pasta, "*.tpyc")):
+            with open(arquivo, "wb") as f:
+                marshal.dump("não é um code object", f)
+        codigo, diagnosticos = compilador_python.compila_com_cache(p10, pasta)
+        obtido = saida_de(codigo, "10\n") if codigo is not None else None
+        resultados.append(("cache: objeto que não é code object é refeito",
+                           None if diagnosticos is not None and obtido == esperado else f"{obtido!r}"))
+
+        invalido = "program e; var x: integer; begin y := 1 end."
+        arquivos_antes = len(os.listdir(pasta))
+        codigo, diagnosticos = compilador_python.compila_com_cache(invalido, pasta)
+        resultados.append(("cache: programa com erros não é guardado",
+                           None if codigo is None and diagnosticos.tem_erros() and
+                           len(os.listdir(pasta)) == arquivos_antes else "guardou ou não informou os erros"))
+    return resultados
+
+def profunda(termos, operador, ultimo): # Saída (ou erro) de um write com uma expressão de muitos termos
+    arvore, _ = compila("program p; var x, z: integer; b: boolean; begin x := 7; b := true;\n"
+                        f"write({f' {operador} '.join(['x = 7'] * termos)} {operador} ({ultimo}))\nend.")
+    saida = io.StringIO()
+    try:
+        compilador_python.executa(compilador_python.gera_codigo(arvore), io.StringIO(), saida)
+    except ErroExecucao as e:
+        return str(e)
+    return saida.getvalue()
+
+def casos_profundos(): # Lista de (nome, diferença ou None) das expressões linearizadas
+    resultados = []
+    for nome, termos, operador, ultimo, esperado in (
+            ("expressão profunda: and", 20000, "and", "x div 7 = 1", "true\n"),
+            ("expressão profunda: or em curto-circuito", 20000, "or", "x div z = 1", "true\n"),
+            ("expressão profunda: linha da divisão por zero", 2000, "and", "x div z = 1",
+             "ERRO DE EXECUÇÃO na linha 2: divisão por zero")):
+        obtido = profunda(termos, operador, ultimo)
+        resultados.append((nome, None if obtido == esperado else f"{obtido!r} x {esperado!r}"))
+    return resultados
+
+def main():
+    print("========================================")
+    print("  TESTE DO TRADUTOR TASCAL -> PYTHON  ")
+    print("========================================\n")
+    todos = True
+    for arquivo in sorted(glob.glob(os.path.join(PASTA_PROGRAMAS, "P[0-9]*.tascal"))):
+        nome = os.path.basename(arquivo)
+        with open(arquivo, "r", encoding="utf-8") as f:
+            codigo = f.read()
+        entrada, _ = PROGRAMAS[nome]
+        todos &= confere(nome, compara_python(codigo, entrada))
+    for nome, codigo, entrada, _ in CASOS:
+        todos &= confere(nome, compara_python(codigo, entrada))
+    todos &= confere("div aninhado com operandos compostos",
+                     compara_python("program d; var a, b: integer; begin a := -17; b := 3;\n"
+                                    "write((a - 1) div (b + 2) div -(b - 1), a div b * b) end.", ""))
+    for semente in range(10):
+        todos &= confere(f"gerado{semente}", compara_python(gera_programa(300, semente=semente),
+                                                            "3 1 4 1 5 9 2 6\n" * 300, 200000))
+    for nome, diferenca in casos_cache() + casos_profundos():
+        todos &= confere(nome, diferenca)
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Script de teste do interpretador do Tascal (interpretador.py)
+# Executa os programas válidos de Tests/Parser/ProgramasTascalTeste com entradas fixas e
+# confere a saída, além de casos de execução específicos (div, entrada, limite de instruções)
+# Exemplo: py -m tascal_compiler.Tests.Interpretador.test_interpretador
+import io
+import os
+import sys
+import glob
+from tascal_compiler.parser import compila
+from tascal_compiler.interpretador import executa, ErroExecucao, LimiteInstrucoesExcedido
+
+PASTA_PROGRAMAS = os.path.join(os.path.dirname(__file__), "..", "Parser", "ProgramasTascalTeste")
+
+# Entrada e saída esperada de cada programa válido
+PROGRAMAS = {
+    "P1.tascal": ("", "42\n"),
+    "P2.tascal": ("", "14\n"),
+    "P3.tascal": ("", "true\n"),
+    "P4.tascal": ("7 2\n", "3\n"),
+    "P5.tascal": ("", "true\n"),
+    "P6.tascal": ("", "false\n"),
+    "P7.tascal": ("", "10\n"),
+    "P8.tascal": ("", "true\n"),
+    "P9.tascal": ("3\n4\n", "7 12 true\n"),
+    "P10.tascal": ("10\n", "0\n1\n1\n2\n3\n5\n8\n"),
+}
+
+# Casos específicos: (nome, código, entrada, saída esperada ou classe do erro esperado)
+CASOS = [
+    ("div trunca em direção a zero",
+     "program d; var a, b: integer; begin a := -7; b := 2; write(a div b, 7 div -2, -7 div -2) end.",
+     "", "-3 -3 3\n"),
+    ("divisão por zero",
+     "program z; var a: integer; begin a := 0; write(1 div a) end.",
+     "", ErroExecucao),
+    ("read de boolean e inteiro negativo",
+     "program r; var b: boolean; x: integer; begin read(b, x); write(not b, -x) end.",
+     "false -5", "true 5\n"),
+    ("entrada inválida",
+     "program r; var x: integer; begin read(x) end.",
+     "abc\n", ErroExecucao),
+    ("fim da entrada",
+     "program r; var x, y: integer; begin read(x, y) end.",
+     "1\n", ErroExecucao),
+    ("laço infinito interrompido pelo limite",
+     "program l; var x: integer; begin x := 0; while true do x := x + 1 end.",
+     "", LimiteInstrucoesExcedido),
+    ("laço infinito com corpo vazio",
+     "program l; begin while true do end.",
+     "", LimiteInstrucoesExcedido),
+    ("variáveis começam com 0 e false",
+     "program v; var x: integer; b: boolean; begin write(x, b) end.",
+     "", "0 false\n"),
+    ("expressões com 3000 termos", # Árvores mais fundas que o limite de recursão do Python
+     "program s; var x: integer; b: boolean; begin x := 1;\n"
+     f"x := {' + '.join(['x'] * 3000)};\nb := {' and '.join(['(x > 0)'] * 3000)} or (x div 0 = 1);\n"
+     f"write(x, b, {' - '.join(['x'] * 3000)}) end.",
+     "", "3000 true -8994000\n"),
+]
+
+def roda(codigo, entrada, limite_instrucoes=100000): # Saída do programa, ou a exceção levantada
+    arvore, diagnosticos = compila(codigo)
+    if arvore is None or diagnosticos.tem_erros():
+        return "erros de compilação: " + "; ".join(diagnosticos.formata())
+    saida = io.StringIO()
+    try:
+        executa(arvore, io.StringIO(entrada), saida, limite_instrucoes)
+    except ErroExecucao as e:
+        return e
+    return saida.getvalue()
+
+def confere(nome, obtido, esperado): # Imprime o resultado de um caso, devolve True se passou
+    if isinstance(esperado, type):
+        passou = isinstance(obtido, esperado)
+    else:
+        passou = obtido == esperado
+    print(f"{'OK' if passou else 'FALHOU':<8}{nome}")
+    if not passou:
+        print(f"  esperado: {esperado!r}")
+        print(f"  obtido:   {obtido!r}")
+    return passou
+
+def main():
+    print("========================================")
+    print("  TESTE DO INTERPRETADOR TASCAL  ")
+    print("========================================\n")
+    todos = True
+    arquivos = sorted(glob.glob(os.path.join(PASTA_PROGRAMAS, "P[0-9]*.tascal")))
+    for arquivo in arquivos:
+        nome = os.path.basename(arquivo)
+        with open(arquivo, "r", encoding="utf-8") as f:
+            codigo = f.read()
+        entrada, esperado = PROGRAMAS[nome]
+        todos &= confere(nome, roda(codigo, entrada), esperado)
+    for nome, codigo, entrada, esperado in CASOS:
+        todos &= confere(nome, roda(codigo, entrada), esperado)
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
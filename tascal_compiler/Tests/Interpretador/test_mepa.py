@@ -0,0 +1,66 @@
+# Script de teste do gerador de MEPA e do executor de MEPA (mepa.py)
+# Executa os mesmos programas e casos de test_bytecode.py no código MEPA pré-decodificado e no
+# interpretador da árvore, conferindo saídas e erros. Também confere que o texto MEPA gerado,
+# montado de volta, produz a mesma saída e que o montador rejeita textos inválidos
+# Exemplo: py -m tascal_compiler.Tests.Interpretador.test_mepa
+import os
+import sys
+import glob
+from tascal_compiler import mepa
+from tascal_compiler.parser import compila
+from tascal_compiler.Tests.Interpretador.test_bytecode import compara, confere, roda
+from tascal_compiler.Tests.Interpretador.test_interpretador import PASTA_PROGRAMAS, PROGRAMAS, CASOS
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+def compara_mepa(codigo, entrada, limite_instrucoes=100000):
+    return compara(codigo, entrada, limite_instrucoes, lambda arvore: mepa.gera(arvore).monta(), mepa.executa)
+
+def compara_texto(codigo, entrada): # O texto MEPA, montado de novo, executa igual ao código gerado
+    arvore, _ = compila(codigo)
+    gerado = mepa.gera(arvore)
+    saida_gerado, erro_gerado = roda(mepa.executa, gerado.monta(), entrada, 100000)
+    saida_texto, erro_texto = roda(mepa.executa, mepa.monta(gerado.texto()), entrada, 100000)
+    if saida_gerado != saida_texto:
+        return f"saídas divergem: {saida_gerado!r} x {saida_texto!r}"
+    if type(erro_gerado) is not type(erro_texto):
+        return f"erros divergem: {erro_gerado} x {erro_texto}"
+    return None
+
+def rejeita(texto): # None se o montador rejeita o texto
+    try:
+        mepa.monta(texto)
+    except mepa.ErroMontagem:
+        return None
+    return "texto inválido foi aceito"
+
+def main():
+    print("========================================")
+    print("  TESTE DO GERADOR E EXECUTOR DE MEPA  ")
+    print("========================================\n")
+    todos = True
+    for arquivo in sorted(glob.glob(os.path.join(PASTA_PROGRAMAS, "P[0-9]*.tascal"))):
+        nome = os.path.basename(arquivo)
+        with open(arquivo, "r", encoding="utf-8") as f:
+            codigo = f.read()
+        entrada, _ = PROGRAMAS[nome]
+        todos &= confere(nome, compara_mepa(codigo, entrada))
+        todos &= confere(f"{nome} (texto)", compara_texto(codigo, entrada))
+    for nome, codigo, entrada, _ in CASOS:
+        todos &= confere(nome, compara_mepa(codigo, entrada))
+    todos &= confere("inteiros grandes",
+                     compara_mepa("program g; var x: integer; begin x := 3000000000; write(x * x, -x div 7) end.", ""))
+    todos &= confere("and/or com div à direita não avalia o lado direito",
+                     compara_mepa("program c; var a: integer; b: boolean; begin a := 0;\n"
+                                  "b := (a = 0) or (1 div a = 1); write(b, (a <> 0) and (1 div a = 1)) end.", ""))
+    for semente in range(10):
+        todos &= confere(f"gerado{semente}", compara_mepa(gera_programa(300, semente=semente),
+                                                          "3 1 4 1 5 9 2 6\n" * 300, 200000))
+    todos &= confere("montador: instrução desconhecida", rejeita("INPP\nXYZW\nPARA\n"))
+    todos &= confere("montador: rótulo não definido", rejeita("INPP\nDSVS L9\nPARA\n"))
+    todos &= confere("montador: nível diferente de 0", rejeita("INPP\nAMEM 1\nCRVL 1,0\nPARA\n"))
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
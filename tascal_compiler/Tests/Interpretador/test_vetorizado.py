@@ -0,0 +1,91 @@
+# Script de teste diferencial da execução vetorizada (vetorizado.py) contra o interpretador da árvore
+# Executa cada programa P*.tascal, os casos de test_interpretador.py e programas gerados sobre um
+# lote de entradas (válidas, inválidas, incompletas, com divisão por zero e com inteiros fora do
+# int64) e confere, pista a pista, a saída, o erro (mensagem e linha) e o número de instruções
+# Requer o NumPy; sem ele, o teste é ignorado
+# Exemplo: py -m tascal_compiler.Tests.Interpretador.test_vetorizado
+import io
+import os
+import sys
+import glob
+import random
+import importlib.util
+from tascal_compiler.parser import compila
+from tascal_compiler import interpretador
+from tascal_compiler.interpretador import ErroExecucao
+from tascal_compiler.Tests.Interpretador.test_bytecode import confere
+from tascal_compiler.Tests.Interpretador.test_interpretador import PASTA_PROGRAMAS, PROGRAMAS, CASOS
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+TEM_NUMPY = importlib.util.find_spec("numpy") is not None
+if TEM_NUMPY: # vetorizado importa o NumPy
+    from tascal_compiler import vetorizado
+
+ENTRADAS = [ # Entradas de todos os lotes, além da entrada do próprio programa
+    "", "0 0", "7 -2\n", "-7\n2", "1", "abc 1", "2 abc", "true 3", "false true",
+    f"{10 ** 18} 3", f"{2 ** 63 - 1} 1", f"{-2 ** 63} -1", f"{10 ** 30}", "3037000500 3037000500",
+    [3, 4], [True, 5], ["-8", "3"],
+]
+
+def lote(entrada_programa, pistas=200, semente=0): # Entradas de um lote, com pistas aleatórias
+    rnd = random.Random(semente)
+    entradas = [entrada_programa] + ENTRADAS
+    while len(entradas) < pistas:
+        valores = [str(rnd.randint(-30, 30)) for _ in range(rnd.randint(0, 8))]
+        entradas.append(" ".join(valores))
+    return entradas
+
+def escalar(programa, entrada, limite_instrucoes): # Saída, erro e instruções no interpretador da árvore
+    saida = io.StringIO()
+    execucao = interpretador.Interpretador(programa, io.StringIO(entrada) if isinstance(entrada, str)
+                                           else entrada, saida, limite_instrucoes)
+    try:
+        execucao.executa()
+    except ErroExecucao as e:
+        return saida.getvalue(), str(e), execucao.instrucoes
+    return saida.getvalue(), str(None), execucao.instrucoes
+
+def compara(codigo, entradas, limite_instrucoes=100000):
+    # None se a execução vetorizada concorda com o interpretador em todas as pistas, senão a diferença
+    programa, diagnosticos = compila(codigo)
+    if programa is None or diagnosticos.tem_erros():
+        return "erros de compilação: " + "; ".join(diagnosticos.formata())
+    resultado = vetorizado.executa_lote(programa, entradas, limite_instrucoes)
+    saidas = resultado.saidas()
+    for pista, entrada in enumerate(entradas):
+        esperado = escalar(programa, entrada, limite_instrucoes)
+        obtido = (saidas[pista], str(resultado.erros[pista]), int(resultado.instrucoes[pista]))
+        if obtido != esperado:
+            return f"pista {pista} ({entrada!r}): {obtido!r} x {esperado!r}"
+        if resultado.saida(pista) != saidas[pista]:
+            return f"pista {pista} ({entrada!r}): saida() e saidas() divergem"
+    return None
+
+def main():
+    print("========================================")
+    print("  TESTE DA EXECUÇÃO VETORIZADA TASCAL  ")
+    print("========================================\n")
+    if not TEM_NUMPY:
+        print("NumPy não instalado: teste da execução vetorizada ignorado.")
+        sys.exit(0)
+    todos = True
+    for arquivo in sorted(glob.glob(os.path.join(PASTA_PROGRAMAS, "P[0-9]*.tascal"))):
+        nome = os.path.basename(arquivo)
+        with open(arquivo, "r", encoding="utf-8") as f:
+            codigo = f.read()
+        entrada, _ = PROGRAMAS[nome]
+        todos &= confere(nome, compara(codigo, lote(entrada)))
+    for nome, codigo, entrada, _ in CASOS:
+        todos &= confere(nome, compara(codigo, lote(entrada, 40), 1000))
+    todos &= confere("constante fora do int64",
+                     compara("program g; var x: integer; begin read(x); write(x * 100000000000000000000) end.",
+                             lote("2", 20)))
+    for semente in range(5):
+        entradas = ["3 1 4 1 5 9 2 6\n" * 300] + [" ".join(str(valor) for valor in range(semente, semente + 2400))] * 3
+        todos &= confere(f"gerado{semente}", compara(gera_programa(300, semente=semente), entradas, 200000))
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
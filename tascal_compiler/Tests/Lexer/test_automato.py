@@ -0,0 +1,97 @@
+# Script de teste diferencial do lexer por autômato (automato.py) contra o lexer do PLY (lexer.py)
+# Confere, em todos os programas de teste, em programas gerados (válidos e com erros) e em casos
+# de borda, que os dois lexers devolvem os mesmos tokens (tipo, valor, linha e posição), param no
+# mesmo símbolo ilegal com o mesmo LexError e registram os mesmos diagnósticos, token a token e
+# com tokenize_all; e que a compilação com motor_lexico='afd' dá a mesma árvore e os mesmos erros
+# Exemplo: py -m tascal_compiler.Tests.Lexer.test_automato
+import os
+import sys
+import glob
+from tascal_compiler.parser import parser, ContextoCompilacao
+from tascal_compiler.lex import LexError
+from tascal_compiler import parser_especializado
+from tascal_compiler.arvore import iguais
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa, gera_programa_com_erros
+
+PASTA_TESTES = os.path.dirname(os.path.dirname(__file__))
+
+CASOS = [ # Casos de borda: (nome, código)
+    ("vazio", ""),
+    ("só espaços", " \t \n\n\t"),
+    ("sem quebra no fim", "program p; begin end."),
+    ("operadores colados", "x:=y<>z<=w>=v<u>t=s:r;(a+b-c*d),e."),
+    ("menor maior igual", "<>= <= >= =< => :== ::="),
+    ("número e identificador", "12abc 007 x_1 a__b Begin BEGIN begin1 do_ ifx"),
+    ("sublinhado inicial", "x := _y"),
+    ("comentário", "x { um comentário } y"),
+    ("comentário em várias linhas", "a\n{ linha 1\nlinha 2\n}\nb\nc"),
+    ("comentário com acentos", "a { ação, não é permitido } b"),
+    ("comentário sem fim", "a := 1;\n{ sem fim\nb"),
+    ("chave fechando sozinha", "a } b"),
+    ("caractere ilegal", "program p;\nbegin\n  x := 1 # 2\nend."),
+    ("fora do ASCII", "x := ç"),
+    ("retorno de carro", "program p;\r\nbegin end."),
+    ("quebras seguidas", "a\n\n\n\nb\n\nc"),
+]
+
+def tokens(lexer, codigo, colunar): # Tokens, o LexError que parou a análise e os diagnósticos
+    lexer.lineno = 1
+    lista = []
+    try:
+        for token in (lexer.tokenize_all(codigo) if colunar else (lexer.input(codigo) or lexer)):
+            lista.append((token.type, token.value, token.lineno, token.lexpos))
+    except LexError as e:
+        return lista, (str(e), e.text), [(d.codigo, d.linha, d.coluna, d.argumentos) for d in lexer.diagnosticos]
+    return lista, None, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in lexer.diagnosticos]
+
+def compila(codigo, motor_lexico, parse, colunar): # Árvore (ou a exceção) e diagnósticos da compilação
+    contexto = ContextoCompilacao(motor_lexico=motor_lexico)
+    try:
+        resultado = contexto.compila(codigo, parse=parse, colunar=colunar)
+    except Exception as e:
+        resultado = f"{type(e).__name__}: {e}"
+    return resultado, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in contexto.diagnosticos]
+
+def compara(nome, codigo): # Compara os dois lexers em um código, retorna True se forem iguais
+    diferencas = []
+    for colunar in (False, True):
+        esperado = tokens(ContextoCompilacao(motor_lexico='ply').lexer, codigo, colunar)
+        obtido = tokens(ContextoCompilacao(motor_lexico='afd').lexer, codigo, colunar)
+        if esperado != obtido:
+            diferencas.append(("tokenize_all" if colunar else "token()", esperado, obtido))
+    for parse, colunar in ((parser.parse, False), (parser.parse, True), (parser_especializado.parse, False),
+                           (parser_especializado.parse, True)):
+        esperado = compila(codigo, 'ply', parse, colunar)
+        obtido = compila(codigo, 'afd', parse, colunar)
+        if not iguais(esperado[0], obtido[0]) or esperado[1] != obtido[1]:
+            diferencas.append((f"compilação (colunar={colunar})", esperado, obtido))
+    if not diferencas:
+        print(f"OK          {nome}")
+        return True
+    print(f"DIFERENTE   {nome}")
+    for etapa, esperado, obtido in diferencas:
+        print(f"  {etapa}:")
+        print(f"    ply: {esperado!r}")
+        print(f"    afd: {obtido!r}")
+    return False
+
+def main():
+    print("========================================")
+    print("  TESTE DO LEXER POR AUTÔMATO TASCAL  ")
+    print("========================================\n")
+    todos = True
+    for pasta in ("Lexer", "Parser"):
+        for arquivo in sorted(glob.glob(os.path.join(PASTA_TESTES, pasta, "ProgramasTascalTeste", "*.tascal"))):
+            with open(arquivo, "r", encoding="utf-8") as f:
+                todos &= compara(f"{pasta}/{os.path.basename(arquivo)}", f.read())
+    for nome, codigo in CASOS:
+        todos &= compara(nome, codigo)
+    for semente in range(3):
+        todos &= compara(f"gerado{semente}", gera_programa(300, semente=semente))
+        todos &= compara(f"gerado_com_erros{semente}", gera_programa_com_erros(300, semente=semente))
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Script de teste da leitura em fluxo do lexer por autômato (Automato.input_stream e tokens_stream)
+# Confere, em todos os programas de teste, em programas gerados e nos casos de borda do
+# test_automato, que ler o código aos poucos (de bytes, mmap, arquivos em modo texto e binário,
+# com blocos de vários tamanhos, inclusive de um caractere) dá os mesmos tokens, o mesmo erro
+# léxico e os mesmos diagnósticos que input(), e que compila_fluxo dá a mesma árvore que compila
+# Exemplo: py -m tascal_compiler.Tests.Lexer.test_fluxo
+import io
+import os
+import sys
+import glob
+import mmap
+import tempfile
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.lex import LexError
+from tascal_compiler import parser_especializado
+from tascal_compiler.arvore import iguais
+from tascal_compiler.Tests.Lexer.test_automato import CASOS
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa, gera_programa_com_erros
+
+PASTA_TESTES = os.path.dirname(os.path.dirname(__file__))
+TAMANHOS_BLOCO = (1, 2, 3, 7, 64)
+
+CASOS_FLUXO = CASOS + [ # Casos em que o fim de um bloco cai no meio de algo
+    ("acentos (utf-8 em vários bytes)", "program ação;\nbegin\n  x := 1 { é }\nend."),
+    ("identificador longo", "x := " + "a" * 300 + " + 1"),
+    ("número longo", "x := " + "9" * 200),
+    ("comentário longo sem fim", "x := 1;\n{" + "abc\n" * 100),
+]
+
+def tokens(iteravel, lexer): # Tokens, a mensagem do LexError que parou a análise e os diagnósticos
+    lista = []
+    erro = None
+    try:
+        for token in iteravel:
+            lista.append((token.type, token.value, token.lineno, token.lexpos))
+    except LexError as e:
+        erro = str(e)
+    return lista, erro, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in lexer.diagnosticos]
+
+def compila(codigo=None, fonte=None): # Árvore (ou a exceção) e diagnósticos, por compila ou compila_fluxo
+    contexto = ContextoCompilacao(motor_lexico='afd')
+    try:
+        if fonte is None:
+            resultado = contexto.compila(codigo, parse=parser_especializado.parse)
+        else:
+            resultado = contexto.compila_fluxo(fonte, parse=parser_especializado.parse, tamanho_bloco=5)
+    except Exception as e:
+        resultado = f"{type(e).__name__}: {e}"
+    return resultado, list(contexto.diagnosticos.formata())
+
+def fecha(fonte): # Fecha a fonte, se for um arquivo ou mmap
+    if hasattr(fonte, "close"):
+        fonte.close()
+
+def mapeia(arquivo): # mmap do arquivo inteiro, só para leitura
+    with open(arquivo, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def fontes(codigo, arquivo): # Fontes do mesmo código: (nome, função que abre a fonte)
+    yield "bytes", lambda: codigo.encode("utf-8")
+    yield "bytearray", lambda: bytearray(codigo.encode("utf-8"))
+    yield "StringIO", lambda: io.StringIO(codigo)
+    yield "arquivo texto", lambda: open(arquivo, "r", encoding="utf-8", newline="") # Sem traduzir \r\n
+    yield "arquivo binário", lambda: open(arquivo, "rb")
+    if codigo: # Não dá para mapear um arquivo vazio
+        yield "mmap", lambda: mapeia(arquivo)
+
+def compara(nome, codigo, pasta): # Compara a leitura em fluxo com input(), retorna True se forem iguais
+    arquivo = os.path.join(pasta, "programa.tascal")
+    with open(arquivo, "w", encoding="utf-8", newline="") as f:
+        f.write(codigo)
+    lexer = ContextoCompilacao(motor_lexico='afd').lexer
+    lexer.input(codigo)
+    esperado = tokens(lexer, lexer)
+    arvore, diagnosticos = compila(codigo)
+
+    diferencas = []
+    for fonte, abre in fontes(codigo, arquivo):
+        for tamanho in TAMANHOS_BLOCO:
+            lexer = ContextoCompilacao(motor_lexico='afd').lexer
+            fonte_aberta = abre()
+            obtido = tokens(lexer.tokens_stream(fonte_aberta, tamanho), lexer)
+            fecha(fonte_aberta)
+            if obtido != esperado:
+                diferencas.append((f"tokens ({fonte}, blocos de {tamanho})", esperado, obtido))
+                break
+        fonte_aberta = abre()
+        obtida, obtidos = compila(fonte=fonte_aberta)
+        fecha(fonte_aberta)
+        if not iguais(arvore, obtida) or obtidos != diagnosticos:
+            diferencas.append((f"compila_fluxo ({fonte})", (arvore, diagnosticos), (obtida, obtidos)))
+    if not diferencas:
+        print(f"OK          {nome}")
+        return True
+    print(f"DIFERENTE   {nome}")
+    for etapa, esperado, obtido in diferencas:
+        print(f"  {etapa}:")
+        print(f"    input():  {esperado!r}")
+        print(f"    em fluxo: {obtido!r}")
+    return False
+
+def main():
+    print("========================================")
+    print("  TESTE DO LEXER EM FLUXO TASCAL  ")
+    print("========================================\n")
+    todos = True
+    with tempfile.TemporaryDirectory() as pasta:
+        for pasta_testes in ("Lexer", "Parser"):
+            for arquivo in sorted(glob.glob(os.path.join(PASTA_TESTES, pasta_testes, "ProgramasTascalTeste", "*.tascal"))):
+                with open(arquivo, "r", encoding="utf-8") as f:
+                    todos &= compara(f"{pasta_testes}/{os.path.basename(arquivo)}", f.read(), pasta)
+        for nome, codigo in CASOS_FLUXO:
+            todos &= compara(nome, codigo, pasta)
+        todos &= compara("gerado", gera_programa(100, semente=0), pasta)
+        todos &= compara("gerado_com_erros", gera_programa_com_erros(100, semente=0), pasta)
+
+        try: # Um contexto com o lexer do PLY não tem o modo de fluxo
+            ContextoCompilacao(motor_lexico='ply').compila_fluxo(b"program p; begin end.")
+            print("DIFERENTE   compila_fluxo com motor_lexico='ply' não deu ValueError")
+            todos = False
+        except ValueError:
+            print("OK          compila_fluxo com motor_lexico='ply'")
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 # Script de teste para o analisador léxico do Tascal
 import sys, os
 from tascal_compiler.lexer import lexico
+from tascal_compiler.diagnosticos import Diagnosticos
 
 # Se não passar argumento, usa o arquivo padrão
 arquivo = sys.argv[1] 
@@ -17,13 +18,18 @@ print("  ANÁLISE LÉXICA TASCAL  ")
 print("========================================\n")
 print(f"Arquivo: {os.path.basename(arquivo)}\n")
 
-# Alimenta o analisador léxico
+# Alimenta o analisador léxico, com um coletor novo para os erros léxicos deste arquivo
+lexico.diagnosticos = Diagnosticos()
 lexico.input(data)
 
 # Itera sobre os tokens e imprime cada um
 print("\n--- TOKENS RECONHECIDOS ---\n")
-for token in lexico:
-    print(f"{token.type:<12} -> {token.value}")
+try:
+    for token in lexico:
+        print(f"{token.type:<12} -> {token.value}")
+finally:
+    for linha in lexico.diagnosticos.formata(): # Exibe os erros léxicos encontrados
+        print(linha)
 
 print("\n========================================")
 print("        ANÁLISE FINALIZADA              ")  
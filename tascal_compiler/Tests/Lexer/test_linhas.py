@@ -0,0 +1,100 @@
+# Script de teste das linhas e colunas calculadas pelo índice das quebras de linha
+# Confere, nos dois motores léxicos (lexer.py e automato.py), token a token e com tokenize_all,
+# que a linha e a coluna de cada token e de cada diagnóstico léxico são as esperadas, inclusive
+# depois de comentários de várias linhas; e que line()/column() batem, em todas as posições dos
+# programas de teste, com a contagem direta das quebras de linha
+# Exemplo: py -m tascal_compiler.Tests.Lexer.test_linhas
+import os
+import sys
+import glob
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.lex import LexError, newline_offsets
+
+PASTA_TESTES = os.path.dirname(os.path.dirname(__file__))
+MOTORES = ('ply', 'afd')
+
+CASOS = [ # (nome, código, [(valor, linha, coluna) de cada token], [(código, linha, coluna) dos diagnósticos])
+    ("uma linha", "x := 1",
+     [("x", 1, 1), (":=", 1, 3), (1, 1, 6)], []),
+    ("várias linhas", "a\n  b\n\n\tc",
+     [("a", 1, 1), ("b", 2, 3), ("c", 4, 2)], []),
+    ("comentário de várias linhas", "a\n{ linha 1\nlinha 2\n}\nb\nc",
+     [("a", 1, 1), ("b", 5, 1), ("c", 6, 1)], [("LEX002", 2, 1)]),
+    ("comentário no meio da linha", "a { um\ndois } b\nc",
+     [("a", 1, 1), ("b", 2, 8), ("c", 3, 1)], [("LEX002", 1, 3)]),
+    ("dois comentários", "{\n}{\n\n}x",
+     [("x", 4, 2)], [("LEX002", 1, 1), ("LEX002", 2, 2)]),
+    ("símbolo ilegal depois de comentário", "a {\n\n}\n  # b",
+     [("a", 1, 1)], [("LEX002", 1, 3), ("LEX001", 4, 3)]),
+    ("quebra no início e no fim", "\n\nx\n\n",
+     [("x", 3, 1)], []),
+]
+
+def tokens(motor, codigo, colunar): # (valor, linha, coluna) dos tokens e (código, linha, coluna) dos diagnósticos
+    lexer = ContextoCompilacao(motor_lexico=motor).lexer
+    lista = []
+    try:
+        for token in (lexer.tokenize_all(codigo) if colunar else (lexer.input(codigo) or lexer)):
+            lista.append((token.value, token.lineno, lexer.column(token.lexpos)))
+    except LexError:
+        pass
+    return lista, [(d.codigo, d.linha, d.coluna) for d in lexer.diagnosticos]
+
+def posicoes(motor, codigo): # Posições em que line()/column() não batem com a contagem direta
+    lexer = ContextoCompilacao(motor_lexico=motor).lexer
+    lexer.input(codigo)
+    erradas = []
+    for lexpos in range(len(codigo) + 1):
+        linha = codigo.count("\n", 0, lexpos) + 1
+        coluna = lexpos - codigo.rfind("\n", 0, lexpos)
+        if (lexer.line(lexpos), lexer.column(lexpos)) != (linha, coluna):
+            erradas.append((lexpos, linha, coluna, lexer.line(lexpos), lexer.column(lexpos)))
+    return erradas
+
+def main():
+    print("========================================")
+    print("  TESTE DAS LINHAS E COLUNAS TASCAL  ")
+    print("========================================\n")
+    todos = True
+    for nome, codigo, esperados, diagnosticos in CASOS:
+        for motor in MOTORES:
+            for colunar in (False, True):
+                obtido = tokens(motor, codigo, colunar)
+                rotulo = f"{nome} ({motor}, {'tokenize_all' if colunar else 'token()'})"
+                if obtido == (esperados, diagnosticos):
+                    print(f"OK          {rotulo}")
+                else:
+                    print(f"DIFERENTE   {rotulo}")
+                    print(f"    esperado: {(esperados, diagnosticos)!r}")
+                    print(f"    obtido:   {obtido!r}")
+                    todos = False
+
+    programas = sorted(glob.glob(os.path.join(PASTA_TESTES, "*", "ProgramasTascalTeste", "*.tascal")))
+    for arquivo in programas:
+        with open(arquivo, "r", encoding="utf-8") as f:
+            codigo = f.read()
+        for motor in MOTORES:
+            erradas = posicoes(motor, codigo)
+            rotulo = f"line/column {os.path.basename(arquivo)} ({motor})"
+            if erradas:
+                print(f"DIFERENTE   {rotulo}: {erradas[:3]!r}")
+                todos = False
+            else:
+                print(f"OK          {rotulo}")
+
+    for codigo in ("", "\n", "a", "a\nb", "\n\n", "ab\n\ncd\n"): # Índice das quebras de linha
+        esperado = [i for i, c in enumerate(codigo) if c == "\n"]
+        for inicio in (0, 10):
+            obtido = list(newline_offsets(codigo, inicio))
+            rotulo = f"newline_offsets({codigo!r}, {inicio})"
+            if obtido == [inicio + i for i in esperado]:
+                print(f"OK          {rotulo}")
+            else:
+                print(f"DIFERENTE   {rotulo}: {obtido!r}")
+                todos = False
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
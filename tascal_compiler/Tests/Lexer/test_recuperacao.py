@@ -0,0 +1,116 @@
+# Script de teste do modo de recuperação de erros léxicos (recupera_erros_lexicos=True)
+# Confere, nos dois motores léxicos, token a token e com tokenize_all, que os símbolos ilegais
+# são pulados com os diagnósticos esperados e a análise continua; que os dois motores dão os
+# mesmos tokens e diagnósticos em programas com erros léxicos espalhados (também na compilação
+# e na leitura em fluxo); e que, sem a recuperação, a análise continua parando no primeiro erro
+# Exemplo: py -m tascal_compiler.Tests.Lexer.test_recuperacao
+import sys
+import random
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.lex import LexError
+from tascal_compiler import parser_especializado
+from tascal_compiler.arvore import iguais
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+MOTORES = ('ply', 'afd')
+
+CASOS = [ # (nome, código, [valores dos tokens], [(código, linha, coluna, argumentos) dos diagnósticos])
+    ("símbolo ilegal", "a # b",
+     ["a", "b"], [("LEX001", 1, 3, ("#",))]),
+    ("sequência de ilegais", "a #$%? b",
+     ["a", "b"], [("LEX004", 1, 3, ("#$%?",))]),
+    ("sequência longa", "x" + "#" * 50 + "y",
+     ["x", "y"], [("LEX004", 1, 2, ("#" * 20 + "...",))]),
+    ("sublinhado e chave fechando", "_a }} b",
+     ["a", "b"], [("LEX001", 1, 1, ("_",)), ("LEX004", 1, 4, ("}}",))]),
+    ("fora do ASCII", "x := ação;",
+     ["x", ":=", "a", "o", ";"], [("LEX004", 1, 7, ("çã",))]),
+    ("retorno de carro", "a\r\nb",
+     ["a", "b"], [("LEX001", 1, 2, ("\r",))]),
+    ("comentário sem fim", "a\n{ sem fim\nb c",
+     ["a"], [("LEX003", 2, 1, ())]),
+    ("comentário antes de ilegal", "{ x\n} # y",
+     ["y"], [("LEX002", 1, 1, ()), ("LEX001", 2, 3, ("#",))]),
+    ("vários '{' sem fim", "a {{{{ b",
+     ["a"], [("LEX003", 1, 3, ())]),
+]
+
+def tokens(motor, codigo, colunar, recupera): # Valores dos tokens, o LexError (ou None) e os diagnósticos
+    lexer = ContextoCompilacao(motor_lexico=motor, recupera_erros_lexicos=recupera).lexer
+    lista = []
+    erro = None
+    try:
+        for token in (lexer.tokenize_all(codigo) if colunar else (lexer.input(codigo) or lexer)):
+            lista.append((token.type, token.value, token.lineno, token.lexpos))
+    except LexError as e:
+        erro = (str(e), e.text)
+    return lista, erro, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in lexer.diagnosticos]
+
+def compila(motor, codigo): # Árvore (ou a exceção) e diagnósticos da compilação com recuperação
+    contexto = ContextoCompilacao(motor_lexico=motor, recupera_erros_lexicos=True)
+    try:
+        resultado = contexto.compila(codigo, parse=parser_especializado.parse)
+    except Exception as e:
+        resultado = f"{type(e).__name__}: {e}"
+    return resultado, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in contexto.diagnosticos]
+
+def espalha_erros(codigo, semente): # Insere símbolos ilegais e comentários em posições sorteadas
+    rnd = random.Random(semente)
+    pedacos = list(codigo)
+    for _ in range(len(codigo) // 40):
+        i = rnd.randrange(len(pedacos))
+        pedacos[i] += rnd.choice(["#", " @@ ", "_", "}", "ç", "\r", "{ c }", "{\n}", "$%&"])
+    if semente % 2:
+        pedacos.append("\n{ sem fim\nx := 1;")
+    return "".join(pedacos)
+
+def confere(rotulo, esperado, obtido):
+    if esperado == obtido:
+        print(f"OK          {rotulo}")
+        return True
+    print(f"DIFERENTE   {rotulo}")
+    print(f"    esperado: {esperado!r}")
+    print(f"    obtido:   {obtido!r}")
+    return False
+
+def main():
+    print("========================================")
+    print("  TESTE DA RECUPERAÇÃO DE ERROS LÉXICOS  ")
+    print("========================================\n")
+    todos = True
+    for nome, codigo, valores, diagnosticos in CASOS:
+        for motor in MOTORES:
+            for colunar in (False, True):
+                lista, erro, obtidos = tokens(motor, codigo, colunar, True)
+                rotulo = f"{nome} ({motor}, {'tokenize_all' if colunar else 'token()'})"
+                todos &= confere(rotulo, (valores, None, diagnosticos), ([t[1] for t in lista], erro, obtidos))
+
+    for semente in range(4):
+        codigo = espalha_erros(gera_programa(150, semente=semente), semente)
+        for colunar in (False, True):
+            rotulo = f"ply x afd, erros espalhados {semente} ({'tokenize_all' if colunar else 'token()'})"
+            todos &= confere(rotulo, tokens('ply', codigo, colunar, True), tokens('afd', codigo, colunar, True))
+        esperado = compila('ply', codigo)
+        obtido = compila('afd', codigo)
+        rotulo = f"ply x afd, compilação com erros espalhados {semente}"
+        if iguais(esperado[0], obtido[0]) and esperado[1] == obtido[1]:
+            print(f"OK          {rotulo}")
+        else:
+            todos &= confere(rotulo, esperado, obtido)
+        lexer = ContextoCompilacao(motor_lexico='afd', recupera_erros_lexicos=True).lexer
+        lista = [(t.type, t.value, t.lineno, t.lexpos) for t in lexer.tokens_stream(codigo.encode("utf-8"), 7)]
+        fluxo = (lista, None, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in lexer.diagnosticos])
+        todos &= confere(f"afd em fluxo, erros espalhados {semente}", tokens('afd', codigo, False, True), fluxo)
+
+    for motor in MOTORES: # Sem recuperação, a análise para no primeiro erro
+        for colunar in (False, True):
+            lista, erro, obtidos = tokens(motor, "a # b {", colunar, False)
+            rotulo = f"sem recuperação ({motor}, {'tokenize_all' if colunar else 'token()'})"
+            todos &= confere(rotulo, (["a"], ("Scanning error. Illegal character '#'", "# b {"), [("LEX001", 1, 3, ("#",))]),
+                             ([t[1] for t in lista], erro, obtidos))
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
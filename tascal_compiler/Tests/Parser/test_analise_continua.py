@@ -0,0 +1,155 @@
+# Script de teste da análise contínua (parser.AnaliseContinua, sobre yacc.PushParser)
+# Empurra os tokens de cada programa um a um e confere que:
+# - a árvore e os diagnósticos são os mesmos da compilação do código inteiro (ContextoCompilacao.compila)
+# - são emitidos, nesta ordem, os diagnósticos e as declarações e comandos do bloco principal
+#   (nos programas válidos, exatamente os da árvore)
+# - cada declaração e cada comando é emitido sem esperar os tokens seguintes ao seu fim: antes de
+#   entregar o segundo token da declaração ou do comando seguinte (o primeiro pode ser o lookahead)
+# - duas análises intercaladas, token a token, no mesmo parser dão os resultados das análises isoladas
+# - lendo o código de um pipe, o primeiro comando é emitido antes de o processo que escreve terminar
+# - o ao_concluir de um contexto dado à análise volta a ele em finish()
+# Exemplo: py -m tascal_compiler.Tests.Parser.test_analise_continua
+import os
+import sys
+import glob
+import threading
+from tascal_compiler import arvore
+from tascal_compiler.parser import ContextoCompilacao, AnaliseContinua
+from tascal_compiler.diagnosticos import Diagnostico
+from tascal_compiler.arvore import iguais
+from tascal_compiler.lex import LexError
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa, gera_programa_com_erros
+
+def chave(diagnosticos):
+    return [(d.codigo, d.linha, d.coluna, d.argumentos) for d in diagnosticos]
+
+def tokens(codigo, contexto): # Tokens do código pelo lexer do contexto (ou None, se houver erro léxico)
+    contexto.lexer.input(codigo)
+    try:
+        return list(contexto.lexer)
+    except LexError:
+        return None
+
+def analisa(codigo): # Análise contínua: (árvore, diagnósticos, emitidos como (tokens entregues, item))
+    entregues = 0
+    emitidos = []
+    analise = AnaliseContinua(emite=lambda item: emitidos.append((entregues, item)))
+    lista = tokens(codigo, analise.contexto)
+    if lista is None:
+        return None
+    for token in lista:
+        entregues += 1
+        analise.feed(token)
+    return analise.finish(), analise.contexto.diagnosticos, emitidos, lista
+
+def confere(codigo): # Lista dos problemas da análise contínua do código (vazia se estiver tudo certo)
+    contexto = ContextoCompilacao()
+    esperado = contexto.compila(codigo) if tokens(codigo, ContextoCompilacao()) is not None else None
+    resultado = analisa(codigo)
+    if resultado is None:
+        return []
+    obtido, diagnosticos, emitidos, lista = resultado
+    problemas = []
+    if not iguais(esperado, obtido) or chave(contexto.diagnosticos) != chave(diagnosticos):
+        problemas.append("árvore ou diagnósticos diferentes da compilação completa")
+    if [item for _, item in emitidos if isinstance(item, Diagnostico)] != list(diagnosticos):
+        problemas.append("diagnósticos emitidos diferentes dos registrados")
+    nos = [(entregues, item) for entregues, item in emitidos if not isinstance(item, Diagnostico)]
+    if obtido is not None and not diagnosticos:
+        if [item for _, item in nos] != list(obtido.declaracoes) + list(obtido.corpo.comandos):
+            problemas.append("nós emitidos diferentes das declarações e comandos da árvore")
+    # Índice do token em cada posição (linha, coluna): um nó de declaração ou de comando fica no seu primeiro token
+    indices = {}
+    for i, token in enumerate(lista):
+        indices.setdefault((token.lineno, contexto.lexer.column(token.lexpos)), i)
+    for (entregues, no), (_, seguinte) in zip(nos, nos[1:]):
+        if type(no) is arvore.Declaracao and type(seguinte) is not arvore.Declaracao:
+            continue # A última declaração só é conhecida no begin
+        inicio = indices.get((seguinte.linha, seguinte.coluna))
+        if inicio is not None and entregues > inicio + 1:
+            problemas.append(f"nó da linha {no.linha} emitido só depois de {entregues} tokens")
+            break
+    return problemas
+
+def intercaladas(codigos): # Análises intercaladas token a token devem dar os resultados das isoladas
+    analises = [AnaliseContinua() for _ in codigos]
+    listas = [tokens(codigo, analise.contexto) for codigo, analise in zip(codigos, analises)]
+    for i in range(max(map(len, listas))):
+        for analise, lista in zip(analises, listas):
+            if i < len(lista):
+                analise.feed(lista[i])
+    for codigo, analise in zip(codigos, analises):
+        contexto = ContextoCompilacao()
+        esperado = contexto.compila(codigo)
+        if not iguais(esperado, analise.finish()) or chave(contexto.diagnosticos) != chave(analise.contexto.diagnosticos):
+            return False
+    return True
+
+def pipe(): # O primeiro comando é emitido enquanto o resto do código ainda não foi escrito no pipe
+    leitura, escrita = os.pipe()
+    emitido = threading.Event()
+    inicio = "program p;\nvar x: integer;\nbegin\n  x := 1;\n  x := x + 1;\n  x := x * 2;\n"
+    def escreve():
+        with os.fdopen(escrita, 'wb') as f:
+            f.write(inicio.encode())
+            f.flush()
+            emitido.wait(10) # Espera o primeiro comando antes de escrever o resto
+            f.write(b"  write(x)\nend.\n")
+    escritor = threading.Thread(target=escreve)
+    escritor.start()
+    antes_do_fim = []
+    def emite(item):
+        if isinstance(item, arvore.Atribuicao) and not emitido.is_set():
+            antes_do_fim.append(escritor.is_alive())
+            emitido.set()
+    analise = AnaliseContinua(ContextoCompilacao(motor_lexico='afd'), emite=emite)
+    with os.fdopen(leitura, 'rb', buffering=0) as f:
+        resultado = analise.alimenta_fluxo(f, tamanho_bloco=16)
+    escritor.join()
+    return antes_do_fim == [True] and resultado is not None and len(resultado.corpo.comandos) == 4
+
+def contexto_devolvido(): # O ao_concluir do contexto é o da análise só até finish()
+    contexto = ContextoCompilacao()
+    concluidos = []
+    def ao_concluir(no):
+        concluidos.append(no)
+    contexto.ao_concluir = ao_concluir
+    analise = AnaliseContinua(contexto)
+    for token in tokens("program p; var x: integer; begin x := 1; write(x) end.", contexto):
+        analise.feed(token)
+    analise.finish()
+    if contexto.ao_concluir is not ao_concluir or concluidos or len(analise.emitidos) != 3:
+        return False
+    contexto.compila("program q; var y: integer; begin y := 2 end.")
+    return len(concluidos) == 2 and len(analise.emitidos) == 3
+
+def main():
+    pasta = os.path.dirname(__file__)
+    programas = {}
+    for arquivo in sorted(glob.glob(os.path.join(pasta, "ProgramasTascalTeste", "*.tascal"))):
+        with open(arquivo, "r", encoding="utf-8") as f:
+            programas[os.path.basename(arquivo)] = f.read()
+    for semente in range(3):
+        programas[f"gerado{semente}"] = gera_programa(300, semente=semente)
+        programas[f"gerado_com_erros{semente}"] = gera_programa_com_erros(300, semente=semente)
+
+    todos = True
+    for nome, codigo in programas.items():
+        problemas = confere(codigo)
+        if problemas:
+            print(f"DIFERENTE   {nome}: {'; '.join(problemas)}")
+            todos = False
+        else:
+            print(f"OK          {nome}")
+    for nome, teste in (("análises intercaladas", lambda: intercaladas([programas["gerado0"], programas["gerado_com_erros1"],
+                                                                          programas["gerado2"]])),
+                        ("leitura de um pipe", pipe), ("ao_concluir devolvido ao contexto", contexto_devolvido)):
+        ok = teste()
+        print(f"{'OK' if ok else 'DIFERENTE':<12}{nome}")
+        todos &= ok
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Script de teste de compilações concorrentes (ContextoCompilacao)
+# Compila todos os programas de teste em sequência e depois, várias vezes, ao mesmo tempo
+# em um pool de threads, conferindo que cada compilação produz a mesma árvore e os mesmos
+# erros que a compilação isolada, sem interferência entre os contextos. Também confere que o
+# estado de cada análise (pilhas, estado atual, função de tokens) fica no quadro da própria
+# chamada: o rastro da pilha visto a cada token pelo parser compartilhado é o mesmo em sequência
+# e em paralelo, e os atributos do parser não mudam com as análises
+# Exemplo: py -m tascal_compiler.Tests.Parser.test_concorrencia
+import os
+import sys
+import glob
+from concurrent.futures import ThreadPoolExecutor
+from tascal_compiler.parser import ContextoCompilacao, parser
+from tascal_compiler.arvore import iguais
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa, gera_programa_com_erros
+
+def compila(codigo): # Resultado de uma compilação: árvore e diagnósticos
+    contexto = ContextoCompilacao()
+    try:
+        arvore = contexto.compila(codigo)
+    except Exception as e:
+        arvore = f"{type(e).__name__}: {e}"
+    return arvore, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in contexto.diagnosticos]
+
+def rastreia(codigo): # Profundidade da pilha e estado do parser compartilhado vistos a cada token pedido
+    contexto = ContextoCompilacao()
+    proximo = contexto.lexer.token
+    rastro = []
+    def token():
+        rastro.append((len(parser.statestack), parser.state, parser.token == token))
+        return proximo()
+    contexto.lexer.token = token
+    try:
+        contexto.compila(codigo)
+    except Exception:
+        pass
+    return rastro
+
+def main():
+    pasta = os.path.dirname(__file__)
+    programas = {}
+    for arquivo in sorted(glob.glob(os.path.join(pasta, "ProgramasTascalTeste", "*.tascal"))):
+        with open(arquivo, "r", encoding="utf-8") as f:
+            programas[os.path.basename(arquivo)] = f.read()
+    for semente in range(3):
+        programas[f"gerado{semente}"] = gera_programa(300, semente=semente)
+        programas[f"gerado_com_erros{semente}"] = gera_programa_com_erros(300, semente=semente)
+
+    repeticoes = 10
+    tarefas = list(programas.items()) * repeticoes
+    esperados = {nome: compila(codigo) for nome, codigo in programas.items()}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        obtidos = list(pool.map(lambda tarefa: compila(tarefa[1]), tarefas))
+
+    diferentes = set()
+    for (nome, _), obtido in zip(tarefas, obtidos):
+        esperado = esperados[nome]
+        if not (iguais(esperado[0], obtido[0]) and esperado[1:] == obtido[1:]):
+            diferentes.add(nome)
+
+    atributos = dict(vars(parser))
+    rastros = {nome: rastreia(codigo) for nome, codigo in programas.items()}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        obtidos = list(pool.map(lambda tarefa: rastreia(tarefa[1]), tarefas))
+    for (nome, _), obtido in zip(tarefas, obtidos):
+        if obtido != rastros[nome]:
+            diferentes.add(nome)
+    if vars(parser) != atributos:
+        print(f"DIFERENTE   atributos do parser: {sorted(set(vars(parser)) ^ set(atributos))}")
+        diferentes.add("atributos do parser")
+
+    for nome in programas:
+        print(f"{'DIFERENTE' if nome in diferentes else 'OK':<12}{nome}")
+    print(f"\n{2 * len(tarefas)} compilações concorrentes em 8 threads.")
+    print("Todos os resultados são idênticos." if not diferentes else "Há diferenças entre as compilações!")
+    sys.exit(0 if not diferentes else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# Script de teste da construção das tabelas LALR do yacc (conjuntos em bitsets)
+# Confere, na gramática do Tascal e em gramáticas aleatórias, que:
+# - FIRST e FOLLOW (Grammar.compute_first/compute_follow) são os mesmos de um ponto fixo simples com conjuntos
+# - os lookaheads LALR(1) calculados por DeRemer-Pennello são exatamente os da coleção LR(1) canônica,
+#   unindo os estados de mesmo núcleo (referência construída por força bruta)
+# - pack_rows dá os mesmos vetores que o first-fit direto, testando deslocamento por deslocamento
+# Exemplo: py -m tascal_compiler.Tests.Parser.test_construcao_lalr
+import sys
+import random
+from tascal_compiler import yacc
+from tascal_compiler.Tests.Benchmark.gerador_gramaticas import gramatica_tascal, gramatica_aleatoria
+
+def first_follow(g): # FIRST (com '<empty>') e FOLLOW de referência, por ponto fixo com conjuntos
+    first = {t: {t} for t in list(g.Terminals) + ['$end']}
+    first.update({n: set() for n in g.Nonterminals})
+    def de_sequencia(simbolos):
+        resultado = set()
+        for s in simbolos:
+            resultado |= first[s] - {'<empty>'}
+            if '<empty>' not in first[s]:
+                return resultado
+        return resultado | {'<empty>'}
+    mudou = True
+    while mudou:
+        mudou = False
+        for p in g.Productions[1:]:
+            novos = de_sequencia(p.prod) - first[p.name]
+            if novos:
+                first[p.name] |= novos
+                mudou = True
+    follow = {n: set() for n in g.Nonterminals}
+    follow[g.Productions[1].name].add('$end')
+    mudou = True
+    while mudou:
+        mudou = False
+        for p in g.Productions[1:]:
+            for i, s in enumerate(p.prod):
+                if s in g.Nonterminals:
+                    resto = de_sequencia(p.prod[i+1:])
+                    novos = (resto - {'<empty>'}) | (follow[p.name] if '<empty>' in resto else set())
+                    if novos - follow[s]:
+                        follow[s] |= novos
+                        mudou = True
+    return first, follow, de_sequencia
+
+def lookaheads_lr1(g, de_sequencia): # núcleo LR(0) -> {produção completa: lookaheads}, pela coleção LR(1) canônica
+    producoes = g.Productions
+    def fecho(itens):
+        itens = set(itens)
+        pendentes = list(itens)
+        while pendentes:
+            n, ponto, a = pendentes.pop()
+            direita = producoes[n].prod
+            if ponto < len(direita) and direita[ponto] in g.Nonterminals:
+                for b in de_sequencia(direita[ponto+1:] + (a,)) - {'<empty>'}:
+                    for q in g.Prodnames[direita[ponto]]:
+                        if (q.number, 0, b) not in itens:
+                            itens.add((q.number, 0, b))
+                            pendentes.append((q.number, 0, b))
+        return frozenset(itens)
+    inicial = fecho({(0, 0, '$end')})
+    estados = {inicial}
+    pendentes = [inicial]
+    while pendentes:
+        estado = pendentes.pop()
+        simbolos = {producoes[n].prod[ponto] for n, ponto, a in estado if ponto < len(producoes[n].prod)}
+        for x in simbolos:
+            destino = fecho({(n, ponto + 1, a) for n, ponto, a in estado
+                             if ponto < len(producoes[n].prod) and producoes[n].prod[ponto] == x})
+            if destino not in estados:
+                estados.add(destino)
+                pendentes.append(destino)
+    lalr = {}
+    for estado in estados:
+        nucleo = frozenset((n, ponto) for n, ponto, a in estado if ponto > 0 or n == 0)
+        for n, ponto, a in estado:
+            if n and ponto == len(producoes[n].prod):
+                lalr.setdefault(nucleo, {}).setdefault(n, set()).add(a)
+    return lalr
+
+def confere(g): # Constrói as tabelas de g e devolve as diferenças dos conjuntos para as referências
+    first, follow, de_sequencia = first_follow(g)
+    lr = yacc.LRTable(g)
+    erros = []
+    if {s: set(v) for s, v in g.First.items()} != first:
+        erros.append("FIRST")
+    if {s: set(v) for s, v in g.Follow.items()} != follow:
+        erros.append("FOLLOW")
+    esperado = lookaheads_lr1(g, de_sequencia)
+    for nucleo, estado in lr.lr0_kernels.items():
+        chave = frozenset((p.number, p.lr_index) for p in nucleo)
+        for p in lr.lr0_closure(list(nucleo)):
+            if p.number and p.lr_index == p.len - 1:
+                obtido = set(yacc.bitset_names(p.lookaheads.get(estado, 0), g.Termnames))
+                if obtido != esperado.get(chave, {}).get(p.number, set()):
+                    erros.append(f"lookaheads de {p} no estado {estado}")
+    return lr, erros
+
+def pack_rows_direto(rows, ncols): # First-fit de referência, testando cada deslocamento a partir de 0
+    base, check, value = [0] * len(rows), [], []
+    for st in sorted(range(len(rows)), key=lambda st: -len(rows[st])):
+        row = sorted(rows[st].items())
+        if not row:
+            continue
+        b = 0
+        while any(b + col < len(check) and check[b + col] >= 0 for col, v in row):
+            b += 1
+        need = b + row[-1][0] + 1 - len(check)
+        check.extend([-1] * max(need, 0))
+        value.extend([None] * max(need, 0))
+        for col, v in row:
+            check[b + col], value[b + col] = st, v
+        base[st] = b
+    need = max(base, default=0) + ncols - len(check)
+    return base, check + [-1] * max(need, 0), value + [None] * max(need, 0)
+
+def main():
+    print("========================================")
+    print("  TESTE DA CONSTRUÇÃO DAS TABELAS LALR  ")
+    print("========================================\n")
+    todos = True
+    lr, erros = confere(gramatica_tascal(passthrough=()))
+    if erros:
+        print(f"DIFERENTE   tascal: {', '.join(erros[:3])}")
+        todos = False
+    else:
+        print(f"OK          tascal ({len(lr.lr0_kernels)} estados LR(0))")
+
+    rnd = random.Random(2022)
+    testadas = 0
+    falhas = []
+    while testadas < 300:
+        g = gramatica_aleatoria(rnd)
+        if g is None:
+            continue
+        try:
+            lr, erros = confere(g)
+        except yacc.LALRError: # Conflito com a aceitação, que o yacc recusa
+            continue
+        testadas += 1
+        if erros:
+            falhas.append(f"{[p.str for p in g.Productions[1:]]}: {', '.join(erros[:3])}")
+    if falhas:
+        print(f"DIFERENTE   {len(falhas)} de {testadas} gramáticas aleatórias, como {falhas[0]}")
+        todos = False
+    else:
+        print(f"OK          {testadas} gramáticas aleatórias")
+
+    tabelas = yacc.LRTable(gramatica_tascal())
+    linhas = [{i: v for i, v in enumerate(linha) if v is not None} for linha in
+              ([tabelas.lr_action[st].get(t) for t in tabelas.lr_terminals] for st in range(len(tabelas.lr_action)))]
+    casos = [(linhas, len(tabelas.lr_terminals) + 1)]
+    for _ in range(200):
+        n = rnd.randint(1, 30)
+        casos.append(([{rnd.randrange(n): rnd.randint(-9, 9) for _ in range(rnd.randint(0, n))}
+                       for _ in range(rnd.randint(1, 40))], n))
+    if all(yacc.pack_rows(linhas, n) == pack_rows_direto(linhas, n) for linhas, n in casos):
+        print(f"OK          pack_rows igual ao first-fit direto em {len(casos)} tabelas")
+    else:
+        print("DIFERENTE   pack_rows difere do first-fit direto")
+        todos = False
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Script de teste das fontes de tokens do parser (parse(..., tokens=...))
+# Analisa os mesmos programas lendo os tokens do lexer (lexer.token()) e de fontes prontas: uma lista
+# de tokens já reconhecidos, um gerador que os repassa e os arrays colunares de lexer.tokenize_all,
+# no parser genérico do yacc e no parser especializado, e confere se a árvore devolvida e os
+# diagnósticos registrados são idênticos. Confere também que um erro léxico guardado nos arrays
+# colunares interrompe a análise como o lexer e que input e tokens não podem ser dados juntos
+# Exemplo: py -m tascal_compiler.Tests.Parser.test_fonte_tokens
+import os
+import sys
+import glob
+from tascal_compiler.parser import parser, ContextoCompilacao
+from tascal_compiler.lex import LexError
+from tascal_compiler import parser_especializado
+from tascal_compiler.arvore import iguais
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa, gera_programa_com_erros
+
+def lista_tokens(codigo, lexer): # Tokens do lexer, reconhecidos de antemão
+    lexer.input(codigo)
+    return list(lexer)
+
+FONTES = { # Nome -> função que devolve a fonte de tokens de um código, dado o lexer do contexto
+    "lista": lista_tokens,
+    "gerador": lambda codigo, lexer: (token for token in lista_tokens(codigo, lexer)),
+    "colunar": lambda codigo, lexer: lexer.tokenize_all(codigo),
+}
+
+def executa(parse, codigo, fonte=None): # Resultado (ou a exceção) e diagnósticos de uma análise
+    contexto = ContextoCompilacao()
+    try:
+        if fonte is None:
+            resultado = parse(codigo, lexer=contexto.lexer, context=contexto)
+        else:
+            # O lexer, já no fim do código, só dá as colunas dos nós e a linha do fim do arquivo
+            tokens = FONTES[fonte](codigo, contexto.lexer)
+            resultado = parse(lexer=contexto.lexer, context=contexto, tokens=tokens)
+    except Exception as e:
+        resultado = f"{type(e).__name__}: {e}"
+    diagnosticos = sorted(((d.codigo, d.linha, d.coluna, d.argumentos) for d in contexto.diagnosticos),
+                          key=lambda d: (d[1], d[2] or 0))
+    return resultado, diagnosticos
+
+def compara(nome, codigo): # Compara todas as fontes nos dois parsers, retorna True se forem iguais
+    esperado = executa(parser.parse, codigo)
+    diferentes = []
+    for rotulo, parse in (("genérico", parser.parse), ("especializado", parser_especializado.parse)):
+        for fonte in FONTES:
+            obtido = executa(parse, codigo, fonte)
+            if not (iguais(esperado[0], obtido[0]) and esperado[1] == obtido[1]):
+                diferentes.append((f"{rotulo}, {fonte}", obtido))
+    if not diferentes:
+        print(f"OK          {nome}")
+        return True
+    print(f"DIFERENTE   {nome}")
+    print(f"  lexer: {esperado!r}")
+    for rotulo, obtido in diferentes:
+        print(f"  {rotulo}: {obtido!r}")
+    return False
+
+def erro_lexico(): # Os arrays colunares guardam o LexError, que a análise levanta no mesmo ponto que o lexer
+    codigo = "program p;\nvar x: integer;\nbegin\n  x := 1;\n  x := x # 2\nend.\n"
+    esperado = executa(parser.parse, codigo)
+    for parse in (parser.parse, parser_especializado.parse):
+        contexto = ContextoCompilacao()
+        try:
+            resultado = parse(lexer=contexto.lexer, context=contexto, tokens=contexto.lexer.tokenize_all(codigo))
+        except LexError as e:
+            resultado = f"{type(e).__name__}: {e}"
+        if resultado != esperado[0] or not resultado.startswith("LexError"):
+            return False
+    return True
+
+def input_e_tokens(): # Dar o código e os tokens ao mesmo tempo é um erro
+    for parse in (parser.parse, parser_especializado.parse):
+        contexto = ContextoCompilacao()
+        try:
+            parse("program p; begin end.", lexer=contexto.lexer, context=contexto, tokens=[])
+        except ValueError:
+            continue
+        return False
+    return True
+
+def main():
+    pasta = os.path.dirname(__file__)
+    todos = True
+    for arquivo in sorted(glob.glob(os.path.join(pasta, "ProgramasTascalTeste", "*.tascal"))):
+        with open(arquivo, "r", encoding="utf-8") as f:
+            todos &= compara(os.path.basename(arquivo), f.read())
+    for semente in range(3):
+        todos &= compara(f"gerado{semente}", gera_programa(300, semente=semente))
+        todos &= compara(f"gerado_com_erros{semente}", gera_programa_com_erros(300, semente=semente))
+    for nome, teste in (("erro léxico nos arrays colunares", erro_lexico), ("input e tokens juntos", input_e_tokens)):
+        ok = teste()
+        print(f"{'OK' if ok else 'DIFERENTE':<12}{nome}")
+        todos &= ok
+
+    print("\nTodos os resultados são idênticos." if todos else "\nHá diferenças entre as fontes de tokens!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# Script de teste da reanálise incremental (incremental.Documento)
+# Aplica sequências de edições sorteadas a programas gerados e confere, depois de cada edição, que a
+# árvore e os diagnósticos do documento são os mesmos de uma compilação completa do código editado,
+# com os dois motores léxicos e os dois parsers. Confere também, em casos escolhidos, quais edições
+# são reanalisadas só em parte e quantos tokens passam pelo lexer e pelo parser
+# Exemplo: py -m tascal_compiler.Tests.Parser.test_incremental
+import re
+import sys
+import random
+from tascal_compiler.parser import ContextoCompilacao, parser
+from tascal_compiler.incremental import Documento
+from tascal_compiler import parser_especializado
+from tascal_compiler.arvore import iguais
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa
+
+PROGRAMA = """program p;
+var x, y: integer; b: boolean;
+begin
+  x := 1;
+  while x < 10 do
+  begin
+    x := x + 1;
+    if b then y := x else y := 2
+  end;
+  write(x, y)
+end.
+"""
+
+CASOS = [ # (nome, texto trocado, texto novo, incremental?, tokens relexados, tokens reanalisados)
+    ("troca um número", "x := 1", "x := 123", True, 5, 3),
+    ("troca uma variável dentro do if", "y := 2", "x := 2", True, 5, 10),
+    ("insere um comando no bloco do while", "x + 1;", "x + 1; y := 3;", True, 10, 14),
+    ("quebra de linha no meio de um comando", "x := x + 1", "x :=\n  x + 1", True, 7, 5),
+    ("condição do while", "x < 10", "x < 20", True, 5, 23),
+    ("quebra de linha entre comandos", "end;\n  write", "end;\n\n  write", True, 5, 6),
+    ("apaga o ';' entre dois comandos", "end;\n  write", "end\n  write", False, None, None),
+    ("troca o begin do while", "do\n  begin", "do\n  bgin", False, None, None),
+    ("edita as declarações", "b: boolean", "b: integer", False, None, None),
+    ("comentário", "x := 1;", "x := 1; { c }", False, None, None),
+    ("variável não declarada", "write(x, y)", "write(x, z)", False, None, None),
+]
+
+def completa(codigo, motor, parse): # Árvore (ou a exceção) e diagnósticos de uma compilação completa
+    contexto = ContextoCompilacao(motor_lexico=motor)
+    try:
+        resultado = contexto.compila(codigo, parse=parse)
+    except Exception as e:
+        resultado = f"{type(e).__name__}: {e}"
+    return resultado, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in contexto.diagnosticos]
+
+def edita(documento, inicio, removidos, inserido): # Árvore (ou a exceção) e diagnósticos depois da edição
+    try:
+        resultado = documento.edita(inicio, removidos, inserido)
+    except Exception as e:
+        resultado = f"{type(e).__name__}: {e}"
+    return resultado, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in documento.diagnosticos]
+
+def sorteia_edicao(rnd, codigo): # (início, removidos, inserido) de uma edição parecida com as de um editor
+    corpo = codigo.index("begin")
+    sorteio = rnd.random()
+    if sorteio < 0.25: # Troca um número
+        m = rnd.choice(list(re.finditer(r"\d+", codigo[corpo:])))
+        return corpo + m.start(), len(m.group()), str(rnd.randint(0, 9999))
+    if sorteio < 0.45: # Troca uma variável inteira
+        m = rnd.choice(list(re.finditer(r"\bi\d+\b", codigo[corpo:])))
+        return corpo + m.start(), len(m.group()), f"i{rnd.randrange(20)}"
+    if sorteio < 0.6: # Insere um comando depois de um ';'
+        posicao = rnd.choice([m.end() for m in re.compile(";").finditer(codigo, corpo)])
+        return posicao, 0, rnd.choice(["\n  i1 := i2 + 3;", " write(i4, b0);", "\n  begin i5 := 1; i6 := 2 end;",
+                                       " while i3 > 0 do\n  begin i3 := i3 - 1 end;"])
+    if sorteio < 0.8: # Insere ou apaga espaços e quebras de linha
+        posicao = rnd.choice([m.start() for m in re.compile(r"[ \n]+").finditer(codigo, corpo)])
+        if rnd.random() < 0.5:
+            return posicao, 0, rnd.choice([" ", "\n", "\n\n  "])
+        return posicao, 1, "" if codigo[posicao + 1] in " \n" else " "
+    # Edição qualquer, que em geral deixa o programa com erros
+    posicao = rnd.randrange(len(codigo))
+    return posicao, min(rnd.randrange(4), len(codigo) - posicao), rnd.choice(["x", ";", "end", "begin", "1", ""])
+
+def compara_sequencia(motor, parse, semente, edicoes): # Confere o documento depois de cada edição sorteada
+    rnd = random.Random(semente)
+    codigo = gera_programa(60, semente=semente)
+    documento = Documento(codigo, parse=parse, motor_lexico=motor)
+    incrementais = 0
+    for n in range(edicoes):
+        inicio, removidos, inserido = sorteia_edicao(rnd, codigo)
+        obtido = edita(documento, inicio, removidos, inserido)
+        codigo = codigo[:inicio] + inserido + codigo[inicio + removidos:]
+        esperado = completa(codigo, motor, parse)
+        incrementais += documento.incremental
+        if documento.codigo != codigo or not iguais(esperado[0], obtido[0]) or esperado[1] != obtido[1]:
+            print(f"DIFERENTE   edições sorteadas {semente} ({motor}), edição {n}: {(inicio, removidos, inserido)!r}")
+            print(f"    completa:    {esperado[1]!r}")
+            print(f"    incremental: {obtido[1]!r}")
+            return False
+        if esperado[1] or esperado[0] is None: # Volta a um programa sem erros, que é o caso incremental
+            codigo = gera_programa(60, semente=rnd.randrange(1000))
+            documento = Documento(codigo, parse=parse, motor_lexico=motor)
+    print(f"OK          edições sorteadas {semente} ({motor}), {incrementais} de {edicoes} incrementais")
+    return True
+
+def main():
+    print("========================================")
+    print("  TESTE DA REANÁLISE INCREMENTAL  ")
+    print("========================================\n")
+    todos = True
+    for nome, antigo, novo, incremental, relexados, reanalisados in CASOS:
+        documento = Documento(PROGRAMA)
+        inicio = PROGRAMA.index(antigo)
+        obtido = edita(documento, inicio, len(antigo), novo)
+        codigo = PROGRAMA.replace(antigo, novo, 1)
+        esperado = completa(codigo, 'ply', parser.parse)
+        iguais_ = iguais(esperado[0], obtido[0]) and esperado[1] == obtido[1]
+        contagem = (documento.incremental, documento.relexados, documento.reanalisados)
+        if iguais_ and contagem[0] == incremental and (not incremental or contagem == (True, relexados, reanalisados)):
+            print(f"OK          {nome}")
+        else:
+            print(f"DIFERENTE   {nome}: (incremental, relexados, reanalisados) = {contagem!r}")
+            todos = False
+
+    documento = Documento(PROGRAMA) # Só espaços: os tokens são os mesmos e nada é reanalisado
+    documento.edita(PROGRAMA.index("  write"), 0, "\n  ")
+    esperado = completa(documento.codigo, 'ply', parser.parse)
+    contagem = (documento.incremental, documento.relexados, documento.reanalisados)
+    if iguais(esperado[0], documento.arvore) and contagem == (True, 2, 0):
+        print("OK          só espaços")
+    else:
+        print(f"DIFERENTE   só espaços: (incremental, relexados, reanalisados) = {contagem!r}")
+        todos = False
+
+    documento = Documento(PROGRAMA) # Edições seguidas no mesmo documento
+    incrementais = True
+    for antigo, novo in (("x := 1", "x := 5"), ("y := 2", "y := 2;\n  y := y * 2"), ("x < 10", "x < 20"), ("\n  write", "\n\n  write")):
+        inicio = documento.codigo.index(antigo)
+        documento.edita(inicio, len(antigo), novo)
+        incrementais &= documento.incremental
+    esperado = completa(documento.codigo, 'ply', parser.parse)
+    if incrementais and iguais(esperado[0], documento.arvore):
+        print("OK          edições seguidas")
+    else:
+        print("DIFERENTE   edições seguidas")
+        todos = False
+
+    try:
+        Documento(PROGRAMA).edita(len(PROGRAMA), 1, "")
+        print("DIFERENTE   edição fora do código não deu ValueError")
+        todos = False
+    except ValueError:
+        print("OK          edição fora do código")
+
+    for motor, parse in (('ply', parser.parse), ('afd', parser_especializado.parse)):
+        for semente in range(3):
+            todos &= compara_sequencia(motor, parse, semente, 150)
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
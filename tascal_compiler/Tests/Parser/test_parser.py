@@ -2,8 +2,7 @@
 # Executa a análise em um arquivo de código Tascal e exibe os resultados
 import sys
 import os
-from tascal_compiler.parser import parser, erros_semanticos, semantico_reset
-from tascal_compiler.lexer import lexico
+from tascal_compiler.parser import ContextoCompilacao
 
 def executar_teste(caminho_arquivo):
 
@@ -15,16 +14,24 @@ def executar_teste(caminho_arquivo):
     print("========================================\n")
     print(f"Arquivo: {os.path.basename(caminho_arquivo)}\n")
 
+    contexto = ContextoCompilacao() # Contexto novo (lexer, símbolos e diagnósticos próprios)
+    arvore = None
     try:
-        
-        semantico_reset() # Reseta estado semântico antes da análise
-        lexico.lineno = 1
-        
-        parser.parse(codigo, lexer=lexico) # Executa análise
+
+        arvore = contexto.compila(codigo) # Executa análise
 
     except Exception:
         None
 
+    for linha in contexto.diagnosticos.formata(): # Exibe os erros encontrados, na ordem em que ocorreram
+        print(linha)
+
+    if arvore is not None: # O programa foi reconhecido até o fim
+        if contexto.diagnosticos.tem_erros('SEM'): # Se houver erros semânticos, informa
+            print("\nAnálise sintática concluída, mas com erros semânticos.") # Informa conclusão com erros
+        else:
+            print("Programa reconhecido com sucesso (sintático e semântico)!") # Informa sucesso
+
     print("\n========================================")
     print("        ANÁLISE FINALIZADA              ")
     print("========================================\n")
@@ -0,0 +1,74 @@
+# Script de teste diferencial do parser especializado (parser_especializado.py)
+# Executa o parser genérico do yacc e o parser especializado sobre os mesmos programas
+# e confere se a árvore devolvida e os diagnósticos registrados são idênticos; o parser
+# especializado também é executado sobre os tokens colunares de lexer.tokenize_all, que
+# devem ser os mesmos devolvidos um a um por lexer.token()
+# Exemplo: py -m tascal_compiler.Tests.Parser.test_parser_especializado
+#          py -m tascal_compiler.Tests.Parser.test_parser_especializado ProgramasTascalTeste/P1.tascal
+import os
+import sys
+import glob
+from tascal_compiler.parser import parser, ContextoCompilacao
+from tascal_compiler.lex import LexError
+from tascal_compiler import parser_especializado
+from tascal_compiler.arvore import iguais
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa, gera_programa_com_erros
+
+def executa(parse, codigo, colunar=False): # Executa uma análise, devolvendo o resultado (ou a exceção) e os diagnósticos
+    contexto = ContextoCompilacao()
+    try:
+        resultado = contexto.compila(codigo, parse=parse, colunar=colunar)
+    except Exception as e:
+        resultado = f"{type(e).__name__}: {e}"
+    diagnosticos = [(d.codigo, d.linha, d.coluna, d.argumentos) for d in contexto.diagnosticos]
+    if colunar: # Os erros léxicos são todos registrados antes da análise sintática
+        diagnosticos.sort(key=lambda d: (d[1], d[2] or 0))
+    return resultado, diagnosticos
+
+def tokens(codigo, colunar): # Tokens (tipo, valor, linha, posição) do lexer e a exceção que o interrompeu
+    lexer = ContextoCompilacao().lexer
+    lista = []
+    try:
+        for token in (lexer.tokenize_all(codigo) if colunar else (lexer.input(codigo) or lexer)):
+            lista.append((token.type, token.value, token.lineno, token.lexpos))
+    except LexError as e:
+        return lista, str(e)
+    return lista, None
+
+def compara(nome, codigo): # Compara os dois parsers em um programa, retorna True se forem iguais
+    esperado = executa(parser.parse, codigo)
+    obtido = executa(parser_especializado.parse, codigo)
+    esperado_ordenado = (esperado[0], sorted(esperado[1], key=lambda d: (d[1], d[2] or 0)))
+    colunar = executa(parser_especializado.parse, codigo, colunar=True)
+    if (iguais(esperado[0], obtido[0]) and esperado[1] == obtido[1] and iguais(esperado[0], colunar[0])
+            and esperado_ordenado[1] == colunar[1] and tokens(codigo, False) == tokens(codigo, True)):
+        print(f"OK          {nome}")
+        return True
+    print(f"DIFERENTE   {nome}")
+    print(f"  genérico:      {esperado!r}")
+    print(f"  especializado: {obtido!r}")
+    print(f"  colunar:       {colunar!r}")
+    return False
+
+def main():
+    pasta = os.path.dirname(__file__)
+    if len(sys.argv) > 1: # Um arquivo específico
+        arquivos = [os.path.join(pasta, sys.argv[1])]
+    else: # Todos os programas de teste
+        arquivos = sorted(glob.glob(os.path.join(pasta, "ProgramasTascalTeste", "*.tascal")))
+
+    iguais = True
+    for arquivo in arquivos:
+        with open(arquivo, "r", encoding="utf-8") as f:
+            iguais &= compara(os.path.basename(arquivo), f.read())
+
+    if len(sys.argv) == 1: # Programas gerados, válidos e com erros
+        for semente in range(3):
+            iguais &= compara(f"gerado{semente}", gera_programa(300, semente=semente))
+            iguais &= compara(f"gerado_com_erros{semente}", gera_programa_com_erros(300, semente=semente))
+
+    print("\nTodos os resultados são idênticos." if iguais else "\nHá diferenças entre os parsers!")
+    sys.exit(0 if iguais else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Script de teste da eliminação das produções unitárias (passthrough em parser.py)
+# Constrói o parser com as tabelas sem as reduções unitárias (o padrão) e com as tabelas originais
+# (passthrough=()) e confere, nos programas de teste e em programas gerados, válidos e com erros,
+# que a árvore e os diagnósticos são idênticos e que nenhuma função p_* é chamada para as produções
+# eliminadas; confere também que regras inválidas em passthrough são recusadas
+# Exemplo: py -m tascal_compiler.Tests.Parser.test_producoes_unitarias
+import os
+import sys
+import glob
+from tascal_compiler import yacc
+from tascal_compiler import parser as gramatica
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.arvore import iguais
+from tascal_compiler.Tests.Benchmark.gerador_programas import gera_programa, gera_programa_com_erros
+
+def constroi(passthrough=None): # Parser novo, com as reduções de cada produção contadas em parser.reducoes
+    novo = yacc.yacc(module=gramatica, passthrough=passthrough, write_tables=False, errorlog=yacc.NullLogger())
+    novo.reducoes = [0] * len(novo.productions)
+    for numero, producao in enumerate(novo.productions):
+        if producao.callable:
+            producao.callable = conta(novo.reducoes, numero, producao.callable)
+    return novo
+
+def conta(reducoes, numero, funcao): # Envolve a função p_* de uma produção, contando as chamadas
+    def contada(p):
+        reducoes[numero] += 1
+        funcao(p)
+    return contada
+
+def executa(parse, codigo): # Árvore (ou a exceção) e diagnósticos de uma compilação
+    contexto = ContextoCompilacao()
+    try:
+        resultado = contexto.compila(codigo, parse=parse)
+    except Exception as e:
+        resultado = f"{type(e).__name__}: {e}"
+    return resultado, [(d.codigo, d.linha, d.coluna, d.argumentos) for d in contexto.diagnosticos]
+
+def compara(nome, codigo, eliminado, original): # Compara os dois parsers em um programa
+    esperado = executa(original.parse, codigo)
+    obtido = executa(eliminado.parse, codigo)
+    if iguais(esperado[0], obtido[0]) and esperado[1] == obtido[1]:
+        print(f"OK          {nome}")
+        return True
+    print(f"DIFERENTE   {nome}")
+    print(f"  original:  {esperado!r}")
+    print(f"  eliminado: {obtido!r}")
+    return False
+
+def main():
+    print("========================================")
+    print("  TESTE DA ELIMINAÇÃO DAS PRODUÇÕES UNITÁRIAS  ")
+    print("========================================\n")
+    eliminado = constroi()
+    original = constroi(passthrough=())
+    todos = True
+
+    pasta = os.path.dirname(__file__)
+    for arquivo in sorted(glob.glob(os.path.join(pasta, "ProgramasTascalTeste", "*.tascal"))):
+        with open(arquivo, "r", encoding="utf-8") as f:
+            todos &= compara(os.path.basename(arquivo), f.read(), eliminado, original)
+    for semente in range(3):
+        todos &= compara(f"gerado{semente}", gera_programa(300, semente=semente), eliminado, original)
+        todos &= compara(f"gerado_com_erros{semente}", gera_programa_com_erros(300, semente=semente), eliminado, original)
+
+    unitarias = [n for n, p in enumerate(original.productions) if p.str.replace(' -> ', ' : ') in gramatica.passthrough]
+    chamadas = {original.productions[n].str: eliminado.reducoes[n] for n in unitarias if eliminado.reducoes[n]}
+    originais = sum(original.reducoes[n] for n in unitarias)
+    if len(unitarias) == len(gramatica.passthrough) and not chamadas and originais:
+        print(f"OK          nenhuma das {len(unitarias)} produções unitárias é reduzida ({originais} reduções nas tabelas originais)")
+    else:
+        print(f"DIFERENTE   produções unitárias reduzidas: {chamadas!r}")
+        todos = False
+
+    for regra in ("comando : nada", "fator : ID", "programa : PROGRAM ID PV bloco PF"): # Regras recusadas
+        try:
+            yacc.yacc(module=gramatica, passthrough=(regra,), write_tables=False, errorlog=yacc.NullLogger())
+            print(f"DIFERENTE   passthrough com {regra!r} foi aceito")
+            todos = False
+        except yacc.YaccError:
+            print(f"OK          passthrough com {regra!r} é recusado")
+
+    print("\nTodos os testes passaram." if todos else "\nHá testes falhando!")
+    sys.exit(0 if todos else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# Árvore sintática abstrata (AST) tipada do Tascal
+# Cada nó guarda a linha e a coluna (a partir de 1) do token que o identifica no código-fonte
+# (a palavra-chave do comando, o operador da expressão ou o próprio identificador/constante);
+# as expressões guardam também o tipo semântico ("integer", "boolean" ou None)
+# calculado pelo analisador semântico durante a própria análise sintática.
+# Os nós usam __slots__: não há __dict__ por instância, o que reduz a memória e
+# acelera o acesso aos atributos em árvores com centenas de milhares de nós
+
+class No: # Classe base de todos os nós da árvore
+    __slots__ = ('linha', 'coluna')
+    campos = () # Nomes dos atributos próprios de cada nó, na ordem do construtor
+
+    def __init__(self, linha, coluna):
+        self.linha = linha
+        self.coluna = coluna
+
+    def __repr__(self): # Ex.: Atribuicao(nome='x', expressao=Numero(valor=1))
+        valores = ", ".join(f"{campo}={getattr(self, campo)!r}" for campo in self.campos)
+        return f"{type(self).__name__}({valores})"
+
+    def filhos(self): # Percorre os nós filhos diretos, na ordem do código-fonte
+        for campo in self.campos:
+            valor = getattr(self, campo)
+            if isinstance(valor, No):
+                yield valor
+            elif isinstance(valor, list):
+                for item in valor:
+                    if isinstance(item, No):
+                        yield item
+
+# ---------------------------------------------------------------------------
+# Programa, declarações e comandos
+# ---------------------------------------------------------------------------
+
+class Programa(No): # program nome; var ...; begin ... end.
+    __slots__ = ('nome', 'declaracoes', 'corpo')
+    campos = __slots__
+
+    def __init__(self, nome, declaracoes, corpo, linha, coluna):
+        self.nome = nome
+        self.declaracoes = declaracoes # Lista de Declaracao, na ordem do código-fonte
+        self.corpo = corpo # Bloco
+        self.linha = linha
+        self.coluna = coluna
+
+class Declaracao(No): # x, y : integer;
+    __slots__ = ('variaveis', 'tipo')
+    campos = __slots__
+
+    def __init__(self, variaveis, tipo, linha, coluna):
+        self.variaveis = variaveis # Lista de Variavel
+        self.tipo = tipo
+        self.linha = linha
+        self.coluna = coluna
+
+class Bloco(No): # begin c1; c2; ... end
+    __slots__ = ('comandos',)
+    campos = __slots__
+
+    def __init__(self, comandos, linha, coluna):
+        self.comandos = comandos # Lista de comandos; comandos vazios não entram na lista
+        self.linha = linha
+        self.coluna = coluna
+
+class Atribuicao(No): # nome := expressao
+    __slots__ = ('nome', 'expressao', 'slot')
+    campos = ('nome', 'expressao')
+
+    def __init__(self, nome, expressao, linha, coluna):
+        self.nome = nome
+        self.expressao = expressao
+        self.slot = None # Posição da variável na memória, preenchida por interpretador.resolve_slots
+        self.linha = linha
+        self.coluna = coluna
+
+class Se(No): # if condicao then entao [else senao]
+    __slots__ = ('condicao', 'entao', 'senao')
+    campos = __slots__
+
+    def __init__(self, condicao, entao, senao, linha, coluna):
+        self.condicao = condicao
+        self.entao = entao # Comando ou None (comando vazio)
+        self.senao = senao # Comando ou None (sem else ou comando vazio)
+        self.linha = linha
+        self.coluna = coluna
+
+class Enquanto(No): # while condicao do corpo
+    __slots__ = ('condicao', 'corpo')
+    campos = __slots__
+
+    def __init__(self, condicao, corpo, linha, coluna):
+        self.condicao = condicao
+        self.corpo = corpo # Comando ou None (comando vazio)
+        self.linha = linha
+        self.coluna = coluna
+
+class Leitura(No): # read(x, y)
+    __slots__ = ('variaveis',)
+    campos = __slots__
+
+    def __init__(self, variaveis, linha, coluna):
+        self.variaveis = variaveis # Lista de Variavel
+        self.linha = linha
+        self.coluna = coluna
+
+class Escrita(No): # write(e1, e2)
+    __slots__ = ('expressoes',)
+    campos = __slots__
+
+    def __init__(self, expressoes, linha, coluna):
+        self.expressoes = expressoes # Lista de expressões
+        self.linha = linha
+        self.coluna = coluna
+
+# ---------------------------------------------------------------------------
+# Expressões
+# ---------------------------------------------------------------------------
+
+class Expressao(No): # Classe base das expressões, que carregam o tipo semântico
+    __slots__ = ('tipo',)
+
+class Numero(Expressao): # Constante inteira
+    __slots__ = ('valor',)
+    campos = __slots__
+
+    def __init__(self, valor, linha, coluna):
+        self.valor = valor
+        self.tipo = "integer"
+        self.linha = linha
+        self.coluna = coluna
+
+class Booleano(Expressao): # Constante true ou false
+    __slots__ = ('valor',)
+    campos = __slots__
+
+    def __init__(self, valor, linha, coluna):
+        self.valor = valor # True ou False
+        self.tipo = "boolean"
+        self.linha = linha
+        self.coluna = coluna
+
+class Variavel(Expressao): # Uso (ou declaração) de uma variável
+    __slots__ = ('nome', 'slot')
+    campos = ('nome',)
+
+    def __init__(self, nome, tipo, linha, coluna):
+        self.nome = nome
+        self.tipo = tipo # Tipo declarado; None enquanto não for resolvido
+        self.slot = None # Posição da variável na memória, preenchida por interpretador.resolve_slots
+        self.linha = linha
+        self.coluna = coluna
+
+class Unaria(Expressao): # Classe base dos operadores unários
+    __slots__ = ('operando',)
+    campos = __slots__
+    operador = None
+
+    def __init__(self, operando, tipo, linha, coluna):
+        self.operando = operando
+        self.tipo = tipo
+        self.linha = linha
+        self.coluna = coluna
+
+class Nao(Unaria): # not e
+    __slots__ = ()
+    operador = 'not'
+
+class MenosUnario(Unaria): # -e
+    __slots__ = ()
+    operador = '-'
+
+class Binaria(Expressao): # Classe base dos operadores binários
+    __slots__ = ('esquerda', 'direita')
+    campos = __slots__
+    operador = None
+
+    def __init__(self, esquerda, direita, tipo, linha, coluna):
+        self.esquerda = esquerda
+        self.direita = direita
+        self.tipo = tipo
+        self.linha = linha
+        self.coluna = coluna
+
+class Ou(Binaria):
+    __slots__ = ()
+    operador = 'or'
+
+class E(Binaria):
+    __slots__ = ()
+    operador = 'and'
+
+class Igual(Binaria):
+    __slots__ = ()
+    operador = '='
+
+class Diferente(Binaria):
+    __slots__ = ()
+    operador = '<>'
+
+class Menor(Binaria):
+    __slots__ = ()
+    operador = '<'
+
+class MenorIgual(Binaria):
+    __slots__ = ()
+    operador = '<='
+
+class Maior(Binaria):
+    __slots__ = ()
+    operador = '>'
+
+class MaiorIgual(Binaria):
+    __slots__ = ()
+    operador = '>='
+
+class Soma(Binaria):
+    __slots__ = ()
+    operador = '+'
+
+class Subtracao(Binaria):
+    __slots__ = ()
+    operador = '-'
+
+class Multiplicacao(Binaria):
+    __slots__ = ()
+    operador = '*'
+
+class Divisao(Binaria):
+    __slots__ = ()
+    operador = 'div'
+
+# Classe do nó para cada lexema de operador binário
+OPERADORES_BINARIOS = {classe.operador: classe for classe in (
+    Ou, E, Igual, Diferente, Menor, MenorIgual, Maior, MaiorIgual,
+    Soma, Subtracao, Multiplicacao, Divisao)}
+
+def iguais(a, b): # Compara duas árvores (ou listas/valores) estruturalmente, incluindo posição e tipo
+    if isinstance(a, No):
+        if type(a) is not type(b) or (a.linha, a.coluna) != (b.linha, b.coluna):
+            return False
+        if isinstance(a, Expressao) and a.tipo != b.tipo:
+            return False
+        return all(iguais(getattr(a, campo), getattr(b, campo)) for campo in a.campos)
+    if isinstance(a, list):
+        return isinstance(b, list) and len(a) == len(b) and all(map(iguais, a, b))
+    return a == b
@@ -0,0 +1,370 @@
+# Analisador léxico do Tascal por autômato finito determinístico (AFD) dirigido por tabela
+# Alternativa ao lexer do PLY (lexer.py), com a mesma interface (input, token, iteração, clone,
+# tokenize_all, lineno, lexpos, lexdata, diagnosticos) e exatamente os mesmos tokens, valores,
+# linhas e erros. Em vez de tentar as alternativas da regex mestre e chamar uma função Python
+# para os números, quebras de linha e comentários, o código é convertido de uma só vez (em C,
+# com encode e translate) para uma sequência de classes de caracteres ASCII, e cada token é
+# reconhecido percorrendo a tabela de transições até o estado morto (casamento mais longo).
+# A ação do estado final decide o token: palavra reservada ou ID, número, operador, espaços,
+# quebras de linha, comentário ou sequência de símbolos ilegais; terminar fora de um estado
+# final é um comentário sem fim. Com recupera_erros, os erros são registrados e a análise continua
+# Caracteres fora do ASCII só são aceitos dentro de comentários (como no lexer.py, exceto pelos
+# dígitos não ASCII, que o \d do PLY aceitaria em um número)
+# O código também pode ser lido aos poucos de um arquivo, mmap ou bytes (input_stream e
+# tokens_stream), com a memória limitada pelo tamanho do bloco em vez do tamanho do código
+# Exemplo: contexto = ContextoCompilacao(motor_lexico='afd')
+#          for token in Automato().tokens_stream(open('programa.tascal', 'rb')): ...
+import copy
+import codecs
+from array import array
+from bisect import bisect_left
+from tascal_compiler.lex import LexToken, LexTokenArrays, LexError, newline_offsets
+from tascal_compiler.lexer import palavras_reservadas, tokens, simbolos_ilegais
+
+# Classes de caracteres. FIM só aparece no sentinela colocado depois do último caractere
+(OUTRO, FIM, LETRA, DIGITO, SUBLINHADO, ESPACO, QUEBRA, ABRE_CHAVE, FECHA_CHAVE, C_MENOR, C_MAIOR,
+ C_DOIS_PONTOS, C_IGUAL, C_EPAR, C_DPAR, C_PV, C_MAIS, C_MENOS, C_VEZES, C_VIRG, C_PONTO) = range(21)
+CLASSES = 21
+
+TABELA_CLASSES = bytearray([OUTRO]) * 256 # Byte -> classe, para bytes.translate
+for _caractere, _classe in {' ': ESPACO, '\t': ESPACO, '\n': QUEBRA, '_': SUBLINHADO, '{': ABRE_CHAVE,
+                            '}': FECHA_CHAVE, '<': C_MENOR, '>': C_MAIOR, ':': C_DOIS_PONTOS, '=': C_IGUAL,
+                            '(': C_EPAR, ')': C_DPAR, ';': C_PV, '+': C_MAIS, '-': C_MENOS, '*': C_VEZES,
+                            ',': C_VIRG, '.': C_PONTO}.items():
+    TABELA_CLASSES[ord(_caractere)] = _classe
+for _byte in range(256):
+    if chr(_byte).isascii() and chr(_byte).isalpha():
+        TABELA_CLASSES[_byte] = LETRA
+    elif chr(_byte).isascii() and chr(_byte).isdigit():
+        TABELA_CLASSES[_byte] = DIGITO
+TABELA_CLASSES = bytes(TABELA_CLASSES)
+
+# Estados. O estado morto é o 0, para que a transição para ele seja falsa
+(MORTO, INICIO, E_ID, E_NUMERO, E_ESPACO, E_QUEBRA, E_COMENTARIO, E_FIM_COMENTARIO, E_MENOR, E_MENORIGUAL,
+ E_DIFERENTE, E_MAIOR, E_MAIORIGUAL, E_DP, E_DPIGUAL, E_IGUAL, E_EPAR, E_DPAR, E_PV, E_MAIS, E_MENOS,
+ E_VEZES, E_VIRG, E_PF, E_ILEGAL) = range(25)
+ESTADOS = 25
+
+TRANSICOES_AFD = { # Estado -> {classe: próximo estado}; as classes ausentes levam ao estado morto
+    INICIO: {LETRA: E_ID, DIGITO: E_NUMERO, ESPACO: E_ESPACO, QUEBRA: E_QUEBRA, ABRE_CHAVE: E_COMENTARIO,
+             C_MENOR: E_MENOR, C_MAIOR: E_MAIOR, C_DOIS_PONTOS: E_DP, C_IGUAL: E_IGUAL, C_EPAR: E_EPAR,
+             C_DPAR: E_DPAR, C_PV: E_PV, C_MAIS: E_MAIS, C_MENOS: E_MENOS, C_VEZES: E_VEZES,
+             C_VIRG: E_VIRG, C_PONTO: E_PF, OUTRO: E_ILEGAL, SUBLINHADO: E_ILEGAL, FECHA_CHAVE: E_ILEGAL},
+    E_ID: {LETRA: E_ID, DIGITO: E_ID, SUBLINHADO: E_ID},
+    E_NUMERO: {DIGITO: E_NUMERO},
+    E_ESPACO: {ESPACO: E_ESPACO},
+    E_QUEBRA: {QUEBRA: E_QUEBRA},
+    E_COMENTARIO: {classe: E_COMENTARIO for classe in range(CLASSES) if classe not in (FIM, FECHA_CHAVE)},
+    E_MENOR: {C_IGUAL: E_MENORIGUAL, C_MAIOR: E_DIFERENTE},
+    E_MAIOR: {C_IGUAL: E_MAIORIGUAL},
+    E_DP: {C_IGUAL: E_DPIGUAL},
+    E_ILEGAL: {OUTRO: E_ILEGAL, SUBLINHADO: E_ILEGAL, FECHA_CHAVE: E_ILEGAL}, # Símbolos que não iniciam tokens
+}
+TRANSICOES_AFD[E_COMENTARIO][FECHA_CHAVE] = E_FIM_COMENTARIO
+
+# Ações dos estados finais (os demais estados são de erro)
+ERRO, SIMPLES, IDENTIFICADOR, NUMERO, IGNORA, LINHAS, COMENTARIO, ILEGAL = range(8)
+OPERADORES = { # Estado final de um operador -> (tipo, valor)
+    E_MENOR: ('MENORQUE', '<'), E_MENORIGUAL: ('MENORIGUAL', '<='), E_DIFERENTE: ('DIFERENTE', '<>'),
+    E_MAIOR: ('MAIORQUE', '>'), E_MAIORIGUAL: ('MAIORIGUAL', '>='), E_DP: ('DP', ':'),
+    E_DPIGUAL: ('DPIGUAL', ':='), E_IGUAL: ('IGUAL', '='), E_EPAR: ('EPAR', '('), E_DPAR: ('DPAR', ')'),
+    E_PV: ('PV', ';'), E_MAIS: ('MAIS', '+'), E_MENOS: ('MENOS', '-'), E_VEZES: ('VEZES', '*'),
+    E_VIRG: ('VIRG', ','), E_PF: ('PF', '.'),
+}
+
+def _monta_tabelas():
+    # Tabela de transições achatada, com os estados já multiplicados pelo número de classes
+    # (próximo = TRANSICOES[estado + classe]), e as ações, tipos e valores indexados pelo estado
+    transicoes = [0] * (ESTADOS * CLASSES)
+    for estado, saidas in TRANSICOES_AFD.items():
+        for classe, proximo in saidas.items():
+            transicoes[estado * CLASSES + classe] = proximo * CLASSES
+    acoes = [ERRO] * (ESTADOS * CLASSES)
+    tipos = [None] * (ESTADOS * CLASSES)
+    valores = [None] * (ESTADOS * CLASSES)
+    for estado, acao in ((E_ID, IDENTIFICADOR), (E_NUMERO, NUMERO), (E_ESPACO, IGNORA),
+                         (E_QUEBRA, LINHAS), (E_FIM_COMENTARIO, COMENTARIO), (E_ILEGAL, ILEGAL)):
+        acoes[estado * CLASSES] = acao
+    for estado, (tipo, valor) in OPERADORES.items():
+        acoes[estado * CLASSES] = SIMPLES
+        tipos[estado * CLASSES] = tipo
+        valores[estado * CLASSES] = valor
+    return tuple(transicoes), tuple(acoes), tuple(tipos), tuple(valores)
+
+TRANSICOES, ACOES, TIPOS, VALORES = _monta_tabelas()
+TAMANHO_BLOCO = 1 << 16 # Tamanho dos blocos lidos no modo de fluxo
+
+def classes(codigo): # Classe de cada caractere do código, seguida do sentinela FIM
+    # Os caracteres fora do ASCII viram '?' (um byte cada, preservando as posições), da classe OUTRO
+    return codigo.encode('ascii', 'replace').translate(TABELA_CLASSES) + bytes([FIM])
+
+def leituras(fonte, tamanho_bloco): # Gera o que fonte.read(tamanho_bloco) devolve até o fim
+    while True:
+        parte = fonte.read(tamanho_bloco)
+        if not parte:
+            return
+        yield parte
+
+def blocos(fonte, tamanho_bloco=TAMANHO_BLOCO, encoding='utf-8'):
+    # Gera o texto da fonte em blocos de até tamanho_bloco caracteres. A fonte pode ser um arquivo
+    # aberto em modo texto ou binário, um mmap ou bytes; os bytes são decodificados aos poucos, e um
+    # caractere dividido entre dois blocos só sai quando estiver completo
+    if isinstance(fonte, (bytes, bytearray, memoryview)):
+        dados = memoryview(fonte)
+        partes = (dados[i:i + tamanho_bloco] for i in range(0, len(dados), tamanho_bloco))
+    else:
+        partes = leituras(fonte, tamanho_bloco)
+    decodificador = codecs.getincrementaldecoder(encoding)()
+    for parte in partes:
+        texto = parte if isinstance(parte, str) else decodificador.decode(parte)
+        if texto:
+            yield texto
+    resto = decodificador.decode(b'', final=True)
+    if resto:
+        yield resto
+
+class Automato: # Lexer do Tascal pelo AFD, com a mesma interface do lex.Lexer usado pelo parser
+    # No modo de fluxo (input_stream), lexdata guarda só uma janela do código, que começa na posição
+    # lexbase do código; lexpos é relativo à janela, como no lex.Lexer, mas os tokens e os diagnósticos
+    # usam posições no código inteiro. Quando o reconhecimento de um token chega ao fim da janela sem
+    # chegar ao estado morto, o token pode continuar no próximo bloco: a janela passa a ser o resto a
+    # partir do início do token mais o bloco seguinte, e o token é reconhecido de novo. Assim, além da
+    # janela, só fica na memória o índice das quebras de linha (para as colunas de posições antigas)
+    def __init__(self):
+        self.lexdata = None
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lexbase = 0 # Posição do início de lexdata no código
+        self.lineno = 1
+        self.classes = b''
+        self.fluxo = None # Blocos ainda não lidos no modo de fluxo (ver blocos)
+        self.quebras = None # Posições das quebras de linha (lidas até agora, no modo de fluxo)
+        self.lextokens = frozenset(tokens)
+        self.lextokens_all = self.lextokens
+        self.diagnosticos = None # Coletor dos erros léxicos (ver diagnosticos.py)
+        self.recupera_erros = False # Continua depois de um erro léxico (ver lexer.py)
+
+    def clone(self):
+        return copy.copy(self)
+
+    def input(self, s):
+        self.lexdata = s
+        self.lexpos = 0
+        self.lexlen = len(s)
+        self.lexbase = 0
+        self.classes = classes(s)
+        self.fluxo = None
+        self.quebras = None
+
+    def input_stream(self, fonte, tamanho_bloco=TAMANHO_BLOCO, encoding='utf-8'):
+        # Lê o código da fonte (arquivo, mmap ou bytes; ver blocos) aos poucos, enquanto os tokens são pedidos
+        self.input('')
+        self.fluxo = blocos(fonte, tamanho_bloco, encoding)
+        self.quebras = array('q')
+
+    def tokens_stream(self, fonte, tamanho_bloco=TAMANHO_BLOCO, encoding='utf-8'): # Gerador dos tokens da fonte
+        self.input_stream(fonte, tamanho_bloco, encoding)
+        yield from self
+
+    def recarrega(self, inicio):
+        # Descarta a janela até inicio e acrescenta o próximo bloco (ou mais de um, se o que sobrou da
+        # janela já for maior que um bloco, para que um token longo não seja reconhecido de novo a cada
+        # bloco); no fim da fonte, o modo de fluxo termina e a janela fica como está
+        partes = [self.lexdata[inicio:]]
+        lidos = len(self.lexdata) - inicio
+        fim = self.lexbase + len(self.lexdata) # Posição no código do primeiro caractere a ler
+        alvo = 2 * lidos
+        while lidos <= alvo:
+            bloco = next(self.fluxo, None)
+            if bloco is None:
+                self.fluxo = None
+                break
+            self.quebras.extend(newline_offsets(bloco, fim))
+            partes.append(bloco)
+            lidos += len(bloco)
+            fim += len(bloco)
+        self.lexbase += inicio
+        self.lexdata = ''.join(partes)
+        self.lexlen = len(self.lexdata)
+        self.classes = classes(self.lexdata)
+
+    # Linha e coluna (a partir de 1) da posição lexpos do código, por busca binária nas posições das
+    # quebras de linha, como em lex.Lexer; fora do modo de fluxo, elas são calculadas no primeiro uso
+    def line(self, lexpos):
+        if self.quebras is None:
+            self.quebras = newline_offsets(self.lexdata)
+        return bisect_left(self.quebras, lexpos) + 1
+
+    def column(self, lexpos):
+        if self.quebras is None:
+            self.quebras = newline_offsets(self.lexdata)
+        i = bisect_left(self.quebras, lexpos)
+        return lexpos - (self.quebras[i - 1] if i else -1)
+
+    def erro(self, inicio, linha): # Registra o símbolo ilegal em lexdata[inicio] e devolve o LexError
+        dados = self.lexdata
+        self.diagnosticos.registra('LEX001', linha, self.column(self.lexbase + inicio), dados[inicio])
+        return LexError(f"Scanning error. Illegal character {dados[inicio]!r}", dados[inicio:])
+
+    def recupera(self, inicio, pos, linha, acao): # Registra o erro de lexdata[inicio:pos] no modo de recuperação
+        coluna = self.column(self.lexbase + inicio)
+        if acao == ILEGAL:
+            simbolos_ilegais(self.diagnosticos, linha, coluna, self.lexdata[inicio:pos])
+        else:
+            self.diagnosticos.registra('LEX003', linha, coluna)
+
+    def token(self):
+        pos = self.lexpos
+        fim = self.lexlen
+        if pos >= fim and self.fluxo is None:
+            if self.lexdata is None:
+                raise RuntimeError('No input string given with input()')
+            self.lexpos = pos + 1
+            return None
+        dados = self.lexdata
+        classes = self.classes
+        base = self.lexbase
+        transicoes = TRANSICOES
+        acoes = ACOES
+        linha = self.lineno
+        while True:
+            inicio = pos
+            estado = transicoes[INICIO * CLASSES + classes[pos]]
+            while estado: # Casamento mais longo: avança até a transição para o estado morto
+                pos += 1
+                proximo = transicoes[estado + classes[pos]]
+                if not proximo:
+                    break
+                estado = proximo
+            if pos == fim and self.fluxo is not None: # O token pode continuar no próximo bloco
+                self.recarrega(inicio)
+                dados = self.lexdata
+                classes = self.classes
+                base = self.lexbase
+                fim = self.lexlen
+                pos = 0
+                continue
+            acao = acoes[estado]
+            if acao == IDENTIFICADOR:
+                tok = LexToken()
+                tok.value = valor = dados[inicio:pos]
+                tok.type = palavras_reservadas.get(valor, 'ID')
+            elif acao == SIMPLES:
+                tok = LexToken()
+                tok.type = TIPOS[estado]
+                tok.value = VALORES[estado]
+            elif acao == IGNORA:
+                continue
+            elif acao == NUMERO:
+                tok = LexToken()
+                tok.type = 'NUMERO'
+                tok.value = int(dados[inicio:pos])
+            elif acao == LINHAS:
+                linha += pos - inicio
+                continue
+            elif acao == COMENTARIO: # Comentários não são permitidos; as quebras de linha dentro dele contam
+                self.diagnosticos.registra('LEX002', linha, self.column(base + inicio))
+                linha += dados.count('\n', inicio, pos)
+                continue
+            elif inicio == fim: # Fim do código
+                self.lineno = linha
+                self.lexpos = fim + 1
+                return None
+            elif self.recupera_erros: # Pula os símbolos ilegais, ou o comentário sem fim até o fim do código
+                self.recupera(inicio, pos, linha, acao)
+                linha += dados.count('\n', inicio, pos)
+                continue
+            else: # Símbolo ilegal (inclusive o '{' de um comentário sem fim): para a análise, como o PLY
+                self.lineno = linha
+                self.lexpos = inicio
+                raise self.erro(inicio, linha)
+            tok.lineno = self.lineno = linha
+            tok.lexpos = base + inicio
+            self.lexpos = pos
+            return tok
+
+    # Tokeniza o código inteiro de uma vez em arrays (lex.LexTokenArrays), como lex.Lexer.tokenize_all
+    def tokenize_all(self, s):
+        self.input(s)
+        typenames = sorted(self.lextokens_all)
+        typecodes = {name: code for code, name in enumerate(typenames)}
+        result = LexTokenArrays(typenames)
+        types_append = result.types.append
+        lexpos_append = result.lexpos.append
+        lineno_append = result.lineno.append
+        values_append = result.values.append
+        valuetable = result.valuetable
+        interned = {}
+        codigos = tuple(typecodes.get(tipo) for tipo in TIPOS) # Estado -> código do tipo do operador
+        codigo_id = typecodes['ID']
+        codigo_numero = typecodes['NUMERO']
+        reservadas = {palavra: typecodes[tipo] for palavra, tipo in palavras_reservadas.items()}
+
+        dados = s
+        classes = self.classes
+        transicoes = TRANSICOES
+        acoes = ACOES
+        fim = self.lexlen
+        linha = self.lineno
+        pos = 0
+        while True:
+            inicio = pos
+            estado = transicoes[INICIO * CLASSES + classes[pos]]
+            while estado:
+                pos += 1
+                proximo = transicoes[estado + classes[pos]]
+                if not proximo:
+                    break
+                estado = proximo
+            acao = acoes[estado]
+            if acao == IDENTIFICADOR:
+                valor = dados[inicio:pos]
+                codigo = reservadas.get(valor, codigo_id)
+                chave = valor
+            elif acao == SIMPLES:
+                codigo = codigos[estado]
+                chave = valor = VALORES[estado]
+            elif acao == IGNORA:
+                continue
+            elif acao == NUMERO:
+                codigo = codigo_numero
+                valor = int(dados[inicio:pos])
+                chave = (int, valor) # 1 e True ficam separados, como no lex.Lexer
+            elif acao == LINHAS:
+                linha += pos - inicio
+                continue
+            elif acao == COMENTARIO:
+                self.diagnosticos.registra('LEX002', linha, self.column(inicio))
+                linha += dados.count('\n', inicio, pos)
+                continue
+            elif inicio == fim:
+                break
+            elif self.recupera_erros:
+                self.recupera(inicio, pos, linha, acao)
+                linha += dados.count('\n', inicio, pos)
+                continue
+            else:
+                self.lineno = linha
+                self.lexpos = inicio
+                result.error = self.erro(inicio, linha)
+                return result
+            indice = interned.get(chave)
+            if indice is None:
+                indice = interned[chave] = len(valuetable)
+                valuetable.append(valor)
+            types_append(codigo)
+            lexpos_append(inicio)
+            lineno_append(linha)
+            values_append(indice)
+        self.lineno = linha
+        self.lexpos = fim
+        return result
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
@@ -0,0 +1,426 @@
+# Compilador de bytecode e máquina de pilha do Tascal
+# O programa já verificado (arvore.Programa sem erros) é traduzido para um array('i')
+# compacto: cada instrução é um código seguido de zero a quatro argumentos inteiros, com
+# inteiros pequenos, índices de variáveis e destinos de desvios embutidos no próprio array.
+# As variáveis ocupam os primeiros registradores da memória e as constantes usadas como
+# operandos (inteiros grandes, true, false, ...) os seguintes, de modo que uma folha da
+# expressão é sempre um índice. Expressões gerais são avaliadas na pilha; as formas mais
+# comuns (x := a op b, while a op b, if a op b) viram uma única instrução sobre registradores.
+# Uma tabela de linhas no estilo do co_lnotab do CPython liga as posições do bytecode às
+# linhas do código-fonte e só é consultada para montar mensagens de erro
+import sys
+import operator
+from array import array
+from tascal_compiler import arvore
+from tascal_compiler.interpretador import (ErroExecucao, LimiteInstrucoesExcedido, Entrada,
+                                           VALOR_INICIAL, resolve_slots, nomes_slots, formata_valor)
+
+# Códigos das instruções (r, a, b, d: registradores; k: operador de OPERACOES; p: posição)
+CARREGA = 1               # CARREGA r: empilha memoria[r]
+EMPILHA = 2               # EMPILHA n: empilha o inteiro n
+ARMAZENA = 3              # ARMAZENA d: desempilha para memoria[d]
+COPIA = 4                 # COPIA d r: memoria[d] = memoria[r]
+ATRIBUI_SOMA = 5          # ATRIBUI_SOMA d a b: memoria[d] = memoria[a] + memoria[b]
+ATRIBUI_BINARIA = 6       # ATRIBUI_BINARIA k d a b: memoria[d] = op(memoria[a], memoria[b])
+BINARIA_REGISTROS = 7     # BINARIA_REGISTROS k a b: empilha op(memoria[a], memoria[b])
+BINARIA = 8               # BINARIA k: desempilha b e a, empilha op(a, b)
+DESVIA_SE_BINARIA = 9     # DESVIA_SE_BINARIA k a b p: desvia se op(memoria[a], memoria[b]) (volta do while)
+DESVIA_SE_NAO_BINARIA = 10 # DESVIA_SE_NAO_BINARIA k a b p: desvia se não op(memoria[a], memoria[b])
+DESVIA = 11               # DESVIA p: continua na posição p
+DESVIA_SE_VERDADEIRO = 12 # DESVIA_SE_VERDADEIRO p: desempilha e desvia se for true (volta do while)
+DESVIA_SE_FALSO = 13      # DESVIA_SE_FALSO p: desempilha e desvia se for false
+E_OU_DESVIA = 14          # and: se o topo for false, desvia para p mantendo-o; senão desempilha
+OU_OU_DESVIA = 15         # or: se o topo for true, desvia para p mantendo-o; senão desempilha
+NAO = 16
+NEGA = 17                 # Menos unário
+ESCREVE = 18              # ESCREVE n: desempilha n valores e escreve uma linha
+LE_INTEIRO = 19           # LE_INTEIRO d: lê um integer da entrada para memoria[d]
+LE_BOOLEANO = 20          # LE_BOOLEANO d: lê um boolean da entrada para memoria[d]
+PARA = 21                 # Fim do programa
+
+NOMES = {codigo: nome for nome, codigo in list(globals().items())
+         if isinstance(codigo, int) and nome.isupper()} # Código -> mnemônico, para desmontar
+ARGUMENTOS = { # Quantidade de argumentos de cada instrução
+    CARREGA: 1, EMPILHA: 1, ARMAZENA: 1, COPIA: 2, ATRIBUI_SOMA: 3, ATRIBUI_BINARIA: 4, BINARIA_REGISTROS: 3,
+    BINARIA: 1, DESVIA_SE_BINARIA: 4, DESVIA_SE_NAO_BINARIA: 4, DESVIA: 1, DESVIA_SE_VERDADEIRO: 1,
+    DESVIA_SE_FALSO: 1, E_OU_DESVIA: 1, OU_OU_DESVIA: 1, NAO: 0, NEGA: 0, ESCREVE: 1,
+    LE_INTEIRO: 1, LE_BOOLEANO: 1, PARA: 0,
+}
+
+def divisao(a, b): # div do Pascal: trunca em direção a zero (ZeroDivisionError se b == 0)
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+# Operadores binários; o índice de cada um é o argumento k das instruções. O and e o or
+# não estão aqui porque são avaliados em curto-circuito, com desvios
+OPERACOES = (operator.add, operator.sub, operator.mul, divisao, operator.eq, operator.ne,
+             operator.lt, operator.le, operator.gt, operator.ge)
+OPERADOR = { # Classe do nó -> índice em OPERACOES
+    arvore.Soma: 0, arvore.Subtracao: 1, arvore.Multiplicacao: 2, arvore.Divisao: 3,
+    arvore.Igual: 4, arvore.Diferente: 5, arvore.Menor: 6, arvore.MenorIgual: 7,
+    arvore.Maior: 8, arvore.MaiorIgual: 9,
+}
+SIMBOLOS = ("+", "-", "*", "div", "=", "<>", "<", "<=", ">", ">=") # Para desmontar
+FOLHAS = (arvore.Variavel, arvore.Numero, arvore.Booleano) # Nós que ocupam um registrador
+
+MENOR_INT, MAIOR_INT = -2 ** 31, 2 ** 31 - 1 # Inteiros que cabem no array('i')
+
+class Codigo: # Programa compilado: bytecode, registradores e tabela de linhas
+    def __init__(self, instrucoes, tipos, nomes, constantes, tabela_linhas, primeira_linha):
+        self.instrucoes = instrucoes # array('i')
+        self.tipos = tipos # Tipo de cada variável (registradores 0 .. len(tipos) - 1)
+        self.nomes = nomes # Nome de cada variável
+        self.constantes = constantes # Valores dos registradores seguintes, somente leitura
+        self.tabela_linhas = tabela_linhas # array('i') com pares (avanço da posição, avanço da linha)
+        self.primeira_linha = primeira_linha
+
+    def memoria_inicial(self): # Registradores no início da execução
+        return [VALOR_INICIAL[tipo] for tipo in self.tipos] + self.constantes
+
+    def linha_de(self, posicao): # Linha do código-fonte da instrução na posição dada
+        linha = self.primeira_linha
+        inicio = 0
+        tabela = self.tabela_linhas
+        for k in range(0, len(tabela), 2):
+            inicio += tabela[k]
+            if inicio > posicao:
+                break
+            linha += tabela[k + 1]
+        return linha
+
+    def registrador(self, r): # Nome da variável ou valor da constante do registrador r
+        if r < len(self.nomes):
+            return self.nomes[r]
+        return formata_valor(self.constantes[r - len(self.nomes)])
+
+    def desmonta(self): # Listagem legível do bytecode, uma instrução por linha
+        listagem = []
+        instrucoes = self.instrucoes
+        pc = 0
+        while pc < len(instrucoes):
+            op = instrucoes[pc]
+            argumentos = list(instrucoes[pc + 1:pc + 1 + ARGUMENTOS[op]])
+            texto = f"{self.linha_de(pc):>5} {pc:>6} {NOMES[op]} {' '.join(map(str, argumentos))}".rstrip()
+            if op in (CARREGA, ARMAZENA, LE_INTEIRO, LE_BOOLEANO):
+                texto += f" ({self.registrador(argumentos[0])})"
+            elif op == COPIA:
+                texto += f" ({self.registrador(argumentos[0])} := {self.registrador(argumentos[1])})"
+            elif op == ATRIBUI_SOMA:
+                d, a, b = argumentos
+                texto += f" ({self.registrador(d)} := {self.registrador(a)} + {self.registrador(b)})"
+            elif op == ATRIBUI_BINARIA:
+                k, d, a, b = argumentos
+                texto += f" ({self.registrador(d)} := {self.registrador(a)} {SIMBOLOS[k]} {self.registrador(b)})"
+            elif op in (BINARIA_REGISTROS, DESVIA_SE_BINARIA, DESVIA_SE_NAO_BINARIA):
+                k, a, b = argumentos[:3]
+                texto += f" ({self.registrador(a)} {SIMBOLOS[k]} {self.registrador(b)})"
+            elif op == BINARIA:
+                texto += f" ({SIMBOLOS[argumentos[0]]})"
+            listagem.append(texto)
+            pc += 1 + ARGUMENTOS[op]
+        return listagem
+
+class CompiladorBytecode: # Traduz um arvore.Programa sem erros para um Codigo
+    def __init__(self):
+        self.instrucoes = array('i')
+        self.constantes = []
+        self.indices_constantes = {} # (tipo, valor) -> índice em constantes; o tipo separa true de 1
+        self.linhas = [] # Pares (posição, linha) no início de cada trecho de uma nova linha
+
+    def compila(self, programa):
+        self.tipos = resolve_slots(programa)
+        self.nomes = nomes_slots(programa)
+        self.marca_linha(programa.linha)
+        self.comando(programa.corpo)
+        self.emite(PARA)
+
+        tabela = array('i')
+        posicao_anterior, linha_anterior = self.linhas[0]
+        for posicao, linha in self.linhas[1:]:
+            tabela.extend((posicao - posicao_anterior, linha - linha_anterior))
+            posicao_anterior, linha_anterior = posicao, linha
+        return Codigo(self.instrucoes, self.tipos, self.nomes, self.constantes, tabela, self.linhas[0][1])
+
+    def emite(self, op, *argumentos): # Acrescenta uma instrução; devolve a posição do último argumento
+        self.instrucoes.append(op)
+        self.instrucoes.extend(argumentos)
+        return len(self.instrucoes) - 1
+
+    def posicao(self): # Posição da próxima instrução
+        return len(self.instrucoes)
+
+    def corrige(self, posicao_argumento, alvo): # Preenche o destino de um desvio já emitido
+        self.instrucoes[posicao_argumento] = alvo
+
+    def marca_linha(self, linha): # As próximas instruções pertencem à linha dada
+        if self.linhas and self.linhas[-1][0] == self.posicao():
+            self.linhas[-1] = (self.posicao(), linha)
+        elif not self.linhas or self.linhas[-1][1] != linha:
+            self.linhas.append((self.posicao(), linha))
+
+    def registrador(self, no): # Registrador de uma folha (variável ou constante), ou None
+        tipo = type(no)
+        if tipo is arvore.Variavel:
+            return no.slot
+        if tipo is arvore.Numero or tipo is arvore.Booleano:
+            chave = (type(no.valor), no.valor)
+            k = self.indices_constantes.get(chave)
+            if k is None:
+                k = self.indices_constantes[chave] = len(self.constantes)
+                self.constantes.append(no.valor)
+            return len(self.tipos) + k
+        return None
+
+    def operandos(self, no): # (k, a, b) se no for um operador binário entre duas folhas, senão None
+        k = OPERADOR.get(type(no))
+        if k is None or type(no.esquerda) not in FOLHAS or type(no.direita) not in FOLHAS:
+            return None
+        if type(no) is arvore.Divisao: # A divisão por zero é informada com a linha do operador
+            self.marca_linha(no.linha)
+        return k, self.registrador(no.esquerda), self.registrador(no.direita)
+
+    # Comandos
+
+    def comando(self, no):
+        if no is None: # Comando vazio
+            return
+        tipo = type(no)
+        if tipo is arvore.Bloco:
+            for comando in no.comandos:
+                self.comando(comando)
+            return
+        self.marca_linha(no.linha)
+        if tipo is arvore.Atribuicao:
+            binaria = self.operandos(no.expressao)
+            if binaria is not None:
+                k, a, b = binaria
+                if k == 0: # Soma, a operação mais comum, sem passar pela tabela de operadores
+                    self.emite(ATRIBUI_SOMA, no.slot, a, b)
+                else:
+                    self.emite(ATRIBUI_BINARIA, k, no.slot, a, b)
+            elif type(no.expressao) in FOLHAS:
+                self.emite(COPIA, no.slot, self.registrador(no.expressao))
+            else:
+                self.expressao(no.expressao)
+                self.emite(ARMAZENA, no.slot)
+        elif tipo is arvore.Se:
+            desvio_senao = self.condicao(no.condicao, False, 0)
+            self.comando(no.entao)
+            if no.senao is not None:
+                desvio_fim = self.emite(DESVIA, 0)
+                self.corrige(desvio_senao, self.posicao())
+                self.comando(no.senao)
+                self.corrige(desvio_fim, self.posicao())
+            else:
+                self.corrige(desvio_senao, self.posicao())
+        elif tipo is arvore.Enquanto:
+            # O teste fica depois do corpo: cada volta executa um único desvio
+            desvio_teste = self.emite(DESVIA, 0)
+            inicio_corpo = self.posicao()
+            self.comando(no.corpo)
+            self.corrige(desvio_teste, self.posicao())
+            self.marca_linha(no.linha)
+            self.condicao(no.condicao, True, inicio_corpo)
+        elif tipo is arvore.Leitura:
+            for variavel in no.variaveis:
+                self.emite(LE_BOOLEANO if self.tipos[variavel.slot] == "boolean" else LE_INTEIRO, variavel.slot)
+        elif tipo is arvore.Escrita:
+            for expressao in no.expressoes:
+                self.expressao(expressao)
+            self.emite(ESCREVE, len(no.expressoes))
+
+    def condicao(self, no, desvia_se, alvo): # Avalia no e desvia para alvo se o resultado for desvia_se
+        # Devolve a posição do argumento com o destino, para ser corrigido depois
+        binaria = self.operandos(no)
+        if binaria is not None:
+            return self.emite(DESVIA_SE_BINARIA if desvia_se else DESVIA_SE_NAO_BINARIA, *binaria, alvo)
+        self.expressao(no)
+        return self.emite(DESVIA_SE_VERDADEIRO if desvia_se else DESVIA_SE_FALSO, alvo)
+
+    # Expressões
+
+    def expressao(self, no): # Emite o código que empilha o valor de no
+        # Sem recursão: uma expressão longa (x + x + ... + x) é uma árvore com a profundidade do número
+        # de termos. pendentes guarda os nós a compilar e, em tuplas (instrução, nó), as instruções
+        # emitidas depois do código dos operandos
+        pendentes = [no]
+        while pendentes:
+            no = pendentes.pop()
+            tipo = type(no)
+            if tipo is tuple:
+                op, no = no
+                if op is None: # Fim do lado direito do and/or; no é a posição do desvio do lado esquerdo
+                    self.corrige(no, self.posicao())
+                elif op == BINARIA:
+                    if type(no) is arvore.Divisao:
+                        self.marca_linha(no.linha)
+                    self.emite(BINARIA, OPERADOR[type(no)])
+                elif op == NAO or op == NEGA:
+                    self.emite(op)
+                else: # Fim do lado esquerdo do and/or
+                    pendentes += ((None, self.emite(op, 0)), no.direita)
+            elif tipo is arvore.Numero and MENOR_INT <= no.valor <= MAIOR_INT:
+                self.emite(EMPILHA, no.valor)
+            elif tipo in FOLHAS:
+                self.emite(CARREGA, self.registrador(no))
+            else:
+                binaria = self.operandos(no)
+                if binaria is not None:
+                    self.emite(BINARIA_REGISTROS, *binaria)
+                elif tipo is arvore.Nao:
+                    pendentes += ((NAO, no), no.operando)
+                elif tipo is arvore.MenosUnario:
+                    pendentes += ((NEGA, no), no.operando)
+                elif tipo is arvore.E or tipo is arvore.Ou: # Curto-circuito, como no interpretador
+                    pendentes += ((E_OU_DESVIA if tipo is arvore.E else OU_OU_DESVIA, no), no.esquerda)
+                else:
+                    pendentes += ((BINARIA, no), no.direita, no.esquerda)
+
+def compila(programa): # Compila um arvore.Programa (sem erros) para bytecode
+    return CompiladorBytecode().compila(programa)
+
+class MaquinaPilha: # Executa um Codigo
+    def __init__(self, codigo, entrada=None, saida=None, limite_instrucoes=None, tamanho_lote=1024):
+        self.codigo = codigo
+        self.memoria = codigo.memoria_inicial() # Variáveis seguidas das constantes
+        self.entrada = Entrada(entrada if entrada is not None else sys.stdin, self.descarrega)
+        self.saida = saida if saida is not None else sys.stdout
+        self.limite_instrucoes = limite_instrucoes # None: sem limite
+        self.tamanho_lote = tamanho_lote # Linhas de saída acumuladas antes de escrever
+        self.instrucoes = 0 # Instruções de bytecode executadas
+        self.lote = [] # Linhas de saída ainda não escritas
+
+    def descarrega(self): # Escreve as linhas de saída acumuladas
+        if self.lote:
+            self.saida.write("\n".join(self.lote) + "\n")
+            self.lote.clear()
+
+    def executa(self): # Executa o programa; devolve o número de instruções executadas
+        # O limite é verificado nos desvios para trás (voltas do while) e no fim do programa;
+        # entre duas verificações executa-se no máximo o tamanho do bytecode em instruções.
+        # Os códigos são comparados como literais, em dois níveis: primeiro o grupo
+        # (registradores, desvios, demais), depois a instrução, da mais para a menos frequente
+        codigo = self.codigo.instrucoes
+        memoria = self.memoria
+        operacoes = OPERACOES
+        limite = self.limite_instrucoes if self.limite_instrucoes is not None else sys.maxsize
+        lote, tamanho_lote = self.lote, self.tamanho_lote
+        pilha = []
+        empilha = pilha.append
+        desempilha = pilha.pop
+        executadas = 0
+        pc = 0
+        try:
+            while True:
+                op = codigo[pc]
+                executadas += 1
+                if op <= 7: # Instruções sobre registradores, as mais frequentes
+                    if op == 1: # CARREGA
+                        empilha(memoria[codigo[pc + 1]])
+                        pc += 2
+                    elif op == 5: # ATRIBUI_SOMA
+                        memoria[codigo[pc + 1]] = memoria[codigo[pc + 2]] + memoria[codigo[pc + 3]]
+                        pc += 4
+                    elif op == 6: # ATRIBUI_BINARIA
+                        memoria[codigo[pc + 2]] = operacoes[codigo[pc + 1]](memoria[codigo[pc + 3]],
+                                                                            memoria[codigo[pc + 4]])
+                        pc += 5
+                    elif op == 4: # COPIA
+                        memoria[codigo[pc + 1]] = memoria[codigo[pc + 2]]
+                        pc += 3
+                    elif op == 7: # BINARIA_REGISTROS
+                        empilha(operacoes[codigo[pc + 1]](memoria[codigo[pc + 2]], memoria[codigo[pc + 3]]))
+                        pc += 4
+                    elif op == 3: # ARMAZENA
+                        memoria[codigo[pc + 1]] = desempilha()
+                        pc += 2
+                    else: # EMPILHA
+                        empilha(codigo[pc + 1])
+                        pc += 2
+                elif op <= 13: # Desvios e operadores sobre a pilha
+                    if op == 9: # DESVIA_SE_BINARIA
+                        if operacoes[codigo[pc + 1]](memoria[codigo[pc + 2]], memoria[codigo[pc + 3]]):
+                            if executadas > limite:
+                                raise LimiteInstrucoesExcedido(f"limite de {limite} instruções excedido",
+                                                               self.codigo.linha_de(pc))
+                            pc = codigo[pc + 4]
+                        else:
+                            pc += 5
+                    elif op == 10: # DESVIA_SE_NAO_BINARIA
+                        if operacoes[codigo[pc + 1]](memoria[codigo[pc + 2]], memoria[codigo[pc + 3]]):
+                            pc += 5
+                        else:
+                            pc = codigo[pc + 4]
+                    elif op == 8: # BINARIA
+                        b = desempilha()
+                        pilha[-1] = operacoes[codigo[pc + 1]](pilha[-1], b)
+                        pc += 2
+                    elif op == 11: # DESVIA
+                        pc = codigo[pc + 1]
+                    elif op == 12: # DESVIA_SE_VERDADEIRO
+                        if desempilha():
+                            if executadas > limite:
+                                raise LimiteInstrucoesExcedido(f"limite de {limite} instruções excedido",
+                                                               self.codigo.linha_de(pc))
+                            pc = codigo[pc + 1]
+                        else:
+                            pc += 2
+                    else: # DESVIA_SE_FALSO
+                        if desempilha():
+                            pc += 2
+                        else:
+                            pc = codigo[pc + 1]
+                elif op == 18: # ESCREVE
+                    n = codigo[pc + 1]
+                    if n == 1:
+                        valor = desempilha()
+                        lote.append("true" if valor is True else "false" if valor is False else str(valor))
+                    else:
+                        valores = pilha[-n:]
+                        del pilha[-n:]
+                        lote.append(" ".join([formata_valor(valor) for valor in valores]))
+                    if len(lote) >= tamanho_lote:
+                        self.descarrega()
+                    pc += 2
+                elif op == 14: # E_OU_DESVIA
+                    if pilha[-1]:
+                        desempilha()
+                        pc += 2
+                    else:
+                        pc = codigo[pc + 1]
+                elif op == 15: # OU_OU_DESVIA
+                    if pilha[-1]:
+                        pc = codigo[pc + 1]
+                    else:
+                        desempilha()
+                        pc += 2
+                elif op == 16: # NAO
+                    pilha[-1] = not pilha[-1]
+                    pc += 1
+                elif op == 17: # NEGA
+                    pilha[-1] = -pilha[-1]
+                    pc += 1
+                elif op == 19 or op == 20: # LE_INTEIRO, LE_BOOLEANO
+                    registrador = codigo[pc + 1]
+                    try:
+                        memoria[registrador] = self.entrada.le("integer" if op == 19 else "boolean",
+                                                               self.codigo.nomes[registrador], 0)
+                    except ErroExecucao as e:
+                        e.linha = self.codigo.linha_de(pc)
+                        raise
+                    pc += 2
+                elif op == 21: # PARA
+                    if executadas > limite:
+                        raise LimiteInstrucoesExcedido(f"limite de {limite} instruções excedido",
+                                                       self.codigo.linha_de(pc))
+                    return executadas
+                else:
+                    raise ValueError(f"instrução inválida {op} na posição {pc}")
+        except ZeroDivisionError: # Só a divisão (OPERACOES[3]) divide
+            raise ErroExecucao("divisão por zero", self.codigo.linha_de(pc)) from None
+        finally:
+            self.instrucoes = executadas
+            self.descarrega()
+
+def executa(codigo, entrada=None, saida=None, limite_instrucoes=None): # Executa e devolve as instruções executadas
+    return MaquinaPilha(codigo, entrada, saida, limite_instrucoes).executa()
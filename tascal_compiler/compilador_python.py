@@ -0,0 +1,339 @@
+# Tradutor do Tascal para Python: o programa já verificado (arvore.Programa sem erros) vira
+# uma árvore do módulo ast do Python, compilada com compile() para um code object que o
+# próprio CPython executa. Cada variável é uma variável local de uma função (acesso rápido,
+# sem dicionários), o div vira uma divisão inteira truncada em direção a zero, o and e o
+# or viram os operadores de curto-circuito do Python e o write acumula as linhas em uma
+# lista, escrita em lotes. Os nós gerados levam a linha do código Tascal de origem, de modo
+# que o traceback de uma divisão por zero aponta direto para a linha do programa Tascal.
+# Os code objects podem ser guardados com marshal em uma pasta de cache, indexados pelo
+# hash do código-fonte: executar de novo um programa inalterado não passa pelo lexer, pelo
+# parser nem pela tradução
+import os
+import sys
+import ast
+import types
+import marshal
+import hashlib
+import tempfile
+from tascal_compiler import arvore
+from tascal_compiler.lex import LexError
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.interpretador import ErroExecucao, LimiteInstrucoesExcedido, Entrada, VALOR_INICIAL
+
+VERSAO = 1 # Versão da tradução; mudá-la invalida os code objects já guardados no cache
+
+# Assinatura da função gerada: _le é Entrada.le, _lote a lista de linhas de saída, _descarrega
+# escreve o lote, _excedido levanta LimiteInstrucoesExcedido e _limite é o número de voltas
+# de laço permitidas. A função devolve as voltas que sobraram
+ESQUELETO = "def programa(_le, _lote, _descarrega, _excedido, _limite, _tamanho_lote):\n    pass\n"
+
+# Expressões mais profundas que isso são linearizadas (TradutorPython.expressao_linear): nem a
+# tradução recursiva nem o compile() do CPython aceitam uma árvore com milhares de níveis
+LIMITE_PROFUNDIDADE = 100
+APLICA, ABRE_DIREITA, FECHA_DIREITA = range(3) # Fases de um operador em expressao_linear
+
+OPERADORES_ARITMETICOS = {
+    arvore.Soma: ast.Add,
+    arvore.Subtracao: ast.Sub,
+    arvore.Multiplicacao: ast.Mult,
+}
+OPERADORES_RELACIONAIS = {
+    arvore.Igual: ast.Eq,
+    arvore.Diferente: ast.NotEq,
+    arvore.Menor: ast.Lt,
+    arvore.MenorIgual: ast.LtE,
+    arvore.Maior: ast.Gt,
+    arvore.MaiorIgual: ast.GtE,
+}
+
+def nome(identificador, contexto=ast.Load): # Referência a uma variável local da função gerada
+    return ast.Name(id=identificador, ctx=contexto())
+
+def posiciona(no_python, linha): # Atribui a linha a no_python e aos filhos que ainda não têm uma
+    for filho in ast.walk(no_python):
+        if isinstance(filho, (ast.stmt, ast.expr)) and getattr(filho, "lineno", None) is None:
+            filho.lineno = filho.end_lineno = linha
+            filho.col_offset = filho.end_col_offset = 0
+    return no_python
+
+def sequencia(passos, valor): # (passo1, passo2, ..., valor)[-1]: avalia os passos em ordem e vale o último
+    if not passos:
+        return valor
+    return ast.Subscript(value=ast.Tuple(elts=passos + [valor], ctx=ast.Load()), slice=ast.Constant(-1),
+                         ctx=ast.Load())
+
+def profunda(no, limite=LIMITE_PROFUNDIDADE): # True se a árvore da expressão passa de limite níveis
+    pendentes = [(no, 1)]
+    while pendentes:
+        no, nivel = pendentes.pop()
+        if nivel > limite:
+            return True
+        if isinstance(no, arvore.Binaria):
+            pendentes += ((no.esquerda, nivel + 1), (no.direita, nivel + 1))
+        elif isinstance(no, arvore.Unaria):
+            pendentes.append((no.operando, nivel + 1))
+    return False
+
+class TradutorPython: # Traduz um arvore.Programa sem erros para um ast.Module
+    def __init__(self):
+        self.temporarios = 0 # Contador para os nomes das variáveis auxiliares do div e das expressões linearizadas
+        self.tipos = {} # Tipo declarado de cada variável
+
+    def traduz(self, programa):
+        modulo = ast.parse(ESQUELETO)
+        funcao = modulo.body[0]
+        corpo = [posiciona(ast.Assign(targets=[nome("_restantes", ast.Store)], value=nome("_limite")),
+                           programa.linha)]
+        for declaracao in programa.declaracoes: # Vale a primeira declaração de cada nome
+            for variavel in declaracao.variaveis:
+                if variavel.nome not in self.tipos:
+                    self.tipos[variavel.nome] = declaracao.tipo
+                    corpo.append(posiciona(ast.Assign(targets=[nome(self.variavel(variavel.nome), ast.Store)],
+                                                      value=ast.Constant(VALOR_INICIAL[declaracao.tipo])),
+                                           declaracao.linha))
+        corpo.extend(self.comando(programa.corpo))
+        corpo.append(posiciona(ast.Return(value=nome("_restantes")), programa.linha))
+        funcao.body = corpo
+        return modulo
+
+    def variavel(self, identificador): # Nome Python da variável Tascal (sem colidir com os internos)
+        return "v_" + identificador
+
+    # Comandos (cada um vira uma lista de comandos Python)
+
+    def bloco(self, no): # Corpo de um if/while; o Python não aceita um corpo vazio
+        comandos = self.comando(no)
+        return comandos or [ast.Pass()]
+
+    def comando(self, no):
+        if no is None: # Comando vazio
+            return []
+        tipo = type(no)
+        if tipo is arvore.Bloco:
+            comandos = []
+            for comando in no.comandos:
+                comandos.extend(self.comando(comando))
+            return comandos
+        if tipo is arvore.Atribuicao:
+            comandos = [ast.Assign(targets=[nome(self.variavel(no.nome), ast.Store)],
+                                   value=self.valor(no.expressao))]
+        elif tipo is arvore.Se:
+            comandos = [ast.If(test=self.valor(no.condicao), body=self.bloco(no.entao),
+                               orelse=self.comando(no.senao))]
+        elif tipo is arvore.Enquanto:
+            # Cada volta consome uma unidade do limite
+            conta_volta = [
+                ast.AugAssign(target=nome("_restantes", ast.Store), op=ast.Sub(), value=ast.Constant(1)),
+                ast.If(test=ast.Compare(left=nome("_restantes"), ops=[ast.Lt()], comparators=[ast.Constant(0)]),
+                       body=[ast.Expr(value=ast.Call(func=nome("_excedido"), args=[ast.Constant(no.linha)],
+                                                     keywords=[]))],
+                       orelse=[]),
+            ]
+            comandos = [ast.While(test=self.valor(no.condicao), body=self.comando(no.corpo) + conta_volta,
+                                  orelse=[])]
+        elif tipo is arvore.Leitura:
+            comandos = [ast.Assign(targets=[nome(self.variavel(variavel.nome), ast.Store)],
+                                   value=ast.Call(func=nome("_le"),
+                                                  args=[ast.Constant(self.tipos[variavel.nome]),
+                                                        ast.Constant(variavel.nome), ast.Constant(no.linha)],
+                                                  keywords=[]))
+                        for variavel in no.variaveis]
+        elif tipo is arvore.Escrita:
+            partes = []
+            for expressao in no.expressoes:
+                if partes:
+                    partes.append(ast.Constant(" "))
+                valor = self.valor(expressao)
+                if expressao.tipo == "boolean":
+                    valor = ast.IfExp(test=valor, body=ast.Constant("true"), orelse=ast.Constant("false"))
+                partes.append(ast.FormattedValue(value=valor, conversion=-1, format_spec=None))
+            comandos = [
+                ast.Expr(value=ast.Call(func=ast.Attribute(value=nome("_lote"), attr="append", ctx=ast.Load()),
+                                        args=[ast.JoinedStr(values=partes)], keywords=[])),
+                ast.If(test=ast.Compare(left=ast.Call(func=nome("len"), args=[nome("_lote")], keywords=[]),
+                                        ops=[ast.GtE()], comparators=[nome("_tamanho_lote")]),
+                       body=[ast.Expr(value=ast.Call(func=nome("_descarrega"), args=[], keywords=[]))],
+                       orelse=[]),
+            ]
+        for comando in comandos:
+            posiciona(comando, no.linha)
+        return comandos
+
+    # Expressões
+
+    def valor(self, no): # Expressão de um comando
+        return self.expressao_linear(no) if profunda(no) else self.expressao(no)
+
+    def expressao(self, no):
+        tipo = type(no)
+        if tipo is arvore.Variavel:
+            return nome(self.variavel(no.nome))
+        if tipo is arvore.Numero or tipo is arvore.Booleano:
+            return ast.Constant(no.valor)
+        if tipo is arvore.Nao:
+            return ast.UnaryOp(op=ast.Not(), operand=self.expressao(no.operando))
+        if tipo is arvore.MenosUnario:
+            return ast.UnaryOp(op=ast.USub(), operand=self.expressao(no.operando))
+        if tipo is arvore.E or tipo is arvore.Ou: # Curto-circuito do próprio Python
+            return ast.BoolOp(op=ast.And() if tipo is arvore.E else ast.Or(),
+                              values=[self.expressao(no.esquerda), self.expressao(no.direita)])
+        if tipo in OPERADORES_RELACIONAIS:
+            return ast.Compare(left=self.expressao(no.esquerda), ops=[OPERADORES_RELACIONAIS[tipo]()],
+                               comparators=[self.expressao(no.direita)])
+        if tipo in OPERADORES_ARITMETICOS:
+            return ast.BinOp(left=self.expressao(no.esquerda), op=OPERADORES_ARITMETICOS[tipo](),
+                             right=self.expressao(no.direita))
+        return posiciona(self.divisao(no), no.linha) # O erro de divisão por zero aponta o operador
+
+    def divisao(self, no):
+        return self.divide(self.expressao(no.esquerda), self.expressao(no.direita))
+
+    def divide(self, esquerda, direita): # a div b: a // b se os sinais forem iguais, senão -(-a // b)
+        if isinstance(esquerda, (ast.Name, ast.Constant)) and isinstance(direita, (ast.Name, ast.Constant)):
+            a, b = esquerda, direita
+            valor_a, valor_b = esquerda, direita
+        else: # Operandos compostos são avaliados uma única vez, guardados em auxiliares (:=)
+            self.temporarios += 1
+            auxiliar_a, auxiliar_b = f"_a{self.temporarios}", f"_b{self.temporarios}"
+            a, b = nome(auxiliar_a), nome(auxiliar_b)
+            valor_a = ast.NamedExpr(target=nome(auxiliar_a, ast.Store), value=esquerda)
+            valor_b = ast.NamedExpr(target=nome(auxiliar_b, ast.Store), value=direita)
+        mesmo_sinal = ast.Compare(
+            left=ast.Compare(left=valor_a, ops=[ast.Lt()], comparators=[ast.Constant(0)]),
+            ops=[ast.Eq()],
+            comparators=[ast.Compare(left=valor_b, ops=[ast.Lt()], comparators=[ast.Constant(0)])])
+        return ast.IfExp(test=mesmo_sinal,
+                         body=ast.BinOp(left=a, op=ast.FloorDiv(), right=b),
+                         orelse=ast.UnaryOp(op=ast.USub(), operand=ast.BinOp(
+                             left=ast.UnaryOp(op=ast.USub(), operand=a), op=ast.FloorDiv(), right=b)))
+
+    def expressao_linear(self, no): # Tradução rasa de uma expressão profunda, sem recursão
+        # Cada operador vira um passo (_tN := a op b) sobre os valores já calculados dos operandos, e a
+        # expressão vira (passo1, passo2, ..., valor)[-1], com os passos na ordem da avaliação original.
+        # O lado direito do and/or só é avaliado quando necessário: seus passos formam uma sequência
+        # própria, dentro do operador
+        escopos = [[]] # Passos de cada sequência aberta
+        valores = [] # Expressões rasas (variáveis, constantes, auxiliares) com o valor de cada operando
+        pendentes = [no] # Nós a traduzir e, em tuplas (fase, nó), operadores à espera dos operandos
+        while pendentes:
+            no = pendentes.pop()
+            tipo = type(no)
+            if tipo is arvore.Variavel:
+                valores.append(nome(self.variavel(no.nome)))
+            elif tipo is arvore.Numero or tipo is arvore.Booleano:
+                valores.append(ast.Constant(no.valor))
+            elif tipo is tuple:
+                fase, no = no
+                tipo = type(no)
+                if fase == ABRE_DIREITA: # O lado esquerdo do and/or já está em valores
+                    escopos.append([])
+                    pendentes += ((FECHA_DIREITA, no), no.direita)
+                    continue
+                if fase == FECHA_DIREITA:
+                    direita = sequencia(escopos.pop(), valores.pop())
+                    valor = ast.BoolOp(op=ast.And() if tipo is arvore.E else ast.Or(), values=[valores.pop(), direita])
+                elif tipo is arvore.Nao:
+                    valor = ast.UnaryOp(op=ast.Not(), operand=valores.pop())
+                elif tipo is arvore.MenosUnario:
+                    valor = ast.UnaryOp(op=ast.USub(), operand=valores.pop())
+                else:
+                    direita = valores.pop()
+                    esquerda = valores.pop()
+                    if tipo in OPERADORES_RELACIONAIS:
+                        valor = ast.Compare(left=esquerda, ops=[OPERADORES_RELACIONAIS[tipo]()], comparators=[direita])
+                    elif tipo in OPERADORES_ARITMETICOS:
+                        valor = ast.BinOp(left=esquerda, op=OPERADORES_ARITMETICOS[tipo](), right=direita)
+                    else: # Com os operandos já rasos, a divisão não precisa de auxiliares próprios
+                        valor = posiciona(self.divide(esquerda, direita), no.linha)
+                self.temporarios += 1
+                auxiliar = f"_t{self.temporarios}"
+                escopos[-1].append(ast.NamedExpr(target=nome(auxiliar, ast.Store), value=valor))
+                valores.append(nome(auxiliar))
+            elif isinstance(no, arvore.Unaria):
+                pendentes += ((APLICA, no), no.operando)
+            elif tipo is arvore.E or tipo is arvore.Ou:
+                pendentes += ((ABRE_DIREITA, no), no.esquerda)
+            else:
+                pendentes += ((APLICA, no), no.direita, no.esquerda)
+        return sequencia(escopos[0], valores[0])
+
+def traduz(programa): # ast.Module com a função programa(...) equivalente ao arvore.Programa
+    return TradutorPython().traduz(programa)
+
+def fonte(programa): # Código Python gerado, para inspeção
+    return ast.unparse(traduz(programa))
+
+def gera_codigo(programa, nome_arquivo="<tascal>"): # Code object do módulo gerado
+    return compile(traduz(programa), nome_arquivo, "exec")
+
+# Cache
+
+def chave_cache(codigo_fonte): # Hash do código-fonte e da versão da tradução
+    return hashlib.sha256(f"{VERSAO}\0".encode() + codigo_fonte.encode("utf-8")).hexdigest()
+
+def arquivo_cache(pasta_cache, chave): # O formato do marshal muda entre versões do Python
+    return os.path.join(pasta_cache, f"{chave}.{sys.implementation.cache_tag}.tpyc")
+
+def compila_com_cache(codigo_fonte, pasta_cache=None, nome_arquivo="<tascal>"):
+    # Devolve (code object, diagnósticos). O code object é None se houver erros de compilação;
+    # os diagnósticos são None quando o code object vem do cache (nada foi analisado)
+    if pasta_cache is not None:
+        caminho = arquivo_cache(pasta_cache, chave_cache(codigo_fonte))
+        try:
+            with open(caminho, "rb") as f:
+                codigo = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError): # Ausente ou corrompido: compila de novo
+            codigo = None
+        if isinstance(codigo, types.CodeType): # Outro objeto válido para o marshal também é refeito
+            return codigo, None
+    contexto = ContextoCompilacao()
+    try:
+        programa = contexto.compila(codigo_fonte)
+    except LexError: # O símbolo inválido já está nos diagnósticos
+        programa = None
+    diagnosticos = contexto.diagnosticos
+    if programa is None or diagnosticos.tem_erros():
+        return None, diagnosticos
+    codigo = gera_codigo(programa, nome_arquivo)
+    if pasta_cache is not None:
+        os.makedirs(pasta_cache, exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(dir=pasta_cache, suffix=".tmp")
+        with os.fdopen(descritor, "wb") as f:
+            marshal.dump(codigo, f)
+        os.replace(temporario, caminho) # Troca atômica: leitores concorrentes nunca veem meio arquivo
+    return codigo, diagnosticos
+
+# Execução
+
+def executa(codigo, entrada=None, saida=None, limite_instrucoes=None, tamanho_lote=1024):
+    # Executa o code object gerado. O limite conta voltas de laço (cada novo teste de um while);
+    # devolve o número de voltas executadas
+    escopo = {}
+    exec(codigo, escopo)
+    programa = escopo["programa"]
+    saida = saida if saida is not None else sys.stdout
+    lote = []
+
+    def descarrega(): # Escreve as linhas de saída acumuladas
+        if lote:
+            saida.write("\n".join(lote) + "\n")
+            lote.clear()
+
+    def excedido(linha):
+        raise LimiteInstrucoesExcedido(f"limite de {limite_instrucoes} instruções excedido", linha)
+
+    limite = limite_instrucoes if limite_instrucoes is not None else sys.maxsize
+    entrada = Entrada(entrada if entrada is not None else sys.stdin, descarrega)
+    try:
+        restantes = programa(entrada.le, lote, descarrega, excedido, limite, tamanho_lote)
+    except ZeroDivisionError as e: # A linha do traceback no código gerado é a linha do Tascal
+        linha = None
+        passo = e.__traceback__
+        while passo is not None:
+            if passo.tb_frame.f_code is programa.__code__:
+                linha = passo.tb_lineno
+            passo = passo.tb_next
+        raise ErroExecucao("divisão por zero", linha) from None
+    finally:
+        descarrega()
+    return limite - restantes
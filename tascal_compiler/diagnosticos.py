@@ -0,0 +1,119 @@
+# Diagnósticos (erros léxicos, sintáticos e semânticos) do compilador Tascal
+# Em vez de imprimir cada erro na hora, o lexer e o parser registram diagnósticos
+# estruturados em um coletor: código estável, severidade, linha, coluna e os argumentos
+# da mensagem. O texto só é montado quando o diagnóstico é exibido (formatação preguiçosa),
+# ocorrências repetidas do mesmo (código, símbolo) são contadas uma única vez e cada
+# código guarda no máximo um número limitado de diagnósticos
+
+ERRO = 'erro'
+AVISO = 'aviso'
+
+# Modelos das mensagens, por código. Os códigos são estáveis: podem ser usados por
+# ferramentas e testes para identificar o erro sem depender do texto
+MENSAGENS = {
+    'LEX001': "Símbolo ilegal '{0}'",
+    'LEX002': "Comentários não são permitidos",
+    'LEX003': "Comentário sem fim",
+    'LEX004': "Símbolos ilegais '{0}'",
+    'SIN001': "token inesperado '{0}'",
+    'SIN002': "fim de arquivo inesperado.",
+    'SEM001': "variável '{0}' já declarada",
+    'SEM002': "variável '{0}' não declarada",
+    'SEM003': "atribuição incompatível: variável '{0}' é {1}, expressão é {2}",
+    'SEM004': "condição do IF deve ser booleana",
+    'SEM005': "condição do WHILE deve ser booleana",
+    'SEM006': "write() recebeu tipo inválido '{0}'",
+    'SEM007': "operador '{0}' requer operandos booleanos (obtido {1} e {2})",
+    'SEM008': "operador '{0}' requer operandos inteiros (obtido {1} e {2})",
+    'SEM009': "operador '{0}' requer operandos do mesmo tipo (obtido {1} e {2})",
+    'SEM010': "operador 'not' requer expressão booleana (obtido {0})",
+    'SEM011': "operador unário '-' requer expressão inteira (obtido {0})",
+}
+
+# Formato de exibição de cada categoria (prefixo do código)
+FORMATOS = {
+    'LEX': "ERRO LÉXICO: {mensagem} na linha {linha}",
+    'SIN': "ERRO SINTÁTICO: {mensagem} na linha {linha}",
+    'SEM': "ERRO SEMÂNTICO na linha {linha}: {mensagem}",
+}
+FORMATOS_CODIGO = { # Exceções ao formato da categoria
+    'LEX002': "ERRO LÉXICO: {mensagem} (linha {linha})",
+    'SIN002': "ERRO SINTÁTICO: {mensagem}",
+}
+
+class Diagnostico: # Um diagnóstico registrado; a mensagem é formatada apenas quando pedida
+    __slots__ = ('codigo', 'severidade', 'linha', 'coluna', 'simbolo', 'argumentos')
+
+    def __init__(self, codigo, severidade, linha, coluna, simbolo, argumentos):
+        self.codigo = codigo
+        self.severidade = severidade
+        self.linha = linha
+        self.coluna = coluna
+        self.simbolo = simbolo # Símbolo (ex.: nome da variável) usado na deduplicação, ou None
+        self.argumentos = argumentos
+
+    @property
+    def categoria(self): # 'LEX', 'SIN' ou 'SEM'
+        return self.codigo[:3]
+
+    @property
+    def mensagem(self): # Texto da mensagem, sem prefixo nem posição
+        return MENSAGENS[self.codigo].format(*self.argumentos)
+
+    def formata(self): # Linha exibida ao usuário, ex.: "ERRO SEMÂNTICO na linha 3: ..."
+        formato = FORMATOS_CODIGO.get(self.codigo) or FORMATOS[self.categoria]
+        return formato.format(mensagem=self.mensagem, linha=self.linha, coluna=self.coluna)
+
+    def __str__(self):
+        return self.formata()
+
+    def __repr__(self):
+        return f"Diagnostico({self.codigo!r}, linha={self.linha}, coluna={self.coluna}, argumentos={self.argumentos!r})"
+
+class Diagnosticos: # Coletor dos diagnósticos de uma compilação
+    def __init__(self, limite_por_codigo=100):
+        self.itens = [] # Diagnósticos guardados, na ordem em que foram registrados
+        self.limite_por_codigo = limite_por_codigo
+        self.guardados = {} # Código -> diagnósticos guardados em self.itens
+        self.repetidos = {} # Código -> ocorrências descartadas por repetirem (código, símbolo)
+        self.excedentes = {} # Código -> ocorrências descartadas pelo limite do código
+        self.vistos = set() # Pares (código, símbolo) já guardados
+
+    def registra(self, codigo, linha, coluna, *argumentos, simbolo=None, severidade=ERRO):
+        # Registra uma ocorrência; devolve o Diagnostico guardado, ou None se ele for
+        # repetido (mesmo código e símbolo) ou se o limite do código já foi atingido
+        if simbolo is not None:
+            chave = (codigo, simbolo)
+            if chave in self.vistos:
+                self.repetidos[codigo] = self.repetidos.get(codigo, 0) + 1
+                return None
+            self.vistos.add(chave)
+        guardados = self.guardados.get(codigo, 0)
+        if guardados >= self.limite_por_codigo:
+            self.excedentes[codigo] = self.excedentes.get(codigo, 0) + 1
+            return None
+        self.guardados[codigo] = guardados + 1
+        diagnostico = Diagnostico(codigo, severidade, linha, coluna, simbolo, argumentos)
+        self.itens.append(diagnostico)
+        return diagnostico
+
+    def __iter__(self):
+        return iter(self.itens)
+
+    def __len__(self):
+        return len(self.itens)
+
+    def __bool__(self):
+        return bool(self.itens)
+
+    def da_categoria(self, categoria): # Diagnósticos guardados de uma categoria ('LEX', 'SIN' ou 'SEM')
+        return [d for d in self.itens if d.codigo.startswith(categoria)]
+
+    def tem_erros(self, categoria=''): # True se houver algum erro (da categoria, se informada)
+        return any(d.severidade == ERRO and d.codigo.startswith(categoria) for d in self.itens)
+
+    def formata(self): # Linhas exibidas ao usuário, incluindo o resumo dos códigos que atingiram o limite
+        linhas = [d.formata() for d in self.itens]
+        for codigo, quantidade in self.excedentes.items():
+            linhas.append(f"... mais {quantidade} ocorrência(s) de {codigo} omitida(s) (limite de {self.limite_por_codigo})")
+        return linhas
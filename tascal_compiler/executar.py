@@ -0,0 +1,76 @@
+# Script que compila e executa um programa Tascal
+# Os valores lidos por read vêm da entrada padrão e o write escreve na saída padrão.
+# Se houver erros de compilação, eles são exibidos e o programa não é executado
+# Exemplo: py -m tascal_compiler.executar tascal_compiler/Tests/Parser/ProgramasTascalTeste/P10.tascal
+#          py -m tascal_compiler.executar programa.tascal 1000000   (limite de instruções)
+#          py -m tascal_compiler.executar --bytecode programa.tascal  (executa na máquina de pilha)
+#          py -m tascal_compiler.executar --python programa.tascal    (traduz para Python; cache em __pycache__)
+#          py -m tascal_compiler.executar --mepa programa.tascal      (gera e executa código MEPA)
+import os
+import sys
+from tascal_compiler.lex import LexError
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler import bytecode, compilador_python, mepa
+from tascal_compiler.interpretador import executa, ErroExecucao
+
+def main():
+    argumentos = sys.argv[1:]
+    usa_bytecode = "--bytecode" in argumentos
+    if usa_bytecode:
+        argumentos.remove("--bytecode")
+    usa_python = "--python" in argumentos
+    if usa_python:
+        argumentos.remove("--python")
+    usa_mepa = "--mepa" in argumentos
+    if usa_mepa:
+        argumentos.remove("--mepa")
+    arquivo = argumentos[0] # Pega o arquivo do argumento de linha de comando
+    limite_instrucoes = int(argumentos[1]) if len(argumentos) > 1 else None
+    with open(arquivo, "r", encoding="utf-8") as f:
+        codigo = f.read()
+
+    if usa_python: # O code object fica no cache ao lado do programa, como os .pyc do Python
+        pasta_cache = os.path.join(os.path.dirname(os.path.abspath(arquivo)), "__pycache__")
+        try:
+            codigo_python, diagnosticos = compilador_python.compila_com_cache(codigo, pasta_cache, arquivo)
+        except RecursionError: # As expressões são linearizadas; os comandos são traduzidos recursivamente
+            print("ERRO: comandos aninhados em profundidade demais")
+            sys.exit(1)
+        if codigo_python is None:
+            for linha in diagnosticos.formata():
+                print(linha)
+            sys.exit(1)
+        try:
+            compilador_python.executa(codigo_python, limite_instrucoes=limite_instrucoes)
+        except ErroExecucao as e:
+            print(e)
+            sys.exit(1)
+        return
+
+    contexto = ContextoCompilacao()
+    arvore = None
+    try:
+        arvore = contexto.compila(codigo)
+    except LexError: # O erro léxico já foi registrado nos diagnósticos
+        pass
+    if arvore is None or contexto.diagnosticos.tem_erros(): # Não executa programas com erros
+        for linha in contexto.diagnosticos.formata():
+            print(linha)
+        sys.exit(1)
+
+    try:
+        if usa_bytecode:
+            bytecode.executa(bytecode.compila(arvore), limite_instrucoes=limite_instrucoes)
+        elif usa_mepa:
+            mepa.executa(mepa.gera(arvore).monta(), limite_instrucoes=limite_instrucoes)
+        else:
+            executa(arvore, limite_instrucoes=limite_instrucoes)
+    except ErroExecucao as e:
+        print(e)
+        sys.exit(1)
+    except RecursionError: # Os comandos são compilados e executados recursivamente; as expressões, não
+        print("ERRO: comandos aninhados em profundidade demais")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
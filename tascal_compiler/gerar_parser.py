@@ -0,0 +1,16 @@
+# Script que gera o parser especializado do Tascal (parser_especializado.py)
+# O módulo gerado contém um laço de análise específico para as tabelas LALR do parser.py:
+# terminais e não-terminais viram inteiros, as tabelas viram listas densas e as funções p_*
+# são ligadas diretamente. Deve ser executado novamente sempre que a gramática mudar
+# Exemplo: py -m tascal_compiler.gerar_parser
+import os
+from tascal_compiler import yacc
+from tascal_compiler.parser import parser
+
+def gera_parser_especializado(): # Escreve parser_especializado.py ao lado deste arquivo
+    yacc.write_parser_module(parser, 'parser_especializado', os.path.dirname(os.path.abspath(__file__)),
+                             grammarmodule='tascal_compiler.parser')
+
+if __name__ == "__main__":
+    gera_parser_especializado()
+    print("parser_especializado.py gerado com sucesso!")
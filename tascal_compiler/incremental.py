@@ -0,0 +1,410 @@
+# Reanálise incremental de um programa Tascal aberto em um editor
+# Um Documento guarda o código, os tokens, a árvore e a tabela de símbolos da última análise.
+# A cada edição (posição, quantidade de caracteres removidos, texto inserido), o lexer reanalisa
+# a partir do último token estável antes da edição até os tokens voltarem a coincidir com os
+# antigos (mesma posição, já deslocada pela edição), e o parser reanalisa só os comandos da
+# lista begin … end que contém os tokens trocados. Os nós seguintes só têm linha e coluna
+# corrigidas. Quando a edição não cabe nesse caso (declarações, begin/end desbalanceados,
+# algum diagnóstico antes ou depois da edição, erro léxico), o programa é analisado inteiro
+# Exemplo:
+#     documento = Documento(codigo)
+#     documento.edita(120, 1, "y")  # Troca o caractere da posição 120 por 'y'
+#     documento.arvore, documento.diagnosticos
+from bisect import bisect_left, bisect_right
+from tascal_compiler import arvore
+from tascal_compiler.lex import LexToken, LexError, newline_offsets
+from tascal_compiler.diagnosticos import Diagnosticos
+from tascal_compiler.parser import ContextoCompilacao, parser
+
+# Nós de comando: a posição deles é a do primeiro token (a das expressões binárias é a do operador)
+COMANDOS = (arvore.Atribuicao, arvore.Se, arvore.Enquanto, arvore.Leitura, arvore.Escrita, arvore.Bloco)
+
+def posicao(no): # Chave de ordenação dos nós: (linha, coluna)
+    return (no.linha, no.coluna)
+
+class ListaDeslocada: # Lista crescente de posições no código, deslocadas de uma vez a cada edição
+    # Os itens a partir do índice corte estão guardados sem o deslocamento (o valor real é o
+    # guardado + deslocamento). Uma edição só leva o corte até ela, em vez de somar o deslocamento
+    # a todos os itens seguintes: edições próximas umas das outras custam pouco, qualquer que seja
+    # o tamanho do código
+    __slots__ = ('itens', 'corte', 'deslocamento')
+
+    def __init__(self, itens):
+        self.itens = list(itens)
+        self.corte = len(self.itens)
+        self.deslocamento = 0
+
+    def __len__(self):
+        return len(self.itens)
+
+    def __getitem__(self, i): # Valor real do item i (i >= 0)
+        if i < self.corte:
+            return self.itens[i]
+        return self.itens[i] + self.deslocamento
+
+    def busca(self, valor): # Índice do primeiro item >= valor, como bisect_left
+        itens, corte = self.itens, self.corte
+        if corte and itens[corte - 1] >= valor:
+            return bisect_left(itens, valor, 0, corte)
+        return bisect_left(itens, valor - self.deslocamento, corte)
+
+    def move_corte(self, i): # Passa o corte para o índice i, aplicando ou retirando o deslocamento no meio
+        itens, corte, deslocamento = self.itens, self.corte, self.deslocamento
+        if i > corte:
+            itens[corte:i] = [valor + deslocamento for valor in itens[corte:i]]
+        elif i < corte:
+            itens[i:corte] = [valor - deslocamento for valor in itens[i:corte]]
+        self.corte = i
+
+    def substitui(self, inicio, fim, novos, deslocamento):
+        # Troca os itens [inicio, fim) pelos novos (valores reais) e soma deslocamento aos seguintes
+        self.move_corte(fim)
+        self.itens[inicio:fim] = novos
+        self.corte = inicio + len(novos)
+        self.deslocamento += deslocamento
+
+TAMANHO_BLOCO = 1 << 10 # Tamanho dos blocos lidos pelo lexer por autômato ao relexar
+
+class LeitorTexto: # Leitura de um str a partir de uma posição, como um arquivo (ver automato.blocos)
+    def __init__(self, texto, posicao):
+        self.texto = texto
+        self.posicao = posicao
+
+    def read(self, tamanho):
+        parte = self.texto[self.posicao:self.posicao + tamanho]
+        self.posicao += len(parte)
+        return parte
+
+class MapaPosicoes: # Leva (linha, coluna) de antes da edição para depois dela
+    # As posições antes do fim da edição não mudam; as da linha do fim da edição mudam de coluna
+    # (e de linha, se a edição inseriu ou removeu quebras de linha); as das linhas seguintes só de linha
+    def __init__(self, antes, depois):
+        self.linha, self.coluna = antes # Fim da edição, antes dela
+        self.nova_linha, self.nova_coluna = depois # Fim do texto inserido, depois da edição
+        self.linhas = self.nova_linha - self.linha # Quebras de linha inseridas menos removidas
+
+    def __call__(self, linha, coluna):
+        if linha == self.linha:
+            if coluna < self.coluna:
+                return linha, coluna
+            return self.nova_linha, coluna + self.nova_coluna - self.coluna
+        if linha > self.linha:
+            return linha + self.linhas, coluna
+        return linha, coluna
+
+def calcula_pares(tipos, inicio=0, fim=None, saida=None):
+    # Distância de cada BEGIN ao END correspondente (0 nos outros tokens), entre inicio e fim
+    saida = [0] * len(tipos) if saida is None else saida
+    abertos = []
+    for k in range(inicio, len(tipos) if fim is None else fim):
+        tipo = tipos[k]
+        if tipo == 'BEGIN':
+            abertos.append(k)
+        elif tipo == 'END' and abertos:
+            b = abertos.pop()
+            saida[b] = k - b
+    return saida
+
+def balanceado(tipos): # True se os begin/end dos tipos fecham na ordem, sem sobrar nenhum
+    profundidade = 0
+    for tipo in tipos:
+        if tipo == 'BEGIN':
+            profundidade += 1
+        elif tipo == 'END':
+            profundidade -= 1
+            if profundidade < 0:
+                return False
+    return profundidade == 0
+
+def bloco_interno(comandos, alvo):
+    # Bloco begin … end que começa antes da posição alvo, dentro do último comando da lista que
+    # começa antes dela (passando pelos ramos do if e pelo corpo do while), ou None
+    k = bisect_left(comandos, alvo, key=posicao)
+    if not k:
+        return None
+    comando = comandos[k - 1]
+    while True:
+        if isinstance(comando, arvore.Bloco):
+            return comando
+        if isinstance(comando, arvore.Enquanto):
+            comando = comando.corpo
+        elif isinstance(comando, arvore.Se):
+            senao = comando.senao
+            comando = senao if senao is not None and posicao(senao) < alvo else comando.entao
+        else:
+            return None
+        if comando is None or posicao(comando) >= alvo:
+            return None
+
+class Documento: # Programa Tascal reanalisado incrementalmente a cada edição
+    # Os parâmetros são os de ContextoCompilacao; parse escolhe o laço de análise, como em compila.
+    # Depois de cada edição, incremental diz se ela foi reanalisada só em parte, e relexados e
+    # reanalisados contam os tokens que passaram pelo lexer e pelo parser
+    def __init__(self, codigo, parse=None, limite_por_codigo=100, motor_lexico='ply', recupera_erros_lexicos=False):
+        self.parse = parse or parser.parse
+        self.opcoes = (limite_por_codigo, motor_lexico, recupera_erros_lexicos)
+        self.compila_tudo(codigo)
+
+    def compila_tudo(self, codigo): # Analisa o código inteiro e refaz os tokens e o índice das quebras de linha
+        self.codigo = codigo
+        self.contexto = ContextoCompilacao(*self.opcoes)
+        self.arvore = None
+        self.limpo = False # Só um programa sem diagnósticos é reanalisado incrementalmente
+        self.incremental = False
+        self.relexados = self.reanalisados = None
+        self.arvore = self.contexto.compila(codigo, parse=self.parse)
+        if self.arvore is None or self.contexto.diagnosticos:
+            return self.arvore
+        tokens = self.contexto.lexer.tokenize_all(codigo) # Sem diagnósticos: nenhum erro léxico a registrar de novo
+        self.relexados = self.reanalisados = len(tokens.types)
+        nomes, tabela = tokens.typenames, tokens.valuetable
+        self.tipos = [nomes[tipo] for tipo in tokens.types]
+        self.valores = [tabela[valor] for valor in tokens.values]
+        self.posicoes = ListaDeslocada(tokens.lexpos)
+        self.quebras = ListaDeslocada(newline_offsets(codigo))
+        self.pares = calcula_pares(self.tipos)
+        self.inicio_corpo = self.tipos.index('BEGIN') # Índice do begin do bloco principal
+        self.limpo = True
+        return self.arvore
+
+    @property
+    def diagnosticos(self):
+        return self.contexto.diagnosticos
+
+    @property
+    def tabela_variaveis(self):
+        return self.contexto.tabela_variaveis
+
+    # Linha e coluna (a partir de 1) da posição lexpos do código atual, pelo índice das quebras de linha
+    def line(self, lexpos):
+        return self.quebras.busca(lexpos) + 1
+
+    def column(self, lexpos):
+        i = self.quebras.busca(lexpos)
+        return lexpos - (self.quebras[i - 1] if i else -1)
+
+    def linha_coluna(self, lexpos):
+        i = self.quebras.busca(lexpos)
+        return i + 1, lexpos - (self.quebras[i - 1] if i else -1)
+
+    def lexpos(self, linha, coluna): # Posição no código atual de (linha, coluna)
+        return (self.quebras[linha - 2] if linha > 1 else -1) + coluna
+
+    def edita(self, inicio, removidos, inserido):
+        # Troca codigo[inicio:inicio + removidos] por inserido e devolve a nova árvore (ou None, como compila)
+        if inicio < 0 or removidos < 0 or inicio + removidos > len(self.codigo):
+            raise ValueError(f"edição fora do código: {inicio}, {removidos} (tamanho {len(self.codigo)})")
+        codigo = self.codigo[:inicio] + inserido + self.codigo[inicio + removidos:]
+        if self.limpo and self.reanalisa(codigo, inicio, removidos, inserido):
+            self.codigo = codigo
+            self.incremental = True
+            return self.arvore
+        return self.compila_tudo(codigo)
+
+    def reanalisa(self, codigo, inicio, removidos, inserido):
+        # Reanálise incremental; devolve False se a edição precisar da análise completa (nesse caso,
+        # os tokens e o índice podem ter ficado pela metade, e compila_tudo refaz tudo)
+        tipos, valores, posicoes, pares = self.tipos, self.valores, self.posicoes, self.pares
+        fim = inicio + removidos
+        deslocamento = len(inserido) - removidos
+        fim_inserido = inicio + len(inserido)
+
+        # Tokens estáveis: os que começam antes do último token que começa antes da edição (este pode
+        # crescer com o texto inserido, como em "x" + "1")
+        i = posicoes.busca(inicio) - 1
+        if i < self.inicio_corpo:
+            return False
+
+        # Relexa a partir do token i até um token novo, depois da edição, começar na posição
+        # (deslocada) de um token antigo: daí em diante, os tokens são os mesmos
+        lexer = self.contexto.lexer
+        lexer.diagnosticos = diagnosticos = Diagnosticos()
+        base = posicoes[i]
+        if hasattr(lexer, 'input_stream'): # O autômato lê só o que precisar a partir daí, em vez de classificar o código todo
+            lexer.input_stream(LeitorTexto(codigo, base), TAMANHO_BLOCO)
+        else:
+            lexer.input(codigo)
+            lexer.lexpos = base
+            base = 0
+        novos_tipos, novos_valores, novas_posicoes = [], [], []
+        j = len(tipos)
+        try:
+            while True:
+                tok = lexer.token()
+                if tok is None:
+                    break
+                lexpos = base + tok.lexpos
+                if lexpos >= fim_inserido:
+                    k = posicoes.busca(lexpos - deslocamento)
+                    if k < j and posicoes[k] == lexpos - deslocamento:
+                        j = k
+                        break
+                novos_tipos.append(tok.type)
+                novos_valores.append(tok.value)
+                novas_posicoes.append(lexpos)
+        except LexError:
+            return False
+        finally:
+            lexer.diagnosticos = self.contexto.diagnosticos
+        if diagnosticos:
+            return False
+        self.relexados = len(novos_tipos) + (j < len(tipos))
+        iguais = 0 # Tokens relexados iguais aos antigos, no começo, também são estáveis
+        while (iguais < len(novos_tipos) and i + iguais < j and tipos[i + iguais] == novos_tipos[iguais]
+               and valores[i + iguais] == novos_valores[iguais] and posicoes[i + iguais] == novas_posicoes[iguais]):
+            iguais += 1
+        if iguais:
+            i += iguais
+            del novos_tipos[:iguais], novos_valores[:iguais], novas_posicoes[:iguais]
+        if i <= self.inicio_corpo: # O cabeçalho e as declarações não mudam
+            return False
+        fim_antigo = self.linha_coluna(fim)
+        if i == j and not novos_tipos: # Os mesmos tokens: só as posições depois da edição mudam
+            self.atualiza_posicoes(inicio, fim, inserido, i, j, novas_posicoes)
+            self.desloca(self.arvore.corpo, MapaPosicoes(fim_antigo, self.linha_coluna(fim_inserido)))
+            self.reanalisados = 0
+            return True
+
+        # Bloco begin … end mais interno que contém os tokens trocados [i, j): desce pela árvore a
+        # partir do bloco principal, escolhendo o bloco aninhado no último comando antes deles
+        bloco, b = self.arvore.corpo, self.inicio_corpo
+        caminho = [b]
+        alvo = self.linha_coluna(posicoes[i])
+        while True:
+            interno = bloco_interno(bloco.comandos, alvo)
+            if interno is None:
+                break
+            k = posicoes.busca(self.lexpos(interno.linha, interno.coluna))
+            if k >= i or k + pares[k] < j:
+                break
+            bloco, b = interno, k
+            caminho.append(b)
+        fim_bloco = b + pares[b]
+        if j > fim_bloco: # A edição chega ao end do bloco principal
+            return False
+
+        # Comandos do bloco que contêm os tokens trocados: do ';' (ou begin) antes deles ao ';' (ou end) depois
+        esquerda, profundidade = i - 1, 0
+        while True:
+            tipo = tipos[esquerda]
+            if tipo == 'END':
+                profundidade += 1
+            elif tipo == 'BEGIN':
+                if not profundidade:
+                    break
+                profundidade -= 1
+            elif tipo == 'PV' and not profundidade:
+                break
+            esquerda -= 1
+        direita, profundidade = j, 0
+        while True:
+            tipo = tipos[direita]
+            if tipo == 'BEGIN':
+                profundidade += 1
+            elif tipo == 'END':
+                if not profundidade:
+                    break
+                profundidade -= 1
+            elif tipo == 'PV' and not profundidade:
+                break
+            direita += 1
+        if (tipos[esquerda] == 'BEGIN' and esquerda != b) or (tipos[direita] == 'END' and direita != fim_bloco):
+            return False # Um begin ou end de um bloco interno foi trocado
+        if not balanceado(tipos[esquerda + 1:direita]): # Um end de um bloco interno foi trocado
+            return False
+        if not balanceado(tipos[esquerda + 1:i] + novos_tipos + tipos[j:direita]):
+            return False
+
+        # Posições (na árvore antiga) dos comandos trocados e do fim da edição
+        comandos = bloco.comandos
+        s = bisect_right(comandos, self.linha_coluna(posicoes[esquerda]), key=posicao)
+        t = bisect_left(comandos, self.linha_coluna(posicoes[direita]), key=posicao)
+
+        # Atualiza o índice das quebras de linha e os tokens
+        self.atualiza_posicoes(inicio, fim, inserido, i, j, novas_posicoes)
+        tipos[i:j] = novos_tipos
+        valores[i:j] = novos_valores
+        diferenca = len(novos_tipos) - (j - i)
+        pares[i:j] = [0] * len(novos_tipos)
+        for k in caminho:
+            pares[k] += diferenca
+        direita += diferenca
+        calcula_pares(tipos, esquerda + 1, direita, pares)
+
+        # Reanalisa os comandos como o corpo de um programa sem declarações, com a tabela de símbolos atual.
+        # O parser lê os tokens do gerador; o documento faz o papel do lexer para as linhas e colunas dos nós
+        regiao = []
+        for k in range(esquerda + 1, direita):
+            tok = LexToken()
+            tok.type = tipos[k]
+            tok.value = valores[k]
+            tok.lexpos = lexpos = posicoes[k]
+            tok.lineno = self.line(lexpos)
+            regiao.append(tok)
+        self.reanalisados = len(regiao)
+        contexto = ContextoCompilacao(*self.opcoes)
+        contexto.tabela_variaveis = self.contexto.tabela_variaveis
+        programa = self.parse(lexer=self, context=contexto, tokens=envolve_em_programa(regiao))
+        if programa is None or contexto.diagnosticos:
+            return False
+
+        # Corrige a posição dos nós seguintes e troca os comandos antigos pelos novos
+        self.desloca(self.arvore.corpo, MapaPosicoes(fim_antigo, self.linha_coluna(fim_inserido)))
+        comandos[s:t] = programa.corpo.comandos
+        return True
+
+    def atualiza_posicoes(self, inicio, fim, inserido, i, j, novas_posicoes):
+        # Troca as quebras de linha de [inicio, fim) pelas do texto inserido e as posições dos tokens
+        # [i, j) pelas novas, deslocando as seguintes
+        deslocamento = len(inserido) - (fim - inicio)
+        quebras = self.quebras
+        quebras.substitui(quebras.busca(inicio), quebras.busca(fim), newline_offsets(inserido, inicio), deslocamento)
+        self.posicoes.substitui(i, j, novas_posicoes, deslocamento)
+
+    def desloca(self, raiz, mapa):
+        # Leva os nós da árvore para as posições depois da edição. Em cada bloco, só visita o último
+        # comando que começa antes do fim da edição e os seguintes; os comandos que começam depois da
+        # linha da edição só mudam de linha, e só se a edição inseriu ou removeu quebras de linha
+        fim_edicao = (mapa.linha, mapa.coluna)
+        pilha = [raiz]
+        while pilha:
+            no = pilha.pop()
+            if no.linha > mapa.linha and isinstance(no, COMANDOS):
+                if mapa.linhas:
+                    soma_linhas(no, mapa.linhas)
+                continue
+            no.linha, no.coluna = mapa(no.linha, no.coluna)
+            if isinstance(no, arvore.Bloco):
+                comandos = no.comandos
+                s = max(bisect_left(comandos, fim_edicao, key=posicao) - 1, 0)
+                t = bisect_left(comandos, (mapa.linha + 1, 0), key=posicao) if not mapa.linhas else len(comandos)
+                pilha.extend(comandos[s:t])
+            else:
+                pilha.extend(no.filhos())
+
+def soma_linhas(raiz, linhas): # Soma linhas à linha de todos os nós da subárvore
+    pilha = [raiz]
+    while pilha:
+        no = pilha.pop()
+        no.linha += linhas
+        for campo in no.campos:
+            valor = getattr(no, campo)
+            if valor.__class__ is list:
+                pilha.extend(valor)
+            elif isinstance(valor, arvore.No):
+                pilha.append(valor)
+
+def envolve_em_programa(regiao): # Tokens de "program p; begin <regiao> end.", para analisar só os comandos
+    for tipo, valor in (('PROGRAM', 'program'), ('ID', 'p'), ('PV', ';'), ('BEGIN', 'begin')):
+        yield sintetico(tipo, valor)
+    yield from regiao
+    yield sintetico('END', 'end')
+    yield sintetico('PF', '.')
+
+def sintetico(tipo, valor): # Token que não está no código (posição 0, linha 1)
+    tok = LexToken()
+    tok.type = tipo
+    tok.value = valor
+    tok.lexpos = 0
+    tok.lineno = 1
+    return tok
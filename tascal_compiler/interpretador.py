@@ -0,0 +1,285 @@
+# Interpretador do Tascal: executa a árvore sintática (arvore.py) devolvida pelo parser
+# As variáveis são numeradas uma única vez (resolve_slots) e guardadas em uma lista
+# indexada por essa posição, sem buscas por nome durante a execução. O read consome a
+# entrada (um stream, lido linha a linha, ou uma lista de valores), o write acumula as
+# linhas de saída e as escreve em lotes, e um limite opcional de instruções interrompe
+# laços que não terminam
+import sys
+import operator
+from tascal_compiler import arvore
+
+class ErroExecucao(Exception): # Erro em tempo de execução (divisão por zero, entrada inválida, ...)
+    def __init__(self, mensagem, linha):
+        super().__init__(mensagem)
+        self.mensagem = mensagem
+        self.linha = linha
+
+    def __str__(self):
+        if self.linha is None: # Código sem informação de linha (MEPA montado a partir de texto)
+            return f"ERRO DE EXECUÇÃO: {self.mensagem}"
+        return f"ERRO DE EXECUÇÃO na linha {self.linha}: {self.mensagem}"
+
+class LimiteInstrucoesExcedido(ErroExecucao): # O programa executou mais instruções que o permitido
+    pass
+
+VALOR_INICIAL = {"integer": 0, "boolean": False} # Valor das variáveis antes da primeira atribuição
+
+def resolve_slots(programa): # Numera as variáveis declaradas e preenche o slot de cada uso
+    # Devolve a lista com o tipo de cada slot. Vale a primeira declaração de cada nome,
+    # como na análise semântica
+    slots = {}
+    tipos = []
+    for declaracao in programa.declaracoes:
+        for variavel in declaracao.variaveis:
+            if variavel.nome not in slots:
+                slots[variavel.nome] = len(tipos)
+                tipos.append(declaracao.tipo)
+            variavel.slot = slots[variavel.nome]
+    pendentes = [programa.corpo]
+    while pendentes:
+        no = pendentes.pop()
+        if isinstance(no, (arvore.Variavel, arvore.Atribuicao)):
+            if no.nome not in slots:
+                raise ErroExecucao(f"variável '{no.nome}' não declarada", no.linha)
+            no.slot = slots[no.nome]
+        pendentes.extend(no.filhos())
+    return tipos
+
+def nomes_slots(programa): # Nome da variável de cada slot (depois de resolve_slots)
+    nomes = {}
+    for declaracao in programa.declaracoes:
+        for variavel in declaracao.variaveis:
+            nomes.setdefault(variavel.slot, variavel.nome)
+    return [nomes[slot] for slot in range(len(nomes))]
+
+class Entrada: # Valores consumidos pelo read: de um arquivo/stream, lido linha a linha, ou de uma lista
+    def __init__(self, fonte, antes_de_esperar=None):
+        self.antes_de_esperar = antes_de_esperar # Chamada antes de ler uma nova linha do stream
+        if hasattr(fonte, 'readline'):
+            self.stream = fonte
+            self.pendentes = []
+        else: # Lista (ou outro iterável) de valores: inteiros, booleanos ou textos
+            self.stream = None
+            self.pendentes = list(fonte)[::-1]
+        # self.pendentes guarda os valores ainda não lidos em ordem inversa
+
+    def proximo(self): # Próximo valor da entrada (separado por espaços ou linhas), ou None no fim
+        while not self.pendentes:
+            if self.stream is None:
+                return None
+            if self.antes_de_esperar:
+                self.antes_de_esperar()
+            linha = self.stream.readline()
+            if not linha:
+                return None
+            self.pendentes = linha.split()[::-1]
+        return self.pendentes.pop()
+
+    def le(self, tipo, nome, linha): # Lê o próximo valor e o converte para o tipo da variável
+        valor = self.proximo()
+        if valor is None:
+            raise ErroExecucao(f"fim da entrada ao ler a variável '{nome}'", linha)
+        if tipo == "boolean":
+            if valor is True or valor is False:
+                return valor
+            if valor in ("true", "false"):
+                return valor == "true"
+        elif type(valor) is int:
+            return valor
+        elif isinstance(valor, str):
+            try:
+                return int(valor)
+            except ValueError:
+                pass
+        raise ErroExecucao(f"valor '{formata_valor(valor)}' inválido para a variável '{nome}' ({tipo})", linha)
+
+def formata_valor(valor): # Valor como aparece na saída do write: 42, true, false
+    if valor is True:
+        return "true"
+    if valor is False:
+        return "false"
+    return str(valor)
+
+def divide(a, b, no): # Divisão inteira do Pascal (div): trunca em direção a zero
+    if b == 0:
+        raise ErroExecucao("divisão por zero", no.linha)
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+OPERACOES = { # Operadores binários sem tratamento especial
+    arvore.Soma: operator.add,
+    arvore.Subtracao: operator.sub,
+    arvore.Multiplicacao: operator.mul,
+    arvore.Igual: operator.eq,
+    arvore.Diferente: operator.ne,
+    arvore.Menor: operator.lt,
+    arvore.MenorIgual: operator.le,
+    arvore.Maior: operator.gt,
+    arvore.MaiorIgual: operator.ge,
+}
+
+class Interpretador: # Executa um programa (arvore.Programa) sem erros de compilação
+    def __init__(self, programa, entrada=None, saida=None, limite_instrucoes=None, tamanho_lote=1024):
+        self.programa = programa
+        self.tipos = resolve_slots(programa)
+        self.memoria = [VALOR_INICIAL[tipo] for tipo in self.tipos] # Valor de cada variável, por slot
+        self.entrada = Entrada(entrada if entrada is not None else sys.stdin, self.descarrega)
+        self.saida = saida if saida is not None else sys.stdout
+        self.limite_instrucoes = limite_instrucoes # None: sem limite
+        self.tamanho_lote = tamanho_lote # Linhas de saída acumuladas antes de escrever
+        self.instrucoes = 0 # Comandos executados, contando cada teste de condição do while
+        self.lote = [] # Linhas de saída ainda não escritas
+
+        self.comandos = { # Função que executa cada tipo de comando
+            arvore.Bloco: self.bloco,
+            arvore.Atribuicao: self.atribuicao,
+            arvore.Se: self.se,
+            arvore.Enquanto: self.enquanto,
+            arvore.Leitura: self.leitura,
+            arvore.Escrita: self.escrita,
+        }
+        self.expressoes = { # Função que avalia cada tipo de expressão
+            arvore.Numero: self.constante,
+            arvore.Booleano: self.constante,
+            arvore.Variavel: self.variavel,
+            arvore.Nao: self.nao,
+            arvore.MenosUnario: self.menos_unario,
+            arvore.Ou: self.ou,
+            arvore.E: self.e,
+            arvore.Divisao: self.divisao,
+        }
+        for classe, operacao in OPERACOES.items():
+            self.expressoes[classe] = self.binaria(operacao)
+
+    def executa(self): # Executa o programa; devolve o número de instruções executadas
+        try:
+            self.executa_comando(self.programa.corpo)
+        finally:
+            self.descarrega()
+        return self.instrucoes
+
+    def conta_instrucao(self, no): # Conta uma instrução e aplica o limite configurado
+        self.instrucoes += 1
+        if self.limite_instrucoes is not None and self.instrucoes > self.limite_instrucoes:
+            raise LimiteInstrucoesExcedido(f"limite de {self.limite_instrucoes} instruções excedido", no.linha)
+
+    def executa_comando(self, no):
+        if no is not None: # None é o comando vazio
+            self.conta_instrucao(no)
+            self.comandos[type(no)](no)
+
+    def avalia(self, no): # Valor da expressão de um comando
+        try:
+            return self.expressoes[type(no)](no)
+        except RecursionError:
+            # Uma expressão longa (x + x + ... + x) é uma árvore com a profundidade do número de termos,
+            # funda demais para a recursão. A avaliação não tem efeitos colaterais, então é refeita
+            # com pilhas explícitas
+            return self.avalia_iterativa(no)
+
+    def avalia_operando(self, no): # Valor de uma subexpressão, na avaliação recursiva
+        return self.expressoes[type(no)](no)
+
+    def avalia_iterativa(self, no): # Avalia a expressão em pós-ordem, sem recursão
+        memoria = self.memoria
+        valores = [] # Valores das subexpressões já avaliadas
+        pendentes = [no] # Nós a avaliar e, em tuplas (nó,), operadores com os operandos no topo de valores
+        while pendentes:
+            no = pendentes.pop()
+            tipo = type(no)
+            if tipo is tuple:
+                no, = no
+                tipo = type(no)
+                if tipo is arvore.Nao:
+                    valores[-1] = not valores[-1]
+                elif tipo is arvore.MenosUnario:
+                    valores[-1] = -valores[-1]
+                elif tipo is arvore.Ou or tipo is arvore.E:
+                    if bool(valores[-1]) is (tipo is arvore.E): # true and ... / false or ...: vale a direita
+                        valores.pop()
+                        pendentes.append(no.direita)
+                else:
+                    b = valores.pop()
+                    valores[-1] = divide(valores[-1], b, no) if tipo is arvore.Divisao else OPERACOES[tipo](valores[-1], b)
+            elif tipo is arvore.Variavel:
+                valores.append(memoria[no.slot])
+            elif tipo is arvore.Numero or tipo is arvore.Booleano:
+                valores.append(no.valor)
+            elif isinstance(no, arvore.Unaria):
+                pendentes += ((no,), no.operando)
+            elif tipo is arvore.Ou or tipo is arvore.E: # Curto-circuito: a direita só depois da esquerda
+                pendentes += ((no,), no.esquerda)
+            else:
+                pendentes += ((no,), no.direita, no.esquerda)
+        return valores[0]
+
+    # Comandos
+
+    def bloco(self, no):
+        executa_comando = self.executa_comando
+        for comando in no.comandos:
+            executa_comando(comando)
+
+    def atribuicao(self, no):
+        self.memoria[no.slot] = self.avalia(no.expressao)
+
+    def se(self, no):
+        if self.avalia(no.condicao):
+            self.executa_comando(no.entao)
+        else:
+            self.executa_comando(no.senao)
+
+    def enquanto(self, no):
+        avalia, executa_comando = self.avalia, self.executa_comando
+        while avalia(no.condicao):
+            executa_comando(no.corpo)
+            self.conta_instrucao(no) # Cada novo teste da condição conta como uma instrução
+
+    def leitura(self, no):
+        for variavel in no.variaveis:
+            self.memoria[variavel.slot] = self.entrada.le(self.tipos[variavel.slot], variavel.nome, no.linha)
+
+    def escrita(self, no):
+        avalia = self.avalia
+        self.lote.append(" ".join([formata_valor(avalia(expressao)) for expressao in no.expressoes]))
+        if len(self.lote) >= self.tamanho_lote:
+            self.descarrega()
+
+    # Saída
+
+    def descarrega(self): # Escreve as linhas de saída acumuladas
+        if self.lote:
+            self.saida.write("\n".join(self.lote) + "\n")
+            self.lote.clear()
+
+    # Expressões
+
+    def constante(self, no):
+        return no.valor
+
+    def variavel(self, no):
+        return self.memoria[no.slot]
+
+    def nao(self, no):
+        return not self.avalia_operando(no.operando)
+
+    def menos_unario(self, no):
+        return -self.avalia_operando(no.operando)
+
+    def ou(self, no): # Avaliação em curto-circuito
+        return self.avalia_operando(no.esquerda) or self.avalia_operando(no.direita)
+
+    def e(self, no): # Avaliação em curto-circuito
+        return self.avalia_operando(no.esquerda) and self.avalia_operando(no.direita)
+
+    def divisao(self, no):
+        return divide(self.avalia_operando(no.esquerda), self.avalia_operando(no.direita), no)
+
+    def binaria(self, operacao): # Avaliador de um operador binário sem tratamento especial
+        avalia = self.avalia_operando
+        def avalia_binaria(no):
+            return operacao(avalia(no.esquerda), avalia(no.direita))
+        return avalia_binaria
+
+def executa(programa, entrada=None, saida=None, limite_instrucoes=None): # Executa e devolve as instruções executadas
+    return Interpretador(programa, entrada, saida, limite_instrucoes).executa()
@@ -38,7 +38,16 @@ import sys
 import types
 import copy
 import os
-import inspect
+import hashlib
+import importlib
+import tempfile
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, chain, repeat
+
+# Version of the lextab file format.  Bump this whenever writetab()/readtab()
+# change so that stale tables written by an older lex.py are never trusted.
+__tabversion__ = '2022.10.27-2'
 
 # This tuple contains acceptable string types
 StringTypes = (str, bytes)
@@ -53,11 +62,70 @@ class LexError(Exception):
         self.args = (message,)
         self.text = s
 
+# Line number of a token of a lexer with lazy line tracking.  Such tokens
+# carry the lexer instead of a line number, and lineno is found from lexpos
+# when it is asked for.  An assigned lineno takes precedence (this descriptor
+# has no __set__).
+class _LazyLineno(object):
+    def __get__(self, tok, owner=None):
+        if tok is None:
+            return self
+        try:
+            lexer = tok.lexer
+        except AttributeError:
+            raise AttributeError('lineno') from None
+        return lexer.line(tok.lexpos)
+
 # Token class.  This class is used to represent the tokens produced.
 class LexToken(object):
+    lineno = _LazyLineno()
+
     def __repr__(self):
         return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
 
+# Offsets (plus start) of the newlines in s, in increasing order.  The offsets
+# are the running sums of the lengths of the lines, so no Python code runs per
+# line.
+def newline_offsets(s, start=0):
+    offsets = array('q', accumulate(map((1).__add__, map(len, s.split('\n'))), initial=start - 1))
+    del offsets[0]
+    del offsets[-1]
+    return offsets
+
+# Struct-of-arrays token stream produced by Lexer.tokenize_all().  Token i has
+# type typenames[types[i]], value valuetable[values[i]], and the given lineno
+# and lexpos.  Equal values share one entry of valuetable.  If scanning stopped
+# with a LexError, the tokens before it are kept and the exception is stored in
+# error; iterating over the tokens raises it after the last one.
+class LexTokenArrays(object):
+    __slots__ = ('typenames', 'types', 'lexpos', 'lineno', 'values', 'valuetable', 'error')
+
+    def __init__(self, typenames):
+        self.typenames = typenames
+        self.types = array('B')
+        self.lexpos = array('l')
+        self.lineno = array('l')
+        self.values = array('l')
+        self.valuetable = []
+        self.error = None
+
+    def __len__(self):
+        return len(self.types)
+
+    def token(self, i):
+        tok = LexToken()
+        tok.type = self.typenames[self.types[i]]
+        tok.value = self.valuetable[self.values[i]]
+        tok.lineno = self.lineno[i]
+        tok.lexpos = self.lexpos[i]
+        return tok
+
+    def __iter__(self):
+        for i in range(len(self.types)):
+            yield self.token(i)
+        if self.error is not None:
+            raise self.error
+
 # This object is a stand-in for a logging object created by the
 # logging module.
 
@@ -87,6 +155,9 @@ class PlyLogger(object):
 #    token()          -  Get the next token
 #    clone()          -  Clone the lexer
 #
+#    line()           -  Line of a position in the input
+#    column()         -  Column of a position in the input
+#
 #    lineno           -  Current line number
 #    lexpos           -  Current position in the input string
 # -----------------------------------------------------------------------------
@@ -118,6 +189,9 @@ class Lexer:
         self.lexliterals = ''         # Literal characters that can be passed through
         self.lexmodule = None         # Module
         self.lineno = 1               # Current line number
+        self.lexlazylines = False     # Lines found from the newline offsets (see line())
+        self.lexnewlines = None       # Offsets of the newlines in lexdata, computed on first use
+        self.lexlastline = (0, -1, 0) # Line of the last position asked for (see _findline())
 
     def clone(self, object=None):
         c = copy.copy(self)
@@ -146,6 +220,109 @@ class Lexer:
             c.lexmodule = object
         return c
 
+    # ------------------------------------------------------------
+    # writetab() - Write lexer information to a table file
+    #
+    # The table is written to a temporary file first and then moved
+    # into place, so concurrent processes never observe a partially
+    # written module.  The temporary file has a unique name (mkstemp),
+    # so threads of one process do not share it either, and it is
+    # removed if writing fails.
+    # ------------------------------------------------------------
+    def writetab(self, lextab, outputdir='', signature=''):
+        if isinstance(lextab, types.ModuleType):
+            raise IOError("Won't overwrite existing lextab module")
+        basetabmodule = lextab.split('.')[-1]
+        filename = os.path.join(outputdir, basetabmodule) + '.py'
+
+        # Rewrite the lexstatere table, replacing function objects with function names
+        tabre = {}
+        for statename, lre in self.lexstatere.items():
+            titem = []
+            for (pat, func), retext, renames in zip(lre, self.lexstateretext[statename],
+                                                    self.lexstaterenames[statename]):
+                titem.append((retext, _funcs_to_names(func, renames), renames))
+            tabre[statename] = titem
+
+        taberr = {}
+        for statename, ef in self.lexstateerrorf.items():
+            taberr[statename] = ef.__name__ if ef else None
+
+        tabeof = {}
+        for statename, ef in self.lexstateeoff.items():
+            tabeof[statename] = ef.__name__ if ef else None
+
+        fd, tmpname = tempfile.mkstemp(dir=os.path.dirname(filename) or os.curdir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as tf:
+                tf.write("# %s.py. This file automatically created by PLY. Don't edit!\n" % basetabmodule)
+                tf.write('_tabversion   = %r\n' % __tabversion__)
+                tf.write('_lexsignature = %r\n' % signature)
+                tf.write('_lextokens    = set(%r)\n' % (tuple(sorted(self.lextokens)),))
+                tf.write('_lexreflags   = %r\n' % int(self.lexreflags))
+                tf.write('_lexliterals  = %r\n' % self.lexliterals)
+                tf.write('_lexstateinfo = %r\n' % self.lexstateinfo)
+                tf.write('_lexstatere   = %r\n' % tabre)
+                tf.write('_lexstateignore = %r\n' % self.lexstateignore)
+                tf.write('_lexstateerrorf = %r\n' % taberr)
+                tf.write('_lexstateeoff = %r\n' % tabeof)
+            os.chmod(tmpname, 0o644)    # mkstemp makes the file readable by its owner only
+            os.replace(tmpname, filename)
+        except BaseException:
+            os.remove(tmpname)
+            raise
+
+    # ------------------------------------------------------------
+    # readtab() - Read lexer information from a tab file
+    #
+    # Raises ImportError if the table is missing, was written by a
+    # different version of lex.py or was built from different rules.
+    # ------------------------------------------------------------
+    def readtab(self, tabfile, fdict, signature=None):
+        if isinstance(tabfile, types.ModuleType):
+            lextab = tabfile
+        else:
+            lextab = importlib.import_module(tabfile)
+
+        if getattr(lextab, '_tabversion', '0.0') != __tabversion__:
+            raise ImportError('Inconsistent PLY version')
+        if signature is not None and getattr(lextab, '_lexsignature', None) != signature:
+            raise ImportError('Lexer rules have changed')
+
+        lexstatere      = {}
+        lexstateretext  = {}
+        lexstaterenames = {}
+        for statename, lre in lextab._lexstatere.items():
+            titem = []
+            txtitem = []
+            for pat, func_name, renames in lre:
+                titem.append((re.compile(pat, lextab._lexreflags), _names_to_funcs(func_name, fdict)))
+                txtitem.append(pat)
+            lexstatere[statename] = titem
+            lexstateretext[statename] = txtitem
+            lexstaterenames[statename] = [renames for pat, func_name, renames in lre]
+
+        lexstateerrorf = {}
+        for statename, ef in lextab._lexstateerrorf.items():
+            lexstateerrorf[statename] = fdict[ef] if ef else None
+
+        lexstateeoff = {}
+        for statename, ef in lextab._lexstateeoff.items():
+            lexstateeoff[statename] = fdict[ef] if ef else None
+
+        self.lextokens       = lextab._lextokens
+        self.lexreflags      = lextab._lexreflags
+        self.lexliterals     = lextab._lexliterals
+        self.lextokens_all   = self.lextokens | set(self.lexliterals)
+        self.lexstateinfo    = lextab._lexstateinfo
+        self.lexstateignore  = lextab._lexstateignore
+        self.lexstatere      = lexstatere
+        self.lexstateretext  = lexstateretext
+        self.lexstaterenames = lexstaterenames
+        self.lexstateerrorf  = lexstateerrorf
+        self.lexstateeoff    = lexstateeoff
+        self.begin('INITIAL')
+
     # ------------------------------------------------------------
     # input() - Push a new string into the lexer
     # ------------------------------------------------------------
@@ -153,6 +330,8 @@ class Lexer:
         self.lexdata = s
         self.lexpos = 0
         self.lexlen = len(s)
+        self.lexnewlines = None
+        self.lexlastline = (0, -1, 0)
 
     # ------------------------------------------------------------
     # begin() - Changes the lexing state
@@ -192,6 +371,45 @@ class Lexer:
     def skip(self, n):
         self.lexpos += n
 
+    # ------------------------------------------------------------
+    # line() - Line (starting at 1) of the input position lexpos
+    #
+    # Found by binary search in the offsets of the newlines of the
+    # input, which are computed once, the first time a line or a
+    # column is asked for.  With lazy line tracking (lazy_lines = True
+    # in the rules module) no rule has to count newlines: tokens get
+    # their lineno from here, and lineno is only updated when the end
+    # of the input or an illegal character is reached.
+    # ------------------------------------------------------------
+    def line(self, lexpos):
+        before, end, lineno = self.lexlastline
+        if before < lexpos <= end:
+            return lineno
+        return self._findline(lexpos)[2]
+
+    # ------------------------------------------------------------
+    # column() - Column (starting at 1) of the input position lexpos
+    # ------------------------------------------------------------
+    def column(self, lexpos):
+        before, end, lineno = self.lexlastline
+        if not before < lexpos <= end:
+            before = self._findline(lexpos)[0]
+        return lexpos - before
+
+    # Finds the line of lexpos and keeps it in lexlastline as (offset of the
+    # newline before the line, offset of the newline that ends it, line number).
+    # Positions are mostly asked for in order, so the next one usually falls in
+    # the same line and needs no search.
+    def _findline(self, lexpos):
+        newlines = self.lexnewlines
+        if newlines is None:
+            newlines = self.lexnewlines = newline_offsets(self.lexdata)
+        i = bisect_left(newlines, lexpos)
+        self.lexlastline = lastline = (newlines[i - 1] if i else -1,
+                                       newlines[i] if i < len(newlines) else self.lexlen,
+                                       i + 1)
+        return lastline
+
     # ------------------------------------------------------------
     # token() - Return the next token from the Lexer
     #
@@ -205,6 +423,7 @@ class Lexer:
         lexlen    = self.lexlen
         lexignore = self.lexignore
         lexdata   = self.lexdata
+        lazylines = self.lexlazylines
 
         while lexpos < lexlen:
             # This code provides some short-circuit code for whitespace, tabs, and other ignored characters
@@ -221,7 +440,10 @@ class Lexer:
                 # Create a token for return
                 tok = LexToken()
                 tok.value = m.group()
-                tok.lineno = self.lineno
+                if lazylines:
+                    tok.lexer = self
+                else:
+                    tok.lineno = self.lineno
                 tok.lexpos = lexpos
 
                 i = m.lastindex
@@ -244,7 +466,8 @@ class Lexer:
                 self.lexmatch = m
                 self.lexpos = lexpos
                 newtok = func(tok)
-                del tok.lexer
+                if not lazylines:
+                    del tok.lexer
                 del self.lexmatch
 
                 # Every function must return a token, if nothing, we just move to next token
@@ -258,7 +481,10 @@ class Lexer:
                 if lexdata[lexpos] in self.lexliterals:
                     tok = LexToken()
                     tok.value = lexdata[lexpos]
-                    tok.lineno = self.lineno
+                    if lazylines:
+                        tok.lexer = self
+                    else:
+                        tok.lineno = self.lineno
                     tok.type = tok.value
                     tok.lexpos = lexpos
                     self.lexpos = lexpos + 1
@@ -268,7 +494,8 @@ class Lexer:
                 if self.lexerrorf:
                     tok = LexToken()
                     tok.value = self.lexdata[lexpos:]
-                    tok.lineno = self.lineno
+                    if not lazylines:
+                        tok.lineno = self.lineno
                     tok.type = 'error'
                     tok.lexer = self
                     tok.lexpos = lexpos
@@ -276,6 +503,8 @@ class Lexer:
                     newtok = self.lexerrorf(tok)
                     if lexpos == self.lexpos:
                         # Error method didn't change text position at all. This is an error.
+                        if lazylines:
+                            self.lineno = self.line(lexpos)
                         raise LexError(f"Scanning error. Illegal character {lexdata[lexpos]!r}",
                                        lexdata[lexpos:])
                     lexpos = self.lexpos
@@ -284,6 +513,8 @@ class Lexer:
                     return newtok
 
                 self.lexpos = lexpos
+                if lazylines:
+                    self.lineno = self.line(lexpos)
                 raise LexError(f"Illegal character {lexdata[lexpos]!r} at index {lexpos}",
                                lexdata[lexpos:])
 
@@ -291,7 +522,8 @@ class Lexer:
             tok = LexToken()
             tok.type = 'eof'
             tok.value = ''
-            tok.lineno = self.lineno
+            if not lazylines:
+                tok.lineno = self.lineno
             tok.lexpos = lexpos
             tok.lexer = self
             self.lexpos = lexpos
@@ -301,8 +533,208 @@ class Lexer:
         self.lexpos = lexpos + 1
         if self.lexdata is None:
             raise RuntimeError('No input string given with input()')
+        if lazylines:
+            self.lineno = self.line(lexpos)
         return None
 
+    # ------------------------------------------------------------
+    # tokenize_all() - Tokenize a whole string at once
+    #
+    # Returns a LexTokenArrays instead of one LexToken per token.
+    # The token stream is the same token() would produce.  Function
+    # rules receive one reused LexToken and must not keep it.
+    # ------------------------------------------------------------
+    def tokenize_all(self, s):
+        self.input(s)
+        typenames = sorted(self.lextokens_all)
+        typecodes = {name: code for code, name in enumerate(typenames)}
+        result = LexTokenArrays(typenames)
+        types_append = result.types.append
+        lexpos_append = result.lexpos.append
+        lineno_append = result.lineno.append
+        values_append = result.values.append
+        valuetable = result.valuetable
+        interned = {}
+
+        lexpos    = 0
+        lexlen    = self.lexlen
+        lexignore = self.lexignore
+        lexdata   = s
+        lazylines = self.lexlazylines
+        lexres    = self.lexre
+        columns   = self._columns(lexres, lexignore, typecodes)
+        tok = LexToken()
+        tok.lexer = self
+
+        try:
+            while lexpos < lexlen:
+                for match, lexre, lexindexfunc, codes in columns:
+                    m = match(lexdata, lexpos)
+                    if not m:
+                        continue
+
+                    # Group 1 of the match is the run of ignored characters before the token
+                    code = codes[m.lastindex]
+                    if code is not None:
+                        # Inline emission of a string rule token
+                        start = m.end(1)
+                        lexpos = m.end()
+                        value = lexdata[start:lexpos]
+                        index = interned.get(value)
+                        if index is None:
+                            index = interned[value] = len(valuetable)
+                            valuetable.append(value)
+                        types_append(code)
+                        lexpos_append(start)
+                        if not lazylines:
+                            lineno_append(self.lineno)
+                        values_append(index)
+                        break
+
+                    func, toktype = lexindexfunc[m.lastindex - 1]
+                    if not func:
+                        lexpos = m.end()
+                        break
+
+                    lexpos = m.end(1)
+                    m = lexre.match(lexdata, lexpos)
+                    tok.value = m.group()
+                    if not lazylines:
+                        tok.lineno = self.lineno
+                    tok.lexpos = lexpos
+                    tok.type = toktype
+                    self.lexmatch = m
+                    self.lexpos = m.end()
+                    newtok = func(tok)
+                    lexpos = self.lexpos
+                    if self.lexre is not lexres or self.lexignore is not lexignore:
+                        lexres = self.lexre
+                        lexignore = self.lexignore
+                        columns = self._columns(lexres, lexignore, typecodes)
+                    if newtok:
+                        code = typecodes.get(newtok.type)
+                        value = newtok.value
+                        valuetype = type(value)
+                        if code is None or (valuetype is not str and valuetype is not int):
+                            self._append_token(result, typecodes, interned, newtok)
+                            break
+                        # Inline emission of the common case: known type, str or int value
+                        key = value if valuetype is str else (int, value)
+                        index = interned.get(key)
+                        if index is None:
+                            index = interned[key] = len(valuetable)
+                            valuetable.append(value)
+                        types_append(code)
+                        lexpos_append(newtok.lexpos)
+                        if not lazylines:
+                            lineno_append(newtok.lineno)
+                        values_append(index)
+                    break
+                else:
+                    if lexdata[lexpos] in lexignore:
+                        lexpos += 1
+                        while lexpos < lexlen and lexdata[lexpos] in lexignore:
+                            lexpos += 1
+                        continue
+
+                    if lexdata[lexpos] in self.lexliterals:
+                        tok.value = tok.type = lexdata[lexpos]
+                        if not lazylines:
+                            tok.lineno = self.lineno
+                        tok.lexpos = lexpos
+                        self._append_token(result, typecodes, interned, tok)
+                        lexpos += 1
+                        continue
+
+                    if self.lexerrorf:
+                        tok.value = lexdata[lexpos:]
+                        if not lazylines:
+                            tok.lineno = self.lineno
+                        tok.type = 'error'
+                        tok.lexpos = lexpos
+                        self.lexpos = lexpos
+                        newtok = self.lexerrorf(tok)
+                        if lexpos == self.lexpos:
+                            result.error = LexError(f"Scanning error. Illegal character {lexdata[lexpos]!r}",
+                                                    lexdata[lexpos:])
+                            break
+                        lexpos = self.lexpos
+                        if newtok:
+                            self._append_token(result, typecodes, interned, newtok)
+                        continue
+
+                    self.lexpos = lexpos
+                    result.error = LexError(f"Illegal character {lexdata[lexpos]!r} at index {lexpos}",
+                                            lexdata[lexpos:])
+                    break
+        except LexError as e:
+            # A rule that stops scanning ends the token stream like an illegal character
+            result.error = e
+            lexpos = self.lexpos
+
+        self.lexmatch = None
+        if result.error is None:
+            self.lexpos = lexpos
+            if self.lexeoff:
+                tok.type = 'eof'
+                tok.value = ''
+                if not lazylines:
+                    tok.lineno = self.lineno
+                tok.lexpos = lexpos
+                newtok = self.lexeoff(tok)
+                if newtok:
+                    self._append_token(result, typecodes, interned, newtok)
+
+        if lazylines:
+            # The line of every token: the running sum of the newlines between
+            # consecutive tokens (counted by str.count, with no Python loop)
+            self.lineno = self.line(lexpos)
+            positions = result.lexpos
+            lines = array('l', accumulate(map(lexdata.count, repeat('\n'), chain((0,), positions), positions),
+                                          initial=1))
+            del lines[0]
+            result.lineno = lines
+        return result
+
+    # The master regexes of a state as (match, regex, lexindexfunc, codes)
+    # for tokenize_all.  match first skips the ignored characters before the
+    # token, in group 1, so they cost no pass of the loop; the negative
+    # lookahead keeps the skipped run whole, as skipping them one by one
+    # would.  The groups of the rules are shifted by one: codes[i] is the
+    # type code of the string rule of group i, or None for function rules
+    # and ignored tokens.
+    def _columns(self, lexre, lexignore, typecodes):
+        columns = []
+        skip = '([%s]*)(?![%s])' % (re.escape(lexignore), re.escape(lexignore)) if lexignore else '()'
+        for regex, lexindexfunc in lexre:
+            match = re.compile('%s(?:%s)' % (skip, regex.pattern), regex.flags).match
+            codes = [None] + [typecodes[entry[1]] if entry and not entry[0] and entry[1] else None
+                              for entry in lexindexfunc]
+            columns.append((match, regex, lexindexfunc, codes))
+        return columns
+
+    # Appends a token returned by a rule function to a LexTokenArrays
+    def _append_token(self, result, typecodes, interned, tok):
+        code = typecodes.get(tok.type)
+        if code is None:
+            code = typecodes[tok.type] = len(result.typenames)
+            result.typenames.append(tok.type)
+        value = tok.value
+        try:
+            # Values of different types that compare equal (1 and True) are kept apart
+            key = value if type(value) is str else (type(value), value)
+            index = interned.get(key)
+            if index is None:
+                index = interned[key] = len(result.valuetable)
+                result.valuetable.append(value)
+        except TypeError: # Unhashable value
+            index = len(result.valuetable)
+            result.valuetable.append(value)
+        result.types.append(code)
+        result.lexpos.append(tok.lexpos)
+        result.lineno.append(tok.lineno)
+        result.values.append(index)
+
     # Iterator interface
     def __iter__(self):
         return self
@@ -340,6 +772,75 @@ def get_caller_module_dict(levels):
     f = sys._getframe(levels)
     return { **f.f_globals, **f.f_locals }
 
+# -----------------------------------------------------------------------------
+# _funcs_to_names()
+# _names_to_funcs()
+#
+# Given a list of regular expression functions, these convert the function
+# objects to names and back again.  This is used when writing and reading
+# the lextab file.
+# -----------------------------------------------------------------------------
+def _funcs_to_names(funclist, namelist):
+    result = []
+    for f, name in zip(funclist, namelist):
+        if f and f[0]:
+            result.append((name, f[1]))
+        else:
+            result.append(f)
+    return result
+
+def _names_to_funcs(namelist, fdict):
+    result = []
+    for n in namelist:
+        if n and n[0]:
+            result.append((fdict[n[0]], n[1]))
+        else:
+            result.append(n)
+    return result
+
+# -----------------------------------------------------------------------------
+# _rules_signature()
+#
+# Computes a hash over everything that determines the built lexer: the token
+# list, literals, states, reflags, reserved words and every t_ rule (its regular
+# expression and, for function rules, the order in which they are tried).  This
+# is cheap compared to a full LexerReflect pass and is used to decide whether a
+# cached lextab can be trusted.
+# -----------------------------------------------------------------------------
+def _rules_signature(ldict, reflags):
+    parts = [__tabversion__, repr(int(reflags)), repr(ldict.get('tokens')),
+             repr(ldict.get('literals', '')), repr(ldict.get('states')),
+             repr(ldict.get('reserved')), repr(ldict.get('reserved_guard'))]
+    funcs = []
+    for name in sorted(f for f in ldict if f[:2] == 't_'):
+        t = ldict[name]
+        if hasattr(t, '__call__'):
+            funcs.append(t)
+            parts.append('%s:%r' % (name, _get_regex(t)))
+        else:
+            parts.append('%s=%r' % (name, t))
+    funcs.sort(key=lambda f: f.__code__.co_firstlineno)
+    parts.append(' '.join(f.__name__ for f in funcs))
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+# -----------------------------------------------------------------------------
+# _rule_regex()
+#
+# Returns the alternative of the master regex for the rule name with regex r.
+# The regex engine skips an alternative that starts with a literal character
+# that does not match with a single comparison, but enters (and then backs out
+# of) every alternative that starts with a group.  So when r is a plain literal,
+# its first character is placed outside of the named group.  The match itself
+# (m.group()) and m.lastindex are unchanged.
+# -----------------------------------------------------------------------------
+_literal_re = re.compile(r'(?:\\[^A-Za-z0-9\s]|[^\\.^$*+?{}\[\]|()#\s])+\Z')
+
+def _rule_regex(name, r):
+    if _literal_re.match(r):
+        text = re.sub(r'\\(.)', r'\1', r)
+        return '%s(?P<%s>%s)' % (re.escape(text[0]), name, re.escape(text[1:]))
+    return '(?P<%s>%s)' % (name, r)
+
 # -----------------------------------------------------------------------------
 # _form_master_re()
 #
@@ -579,8 +1080,11 @@ class LexerReflect(object):
         for s in self.strsym.values():
             s.sort(key=lambda x: len(x[1]), reverse=True)
 
-    # Validate all of the t_rules collected
+    # Validate all of the t_rules collected.  inspect is imported here rather
+    # than at module level because it is only needed when rules are validated,
+    # and importing it dominates start-up time when a cached lextab is used.
     def validate_rules(self):
+        import inspect
         for state in self.stateinfo:
             # Validate all rules defined by functions
 
@@ -684,6 +1188,7 @@ class LexerReflect(object):
     # -----------------------------------------------------------------------------
 
     def validate_module(self, module):
+        import inspect
         try:
             lines, linen = inspect.getsourcelines(module)
         except IOError:
@@ -714,8 +1219,8 @@ class LexerReflect(object):
 #
 # Build all of the regular expression rules from definitions in the supplied module
 # -----------------------------------------------------------------------------
-def lex(*, module=None, object=None, debug=False, 
-        reflags=int(re.VERBOSE), debuglog=None, errorlog=None):
+def lex(*, module=None, object=None, debug=False, optimize=False, lextab='lextab',
+        reflags=int(re.VERBOSE), outputdir=None, debuglog=None, errorlog=None):
 
     global lexer
 
@@ -745,6 +1250,33 @@ def lex(*, module=None, object=None, debug=False,
     else:
         ldict = get_caller_module_dict(2)
 
+    # Determine if the module is package of a package or not.
+    # If so, fix the tabmodule setting so that tables load correctly
+    pkg = ldict.get('__package__')
+    if pkg and isinstance(lextab, str):
+        if '.' not in lextab:
+            lextab = pkg + '.' + lextab
+
+    # Lazy line tracking: if the module sets lazy_lines = True, the lexer does
+    # not count lines as it goes; the line of a token is found from its lexpos
+    # (see Lexer.line()) and newlines can simply be ignored characters
+    lexobj.lexlazylines = bool(ldict.get('lazy_lines'))
+
+    # In optimized mode, try to load a previously written lextab.  The table is
+    # only used if it was built from exactly the same rules, in which case the
+    # reflection and validation passes below are skipped entirely.
+    signature = None
+    if optimize and lextab:
+        signature = _rules_signature(ldict, reflags)
+        try:
+            lexobj.readtab(lextab, ldict, signature)
+            token = lexobj.token
+            input = lexobj.input
+            lexer = lexobj
+            return lexobj
+        except ImportError:
+            pass
+
     # Collect parser information from the dictionary
     linfo = LexerReflect(ldict, log=errorlog, reflags=reflags)
     linfo.get_all()
@@ -773,10 +1305,42 @@ def lex(*, module=None, object=None, debug=False,
     # Get the stateinfo dictionary
     stateinfo = linfo.stateinfo
 
+    # Reserved words.  If the module defines reserved = {word: tokenname}, each
+    # word is folded into the master regex as its own named group
+    # t_reserved_<tokenname>, followed by a negative lookahead on reserved_guard
+    # (the characters that may continue an identifier) so that only whole words
+    # match.  The words come ahead of every other rule, and the string rule that
+    # matches all of them (the identifier rule) is moved right after them.  The
+    # identifier rule can then be a plain string rule: keywords and identifiers
+    # are recognized by the master regex alone, with no Python callback to look
+    # the word up.
+    reserved_list = []
+    reserved = ldict.get('reserved')
+    if reserved:
+        guard = ldict.get('reserved_guard', r'\w')
+        for word, tokname in sorted(reserved.items(), key=lambda item: (-len(item[0]), item[0])):
+            if tokname not in lexobj.lextokens:
+                errorlog.error("Reserved word %r is mapped to undefined token %r", word, tokname)
+                raise SyntaxError("Can't build lexer")
+            name = 't_reserved_%s' % tokname
+            ldict[name] = word
+            linfo.toknames[name] = tokname
+            reserved_list.append('%s(?!%s)' % (_rule_regex(name, re.escape(word)), guard))
+            if debug:
+                debuglog.info("lex: Adding reserved word %r -> %s", word, tokname)
+
     regexs = {}
     # Build the master regular expressions
     for state in stateinfo:
-        regex_list = []
+        regex_list = list(reserved_list)
+        strsym = linfo.strsym[state]
+
+        if reserved:
+            for i, (name, r) in enumerate(strsym):
+                if all(re.fullmatch(r, word, reflags) for word in reserved):
+                    regex_list.append(_rule_regex(name, r))
+                    strsym = strsym[:i] + strsym[i + 1:]
+                    break
 
         # Add rules defined by functions first
         for fname, f in linfo.funcsym[state]:
@@ -785,8 +1349,8 @@ def lex(*, module=None, object=None, debug=False,
                 debuglog.info("lex: Adding rule %s -> '%s' (state '%s')", fname, _get_regex(f), state)
 
         # Now add all of the simple rules
-        for name, r in linfo.strsym[state]:
-            regex_list.append('(?P<%s>%s)' % (name, r))
+        for name, r in strsym:
+            regex_list.append(_rule_regex(name, r))
             if debug:
                 debuglog.info("lex: Adding rule %s -> '%s' (state '%s')", name, r, state)
 
@@ -845,6 +1409,30 @@ def lex(*, module=None, object=None, debug=False,
             if s not in linfo.ignore:
                 linfo.ignore[s] = linfo.ignore.get('INITIAL', '')
 
+    # If in optimize mode, we write the lextab
+    if lextab and optimize:
+        if outputdir is None:
+            # If no output directory is set, the location of the output files
+            # is determined according to the following rules:
+            #     - If lextab specifies a package, files go into that package directory
+            #     - Otherwise, files go in the same directory as the specifying module
+            if isinstance(lextab, types.ModuleType):
+                srcfile = lextab.__file__
+            else:
+                if '.' not in lextab:
+                    srcfile = ldict['__file__']
+                else:
+                    parts = lextab.split('.')
+                    pkgname = '.'.join(parts[:-1])
+                    srcfile = getattr(importlib.import_module(pkgname), '__file__', '')
+            outputdir = os.path.dirname(srcfile)
+        try:
+            lexobj.writetab(lextab, outputdir, signature)
+            if lextab in sys.modules:
+                del sys.modules[lextab]
+        except IOError as e:
+            errorlog.warning("Couldn't write lextab module %r. %s" % (lextab, e))
+
     # Create global versions of the token() and input() functions
     token = lexobj.token
     input = lexobj.input
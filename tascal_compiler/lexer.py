@@ -1,5 +1,6 @@
 # Analisador léxico para a linguagem Tascal usando PLY
-import ply.lex as lex
+from tascal_compiler import lex
+from tascal_compiler.diagnosticos import Diagnosticos
 
 palavras_reservadas = { # Palavras reservadas do Tascal
     'program': 'PROGRAM',
@@ -50,28 +51,77 @@ t_DPIGUAL = r':='
 t_DP = r':'
 t_VIRG = r','
 t_PF = r'\.'
-t_ignore = ' \t'
+t_ID = r'[A-Za-z][A-Za-z0-9_]*' # Identificador
+t_ignore = ' \t\n'
 
-def t_ID(t): # Identificador
-    r'[A-Za-z][A-Za-z0-9_]*'
-    t.type = palavras_reservadas.get(t.value, 'ID')
-    return t
+# As quebras de linha são ignoradas como os espaços: a linha de cada token é calculada a partir
+# do lexpos (lex.Lexer.line), por busca binária nas posições das quebras de linha, só quando um
+# diagnóstico ou um nó da árvore pede por ela; assim as quebras dentro de comentários também contam
+lazy_lines = True
+
+# As palavras reservadas entram na regex mestre como grupos próprios, antes das demais regras,
+# e só casam com uma palavra inteira (não seguida de um caractere de identificador); assim
+# palavras reservadas e identificadores são reconhecidos sem chamar uma função Python por token
+reserved = palavras_reservadas
+reserved_guard = r'[A-Za-z0-9_]'
 
 def t_NUMERO(t): # Número inteiro
     r'\d+'
     t.value = int(t.value)
     return t
 
-def t_newline(t): # Quebra de linha
-    r'\n+'
-    t.lexer.lineno += len(t.value)
+def t_COMMENT(t): # Comentários -> Não são permitidos; sem o '}', o comentário vai até o fim do código
+    r'\{[^}]*\}?'
+    if t.value[-1] == '}':
+        t.lexer.diagnosticos.registra('LEX002', t.lineno, coluna(t))
+    elif t.lexer.recupera_erros:
+        t.lexer.diagnosticos.registra('LEX003', t.lineno, coluna(t))
+    else: # Sem recuperação, o '{' sem fim é um símbolo ilegal e para a análise
+        para_no_erro(t)
 
-def t_COMMENT(t): # Comentários -> Não são permitidos
-    r'\{[^}]*\}'
-    print(f"ERRO LÉXICO: Comentários não são permitidos (linha {t.lineno})")
+def t_ILEGAL(t): # Sequência de símbolos que não iniciam nenhum token
+    r'[^ \t\nA-Za-z\d(){<>=:;,.+*\-]+'
+    if t.lexer.recupera_erros: # Pula a sequência inteira, com um só diagnóstico
+        simbolos_ilegais(t.lexer.diagnosticos, t.lineno, coluna(t), t.value)
+    else:
+        para_no_erro(t)
 
 def t_error(t): # Tratamento de erros léxicos
-    print(f"ERRO LÉXICO: Símbolo ilegal '{t.value[0]}' na linha {t.lineno}")
+    t.lexer.diagnosticos.registra('LEX001', t.lineno, coluna(t), t.value[0])
+    if t.lexer.recupera_erros:
+        t.lexer.skip(1)
+
+# Modo de recuperação (lexer.recupera_erros, ver ContextoCompilacao): em vez de parar no primeiro
+# símbolo ilegal, o lexer registra o erro, pula a sequência de símbolos ilegais e continua; um
+# comentário sem fim vai até o fim do código. As duas regras acima casam a sequência inteira de
+# uma vez (o '{' sem fim só é procurado uma vez), então o tempo continua linear no tamanho do
+# código mesmo com muitos erros; o t_error, que recebe o resto do código a cada chamada, não é usado
+LIMITE_ILEGAIS = 20 # Símbolos ilegais mostrados na mensagem
+
+def simbolos_ilegais(diagnosticos, linha, coluna, texto): # Registra uma sequência de símbolos ilegais
+    if len(texto) == 1:
+        diagnosticos.registra('LEX001', linha, coluna, texto)
+    else:
+        if len(texto) > LIMITE_ILEGAIS:
+            texto = texto[:LIMITE_ILEGAIS] + '...'
+        diagnosticos.registra('LEX004', linha, coluna, texto)
+
+def para_no_erro(t): # Registra o símbolo ilegal em t.lexpos e para a análise, como o t_error sem recuperação
+    lexer = t.lexer
+    lexer.diagnosticos.registra('LEX001', t.lineno, coluna(t), t.value[0])
+    lexer.lexpos = t.lexpos
+    lexer.lineno = t.lineno
+    raise lex.LexError(f"Scanning error. Illegal character {t.value[0]!r}", lexer.lexdata[t.lexpos:])
+
+def coluna(t): # Coluna (a partir de 1) do token, calculada a partir do lexpos
+    return t.lexer.column(t.lexpos)
 
 # Construção do analisador léxico
-lexico = lex.lex()
+# O modo otimizado reaproveita a tabela salva em lextab.py (regex mestre e regras),
+# evitando a reflexão e a validação das regras a cada processo; a tabela é
+# regenerada automaticamente quando as regras acima mudam
+lexico = lex.lex(optimize=True, lextab='lextab')
+# Os erros léxicos são registrados no coletor do lexer (ver diagnosticos.py); cada
+# ContextoCompilacao troca o coletor do seu clone do lexer pelo seu próprio
+lexico.diagnosticos = Diagnosticos()
+lexico.recupera_erros = False
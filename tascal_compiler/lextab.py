@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY. Don't edit!
+_tabversion   = '2022.10.27-2'
+_lexsignature = 'cc5d36720a9438e5d10949b8f19a568c6fdc1d570bcd2f0faefdb27e9fe7f58c'
+_lextokens    = set(('AND', 'BEGIN', 'BOOLEAN', 'DIFERENTE', 'DIV', 'DO', 'DP', 'DPAR', 'DPIGUAL', 'ELSE', 'END', 'EPAR', 'FALSE', 'ID', 'IF', 'IGUAL', 'INTEGER', 'MAIORIGUAL', 'MAIORQUE', 'MAIS', 'MENORIGUAL', 'MENORQUE', 'MENOS', 'NOT', 'NUMERO', 'OR', 'PF', 'PROGRAM', 'PV', 'READ', 'THEN', 'TRUE', 'VAR', 'VEZES', 'VIRG', 'WHILE', 'WRITE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('b(?P<t_reserved_BOOLEAN>oolean)(?![A-Za-z0-9_])|i(?P<t_reserved_INTEGER>nteger)(?![A-Za-z0-9_])|p(?P<t_reserved_PROGRAM>rogram)(?![A-Za-z0-9_])|b(?P<t_reserved_BEGIN>egin)(?![A-Za-z0-9_])|f(?P<t_reserved_FALSE>alse)(?![A-Za-z0-9_])|w(?P<t_reserved_WHILE>hile)(?![A-Za-z0-9_])|w(?P<t_reserved_WRITE>rite)(?![A-Za-z0-9_])|e(?P<t_reserved_ELSE>lse)(?![A-Za-z0-9_])|r(?P<t_reserved_READ>ead)(?![A-Za-z0-9_])|t(?P<t_reserved_THEN>hen)(?![A-Za-z0-9_])|t(?P<t_reserved_TRUE>rue)(?![A-Za-z0-9_])|a(?P<t_reserved_AND>nd)(?![A-Za-z0-9_])|d(?P<t_reserved_DIV>iv)(?![A-Za-z0-9_])|e(?P<t_reserved_END>nd)(?![A-Za-z0-9_])|n(?P<t_reserved_NOT>ot)(?![A-Za-z0-9_])|v(?P<t_reserved_VAR>ar)(?![A-Za-z0-9_])|d(?P<t_reserved_DO>o)(?![A-Za-z0-9_])|i(?P<t_reserved_IF>f)(?![A-Za-z0-9_])|o(?P<t_reserved_OR>r)(?![A-Za-z0-9_])|(?P<t_ID>[A-Za-z][A-Za-z0-9_]*)|(?P<t_NUMERO>\\d+)|(?P<t_COMMENT>\\{[^}]*\\}?)|(?P<t_ILEGAL>[^ \\t\\nA-Za-z\\d(){<>=:;,.+*\\-]+)|\\((?P<t_EPAR>)|\\)(?P<t_DPAR>)|<(?P<t_DIFERENTE>>)|<(?P<t_MENORIGUAL>=)|>(?P<t_MAIORIGUAL>=)|\\+(?P<t_MAIS>)|\\*(?P<t_VEZES>)|:(?P<t_DPIGUAL>=)|\\.(?P<t_PF>)|;(?P<t_PV>)|=(?P<t_IGUAL>)|<(?P<t_MENORQUE>)|>(?P<t_MAIORQUE>)|\\-(?P<t_MENOS>)|:(?P<t_DP>)|,(?P<t_VIRG>)', [None, (None, 'BOOLEAN'), (None, 'INTEGER'), (None, 'PROGRAM'), (None, 'BEGIN'), (None, 'FALSE'), (None, 'WHILE'), (None, 'WRITE'), (None, 'ELSE'), (None, 'READ'), (None, 'THEN'), (None, 'TRUE'), (None, 'AND'), (None, 'DIV'), (None, 'END'), (None, 'NOT'), (None, 'VAR'), (None, 'DO'), (None, 'IF'), (None, 'OR'), (None, 'ID'), ('t_NUMERO', 'NUMERO'), ('t_COMMENT', 'COMMENT'), ('t_ILEGAL', 'ILEGAL'), (None, 'EPAR'), (None, 'DPAR'), (None, 'DIFERENTE'), (None, 'MENORIGUAL'), (None, 'MAIORIGUAL'), (None, 'MAIS'), (None, 'VEZES'), (None, 'DPIGUAL'), (None, 'PF'), (None, 'PV'), (None, 'IGUAL'), (None, 'MENORQUE'), (None, 'MAIORQUE'), (None, 'MENOS'), (None, 'DP'), (None, 'VIRG')], [None, 't_reserved_BOOLEAN', 't_reserved_INTEGER', 't_reserved_PROGRAM', 't_reserved_BEGIN', 't_reserved_FALSE', 't_reserved_WHILE', 't_reserved_WRITE', 't_reserved_ELSE', 't_reserved_READ', 't_reserved_THEN', 't_reserved_TRUE', 't_reserved_AND', 't_reserved_DIV', 't_reserved_END', 't_reserved_NOT', 't_reserved_VAR', 't_reserved_DO', 't_reserved_IF', 't_reserved_OR', 't_ID', 't_NUMERO', 't_COMMENT', 't_ILEGAL', 't_EPAR', 't_DPAR', 't_DIFERENTE', 't_MENORIGUAL', 't_MAIORIGUAL', 't_MAIS', 't_VEZES', 't_DPIGUAL', 't_PF', 't_PV', 't_IGUAL', 't_MENORQUE', 't_MAIORQUE', 't_MENOS', 't_DP', 't_VIRG'])]}
+_lexstateignore = {'INITIAL': ' \t\n'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
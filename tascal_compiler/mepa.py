@@ -0,0 +1,529 @@
+# Geração de código MEPA e executor de MEPA
+# A MEPA (Máquina de Execução para Pascal, Kowaltowski) é a máquina de pilha usada como alvo
+# dos compiladores de Pascal simplificado. O gerador traduz o programa já verificado
+# (arvore.Programa sem erros) para uma lista de instruções MEPA, que pode ser escrita como
+# texto (uma instrução por linha, rótulos "L1:") e lida de volta. O executor não interpreta
+# o texto: o montador pré-decodifica as instruções em um array de inteiros (códigos e
+# argumentos, com os rótulos já resolvidos em posições), combinando as sequências mais comuns
+# em uma só instrução, e o laço de execução percorre esse array, como a máquina de pilha de
+# bytecode.py.
+#
+# Como o Tascal não tem procedimentos, todas as variáveis estão no nível 0 (CRVL 0,n).
+# Booleanos são 0 e 1. Instruções que não existem na MEPA original, necessárias para manter a
+# entrada e a saída do Tascal:
+#   LEIB        lê um boolean (true/false) e o empilha como 1 ou 0
+#   IMPT n,m    desempilha n valores e os escreve em uma linha, separados por espaço; o bit i
+#               de m indica que o i-ésimo valor é boolean (escrito como true/false)
+# Um write de um único integer usa o IMPR da MEPA original
+import sys
+import operator
+from array import array
+from tascal_compiler import arvore, bytecode
+from tascal_compiler.lex import LexError
+from tascal_compiler.parser import ContextoCompilacao
+from tascal_compiler.interpretador import (ErroExecucao, LimiteInstrucoesExcedido, Entrada,
+                                           resolve_slots, nomes_slots)
+
+# Instruções e o número de argumentos de cada uma
+ARGUMENTOS = {
+    "INPP": 0, "AMEM": 1, "DMEM": 1, "PARA": 0, "NADA": 0,
+    "CRCT": 1, "CRVL": 2, "ARMZ": 2,
+    "SOMA": 0, "SUBT": 0, "MULT": 0, "DIVI": 0, "INVR": 0,
+    "CONJ": 0, "DISJ": 0, "NEGA": 0,
+    "CMME": 0, "CMMA": 0, "CMIG": 0, "CMDG": 0, "CMEG": 0, "CMAG": 0,
+    "DSVS": 1, "DSVF": 1,
+    "LEIT": 0, "LEIB": 0, "IMPR": 0, "IMPT": 2,
+}
+
+OPERADORES = { # Instrução de cada operador binário
+    arvore.Soma: "SOMA", arvore.Subtracao: "SUBT", arvore.Multiplicacao: "MULT", arvore.Divisao: "DIVI",
+    arvore.E: "CONJ", arvore.Ou: "DISJ",
+    arvore.Igual: "CMIG", arvore.Diferente: "CMDG", arvore.Menor: "CMME", arvore.MenorIgual: "CMEG",
+    arvore.Maior: "CMMA", arvore.MaiorIgual: "CMAG",
+}
+
+class ErroMontagem(Exception): # Texto MEPA inválido
+    pass
+
+class Instrucao: # Uma instrução MEPA simbólica, com rótulo opcional e a linha do Tascal de origem
+    __slots__ = ('rotulo', 'mnemonico', 'argumentos', 'linha')
+
+    def __init__(self, rotulo, mnemonico, argumentos=(), linha=None):
+        self.rotulo = rotulo
+        self.mnemonico = mnemonico
+        self.argumentos = tuple(argumentos)
+        self.linha = linha
+
+    def __str__(self):
+        prefixo = f"{self.rotulo}:" if self.rotulo else ""
+        texto = f"{prefixo:<6}{self.mnemonico}"
+        if self.argumentos:
+            texto += " " + ",".join(str(argumento) for argumento in self.argumentos)
+        return texto
+
+class CodigoMepa: # Programa MEPA gerado, com as informações de depuração (linhas e nomes)
+    def __init__(self, instrucoes, nomes):
+        self.instrucoes = instrucoes # Lista de Instrucao
+        self.nomes = nomes # Nome da variável de cada endereço
+
+    def texto(self): # Programa MEPA como texto, uma instrução por linha
+        return "\n".join(str(instrucao) for instrucao in self.instrucoes) + "\n"
+
+    def monta(self): # Pré-decodifica o programa, mantendo as linhas do Tascal para os erros
+        return monta(self.instrucoes, self.nomes)
+
+class GeradorMepa: # Traduz um arvore.Programa sem erros para um CodigoMepa
+    def __init__(self):
+        self.instrucoes = []
+        self.rotulos = 0
+        self.linha = None # Linha do Tascal das instruções emitidas
+
+    def gera(self, programa):
+        tipos = resolve_slots(programa)
+        self.tipos = tipos
+        self.linha = programa.linha
+        self.emite("INPP")
+        if tipos:
+            self.emite("AMEM", len(tipos))
+        self.comando(programa.corpo)
+        self.linha = programa.linha
+        if tipos:
+            self.emite("DMEM", len(tipos))
+        self.emite("PARA")
+        return CodigoMepa(self.instrucoes, nomes_slots(programa))
+
+    def emite(self, mnemonico, *argumentos):
+        self.instrucoes.append(self.instrucao(mnemonico, *argumentos))
+
+    def instrucao(self, mnemonico, *argumentos): # Instrução na linha atual, sem emiti-la
+        return Instrucao(None, mnemonico, argumentos, self.linha)
+
+    def novo_rotulo(self):
+        self.rotulos += 1
+        return f"L{self.rotulos}"
+
+    def rotulo(self, rotulo): # Marca a próxima instrução com o rótulo (NADA, como no livro)
+        self.instrucoes.append(Instrucao(rotulo, "NADA", (), self.linha))
+
+    # Comandos
+
+    def comando(self, no):
+        if no is None: # Comando vazio
+            return
+        tipo = type(no)
+        if tipo is arvore.Bloco:
+            for comando in no.comandos:
+                self.comando(comando)
+            return
+        self.linha = no.linha
+        if tipo is arvore.Atribuicao:
+            self.expressao(no.expressao)
+            self.emite("ARMZ", 0, no.slot)
+        elif tipo is arvore.Se:
+            senao = self.novo_rotulo() if no.senao is not None else None
+            fim = self.novo_rotulo()
+            self.expressao(no.condicao)
+            self.emite("DSVF", senao or fim)
+            self.comando(no.entao)
+            if no.senao is not None:
+                self.emite("DSVS", fim)
+                self.rotulo(senao)
+                self.comando(no.senao)
+            self.rotulo(fim)
+        elif tipo is arvore.Enquanto:
+            inicio, fim = self.novo_rotulo(), self.novo_rotulo()
+            self.rotulo(inicio)
+            self.expressao(no.condicao)
+            self.emite("DSVF", fim)
+            self.comando(no.corpo)
+            self.linha = no.linha
+            self.emite("DSVS", inicio)
+            self.rotulo(fim)
+        elif tipo is arvore.Leitura:
+            for variavel in no.variaveis:
+                self.emite("LEIB" if self.tipos[variavel.slot] == "boolean" else "LEIT")
+                self.emite("ARMZ", 0, variavel.slot)
+        elif tipo is arvore.Escrita:
+            for expressao in no.expressoes:
+                self.expressao(expressao)
+            if len(no.expressoes) == 1 and no.expressoes[0].tipo != "boolean":
+                self.emite("IMPR")
+            else:
+                mascara = sum(1 << i for i, expressao in enumerate(no.expressoes) if expressao.tipo == "boolean")
+                self.emite("IMPT", len(no.expressoes), mascara)
+
+    # Expressões
+
+    def expressao(self, no): # Emite o código que empilha o valor de no
+        # Sem recursão: uma expressão longa (x + x + ... + x) é uma árvore com a profundidade do número
+        # de termos. pendentes guarda os nós a compilar e, em tuplas, as instruções já montadas que
+        # vêm depois do código dos operandos
+        pendentes = [no]
+        while pendentes:
+            no = pendentes.pop()
+            tipo = type(no)
+            if tipo is tuple:
+                self.instrucoes += no
+            elif tipo is arvore.Variavel:
+                self.emite("CRVL", 0, no.slot)
+            elif tipo is arvore.Numero or tipo is arvore.Booleano:
+                self.emite("CRCT", int(no.valor))
+            elif tipo is arvore.Nao:
+                pendentes += ((self.instrucao("NEGA"),), no.operando)
+            elif tipo is arvore.MenosUnario:
+                pendentes += ((self.instrucao("INVR"),), no.operando)
+            elif (tipo is arvore.E or tipo is arvore.Ou) and contem_divisao(no.direita):
+                # CONJ e DISJ avaliam os dois lados; como nos outros executores, o lado direito só é
+                # avaliado quando necessário, o que importa apenas se ele puder dividir por zero
+                curto, fim = self.novo_rotulo(), self.novo_rotulo()
+                if tipo is arvore.E:
+                    depois_esquerda = (self.instrucao("DSVF", curto),)
+                else:
+                    depois_esquerda = (self.instrucao("NEGA"), self.instrucao("DSVF", curto))
+                depois_direita = (self.instrucao("DSVS", fim), Instrucao(curto, "NADA", (), self.linha),
+                                  self.instrucao("CRCT", 0 if tipo is arvore.E else 1),
+                                  Instrucao(fim, "NADA", (), self.linha))
+                pendentes += (depois_direita, no.direita, depois_esquerda, no.esquerda)
+            else:
+                if tipo is arvore.Divisao: # A divisão por zero é informada com a linha do operador
+                    operador = Instrucao(None, "DIVI", (), no.linha)
+                else:
+                    operador = self.instrucao(OPERADORES[tipo])
+                pendentes += ((operador,), no.direita, no.esquerda)
+
+def contem_divisao(no): # A expressão tem algum div?
+    pendentes = [no]
+    while pendentes:
+        no = pendentes.pop()
+        if type(no) is arvore.Divisao:
+            return True
+        pendentes.extend(no.filhos())
+    return False
+
+def gera(programa): # Gera o código MEPA de um arvore.Programa (sem erros)
+    return GeradorMepa().gera(programa)
+
+# Montagem
+
+def le_texto(texto): # Lista de Instrucao a partir do texto MEPA
+    instrucoes = []
+    for numero, linha in enumerate(texto.splitlines(), 1):
+        partes = linha.split()
+        if not partes:
+            continue
+        rotulo = None
+        if partes[0].endswith(":"):
+            rotulo = partes.pop(0)[:-1]
+            if not partes: # Rótulo sozinho na linha: marca um NADA
+                partes = ["NADA"]
+        mnemonico = partes[0].upper()
+        if mnemonico not in ARGUMENTOS:
+            raise ErroMontagem(f"linha {numero}: instrução desconhecida '{partes[0]}'")
+        argumentos = []
+        for argumento in "".join(partes[1:]).split(","):
+            if argumento:
+                try:
+                    argumentos.append(int(argumento))
+                except ValueError:
+                    argumentos.append(argumento) # Rótulo
+        if mnemonico in ("CRVL", "ARMZ") and len(argumentos) == 1: # Forma sem nível: CRVL n
+            argumentos.insert(0, 0)
+        if len(argumentos) != ARGUMENTOS[mnemonico]:
+            raise ErroMontagem(f"linha {numero}: {mnemonico} espera {ARGUMENTOS[mnemonico]} argumento(s)")
+        instrucoes.append(Instrucao(rotulo, mnemonico, argumentos))
+    return instrucoes
+
+class ProgramaMepa: # Programa pré-decodificado: um array de inteiros e as tabelas auxiliares
+    def __init__(self, codigo, memoria_inicial, mascaras, linhas, nomes):
+        self.codigo = codigo # array('i'): código de cada instrução seguido dos argumentos
+        self.memoria_inicial = memoria_inicial # Variáveis (0) seguidas das constantes
+        self.mascaras = mascaras # Máscaras dos IMPT
+        self.linhas = linhas # Posição -> linha do Tascal, ou None
+        self.nomes = nomes # Nome da variável de cada endereço, ou None
+
+    def linha_de(self, pc):
+        return self.linhas.get(pc) if self.linhas is not None else None
+
+    def nome_de(self, endereco):
+        if self.nomes is not None and endereco < len(self.nomes):
+            return self.nomes[endereco]
+        return f"M[{endereco}]"
+
+# Códigos da forma pré-decodificada. As constantes (CRCT) viram registradores guardados
+# depois das variáveis, então CRCT e CRVL são a mesma instrução, e as sequências mais comuns
+# viram uma só instrução (cada uma ainda conta como as instruções MEPA que substitui):
+#   CRxx r; ARMZ d                  -> COPIA d r
+#   CRxx a; CRxx b; op              -> BINARIA_REGISTROS k a b
+#   CRxx a; CRxx b; op; ARMZ d      -> ATRIBUI k d a b
+#   CRxx a; CRxx b; op; DSVF p      -> DESVIA_SE_NAO k a b p
+CARREGA, ARMAZENA, COPIA, ATRIBUI, BINARIA_REGISTROS, DESVIA_SE_NAO, BINARIA = range(1, 8)
+DESVIA_SE_FALSO, DESVIA, NEGA, INVERTE, IMPRIME, IMPRIME_LINHA, LE_INTEIRO, LE_BOOLEANO = range(8, 16)
+ALOCA, DESALOCA, PARA = range(16, 19)
+
+# Operadores binários (argumento k); as comparações devolvem bool, que vale 0 ou 1
+OPERACOES = bytecode.OPERACOES + (operator.and_, operator.or_)
+OPERADOR = {
+    "SOMA": 0, "SUBT": 1, "MULT": 2, "DIVI": 3, "CMIG": 4, "CMDG": 5, "CMME": 6, "CMEG": 7,
+    "CMMA": 8, "CMAG": 9, "CONJ": 10, "DISJ": 11,
+}
+SIMPLES = { # Instruções sem argumentos que não são operadores binários
+    "NEGA": NEGA, "INVR": INVERTE, "IMPR": IMPRIME, "LEIT": LE_INTEIRO, "LEIB": LE_BOOLEANO, "PARA": PARA,
+}
+
+def monta(instrucoes, nomes=None): # Pré-decodifica uma lista de Instrucao (ou um texto MEPA)
+    if isinstance(instrucoes, str):
+        instrucoes = le_texto(instrucoes)
+    # NADA e INPP não geram código: cada rótulo aponta para a instrução seguinte
+    reais = []
+    rotulos = {}
+    for instrucao in instrucoes:
+        if instrucao.rotulo is not None:
+            if instrucao.rotulo in rotulos:
+                raise ErroMontagem(f"rótulo '{instrucao.rotulo}' repetido")
+            rotulos[instrucao.rotulo] = len(reais)
+        if instrucao.mnemonico not in ("NADA", "INPP"):
+            reais.append(instrucao)
+    for instrucao in reais:
+        if instrucao.mnemonico in ("DSVS", "DSVF") and instrucao.argumentos[0] not in rotulos:
+            raise ErroMontagem(f"rótulo '{instrucao.argumentos[0]}' não definido")
+        if instrucao.mnemonico in ("CRVL", "ARMZ") and instrucao.argumentos[0] != 0:
+            raise ErroMontagem(f"{instrucao.mnemonico} {instrucao.argumentos[0]},{instrucao.argumentos[1]}: "
+                               f"só há variáveis no nível 0")
+    destinos = set(rotulos.values()) # Instruções que não podem ficar no meio de uma instrução combinada
+
+    variaveis = sum(instrucao.argumentos[0] for instrucao in reais if instrucao.mnemonico == "AMEM")
+    constantes = {} # Valor -> registrador
+    def registrador(instrucao): # Registrador de um CRVL/CRCT, ou None
+        if instrucao.mnemonico == "CRVL":
+            return instrucao.argumentos[1]
+        if instrucao.mnemonico == "CRCT":
+            return constantes.setdefault(instrucao.argumentos[0], variaveis + len(constantes))
+        return None
+
+    codigo = array('i')
+    posicoes = {} # Índice em reais -> posição no código
+    desvios = [] # (posição do argumento, índice em reais do destino)
+    mascaras = []
+    linhas = {} if all(instrucao.linha is not None for instrucao in reais) else None
+    i = 0
+    while i < len(reais):
+        instrucao = reais[i]
+        inicio = posicoes[i] = len(codigo)
+        seguintes = [] # Até três instruções seguintes, sem destinos de desvio entre elas
+        for j in range(i + 1, min(i + 4, len(reais))):
+            if j in destinos:
+                break
+            seguintes.append(reais[j])
+        a = registrador(instrucao)
+        b = registrador(seguintes[0]) if seguintes else None
+        linha = instrucao.linha
+        if a is not None and b is not None and len(seguintes) >= 2 and seguintes[1].mnemonico in OPERADOR:
+            k = OPERADOR[seguintes[1].mnemonico]
+            linha = seguintes[1].linha # Linha do operador, para a divisão por zero
+            if len(seguintes) == 3 and seguintes[2].mnemonico == "ARMZ":
+                codigo.extend((ATRIBUI, k, seguintes[2].argumentos[1], a, b))
+                i += 4
+            elif len(seguintes) == 3 and seguintes[2].mnemonico == "DSVF":
+                codigo.extend((DESVIA_SE_NAO, k, a, b, 0))
+                desvios.append((len(codigo) - 1, rotulos[seguintes[2].argumentos[0]]))
+                i += 4
+            else:
+                codigo.extend((BINARIA_REGISTROS, k, a, b))
+                i += 3
+        elif a is not None and seguintes and seguintes[0].mnemonico == "ARMZ":
+            codigo.extend((COPIA, seguintes[0].argumentos[1], a))
+            i += 2
+        else:
+            mnemonico = instrucao.mnemonico
+            if a is not None:
+                codigo.extend((CARREGA, a))
+            elif mnemonico == "ARMZ":
+                codigo.extend((ARMAZENA, instrucao.argumentos[1]))
+            elif mnemonico in OPERADOR:
+                codigo.extend((BINARIA, OPERADOR[mnemonico]))
+            elif mnemonico in ("DSVS", "DSVF"):
+                codigo.extend((DESVIA if mnemonico == "DSVS" else DESVIA_SE_FALSO, 0))
+                desvios.append((len(codigo) - 1, rotulos[instrucao.argumentos[0]]))
+            elif mnemonico == "IMPT":
+                mascaras.append(instrucao.argumentos[1])
+                codigo.extend((IMPRIME_LINHA, instrucao.argumentos[0], len(mascaras) - 1))
+            elif mnemonico in ("AMEM", "DMEM"):
+                codigo.extend((ALOCA if mnemonico == "AMEM" else DESALOCA, instrucao.argumentos[0]))
+            else:
+                codigo.append(SIMPLES[mnemonico])
+            i += 1
+        if linhas is not None:
+            linhas[inicio] = linha
+    posicoes[len(reais)] = len(codigo) # Rótulo depois da última instrução
+    for argumento, destino in desvios:
+        codigo[argumento] = posicoes[destino]
+    memoria_inicial = [0] * variaveis + sorted(constantes, key=constantes.get)
+    return ProgramaMepa(codigo, memoria_inicial, mascaras, linhas, nomes)
+
+# Execução
+
+class ExecutorMepa: # Executa um ProgramaMepa
+    def __init__(self, programa, entrada=None, saida=None, limite_instrucoes=None, tamanho_lote=1024):
+        self.programa = programa
+        self.memoria = list(programa.memoria_inicial)
+        self.entrada = Entrada(entrada if entrada is not None else sys.stdin, self.descarrega)
+        self.saida = saida if saida is not None else sys.stdout
+        self.limite_instrucoes = limite_instrucoes # None: sem limite
+        self.tamanho_lote = tamanho_lote # Linhas de saída acumuladas antes de escrever
+        self.instrucoes = 0 # Instruções MEPA executadas (uma combinada conta como as que substitui)
+        self.lote = [] # Linhas de saída ainda não escritas
+
+    def descarrega(self): # Escreve as linhas de saída acumuladas
+        if self.lote:
+            self.saida.write("\n".join(self.lote) + "\n")
+            self.lote.clear()
+
+    def le(self, tipo, pc): # Valor lido pelo LEIT/LEIB, com o nome da variável do ARMZ seguinte
+        programa = self.programa
+        codigo = programa.codigo
+        nome = programa.nome_de(codigo[pc + 2]) if codigo[pc + 1] == ARMAZENA else "?"
+        try:
+            return int(self.entrada.le(tipo, nome, None))
+        except ErroExecucao as e:
+            e.linha = programa.linha_de(pc)
+            raise
+
+    def excedido(self, pc):
+        raise LimiteInstrucoesExcedido(f"limite de {self.limite_instrucoes} instruções excedido",
+                                       self.programa.linha_de(pc))
+
+    def executa(self): # Executa o programa; devolve o número de instruções executadas
+        # Mesma organização da máquina de pilha de bytecode.py: variáveis do laço em locais,
+        # códigos comparados como literais em dois níveis, limite verificado nos desvios para
+        # trás e no fim do programa
+        programa = self.programa
+        codigo = programa.codigo
+        memoria = self.memoria
+        operacoes = OPERACOES
+        lote, tamanho_lote = self.lote, self.tamanho_lote
+        limite = self.limite_instrucoes if self.limite_instrucoes is not None else sys.maxsize
+        pilha = []
+        empilha = pilha.append
+        desempilha = pilha.pop
+        executadas = 0
+        pc = 0
+        try:
+            while True:
+                op = codigo[pc]
+                if op <= 7: # Instruções sobre registradores, as mais frequentes
+                    if op == 1: # CARREGA (CRVL, CRCT)
+                        empilha(memoria[codigo[pc + 1]])
+                        executadas += 1
+                        pc += 2
+                    elif op == 4: # ATRIBUI (CRxx, CRxx, op, ARMZ)
+                        memoria[codigo[pc + 2]] = operacoes[codigo[pc + 1]](memoria[codigo[pc + 3]],
+                                                                            memoria[codigo[pc + 4]])
+                        executadas += 4
+                        pc += 5
+                    elif op == 3: # COPIA (CRxx, ARMZ)
+                        memoria[codigo[pc + 1]] = memoria[codigo[pc + 2]]
+                        executadas += 2
+                        pc += 3
+                    elif op == 6: # DESVIA_SE_NAO (CRxx, CRxx, op, DSVF)
+                        executadas += 4
+                        if operacoes[codigo[pc + 1]](memoria[codigo[pc + 2]], memoria[codigo[pc + 3]]):
+                            pc += 5
+                        else:
+                            destino = codigo[pc + 4]
+                            if destino <= pc and executadas > limite:
+                                self.excedido(pc)
+                            pc = destino
+                    elif op == 5: # BINARIA_REGISTROS (CRxx, CRxx, op)
+                        empilha(operacoes[codigo[pc + 1]](memoria[codigo[pc + 2]], memoria[codigo[pc + 3]]))
+                        executadas += 3
+                        pc += 4
+                    elif op == 2: # ARMAZENA (ARMZ)
+                        memoria[codigo[pc + 1]] = desempilha()
+                        executadas += 1
+                        pc += 2
+                    else: # BINARIA (SOMA, SUBT, ..., CMIG, ..., CONJ, DISJ)
+                        b = desempilha()
+                        pilha[-1] = operacoes[codigo[pc + 1]](pilha[-1], b)
+                        executadas += 1
+                        pc += 2
+                elif op == 9: # DESVIA (DSVS)
+                    executadas += 1
+                    destino = codigo[pc + 1]
+                    if destino <= pc and executadas > limite:
+                        self.excedido(pc)
+                    pc = destino
+                elif op == 8: # DESVIA_SE_FALSO (DSVF)
+                    executadas += 1
+                    if desempilha():
+                        pc += 2
+                    else:
+                        destino = codigo[pc + 1]
+                        if destino <= pc and executadas > limite:
+                            self.excedido(pc)
+                        pc = destino
+                elif op == 12: # IMPRIME (IMPR)
+                    executadas += 1
+                    lote.append(str(desempilha()))
+                    if len(lote) >= tamanho_lote:
+                        self.descarrega()
+                    pc += 1
+                elif op == 13: # IMPRIME_LINHA (IMPT)
+                    executadas += 1
+                    n = codigo[pc + 1]
+                    mascara = programa.mascaras[codigo[pc + 2]]
+                    valores = pilha[-n:]
+                    del pilha[-n:]
+                    lote.append(" ".join([("true" if valor else "false") if mascara >> i & 1 else str(valor)
+                                          for i, valor in enumerate(valores)]))
+                    if len(lote) >= tamanho_lote:
+                        self.descarrega()
+                    pc += 3
+                elif op == 10: # NEGA
+                    executadas += 1
+                    pilha[-1] = not pilha[-1]
+                    pc += 1
+                elif op == 11: # INVERTE (INVR)
+                    executadas += 1
+                    pilha[-1] = -pilha[-1]
+                    pc += 1
+                elif op == 14 or op == 15: # LE_INTEIRO (LEIT), LE_BOOLEANO (LEIB)
+                    executadas += 1
+                    empilha(self.le("integer" if op == 14 else "boolean", pc))
+                    pc += 1
+                elif op == 16 or op == 17: # ALOCA (AMEM), DESALOCA (DMEM): a memória já está alocada
+                    executadas += 1
+                    pc += 2
+                elif op == 18: # PARA
+                    executadas += 1
+                    if executadas > limite:
+                        self.excedido(pc)
+                    return executadas
+                else:
+                    raise ValueError(f"instrução inválida {op} na posição {pc}")
+        except ZeroDivisionError: # DIVI (OPERACOES[3])
+            raise ErroExecucao("divisão por zero", programa.linha_de(pc)) from None
+        finally:
+            self.instrucoes = executadas
+            self.descarrega()
+
+def executa(programa, entrada=None, saida=None, limite_instrucoes=None): # Executa e devolve as instruções executadas
+    return ExecutorMepa(programa, entrada, saida, limite_instrucoes).executa()
+
+def main(): # Escreve o código MEPA de um programa Tascal
+    # Exemplo: py -m tascal_compiler.mepa tascal_compiler/Tests/Parser/ProgramasTascalTeste/P10.tascal
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        codigo = f.read()
+    contexto = ContextoCompilacao()
+    arvore_programa = None
+    try:
+        arvore_programa = contexto.compila(codigo)
+    except LexError: # O erro léxico já foi registrado nos diagnósticos
+        pass
+    if arvore_programa is None or contexto.diagnosticos.tem_erros():
+        for linha in contexto.diagnosticos.formata():
+            print(linha)
+        sys.exit(1)
+    sys.stdout.write(gera(arvore_programa).texto())
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,131 @@
 # Script do analisador sintático e semântico do Tascal
 # Realiza verificação de tipos, declarações e usos de variáveis
-# Gera mensagens de erro semântico detalhadas
-import ply.yacc as yacc
-from tascal_compiler.lexer import tokens
-
-tabela_variaveis = {} # Tabela de símbolos para variáveis
-erros_semanticos = [] # Lista de erros semânticos encontrados
-
-def semantico_reset(): # Reseta o estado semântico
-    global tabela_variaveis, erros_semanticos
-    tabela_variaveis = {}
-    erros_semanticos = []
-
-def erro_semantico(msg, linha): # Registra um erro semântico
-    print(f"ERRO SEMÂNTICO na linha {linha}: {msg}")
-    erros_semanticos.append(f"Linha {linha}: {msg}")
-
-def instala_programa(nome, linha): # Registra o programa principal
-    pass 
-
-def instala_variavel(nome, tipo, linha): # Registra uma variável na tabela de símbolos
-    if nome in tabela_variaveis:
-        erro_semantico(f"variável '{nome}' já declarada", linha) # Erro se redeclarada
-    else:
-        tabela_variaveis[nome] = tipo # Adiciona à tabela
-
-def busca_variavel(nome, linha):
-    if nome not in tabela_variaveis:
-        erro_semantico(f"variável '{nome}' não declarada", linha)
-        return None
-    return tabela_variaveis[nome]
+# Registra os erros como diagnósticos (ver diagnosticos.py) e devolve a árvore sintática tipada (ver arvore.py)
+from tascal_compiler import yacc
+from tascal_compiler import arvore
+from tascal_compiler import automato
+from tascal_compiler.diagnosticos import Diagnosticos
+from tascal_compiler.lexer import tokens, lexico
+
+MOTORES_LEXICOS = { # Nome -> função que cria um lexer novo
+    'ply': lexico.clone,
+    'afd': automato.Automato,
+}
+
+class ContextoCompilacao: # Estado de uma compilação: lexer próprio, tabela de símbolos e diagnósticos
+    # O contexto é repassado às regras p_* (p.context) e ao p_error, em vez de ficar em
+    # variáveis globais do módulo; assim várias compilações podem rodar ao mesmo tempo
+    # no mesmo processo (threads, asyncio), compartilhando apenas as tabelas do parser.
+    # Use um contexto novo para cada programa compilado. O motor_lexico escolhe o lexer:
+    # 'ply' (lexer.py) ou 'afd' (automato.py, o autômato dirigido por tabela), com os mesmos tokens.
+    # Com recupera_erros_lexicos, o lexer registra os erros léxicos e continua em vez de parar no primeiro
+    def __init__(self, limite_por_codigo=100, motor_lexico='ply', recupera_erros_lexicos=False):
+        self.diagnosticos = Diagnosticos(limite_por_codigo) # Erros léxicos, sintáticos e semânticos
+        if motor_lexico not in MOTORES_LEXICOS:
+            raise ValueError(f"motor léxico desconhecido: {motor_lexico!r}")
+        self.lexer = MOTORES_LEXICOS[motor_lexico]() # Lexer próprio, com posição e contagem de linhas independentes
+        self.lexer.lineno = 1
+        self.lexer.diagnosticos = self.diagnosticos
+        self.lexer.recupera_erros = recupera_erros_lexicos
+        self.tabela_variaveis = {} # Tabela de símbolos para variáveis
+        self.ao_concluir = None # Recebe cada declaração e comando do bloco principal já reduzido (ver AnaliseContinua)
+
+    def compila(self, codigo, parse=None, colunar=False): # Analisa o código e devolve a árvore (arvore.Programa)
+        parse = parse or parser.parse # Permite usar outro laço de análise, como o parser especializado
+        if colunar: # Tokeniza tudo de uma vez em arrays (lex.LexTokenArrays), sem um LexToken por token
+            return parse(lexer=self.lexer, context=self, tokens=self.lexer.tokenize_all(codigo))
+        return parse(codigo, lexer=self.lexer, context=self)
+
+    def compila_fluxo(self, fonte, parse=None, tamanho_bloco=automato.TAMANHO_BLOCO):
+        # Como compila, mas lê o código aos poucos de um arquivo, mmap ou bytes (ver automato.blocos);
+        # só o lexer por autômato tem o modo de fluxo
+        if not hasattr(self.lexer, 'input_stream'):
+            raise ValueError("a leitura em fluxo requer motor_lexico='afd'")
+        parse = parse or parser.parse
+        self.lexer.input_stream(fonte, tamanho_bloco)
+        return parse(lexer=self.lexer, context=self)
+
+    def erro_semantico(self, codigo, linha, coluna, *argumentos, simbolo=None): # Registra um erro semântico
+        self.diagnosticos.registra(codigo, linha, coluna, *argumentos, simbolo=simbolo)
+
+    def instala_programa(self, nome, linha): # Registra o programa principal
+        pass
+
+    def conclui(self, no): # Uma declaração (nó Declaracao) ou um comando do bloco principal foi reduzido
+        if self.ao_concluir is not None:
+            self.ao_concluir(no)
+
+    def instala_variavel(self, variavel, tipo): # Registra uma variável (nó Variavel) na tabela de símbolos
+        if variavel.nome in self.tabela_variaveis: # Erro se redeclarada
+            self.erro_semantico('SEM001', variavel.linha, variavel.coluna, variavel.nome, simbolo=variavel.nome)
+        else:
+            self.tabela_variaveis[variavel.nome] = tipo # Adiciona à tabela
+
+    def busca_variavel(self, nome, linha, coluna):
+        if nome not in self.tabela_variaveis:
+            self.erro_semantico('SEM002', linha, coluna, nome, simbolo=nome)
+            return None
+        return self.tabela_variaveis[nome]
+
+def compila(codigo): # Compila um programa em um contexto novo, devolvendo (árvore, diagnósticos)
+    contexto = ContextoCompilacao()
+    return contexto.compila(codigo), contexto.diagnosticos
+
+class AnaliseContinua: # Análise de um programa cujos tokens chegam aos poucos (de um pipe, de outro processo)
+    # Os tokens são empurrados com feed(token) à medida que chegam, e finish() encerra o código e devolve
+    # a árvore (ou None, como compila). A análise roda sobre as tabelas do parser (yacc.PushParser),
+    # com a pilha LR guardada entre as chamadas, e cada declaração e cada comando do bloco principal é
+    # emitido assim que é reduzido, depois dos diagnósticos registrados até ali, sem esperar o fim do
+    # código. emite recebe cada item (nó arvore.Declaracao, nó de comando ou diagnosticos.Diagnostico);
+    # sem ela, os itens ficam em emitidos. Os tokens vêm do lexer do contexto, que dá as colunas dos nós.
+    # Até finish(), o ao_concluir do contexto é o da análise; finish() devolve ao contexto o anterior
+    def __init__(self, contexto=None, emite=None):
+        self.contexto = contexto or ContextoCompilacao()
+        self.emitidos = []
+        self.emite = emite or self.emitidos.append
+        self.diagnosticos_emitidos = 0
+        self.ao_concluir_anterior = self.contexto.ao_concluir
+        self.contexto.ao_concluir = self.conclui
+        self.analise = parser.push_parser(lexer=self.contexto.lexer, context=self.contexto)
+
+    def feed(self, token): # Entrega o próximo token; a análise avança até precisar de outro
+        try:
+            self.analise.feed(token)
+        finally:
+            self.emite_diagnosticos()
+
+    def finish(self): # Fim do código: termina a análise e devolve a árvore
+        try:
+            return self.analise.finish()
+        finally:
+            self.contexto.ao_concluir = self.ao_concluir_anterior
+            self.emite_diagnosticos()
+
+    def alimenta_fluxo(self, fonte, tamanho_bloco=automato.TAMANHO_BLOCO):
+        # Lê o código de um arquivo, pipe, mmap ou bytes (ver automato.blocos) e entrega cada token assim
+        # que o lexer o reconhece; como compila_fluxo, requer motor_lexico='afd'. Devolve a árvore
+        lexer = self.contexto.lexer
+        if not hasattr(lexer, 'tokens_stream'):
+            raise ValueError("a leitura em fluxo requer motor_lexico='afd'")
+        for token in lexer.tokens_stream(fonte, tamanho_bloco):
+            self.feed(token)
+        return self.finish()
+
+    def conclui(self, no):
+        self.emite_diagnosticos()
+        self.emite(no)
+
+    def emite_diagnosticos(self): # Emite os diagnósticos registrados desde a última emissão
+        itens = self.contexto.diagnosticos.itens
+        while self.diagnosticos_emitidos < len(itens):
+            self.emite(itens[self.diagnosticos_emitidos])
+            self.diagnosticos_emitidos += 1
+
+def coluna(p, n): # Coluna (a partir de 1) do token n da produção, calculada a partir do lexpos
+    return coluna_lexpos(p, p.lexpos(n))
+
+def coluna_lexpos(p, lexpos): # Distância até a quebra de linha anterior (ou até o início do código)
+    return p.lexer.column(lexpos)
 
 precedence = ( # Define precedência dos operadores para análise correta
     ('left', 'OR'),
@@ -40,40 +136,73 @@ precedence = ( # Define precedência dos operadores para análise correta
     ('right', 'NOT', 'UMINUS'),
 )
 
+passthrough = ( # Produções unitárias cuja ação só repassa o valor (p[0] = p[1])
+    # O yacc tira essas reduções das tabelas e vai direto ao estado certo, sem chamar a função p_*;
+    # cada operando de uma expressão deixa de passar por cinco reduções (fator -> termo -> ... -> expressao)
+    'comando : atribuicao',
+    'comando : comando_condicional',
+    'comando : comando_enquanto',
+    'comando : comando_leitura',
+    'comando : comando_escrita',
+    'comando : comando_composto',
+    'comando : empty',
+    'expressao : expressao_and',
+    'expressao_and : expressao_rel',
+    'expressao_rel : soma',
+    'soma : termo',
+    'termo : fator',
+)
+
 def p_programa(p): # Regra principal do programa, serve para iniciar a análise e finalizar
     """programa : PROGRAM ID PV bloco PF"""
-    instala_programa(p[2], p.lineno(2))
-
-    if erros_semanticos: # Se houver erros semânticos, informa
-        print("\nAnálise sintática concluída, mas com erros semânticos.") # Informa conclusão com erros
-    else: 
-        print("Programa reconhecido com sucesso (sintático e semântico)!") # Informa sucesso
+    p.context.instala_programa(p[2], p.lineno(2))
+    declaracoes, corpo = p[4]
+    p[0] = arvore.Programa(p[2], declaracoes, corpo, p.lineno(1), coluna(p, 1)) # Raiz devolvida por parser.parse
 
 def p_bloco(p): # Regra do bloco principal do programa, serve para agrupar declarações e comandos
     """bloco : declaracoes comando_composto"""
-    p[0] = None
+    p[0] = (p[1], p[2])
 
 def p_declaracoes(p): # Regra para declarações de variáveis
     """declaracoes : VAR declaracao_variaveis
                    | empty"""
-    p[0] = None
+    if len(p) == 3:
+        # Instala os grupos na ordem do código-fonte: a primeira declaração de um nome
+        # vale e as seguintes são informadas como redeclaração, na sua própria linha
+        for declaracao in p[2]:
+            for variavel in declaracao.variaveis: # Instala cada variável declarada
+                p.context.instala_variavel(variavel, declaracao.tipo)
+        p[0] = p[2]
+    else:
+        p[0] = []
 
 def p_declaracao_variaveis(p): # Regra para declaração de variáveis, dessa vez com suporte a múltiplas variáveis
-    """declaracao_variaveis : lista_id DP tipo PV declaracao_variaveis
+    """declaracao_variaveis : declaracao_variaveis lista_id DP tipo PV
                             | lista_id DP tipo PV"""
-    
-    for nome in p[1]: # Instala cada variável declarada
-        instala_variavel(nome, p[3], p.lineno(1))
-    p[0] = None
+    # Recursão à esquerda: a pilha do parser não cresce com o número de declarações
+    # e cada grupo (nó Declaracao) é acrescentado à lista em O(1) amortizado
+    if len(p) == 5: # Primeiro grupo de declarações
+        p[0] = [declaracao(p[1], p[3])]
+    else: # Demais grupos, acrescentados à lista já existente
+        p[1].append(declaracao(p[2], p[4]))
+        p[0] = p[1]
+    p.context.conclui(p[0][-1])
+
+def declaracao(variaveis, tipo): # Nó de um grupo "x, y : tipo", posicionado na primeira variável
+    for variavel in variaveis:
+        variavel.tipo = tipo
+    return arvore.Declaracao(variaveis, tipo, variaveis[0].linha, variaveis[0].coluna)
 
 def p_lista_id(p): # Regra para lista de identificadores (variáveis)
-    """lista_id : ID
-                | ID VIRG lista_id"""
+    """lista_id : lista_id VIRG ID
+                | ID"""
     
+    # Cada ID vira um nó Variavel; o tipo é preenchido pela declaração ou pela leitura
     if len(p) == 2: # Se o len for 2, é apenas um ID
-        p[0] = [p[1]] 
-    else: # Senão, é uma lista
-        p[0] = [p[1]] + p[3]
+        p[0] = [arvore.Variavel(p[1], None, p.lineno(1), coluna(p, 1))]
+    else: # Senão, acrescenta o ID à lista (recursão à esquerda, O(1) amortizado)
+        p[1].append(arvore.Variavel(p[3], None, p.lineno(3), coluna(p, 3)))
+        p[0] = p[1]
 
 def p_tipo(p): # Regra para tipos de variáveis
     """tipo : INTEGER
@@ -82,13 +211,23 @@ def p_tipo(p): # Regra para tipos de variáveis
 
 def p_comando_composto(p): # Regra para comandos compostos (blocos de comandos)
     """comando_composto : BEGIN lista_comandos END"""
-    p[0] = None
+    p[0] = arvore.Bloco(p[2], p.lineno(1), coluna(p, 1))
 
 def p_lista_comandos(p): # Regra para lista de comandos, ou seja, múltiplos comandos separados
-    """lista_comandos : comando
-                      | comando PV lista_comandos
-                      | comando PV"""
-    p[0] = None
+    """lista_comandos : lista_comandos PV comando
+                      | comando"""
+    # Recursão à esquerda: a pilha do parser cresce com o aninhamento dos blocos,
+    # não com o número de comandos. Como comando pode ser vazio, "c1; c2;" continua válido;
+    # comandos vazios (None) não entram na lista
+    if len(p) == 2:
+        p[0] = [] if p[1] is None else [p[1]]
+    else:
+        if p[3] is not None:
+            p[1].append(p[3])
+        p[0] = p[1]
+    # Abaixo da lista na pilha: "declaracoes BEGIN" só no bloco principal, cujos comandos já podem ser emitidos
+    if p[len(p) - 1] is not None and p.stack[-2].type == 'declaracoes':
+        p.context.conclui(p[len(p) - 1])
 
 def p_comando(p): # Regra para comandos individuais
     """comando : atribuicao
@@ -98,52 +237,53 @@ def p_comando(p): # Regra para comandos individuais
                | comando_escrita
                | comando_composto
                | empty"""
-    p[0] = None
+    p[0] = p[1] # Nó do comando, ou None para o comando vazio
 
 
 def p_atribuicao(p): # Regra para atribuição
     """atribuicao : ID DPIGUAL expressao"""
-    tipo_var = busca_variavel(p[1], p.lineno(1)) # Tipo da variável faz busca na tabela de símbolos
-    tipo_expr = p[3] # Tipo da expressão é retornado pela regra de expressão
+    tipo_var = p.context.busca_variavel(p[1], p.lineno(1), coluna(p, 1)) # Tipo da variável faz busca na tabela de símbolos
+    tipo_expr = p[3].tipo # Tipo da expressão é calculado pela regra de expressão
 
     if tipo_var and tipo_expr and tipo_var != tipo_expr: # Verifica compatibilidade de tipos
-        erro_semantico(f"atribuição incompatível: variável '{p[1]}' é {tipo_var}, expressão é {tipo_expr}", p.lineno(1))
-    p[0] = None
+        p.context.erro_semantico('SEM003', p.lineno(1), coluna(p, 1), p[1], tipo_var, tipo_expr)
+    p[0] = arvore.Atribuicao(p[1], p[3], p.lineno(1), coluna(p, 1))
 
 def p_comando_condicional(p): # Regra para comando condicional (if-else)
     """comando_condicional : IF expressao THEN comando
                            | IF expressao THEN comando ELSE comando"""
-    if p[2] != "boolean":
-        erro_semantico("condição do IF deve ser booleana", p.lineno(1))
-    p[0] = None
+    if p[2].tipo != "boolean":
+        p.context.erro_semantico('SEM004', p.lineno(1), coluna(p, 1))
+    senao = p[6] if len(p) == 7 else None
+    p[0] = arvore.Se(p[2], p[4], senao, p.lineno(1), coluna(p, 1))
 
 def p_comando_enquanto(p): # Regra para comando repetição (while)
     """comando_enquanto : WHILE expressao DO comando"""
-    if p[2] != "boolean":
-        erro_semantico("condição do WHILE deve ser booleana", p.lineno(1))
-    p[0] = None
+    if p[2].tipo != "boolean":
+        p.context.erro_semantico('SEM005', p.lineno(1), coluna(p, 1))
+    p[0] = arvore.Enquanto(p[2], p[4], p.lineno(1), coluna(p, 1))
 
 def p_comando_leitura(p): # Regra para comando de leitura (read)
     """comando_leitura : READ EPAR lista_id DPAR"""
-    for nome in p[3]:
-        if busca_variavel(nome, p.lineno(1)) is None:
-            erro_semantico(f"variável '{nome}' não declarada", p.lineno(1))
-    p[0] = None
+    for variavel in p[3]: # Variáveis não declaradas são informadas uma única vez (SEM002 por nome)
+        variavel.tipo = p.context.busca_variavel(variavel.nome, variavel.linha, variavel.coluna)
+    p[0] = arvore.Leitura(p[3], p.lineno(1), coluna(p, 1))
 
 def p_comando_escrita(p): # Regra para comando de escrita (write)
     """comando_escrita : WRITE EPAR lista_expressoes DPAR"""
-    for tipo in p[3]:
-        if tipo not in ("integer", "boolean"):
-            erro_semantico(f"write() recebeu tipo inválido '{tipo}'", p.lineno(1))
-    p[0] = None
+    for expressao in p[3]:
+        if expressao.tipo not in ("integer", "boolean"):
+            p.context.erro_semantico('SEM006', p.lineno(1), coluna(p, 1), expressao.tipo)
+    p[0] = arvore.Escrita(p[3], p.lineno(1), coluna(p, 1))
 
 def p_lista_expressoes(p): # Regra para lista de expressões em comandos de escrita
-    """lista_expressoes : expressao
-                        | expressao VIRG lista_expressoes"""
+    """lista_expressoes : lista_expressoes VIRG expressao
+                        | expressao"""
     if len(p) == 2: # Se len for 2, é apenas uma expressão
         p[0] = [p[1]]
-    else: # Senão, é uma lista
-        p[0] = [p[1]] + p[3]
+    else: # Senão, acrescenta a expressão à lista (recursão à esquerda, O(1) amortizado)
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_expressao_or(p): # Regra para expressão com operador 'or'
     """expressao : expressao OR expressao_and
@@ -151,10 +291,10 @@ def p_expressao_or(p): # Regra para expressão com operador 'or'
     if len(p) == 2: # Se len for 2, é apenas uma expressão_and
         p[0] = p[1]
     else: # Senão, é uma expressão com 'or'
-        left, right = p[1], p[3] # São os operandos, respectivamente à esquerda e direita, que recebem o operador
+        left, right = p[1].tipo, p[3].tipo # Tipos dos operandos, respectivamente à esquerda e direita do operador
         if left != "boolean" or right != "boolean":
-            erro_semantico(f"operador 'or' requer operandos booleanos (obtido {left} e {right})", p.lineno(2))
-        p[0] = "boolean"
+            p.context.erro_semantico('SEM007', p.lineno(2), coluna(p, 2), 'or', left, right)
+        p[0] = arvore.Ou(p[1], p[3], "boolean", p.lineno(2), coluna(p, 2))
 
 def p_expressao_and(p): # Regra para expressão com operador 'and'
     """expressao_and : expressao_and AND expressao_rel
@@ -162,10 +302,10 @@ def p_expressao_and(p): # Regra para expressão com operador 'and'
     if len(p) == 2: # Se len for 2, é apenas uma expressão_rel
         p[0] = p[1]
     else: # Senão, é uma expressão com 'and'
-        left, right = p[1], p[3] # São os operandos, respectivamente à esquerda e direita, que recebem o operador
+        left, right = p[1].tipo, p[3].tipo # Tipos dos operandos, respectivamente à esquerda e direita do operador
         if left != "boolean" or right != "boolean":
-            erro_semantico(f"operador 'and' requer operandos booleanos (obtido {left} e {right})", p.lineno(2))
-        p[0] = "boolean"
+            p.context.erro_semantico('SEM007', p.lineno(2), coluna(p, 2), 'and', left, right)
+        p[0] = arvore.E(p[1], p[3], "boolean", p.lineno(2), coluna(p, 2))
 
 def p_expressao_rel(p): # Regra para expressão com operadores relacionais
     """expressao_rel : soma relacao soma
@@ -173,16 +313,17 @@ def p_expressao_rel(p): # Regra para expressão com operadores relacionais
     if len(p) == 2: # Se len for 2, é apenas uma soma
         p[0] = p[1]
     else: # Senão, é uma expressão relacional
-        left, right = p[1], p[3] # São os operandos, respectivamente à esquerda e direita, que recebem o operador
-        op = p[2]
+        left, right = p[1].tipo, p[3].tipo # Tipos dos operandos, respectivamente à esquerda e direita do operador
+        token = p[2] # Token do operador relacional, que traz o lexema e a posição
+        op = token.value
+        coluna_op = coluna_lexpos(p, token.lexpos)
         if op in ('<', '<=', '>', '>='): # Operadores relacionais que precisam de operandos inteiros
             if left != "integer" or right != "integer":
-                erro_semantico(f"operador '{op}' requer operandos inteiros (obtido {left} e {right})", p.lineno(2))
-            p[0] = "boolean"
+                p.context.erro_semantico('SEM008', token.lineno, coluna_op, op, left, right)
         elif op in ('=', '<>'): # Operadores relacionais que precisam de operandos do mesmo tipo
             if left != right:
-                erro_semantico(f"operador '{op}' requer operandos do mesmo tipo (obtido {left} e {right})", p.lineno(2))
-            p[0] = "boolean"
+                p.context.erro_semantico('SEM009', token.lineno, coluna_op, op, left, right)
+        p[0] = arvore.OPERADORES_BINARIOS[op](p[1], p[3], "boolean", token.lineno, coluna_op)
 
 def p_soma(p): # Regra para expressão de soma e subtração 
     """soma : soma MAIS termo
@@ -191,12 +332,12 @@ def p_soma(p): # Regra para expressão de soma e subtração
     if len(p) == 2: # Se len for 2, é apenas um termo
         p[0] = p[1]
     else: # Senão, é uma expressão de soma ou subtração
-        left, right = p[1], p[3]
+        left, right = p[1].tipo, p[3].tipo
+        tipo = "integer"
         if left != "integer" or right != "integer":
-            erro_semantico(f"operador '{p[2]}' requer operandos inteiros (obtido {left} e {right})", p.lineno(2))
-            p[0] = None
-        else:
-            p[0] = "integer"
+            p.context.erro_semantico('SEM008', p.lineno(2), coluna(p, 2), p[2], left, right)
+            tipo = None
+        p[0] = arvore.OPERADORES_BINARIOS[p[2]](p[1], p[3], tipo, p.lineno(2), coluna(p, 2))
 
 def p_termo(p): # Regra para expressão de multiplicação e divisão
     """termo : termo VEZES fator
@@ -205,10 +346,10 @@ def p_termo(p): # Regra para expressão de multiplicação e divisão
     if len(p) == 2: # Se len for 2, é apenas um fator
         p[0] = p[1]
     else: # Senão, é uma expressão de multiplicação ou divisão
-        left, right = p[1], p[3]
+        left, right = p[1].tipo, p[3].tipo
         if left != "integer" or right != "integer":
-            erro_semantico(f"operador '{p[2]}' requer operandos inteiros (obtido {left} e {right})", p.lineno(2))
-        p[0] = "integer"
+            p.context.erro_semantico('SEM008', p.lineno(2), coluna(p, 2), p[2], left, right)
+        p[0] = arvore.OPERADORES_BINARIOS[p[2]](p[1], p[3], "integer", p.lineno(2), coluna(p, 2))
 
 def p_fator(p): # Regra para fator (número, variável, expressão entre parênteses, negação, ou menos unário)
     """fator : ID
@@ -220,26 +361,24 @@ def p_fator(p): # Regra para fator (número, variável, expressão entre parênt
              | MENOS fator %prec UMINUS"""
     if len(p) == 2: # Se len for 2, é um ID, número ou booleano
         if p.slice[1].type == "NUMERO":
-            p[0] = "integer"
+            p[0] = arvore.Numero(p[1], p.lineno(1), coluna(p, 1))
         elif p.slice[1].type in ("TRUE", "FALSE"):
-            p[0] = "boolean"
+            p[0] = arvore.Booleano(p.slice[1].type == "TRUE", p.lineno(1), coluna(p, 1))
         elif p.slice[1].type == "ID":
-            tipo = busca_variavel(p[1], p.lineno(1))
+            tipo = p.context.busca_variavel(p[1], p.lineno(1), coluna(p, 1))
             if tipo is None:
                 tipo = "integer"
-            p[0] = tipo
-        else:
-            p[0] = "integer"
-    elif len(p) == 4 and p.slice[1].type == "EPAR": # Elif para expressão entre parênteses, retorna o tipo da expressão interna
+            p[0] = arvore.Variavel(p[1], tipo, p.lineno(1), coluna(p, 1))
+    elif len(p) == 4 and p.slice[1].type == "EPAR": # Elif para expressão entre parênteses, devolve o nó da expressão interna
         p[0] = p[2]
     elif p.slice[1].type == "NOT":
-        if p[2] != "boolean":
-            erro_semantico(f"operador 'not' requer expressão booleana (obtido {p[2]})", p.lineno(1))
-        p[0] = "boolean"
+        if p[2].tipo != "boolean":
+            p.context.erro_semantico('SEM010', p.lineno(1), coluna(p, 1), p[2].tipo)
+        p[0] = arvore.Nao(p[2], "boolean", p.lineno(1), coluna(p, 1))
     elif p.slice[1].type == "MENOS":
-        if p[2] != "integer":
-            erro_semantico(f"operador unário '-' requer expressão inteira (obtido {p[2]})", p.lineno(1))
-        p[0] = "integer"
+        if p[2].tipo != "integer":
+            p.context.erro_semantico('SEM011', p.lineno(1), coluna(p, 1), p[2].tipo)
+        p[0] = arvore.MenosUnario(p[2], "integer", p.lineno(1), coluna(p, 1))
 
 def p_relacao(p): # Regra para operadores relacionais, como =, <>, <, <=, >, >=
     """relacao : IGUAL
@@ -248,18 +387,20 @@ def p_relacao(p): # Regra para operadores relacionais, como =, <>, <, <=, >, >=
                | MENORIGUAL
                | MAIORQUE
                | MAIORIGUAL"""
-    # Devolve o lexema do operador (por exemplo '<' ou '<=')
-    p[0] = p[1]
+    # Devolve o próprio token do operador, com o lexema (por exemplo '<' ou '<=') e a posição
+    p[0] = p.slice[1]
 
 def p_empty(p): # Regra para produção vazia
     """empty :"""
     pass
 
-def p_error(p): # Função de tratamento de erros sintáticos
+def p_error(p, contexto): # Função de tratamento de erros sintáticos (recebe também o contexto da compilação)
     if p:
-        print(f"ERRO SINTÁTICO: token inesperado '{p.value}' na linha {p.lineno}")
+        contexto.diagnosticos.registra('SIN001', p.lineno, coluna_lexpos(p, p.lexpos), p.value)
     else:
-        print("ERRO SINTÁTICO: fim de arquivo inesperado.")
+        contexto.diagnosticos.registra('SIN002', contexto.lexer.lineno, None)
 
 #  Construção do parser
-parser = yacc.yacc()
+# As tabelas LALR ficam salvas em parsetab.py junto com a assinatura da gramática;
+# enquanto a assinatura bater, a análise da gramática não é refeita a cada processo
+parser = yacc.yacc(tabmodule='parsetab')
@@ -0,0 +1,579 @@
+# parser_especializado.py
+# This file is automatically generated by yacc.write_parser_module(). Do not edit.
+# pylint: disable=W,C,R
+import sys
+import importlib
+from functools import partial
+
+_tabversion = '2022.10.27-2'
+_lr_signature = 'leftORleftANDnonassocIGUALDIFERENTEMENORQUEMENORIGUALMAIORQUEMAIORIGUALleftMAISMENOSleftVEZESDIVrightNOTUMINUSAND BEGIN BOOLEAN DIFERENTE DIV DO DP DPAR DPIGUAL ELSE END EPAR FALSE ID IF IGUAL INTEGER MAIORIGUAL MAIORQUE MAIS MENORIGUAL MENORQUE MENOS NOT NUMERO OR PF PROGRAM PV READ THEN TRUE VAR VEZES VIRG WHILE WRITEcomando : atribuicao|comando : comando_condicional|comando : comando_enquanto|comando : comando_leitura|comando : comando_escrita|comando : comando_composto|comando : empty|expressao : expressao_and|expressao_and : expressao_rel|expressao_rel : soma|soma : termo|termo : fatorprograma : PROGRAM ID PV bloco PFbloco : declaracoes comando_compostodeclaracoes : VAR declaracao_variaveis\n                   | emptydeclaracao_variaveis : declaracao_variaveis lista_id DP tipo PV\n                            | lista_id DP tipo PVlista_id : lista_id VIRG ID\n                | IDtipo : INTEGER\n            | BOOLEANcomando_composto : BEGIN lista_comandos ENDlista_comandos : lista_comandos PV comando\n                      | comandocomando : atribuicao\n               | comando_condicional\n               | comando_enquanto\n               | comando_leitura\n               | comando_escrita\n               | comando_composto\n               | emptyatribuicao : ID DPIGUAL expressaocomando_condicional : IF expressao THEN comando\n                           | IF expressao THEN comando ELSE comandocomando_enquanto : WHILE expressao DO comandocomando_leitura : READ EPAR lista_id DPARcomando_escrita : WRITE EPAR lista_expressoes DPARlista_expressoes : lista_expressoes VIRG expressao\n                        | expressaoexpressao : expressao OR expressao_and\n                 | expressao_andexpressao_and : expressao_and AND expressao_rel\n                      | expressao_relexpressao_rel : soma relacao soma\n                     | somasoma : soma MAIS termo\n            | soma MENOS termo\n            | termotermo : termo VEZES fator\n             | termo DIV fator\n             | fatorfator : ID\n             | NUMERO\n             | TRUE\n             | FALSE\n             | EPAR expressao DPAR\n             | NOT fator\n             | MENOS fator %prec UMINUSrelacao : IGUAL\n               | DIFERENTE\n               | MENORQUE\n               | MENORIGUAL\n               | MAIORQUE\n               | MAIORIGUALempty :'
+
+_grammar = importlib.import_module('tascal_compiler.parser')
+if getattr(getattr(_grammar, 'parser', None), 'signature', None) != _lr_signature:
+    raise ImportError('parser_especializado is out of date with the grammar in tascal_compiler.parser')
+
+_error_count = 3
+_lr_terminal_ids = {'$end': 0, 'AND': 1, 'BEGIN': 2, 'BOOLEAN': 3, 'DIFERENTE': 4, 'DIV': 5, 'DO': 6, 'DP': 7, 'DPAR': 8, 'DPIGUAL': 9, 'ELSE': 10, 'END': 11, 'EPAR': 12, 'FALSE': 13, 'ID': 14, 'IF': 15, 'IGUAL': 16, 'INTEGER': 17, 'MAIORIGUAL': 18, 'MAIORQUE': 19, 'MAIS': 20, 'MENORIGUAL': 21, 'MENORQUE': 22, 'MENOS': 23, 'NOT': 24, 'NUMERO': 25, 'OR': 26, 'PF': 27, 'PROGRAM': 28, 'PV': 29, 'READ': 30, 'THEN': 31, 'TRUE': 32, 'VAR': 33, 'VEZES': 34, 'VIRG': 35, 'WHILE': 36, 'WRITE': 37, 'error': 38}
+_lr_unknown_terminal = 39
+_lr_action = [
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None],
+  [0, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 4, None, None, None, None, None, None, None, None, None, None],
+  [None, None, -54, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 7, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 9, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, 11, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, 14, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, -4, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [-1, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -2, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, 11, None, None, None, None, None, None, None, None, -54, None, None, 17, 18, None, None, None, None, None, None, None, None, None, None, None, None, None, -54, 20, None, None, None, None, None, 19, 21, None, None],
+  [None, None, -3, None, None, None, None, None, None, None, None, None, None, None, 14, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, 23, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 24, None, None, None, None],
+  [None, None, None, None, None, None, None, -8, -8, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -8, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, 25, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 26, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, -13, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -13, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, 27, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 37, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 38, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, 39, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 24, None, None, None, None],
+  [None, None, None, 42, None, None, None, None, None, None, None, None, None, None, None, None, None, 41, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, 43, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, -11, -11, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -11, None, -11, None, None, None, None, None, None, None, None, None, None],
+  [None, None, 11, None, None, None, None, None, None, None, None, -54, None, None, 17, 18, None, None, None, None, None, None, None, None, None, None, None, None, None, -54, 20, None, None, None, None, None, 19, 21, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, 46, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, -41, None, None, -41, -41, -41, None, -41, None, -41, -41, None, None, None, None, -41, None, -41, -41, -41, -41, -41, -41, None, None, -41, None, None, -41, None, -41, None, None, -41, -41, None, None, None, None],
+  [None, -42, None, None, -42, -42, -42, None, -42, None, -42, -42, None, None, None, None, -42, None, -42, -42, -42, -42, -42, -42, None, None, -42, None, None, -42, None, -42, None, None, -42, -42, None, None, None, None],
+  [None, -43, None, None, -43, -43, -43, None, -43, None, -43, -43, None, None, None, None, -43, None, -43, -43, -43, -43, -43, -43, None, None, -43, None, None, -43, None, -43, None, None, -43, -43, None, None, None, None],
+  [None, -44, None, None, -44, -44, -44, None, -44, None, -44, -44, None, None, None, None, -44, None, -44, -44, -44, -44, -44, -44, None, None, -44, None, None, -44, None, -44, None, None, -44, -44, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, 63, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, 14, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, 42, None, None, None, None, None, None, None, None, None, None, None, None, None, 41, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 68, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -9, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -10, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, -7, -7, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -7, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, -12, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -12, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, -21, -21, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, -21, None, None, None, None, None, None, None, None, None, None],
+  [None, None, 11, None, None, None, None, None, None, None, -54, -54, None, None, 17, 18, None, None, None, None, None, None, None, None, None, None, None, None, None, -54, 20, None, None, None, None, None, 19, 21, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, -48, -48, -48, None, None, None, None, None, None, None, None, -48, -48, -48, None, None, None, None, None, None, -48, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, -49, -49, -49, None, None, None, None, None, None, None, None, -49, -49, -49, None, None, None, None, None, None, -49, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, -50, -50, -50, None, None, None, None, None, None, None, None, -50, -50, -50, None, None, None, None, None, None, -50, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, -51, -51, -51, None, None, None, None, None, None, None, None, -51, -51, -51, None, None, None, None, None, None, -51, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, -52, -52, -52, None, None, None, None, None, None, None, None, -52, -52, -52, None, None, None, None, None, None, -52, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, -53, -53, -53, None, None, None, None, None, None, None, None, -53, -53, -53, None, None, None, None, None, None, -53, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, -47, None, None, -47, -47, -47, None, -47, None, -47, -47, None, None, None, None, -47, None, -47, -47, -47, -47, -47, -47, None, None, -47, None, None, -47, None, -47, None, None, -47, -47, None, None, None, None],
+  [None, None, None, None, None, None, None, None, 77, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, -46, None, None, -46, -46, -46, None, -46, None, -46, -46, None, None, None, None, -46, None, -46, -46, -46, -46, -46, -46, None, None, -46, None, None, -46, None, -46, None, None, -46, -46, None, None, None, None],
+  [None, None, 11, None, None, None, None, None, None, None, -54, -54, None, None, 17, 18, None, None, None, None, None, None, None, None, None, None, None, None, None, -54, 20, None, None, None, None, None, 19, 21, None, None],
+  [None, None, None, None, None, None, None, None, 79, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 24, None, None, None, None],
+  [None, None, None, None, None, None, None, None, 80, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 81, None, None, None, None],
+  [None, None, None, None, None, None, None, None, -28, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, None, None, None, None, -28, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 82, None, None, None, None, None, None, None, None, None, None],
+  [None, None, -6, None, None, None, None, None, None, None, None, None, None, None, -6, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, 83, -22, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -22, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, None, None, -29, None, -29, None, -29, -29, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -29, None, None, -29, None, -29, None, None, None, -29, None, None, None, None],
+  [None, -31, None, None, None, None, -31, None, -31, None, -31, -31, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -31, None, None, -31, None, -31, None, None, None, -31, None, None, None, None],
+  [None, -33, None, None, None, None, -33, None, -33, None, -33, -33, None, None, None, None, None, None, None, None, 50, None, None, 51, None, None, -33, None, None, -33, None, -33, None, None, None, -33, None, None, None, None],
+  [None, -35, None, None, -35, 59, -35, None, -35, None, -35, -35, None, None, None, None, -35, None, -35, -35, -35, -35, -35, -35, None, None, -35, None, None, -35, None, -35, None, None, 58, -35, None, None, None, None],
+  [None, -36, None, None, -36, 59, -36, None, -36, None, -36, -36, None, None, None, None, -36, None, -36, -36, -36, -36, -36, -36, None, None, -36, None, None, -36, None, -36, None, None, 58, -36, None, None, None, None],
+  [None, -38, None, None, -38, -38, -38, None, -38, None, -38, -38, None, None, None, None, -38, None, -38, -38, -38, -38, -38, -38, None, None, -38, None, None, -38, None, -38, None, None, -38, -38, None, None, None, None],
+  [None, -39, None, None, -39, -39, -39, None, -39, None, -39, -39, None, None, None, None, -39, None, -39, -39, -39, -39, -39, -39, None, None, -39, None, None, -39, None, -39, None, None, -39, -39, None, None, None, None],
+  [None, -45, None, None, -45, -45, -45, None, -45, None, -45, -45, None, None, None, None, -45, None, -45, -45, -45, -45, -45, -45, None, None, -45, None, None, -45, None, -45, None, None, -45, -45, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, -24, -24, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -24, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, -25, -25, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -25, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, -26, -26, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -26, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 34, 33, 30, None, None, None, None, None, None, None, None, 29, 35, 31, None, None, None, None, None, None, 32, None, None, None, None, None, None, None],
+  [None, None, -5, None, None, None, None, None, None, None, None, None, None, None, -5, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, 11, None, None, None, None, None, None, None, -54, -54, None, None, 17, 18, None, None, None, None, None, None, None, None, None, None, None, None, None, -54, 20, None, None, None, None, None, 19, 21, None, None],
+  [None, None, None, None, None, None, None, None, -27, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, None, None, None, None, -27, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, -23, -23, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -23, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, -13, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -13, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, 46, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, 53, None, None, None, None, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, 46, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, 53, 59, None, None, None, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, 46, None, None, 58, None, None, None, None, None],
+  [None, 48, None, None, None, None, 63, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, 53, None, 63, None, None, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, 53, 59, 63, None, None, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, None, None, None, 58, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, -12, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -12, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, None, None, None, None, None, None, -21, -21, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, -21, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, 53, None, None, None, None, None, -21, -21, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, -21, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, 53, 59, None, None, None, None, -21, -21, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, -21, None, None, None, None, 58, None, None, None, None, None],
+  [None, 48, None, None, None, None, None, None, 77, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, 53, None, None, None, 77, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, 53, 59, None, None, 77, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, None, None, None, 58, None, None, None, None, None],
+  [None, 48, None, None, None, None, None, None, -28, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, None, None, None, None, -28, None, None, None, None],
+  [None, 48, None, None, 53, None, None, None, -28, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, None, None, None, None, -28, None, None, None, None],
+  [None, 48, None, None, 53, 59, None, None, -28, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, None, None, None, 58, -28, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, 83, -22, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -22, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, None, None, -29, None, -29, None, -29, -29, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -29, None, None, -29, None, -29, None, None, None, -29, None, None, None, None],
+  [None, 48, None, None, 53, None, -29, None, -29, None, -29, -29, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, -29, None, None, -29, None, -29, None, None, None, -29, None, None, None, None],
+  [None, 48, None, None, 53, 59, -29, None, -29, None, -29, -29, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, -29, None, None, -29, None, -29, None, None, 58, -29, None, None, None, None],
+  [None, -31, None, None, 53, None, -31, None, -31, None, -31, -31, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, -31, None, None, -31, None, -31, None, None, None, -31, None, None, None, None],
+  [None, -31, None, None, 53, 59, -31, None, -31, None, -31, -31, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, -31, None, None, -31, None, -31, None, None, 58, -31, None, None, None, None],
+  [None, -33, None, None, None, 59, -33, None, -33, None, -33, -33, None, None, None, None, None, None, None, None, 50, None, None, 51, None, None, -33, None, None, -33, None, -33, None, None, 58, -33, None, None, None, None],
+  [None, -35, None, None, -35, 59, -35, None, -35, None, -35, -35, None, None, None, None, -35, None, -35, -35, -35, -35, -35, -35, None, None, -35, None, None, -35, None, -35, None, None, 58, -35, None, None, None, None],
+  [None, -36, None, None, -36, 59, -36, None, -36, None, -36, -36, None, None, None, None, -36, None, -36, -36, -36, -36, -36, -36, None, None, -36, None, None, -36, None, -36, None, None, 58, -36, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, -24, -24, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -24, None, None, None, None, None, None, None, None, None, None],
+  [None, 48, None, None, None, None, None, None, -27, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 47, None, None, None, None, None, None, None, None, -27, None, None, None, None],
+  [None, 48, None, None, 53, None, None, None, -27, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, None, None, None, None, -27, None, None, None, None],
+  [None, 48, None, None, 53, 59, None, None, -27, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, None, None, None, None, None, 58, -27, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, -23, -23, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -23, None, None, None, None, None, None, None, None, None, None],
+]
+_lr_goto = [
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, 5, None, None, None, None, None, None, None, 6, 8, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, 10, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, 12, None, None, None, None, None, None, None, None, 13, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, 86, None, 16, 86, 86, 86, 86, 86, None, None, 86, None, None, None, None, 15, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 22, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 28, 87, 87, 89, None, None, None, None, None, 88, 89, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 36, 90, 90, 92, None, None, None, None, None, 91, 92, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 40],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, 93, None, 44, 93, 93, 93, 93, 93, None, None, 93, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 45, 94, 94, 96, None, None, None, None, None, 95, 96, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 60, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 61, 97, 97, 99, None, None, None, None, None, 98, 99, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 62, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 64, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 66, 100, 100, 102, None, 65, None, None, None, 101, 102, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 67],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, 103, None, 69, 103, 103, 103, 103, 103, None, None, 103, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, 70, 104, 106, None, None, None, None, None, 105, 106, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, 71, 108, None, None, None, None, None, 107, 108, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 109, None, None, None, None, None, 72, 109, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 110, None, None, None, None, None, None, 73, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 111, None, None, None, None, None, None, 74, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 75, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 76, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, 112, None, 78, 112, 112, 112, 112, 112, None, None, 112, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, 84, 113, 113, 115, None, None, None, None, None, 114, 115, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, 116, None, 85, 116, 116, 116, 116, 116, None, None, 116, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, 49, None, None, None],
+  [None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None],
+]
+_lr_defaulted = [None, None, None, None, None, None, None, None, -4, -1, -2, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -9, -10, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None]
+_lr_prod_names = ["S'", 'programa', 'bloco', 'declaracoes', 'declaracoes', 'declaracao_variaveis', 'declaracao_variaveis', 'lista_id', 'lista_id', 'tipo', 'tipo', 'comando_composto', 'lista_comandos', 'lista_comandos', 'comando', 'comando', 'comando', 'comando', 'comando', 'comando', 'comando', 'atribuicao', 'comando_condicional', 'comando_condicional', 'comando_enquanto', 'comando_leitura', 'comando_escrita', 'lista_expressoes', 'lista_expressoes', 'expressao', 'expressao', 'expressao_and', 'expressao_and', 'expressao_rel', 'expressao_rel', 'soma', 'soma', 'soma', 'termo', 'termo', 'termo', 'fator', 'fator', 'fator', 'fator', 'fator', 'fator', 'fator', 'relacao', 'relacao', 'relacao', 'relacao', 'relacao', 'relacao', 'empty']
+_lr_prod_lens = [1, 5, 2, 2, 1, 5, 4, 3, 1, 1, 1, 3, 3, 1, 1, 1, 1, 1, 1, 1, 1, 3, 4, 6, 4, 4, 4, 3, 1, 3, 1, 3, 1, 3, 1, 3, 3, 1, 3, 3, 1, 1, 1, 1, 1, 3, 2, 2, 1, 1, 1, 1, 1, 1, 0]
+_lr_prod_nonterminals = [0, 19, 2, 10, 10, 9, 9, 18, 18, 23, 23, 4, 16, 16, 3, 3, 3, 3, 3, 3, 3, 1, 5, 5, 6, 8, 7, 17, 17, 12, 12, 13, 13, 14, 14, 21, 21, 21, 22, 22, 22, 15, 15, 15, 15, 15, 15, 15, 20, 20, 20, 20, 20, 20, 11]
+_lr_prod_funcs = [
+  None,   # S' -> programa
+  _grammar.p_programa,   # programa -> PROGRAM ID PV bloco PF
+  _grammar.p_bloco,   # bloco -> declaracoes comando_composto
+  _grammar.p_declaracoes,   # declaracoes -> VAR declaracao_variaveis
+  _grammar.p_declaracoes,   # declaracoes -> empty
+  _grammar.p_declaracao_variaveis,   # declaracao_variaveis -> declaracao_variaveis lista_id DP tipo PV
+  _grammar.p_declaracao_variaveis,   # declaracao_variaveis -> lista_id DP tipo PV
+  _grammar.p_lista_id,   # lista_id -> lista_id VIRG ID
+  _grammar.p_lista_id,   # lista_id -> ID
+  _grammar.p_tipo,   # tipo -> INTEGER
+  _grammar.p_tipo,   # tipo -> BOOLEAN
+  _grammar.p_comando_composto,   # comando_composto -> BEGIN lista_comandos END
+  _grammar.p_lista_comandos,   # lista_comandos -> lista_comandos PV comando
+  _grammar.p_lista_comandos,   # lista_comandos -> comando
+  _grammar.p_comando,   # comando -> atribuicao
+  _grammar.p_comando,   # comando -> comando_condicional
+  _grammar.p_comando,   # comando -> comando_enquanto
+  _grammar.p_comando,   # comando -> comando_leitura
+  _grammar.p_comando,   # comando -> comando_escrita
+  _grammar.p_comando,   # comando -> comando_composto
+  _grammar.p_comando,   # comando -> empty
+  _grammar.p_atribuicao,   # atribuicao -> ID DPIGUAL expressao
+  _grammar.p_comando_condicional,   # comando_condicional -> IF expressao THEN comando
+  _grammar.p_comando_condicional,   # comando_condicional -> IF expressao THEN comando ELSE comando
+  _grammar.p_comando_enquanto,   # comando_enquanto -> WHILE expressao DO comando
+  _grammar.p_comando_leitura,   # comando_leitura -> READ EPAR lista_id DPAR
+  _grammar.p_comando_escrita,   # comando_escrita -> WRITE EPAR lista_expressoes DPAR
+  _grammar.p_lista_expressoes,   # lista_expressoes -> lista_expressoes VIRG expressao
+  _grammar.p_lista_expressoes,   # lista_expressoes -> expressao
+  _grammar.p_expressao_or,   # expressao -> expressao OR expressao_and
+  _grammar.p_expressao_or,   # expressao -> expressao_and
+  _grammar.p_expressao_and,   # expressao_and -> expressao_and AND expressao_rel
+  _grammar.p_expressao_and,   # expressao_and -> expressao_rel
+  _grammar.p_expressao_rel,   # expressao_rel -> soma relacao soma
+  _grammar.p_expressao_rel,   # expressao_rel -> soma
+  _grammar.p_soma,   # soma -> soma MAIS termo
+  _grammar.p_soma,   # soma -> soma MENOS termo
+  _grammar.p_soma,   # soma -> termo
+  _grammar.p_termo,   # termo -> termo VEZES fator
+  _grammar.p_termo,   # termo -> termo DIV fator
+  _grammar.p_termo,   # termo -> fator
+  _grammar.p_fator,   # fator -> ID
+  _grammar.p_fator,   # fator -> NUMERO
+  _grammar.p_fator,   # fator -> TRUE
+  _grammar.p_fator,   # fator -> FALSE
+  _grammar.p_fator,   # fator -> EPAR expressao DPAR
+  _grammar.p_fator,   # fator -> NOT fator
+  _grammar.p_fator,   # fator -> MENOS fator
+  _grammar.p_relacao,   # relacao -> IGUAL
+  _grammar.p_relacao,   # relacao -> DIFERENTE
+  _grammar.p_relacao,   # relacao -> MENORQUE
+  _grammar.p_relacao,   # relacao -> MENORIGUAL
+  _grammar.p_relacao,   # relacao -> MAIORQUE
+  _grammar.p_relacao,   # relacao -> MAIORIGUAL
+  _grammar.p_empty,   # empty -> <empty>
+]
+_errorfunc = _grammar.p_error
+_errorcontext = True
+
+class YaccSymbol:
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlineno', 'endlexpos', 'lexer')
+
+    def __str__(self):
+        return self.type
+
+    def __repr__(self):
+        return str(self)
+
+class YaccProduction:
+    __slots__ = ('slice', 'stack', 'lexer', 'parser', 'context')
+
+    def __getitem__(self, n):
+        if type(n) is int:
+            if n >= 0:
+                return self.slice[n].value
+            return self.stack[n].value
+        return [s.value for s in self.slice[n]]
+
+    def __setitem__(self, n, v):
+        self.slice[n].value = v
+
+    def __len__(self):
+        return len(self.slice)
+
+    def lineno(self, n):
+        return getattr(self.slice[n], 'lineno', 0)
+
+    def set_lineno(self, n, lineno):
+        self.slice[n].lineno = lineno
+
+    def linespan(self, n):
+        startline = getattr(self.slice[n], 'lineno', 0)
+        endline = getattr(self.slice[n], 'endlineno', startline)
+        return startline, endline
+
+    def lexpos(self, n):
+        return getattr(self.slice[n], 'lexpos', 0)
+
+    def set_lexpos(self, n, lexpos):
+        self.slice[n].lexpos = lexpos
+
+    def lexspan(self, n):
+        startpos = getattr(self.slice[n], 'lexpos', 0)
+        endpos = getattr(self.slice[n], 'endlexpos', startpos)
+        return startpos, endpos
+
+    def error(self):
+        raise SyntaxError
+
+def parse(input=None, lexer=None, context=None, tokens=None):
+    actions  = _lr_action
+    goto     = _lr_goto
+    defaulted_states = _lr_defaulted
+    termid   = _lr_terminal_ids.get
+    nterms   = _lr_unknown_terminal
+    pnames   = _lr_prod_names
+    plens    = _lr_prod_lens
+    pgoto    = _lr_prod_nonterminals
+    pfuncs   = _lr_prod_funcs
+
+    lookahead = None
+    ltid = 0
+    lookaheadstack = []
+    errorcount = 0
+    errorok = True
+
+    if not lexer and tokens is None:
+        raise ValueError('a lexer is required')
+    pslice = YaccProduction()
+    pslice.lexer = lexer
+    pslice.parser = None
+    pslice.context = context
+
+    if input is not None:
+        if tokens is not None:
+            raise ValueError('input and tokens cannot both be given')
+        lexer.input(input)
+    if tokens is None:
+        get_token = lexer.token
+    elif not hasattr(tokens, 'typenames'):
+        # Any iterable of tokens, pulled one by one as from lexer.token()
+        get_token = partial(next, iter(tokens), None)
+        tokens = None
+    else:
+        # Columnar tokens from lexer.tokenize_all(): the terminal id of each token
+        # type is looked up once and tokens are read straight from the arrays
+        tnames = tokens.typenames
+        tids = [termid(name, nterms) for name in tnames]
+        ttypes = tokens.types
+        tvalues = tokens.values
+        tvaluetable = tokens.valuetable
+        tlineno = tokens.lineno
+        tlexpos = tokens.lexpos
+        ntokens = len(ttypes)
+        position = 0
+
+    statestack = [0]
+    sym = YaccSymbol()
+    sym.type = '$end'
+    symstack = [sym]
+    pslice.stack = symstack
+    errtoken = None
+    state = 0
+    while True:
+        t = defaulted_states[state]
+        if t is None:
+            if lookahead is None:
+                if lookaheadstack:
+                    lookahead = lookaheadstack.pop()
+                    ltid = termid(lookahead.type, nterms)
+                elif tokens is None:
+                    lookahead = get_token()
+                    if not lookahead:
+                        lookahead = YaccSymbol()
+                        lookahead.type = '$end'
+                    ltid = termid(lookahead.type, nterms)
+                elif position < ntokens:
+                    code = ttypes[position]
+                    lookahead = YaccSymbol()
+                    lookahead.type = tnames[code]
+                    lookahead.value = tvaluetable[tvalues[position]]
+                    lookahead.lineno = tlineno[position]
+                    lookahead.lexpos = tlexpos[position]
+                    ltid = tids[code]
+                    position += 1
+                else:
+                    if tokens.error is not None: # The lexer stopped here
+                        raise tokens.error
+                    lookahead = YaccSymbol()
+                    lookahead.type = '$end'
+                    ltid = 0
+            t = actions[state][ltid]
+
+        if t is not None:
+            if t > 0:
+                statestack.append(t)
+                state = t
+                symstack.append(lookahead)
+                lookahead = None
+                if errorcount:
+                    errorcount -= 1
+                continue
+
+            if t < 0:
+                pn = -t
+                plen = plens[pn]
+                sym = YaccSymbol()
+                sym.type = pnames[pn]
+                sym.value = None
+
+                if plen:
+                    targ = symstack[-plen-1:]
+                    targ[0] = sym
+                    pslice.slice = targ
+                    try:
+                        del symstack[-plen:]
+                        pfuncs[pn](pslice)
+                        del statestack[-plen:]
+                        symstack.append(sym)
+                        state = goto[statestack[-1]][pgoto[pn]]
+                        statestack.append(state)
+                    except SyntaxError:
+                        lookaheadstack.append(lookahead)
+                        symstack.extend(targ[1:-1])
+                        statestack.pop()
+                        state = statestack[-1]
+                        sym.type = 'error'
+                        sym.value = 'error'
+                        lookahead = sym
+                        ltid = termid('error', nterms)
+                        errorcount = _error_count
+                        errorok = False
+                    continue
+                else:
+                    targ = [sym]
+                    pslice.slice = targ
+                    try:
+                        pfuncs[pn](pslice)
+                        symstack.append(sym)
+                        state = goto[statestack[-1]][pgoto[pn]]
+                        statestack.append(state)
+                    except SyntaxError:
+                        lookaheadstack.append(lookahead)
+                        statestack.pop()
+                        state = statestack[-1]
+                        sym.type = 'error'
+                        sym.value = 'error'
+                        lookahead = sym
+                        ltid = termid('error', nterms)
+                        errorcount = _error_count
+                        errorok = False
+                    continue
+
+            if t == 0:
+                n = symstack[-1]
+                return getattr(n, 'value', None)
+
+        if t is None:
+            if errorcount == 0 or errorok:
+                errorcount = _error_count
+                errorok = False
+                errtoken = lookahead
+                if errtoken.type == '$end':
+                    errtoken = None
+                if _errorfunc:
+                    if errtoken and not hasattr(errtoken, 'lexer'):
+                        errtoken.lexer = lexer
+                    if _errorcontext:
+                        _errorfunc(errtoken, context)
+                    else:
+                        _errorfunc(errtoken)
+                else:
+                    if errtoken:
+                        if hasattr(errtoken, 'lineno'):
+                            lineno = lookahead.lineno
+                        else:
+                            lineno = 0
+                        if lineno:
+                            sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                        else:
+                            sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                    else:
+                        sys.stderr.write('yacc: Parse error in input. EOF\n')
+                        return
+            else:
+                errorcount = _error_count
+
+            if len(statestack) <= 1 and lookahead.type != '$end':
+                lookahead = None
+                errtoken = None
+                state = 0
+                del lookaheadstack[:]
+                continue
+
+            if lookahead.type == '$end':
+                return
+
+            if lookahead.type != 'error':
+                sym = symstack[-1]
+                if sym.type == 'error':
+                    lookahead = None
+                    continue
+
+                t = YaccSymbol()
+                t.type = 'error'
+                if hasattr(lookahead, 'lineno'):
+                    t.lineno = t.endlineno = lookahead.lineno
+                if hasattr(lookahead, 'lexpos'):
+                    t.lexpos = t.endlexpos = lookahead.lexpos
+                t.value = lookahead
+                lookaheadstack.append(lookahead)
+                lookahead = t
+                ltid = termid('error', nterms)
+            else:
+                symstack.pop()
+                statestack.pop()
+                state = statestack[-1]
+
+            continue
@@ -2,84 +2,74 @@
 # parsetab.py
 # This file is automatically generated. Do not edit.
 # pylint: disable=W,C,R
-_tabversion = '3.10'
+_tabversion = '2022.10.27-2'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftORleftANDnonassocIGUALDIFERENTEMENORQUEMENORIGUALMAIORQUEMAIORIGUALleftMAISMENOSleftVEZESDIVrightNOTUMINUSAND BEGIN BOOLEAN DIFERENTE DIV DO DP DPAR DPIGUAL ELSE END EPAR FALSE ID IF IGUAL INTEGER MAIORIGUAL MAIORQUE MAIS MENORIGUAL MENORQUE MENOS NOT NUMERO OR PF PROGRAM PV READ THEN TRUE VAR VEZES VIRG WHILE WRITEprograma : PROGRAM ID PV bloco PFbloco : declaracoes comando_compostodeclaracoes : VAR declaracao_variaveis\n| emptydeclaracao_variaveis : lista_id DP tipo PV declaracao_variaveis\n| lista_id DP tipo PVlista_id : ID\n| ID VIRG lista_idtipo : INTEGER\n| BOOLEANcomando_composto : BEGIN lista_comandos ENDlista_comandos : comando\n| comando PV lista_comandos\n| comando PVcomando : atribuicao\n| comando_condicional\n| comando_enquanto\n| comando_leitura\n| comando_escrita\n| comando_composto\n| emptyatribuicao : ID DPIGUAL expressaocomando_condicional : IF expressao THEN comando\n| IF expressao THEN comando ELSE comandocomando_enquanto : WHILE expressao DO comandocomando_leitura : READ EPAR lista_id DPARcomando_escrita : WRITE EPAR lista_expressoes DPARlista_expressoes : expressao\n| expressao VIRG lista_expressoesexpressao : expressao OR expressao_and\n| expressao_andexpressao_and : expressao_and AND expressao_rel\n| expressao_relexpressao_rel : soma relacao soma\n| somasoma : soma MAIS termo\n| soma MENOS termo\n| termotermo : termo VEZES fator\n| termo DIV fator\n| fatorfator : ID\n| NUMERO\n| TRUE\n| FALSE\n| EPAR expressao DPAR\n| NOT fator\n| MENOS fator %prec UMINUSrelacao : IGUAL\n| DIFERENTE\n| MENORQUE\n| MENORIGUAL\n| MAIORQUE\n| MAIORIGUALempty :'
-    
-_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,9,],[0,-1,]),'ID':([2,7,11,25,26,30,32,33,39,45,46,48,49,56,57,58,59,60,61,62,63,64,65,66,67,68,69,73,77,90,92,],[3,14,24,41,41,14,24,41,41,41,41,14,41,24,41,41,41,41,41,-49,-50,-51,-52,-53,-54,41,41,24,14,41,24,]),'PV':([3,11,16,17,18,19,20,21,22,23,31,32,35,36,37,38,40,41,42,43,44,50,51,52,55,56,70,72,73,78,79,80,81,82,83,84,85,86,87,88,89,92,94,],[4,-55,32,-15,-16,-17,-18,-19,-20,-21,-11,-55,-31,-33,-35,-38,-41,-42,-43,-44,-45,77,-9,-10,-22,-55,-48,-47,-55,-23,-30,-32,-34,-36,-37,-39,-40,-46,-25,-26,-27,-55,-24,]),'VAR':([4,],[7,]),'BEGIN':([4,6,8,11,12,32,56,73,77,91,92,],[-55,11,-4,11,-3,11,11,11,-6,-5,11,]),'PF':([5,10,31,],[9,-2,-11,]),'IF':([11,32,56,73,92,],[25,25,25,25,25,]),'WHILE':([11,32,56,73,92,],[26,26,26,26,26,]),'READ':([11,32,56,73,92,],[27,27,27,27,27,]),'WRITE':([11,32,56,73,92,],[28,28,28,28,28,]),'END':([11,15,16,17,18,19,20,21,22,23,31,32,35,36,37,38,40,41,42,43,44,54,55,56,70,72,73,78,79,80,81,82,83,84,85,86,87,88,89,92,94,],[-55,31,-12,-15,-16,-17,-18,-19,-20,-21,-11,-14,-31,-33,-35,-38,-41,-42,-43,-44,-45,-13,-22,-55,-48,-47,-55,-23,-30,-32,-34,-36,-37,-39,-40,-46,-25,-26,-27,-55,-24,]),'DP':([13,14,53,],[29,-7,-8,]),'DPAR':([14,35,36,37,38,40,41,42,43,44,53,70,71,72,74,75,76,79,80,81,82,83,84,85,86,93,],[-7,-31,-33,-35,-38,-41,-42,-43,-44,-45,-8,-48,86,-47,88,89,-28,-30,-32,-34,-36,-37,-39,-40,-46,-29,]),'VIRG':([14,35,36,37,38,40,41,42,43,44,70,72,76,79,80,81,82,83,84,85,86,],[30,-31,-33,-35,-38,-41,-42,-43,-44,-45,-48,-47,90,-30,-32,-34,-36,-37,-39,-40,-46,]),'ELSE':([17,18,19,20,21,22,23,31,35,36,37,38,40,41,42,43,44,55,56,70,72,73,78,79,80,81,82,83,84,85,86,87,88,89,92,94,],[-15,-16,-17,-18,-19,-20,-21,-11,-31,-33,-35,-38,-41,-42,-43,-44,-45,-22,-55,-48,-47,-55,92,-30,-32,-34,-36,-37,-39,-40,-46,-25,-26,-27,-55,-24,]),'DPIGUAL':([24,],[33,]),'NUMERO':([25,26,33,39,45,46,49,57,58,59,60,61,62,63,64,65,66,67,68,69,90,],[42,42,42,42,42,42,42,42,42,42,42,42,-49,-50,-51,-52,-53,-54,42,42,42,]),'TRUE':([25,26,33,39,45,46,49,57,58,59,60,61,62,63,64,65,66,67,68,69,90,],[43,43,43,43,43,43,43,43,43,43,43,43,-49,-50,-51,-52,-53,-54,43,43,43,]),'FALSE':([25,26,33,39,45,46,49,57,58,59,60,61,62,63,64,65,66,67,68,69,90,],[44,44,44,44,44,44,44,44,44,44,44,44,-49,-50,-51,-52,-53,-54,44,44,44,]),'EPAR':([25,26,27,28,33,39,45,46,49,57,58,59,60,61,62,63,64,65,66,67,68,69,90,],[45,45,48,49,45,45,45,45,45,45,45,45,45,45,-49,-50,-51,-52,-53,-54,45,45,45,]),'NOT':([25,26,33,39,45,46,49,57,58,59,60,61,62,63,64,65,66,67,68,69,90,],[46,46,46,46,46,46,46,46,46,46,46,46,-49,-50,-51,-52,-53,-54,46,46,46,]),'MENOS':([25,26,33,37,38,39,40,41,42,43,44,45,46,49,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,81,82,83,84,85,86,90,],[39,39,39,61,-38,39,-41,-42,-43,-44,-45,39,39,39,39,39,39,39,39,-49,-50,-51,-52,-53,-54,39,39,-48,-47,61,-36,-37,-39,-40,-46,39,]),'INTEGER':([29,],[51,]),'BOOLEAN':([29,],[52,]),'THEN':([34,35,36,37,38,40,41,42,43,44,70,72,79,80,81,82,83,84,85,86,],[56,-31,-33,-35,-38,-41,-42,-43,-44,-45,-48,-47,-30,-32,-34,-36,-37,-39,-40,-46,]),'OR':([34,35,36,37,38,40,41,42,43,44,47,55,70,71,72,76,79,80,81,82,83,84,85,86,],[57,-31,-33,-35,-38,-41,-42,-43,-44,-45,57,57,-48,57,-47,57,-30,-32,-34,-36,-37,-39,-40,-46,]),'DO':([35,36,37,38,40,41,42,43,44,47,70,72,79,80,81,82,83,84,85,86,],[-31,-33,-35,-38,-41,-42,-43,-44,-45,73,-48,-47,-30,-32,-34,-36,-37,-39,-40,-46,]),'AND':([35,36,37,38,40,41,42,43,44,70,72,79,80,81,82,83,84,85,86,],[58,-33,-35,-38,-41,-42,-43,-44,-45,-48,-47,58,-32,-34,-36,-37,-39,-40,-46,]),'MAIS':([37,38,40,41,42,43,44,70,72,81,82,83,84,85,86,],[60,-38,-41,-42,-43,-44,-45,-48,-47,60,-36,-37,-39,-40,-46,]),'IGUAL':([37,38,40,41,42,43,44,70,72,82,83,84,85,86,],[62,-38,-41,-42,-43,-44,-45,-48,-47,-36,-37,-39,-40,-46,]),'DIFERENTE':([37,38,40,41,42,43,44,70,72,82,83,84,85,86,],[63,-38,-41,-42,-43,-44,-45,-48,-47,-36,-37,-39,-40,-46,]),'MENORQUE':([37,38,40,41,42,43,44,70,72,82,83,84,85,86,],[64,-38,-41,-42,-43,-44,-45,-48,-47,-36,-37,-39,-40,-46,]),'MENORIGUAL':([37,38,40,41,42,43,44,70,72,82,83,84,85,86,],[65,-38,-41,-42,-43,-44,-45,-48,-47,-36,-37,-39,-40,-46,]),'MAIORQUE':([37,38,40,41,42,43,44,70,72,82,83,84,85,86,],[66,-38,-41,-42,-43,-44,-45,-48,-47,-36,-37,-39,-40,-46,]),'MAIORIGUAL':([37,38,40,41,42,43,44,70,72,82,83,84,85,86,],[67,-38,-41,-42,-43,-44,-45,-48,-47,-36,-37,-39,-40,-46,]),'VEZES':([38,40,41,42,43,44,70,72,82,83,84,85,86,],[68,-41,-42,-43,-44,-45,-48,-47,68,68,-39,-40,-46,]),'DIV':([38,40,41,42,43,44,70,72,82,83,84,85,86,],[69,-41,-42,-43,-44,-45,-48,-47,69,69,-39,-40,-46,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'programa':([0,],[1,]),'bloco':([4,],[5,]),'declaracoes':([4,],[6,]),'empty':([4,11,32,56,73,92,],[8,23,23,23,23,23,]),'comando_composto':([6,11,32,56,73,92,],[10,22,22,22,22,22,]),'declaracao_variaveis':([7,77,],[12,91,]),'lista_id':([7,30,48,77,],[13,53,74,13,]),'lista_comandos':([11,32,],[15,54,]),'comando':([11,32,56,73,92,],[16,16,78,87,94,]),'atribuicao':([11,32,56,73,92,],[17,17,17,17,17,]),'comando_condicional':([11,32,56,73,92,],[18,18,18,18,18,]),'comando_enquanto':([11,32,56,73,92,],[19,19,19,19,19,]),'comando_leitura':([11,32,56,73,92,],[20,20,20,20,20,]),'comando_escrita':([11,32,56,73,92,],[21,21,21,21,21,]),'expressao':([25,26,33,45,49,90,],[34,47,55,71,76,76,]),'expressao_and':([25,26,33,45,49,57,90,],[35,35,35,35,35,79,35,]),'expressao_rel':([25,26,33,45,49,57,58,90,],[36,36,36,36,36,36,80,36,]),'soma':([25,26,33,45,49,57,58,59,90,],[37,37,37,37,37,37,37,81,37,]),'termo':([25,26,33,45,49,57,58,59,60,61,90,],[38,38,38,38,38,38,38,38,82,83,38,]),'fator':([25,26,33,39,45,46,49,57,58,59,60,61,68,69,90,],[40,40,40,70,40,72,40,40,40,40,40,40,84,85,40,]),'tipo':([29,],[50,]),'relacao':([37,],[59,]),'lista_expressoes':([49,90,],[75,93,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
+_lr_signature = 'leftORleftANDnonassocIGUALDIFERENTEMENORQUEMENORIGUALMAIORQUEMAIORIGUALleftMAISMENOSleftVEZESDIVrightNOTUMINUSAND BEGIN BOOLEAN DIFERENTE DIV DO DP DPAR DPIGUAL ELSE END EPAR FALSE ID IF IGUAL INTEGER MAIORIGUAL MAIORQUE MAIS MENORIGUAL MENORQUE MENOS NOT NUMERO OR PF PROGRAM PV READ THEN TRUE VAR VEZES VIRG WHILE WRITEcomando : atribuicao|comando : comando_condicional|comando : comando_enquanto|comando : comando_leitura|comando : comando_escrita|comando : comando_composto|comando : empty|expressao : expressao_and|expressao_and : expressao_rel|expressao_rel : soma|soma : termo|termo : fatorprograma : PROGRAM ID PV bloco PFbloco : declaracoes comando_compostodeclaracoes : VAR declaracao_variaveis\n                   | emptydeclaracao_variaveis : declaracao_variaveis lista_id DP tipo PV\n                            | lista_id DP tipo PVlista_id : lista_id VIRG ID\n                | IDtipo : INTEGER\n            | BOOLEANcomando_composto : BEGIN lista_comandos ENDlista_comandos : lista_comandos PV comando\n                      | comandocomando : atribuicao\n               | comando_condicional\n               | comando_enquanto\n               | comando_leitura\n               | comando_escrita\n               | comando_composto\n               | emptyatribuicao : ID DPIGUAL expressaocomando_condicional : IF expressao THEN comando\n                           | IF expressao THEN comando ELSE comandocomando_enquanto : WHILE expressao DO comandocomando_leitura : READ EPAR lista_id DPARcomando_escrita : WRITE EPAR lista_expressoes DPARlista_expressoes : lista_expressoes VIRG expressao\n                        | expressaoexpressao : expressao OR expressao_and\n                 | expressao_andexpressao_and : expressao_and AND expressao_rel\n                      | expressao_relexpressao_rel : soma relacao soma\n                     | somasoma : soma MAIS termo\n            | soma MENOS termo\n            | termotermo : termo VEZES fator\n             | termo DIV fator\n             | fatorfator : ID\n             | NUMERO\n             | TRUE\n             | FALSE\n             | EPAR expressao DPAR\n             | NOT fator\n             | MENOS fator %prec UMINUSrelacao : IGUAL\n               | DIFERENTE\n               | MENORQUE\n               | MENORIGUAL\n               | MAIORQUE\n               | MAIORIGUALempty :'
+_lr_terminals = ['$end', 'AND', 'BEGIN', 'BOOLEAN', 'DIFERENTE', 'DIV', 'DO', 'DP', 'DPAR', 'DPIGUAL', 'ELSE', 'END', 'EPAR', 'FALSE', 'ID', 'IF', 'IGUAL', 'INTEGER', 'MAIORIGUAL', 'MAIORQUE', 'MAIS', 'MENORIGUAL', 'MENORQUE', 'MENOS', 'NOT', 'NUMERO', 'OR', 'PF', 'PROGRAM', 'PV', 'READ', 'THEN', 'TRUE', 'VAR', 'VEZES', 'VIRG', 'WHILE', 'WRITE', 'error']
+_lr_nonterminals = ['atribuicao', 'bloco', 'comando', 'comando_composto', 'comando_condicional', 'comando_enquanto', 'comando_escrita', 'comando_leitura', 'declaracao_variaveis', 'declaracoes', 'empty', 'expressao', 'expressao_and', 'expressao_rel', 'fator', 'lista_comandos', 'lista_expressoes', 'lista_id', 'programa', 'relacao', 'soma', 'termo', 'tipo']
+_lr_action_base = [0, 0, 33, 28, 23, 33, 7, 65, 79, 88, 62, 908, 1, 10, 102, 30, 33, 83, 927, 948, 101, 108, 42, 187, 107, 3, 919, 951, 114, 954, 0, 32, 64, 96, 975, 978, 85, 109, 981, 214, 95, 114, 123, 134, 225, 533, 804, 1002, 1005, 1008, 1029, 1032, 1035, 1056, 1059, 1062, 1083, 1086, 1089, 1110, 128, 255, 160, 833, 164, 214, 68, 144, 10, 145, 845, 867, 763, 192, 224, 256, 288, 320, 177, 209, 241, 1113, 254, 877, 100, 273, 284, 127, 693, 598, 1, 781, 621, 289, 494, 647, 529, 159, 804, 670, 38, 717, 552, 305, 889, 480, 352, 506, 384, 697, 416, 448, 337, 70, 740, 575, 369]
+_lr_action_check = [1, 30, 90, 12, 30, 30, 30, 90, 30, 6, 30, 30, 68, 25, 25, 12, 30, 13, 30, 30, 30, 30, 30, 30, 68, 4, 30, 90, 0, 30, 25, 30, 25, 31, 30, 30, 31, 31, 31, 100, 31, 15, 31, 31, 16, 13, 100, 2, 31, 22, 31, 31, 31, 31, 31, 31, 4, 3, 31, 15, 5, 31, 16, 31, 100, 32, 31, 31, 32, 32, 32, 113, 32, 100, 32, 32, 66, 22, 113, 7, 32, 8, 32, 32, 32, 32, 32, 32, 9, 10, 32, 36, 17, 32, 66, 32, 113, 33, 32, 32, 33, 33, 33, 66, 33, 113, 33, 33, 84, 14, 14, 36, 33, 20, 33, 33, 33, 33, 33, 33, 21, 24, 33, 37, 40, 33, 84, 33, 87, 60, 33, 33, 60, 60, 60, 84, 60, 14, 60, 60, 28, 43, 43, 41, 60, 28, 60, 60, 60, 60, 60, 60, 42, 87, 60, 69, 69, 60, 87, 60, 97, 62, 60, 60, 62, 62, 62, 97, 62, 43, 62, 62, 64, 67, 69, -1, 62, -1, 62, 62, 62, 62, 62, 62, -1, 97, 62, 78, 78, 62, 23, 62, -1, 73, 62, 62, 73, 73, 73, 64, 73, -1, 73, 73, 23, -1, 78, -1, 73, -1, 73, 73, 73, 73, 73, 73, -1, 39, 73, 79, 79, 73, 65, 73, -1, 74, 73, 73, 74, 74, 74, 39, 74, -1, 74, 74, 44, -1, 79, -1, 74, -1, 74, 74, 74, 74, 74, 74, -1, 65, 74, 80, 80, 74, 44, 74, 82, 75, 74, 74, 75, 75, 75, 61, 75, -1, 75, 75, 82, -1, 80, -1, 75, -1, 75, 75, 75, 75, 75, 75, -1, 61, 75, 85, 85, 75, -1, 75, -1, 76, 75, 75, 76, 76, 76, 86, 76, -1, 76, 76, 93, -1, 85, -1, 76, -1, 76, 76, 76, 76, 76, 76, -1, 86, 76, 103, 103, 76, 93, 76, -1, 77, 76, 76, 77, 77, 77, -1, 77, -1, 77, 77, -1, -1, 103, -1, 77, -1, 77, 77, 77, 77, 77, 77, -1, -1, 77, 112, 112, 77, -1, 77, -1, 106, 77, 77, 106, 106, 106, -1, 106, -1, 106, 106, -1, -1, 112, -1, 106, -1, 106, 106, 106, 106, 106, 106, -1, -1, 106, 116, 116, 106, -1, 106, -1, 108, 106, 106, 108, 108, 108, -1, 108, -1, 108, 108, -1, -1, 116, -1, 108, -1, 108, 108, 108, 108, 108, 108, -1, -1, 108, -1, -1, 108, -1, 108, -1, 110, 108, 108, 110, 110, 110, -1, 110, -1, 110, 110, -1, -1, -1, -1, 110, -1, 110, 110, 110, 110, 110, 110, -1, -1, 110, -1, -1, 110, -1, 110, -1, 111, 110, 110, 111, 111, 111, -1, 111, -1, 111, 111, -1, -1, -1, -1, 111, -1, 111, 111, 111, 111, 111, 111, -1, -1, 111, -1, -1, 111, -1, 111, -1, 105, 111, 111, 105, -1, 105, -1, 105, -1, 105, 105, -1, -1, -1, 94, 105, -1, 105, 105, 105, 105, 105, 105, 94, 94, 105, 107, -1, 105, 107, 105, 107, -1, 107, 105, 107, 107, -1, -1, 94, -1, 107, 94, 107, 107, 107, 107, 107, 107, 96, -1, 107, 96, 96, 107, -1, 107, -1, 96, 96, 107, -1, 45, 45, 96, -1, 96, 96, 96, 96, 96, 96, 102, -1, 96, 102, 102, 96, 45, 102, -1, 45, 96, -1, -1, -1, -1, 102, -1, 102, 102, 102, 102, 102, 102, 115, -1, 102, 115, 115, -1, -1, 115, -1, -1, 102, 102, -1, -1, -1, 115, -1, 115, 115, 115, 115, 115, 115, 89, -1, 115, 89, 89, -1, -1, -1, -1, -1, 115, 115, -1, -1, -1, 89, -1, 89, 89, 89, 89, 89, 89, 92, -1, 89, 92, 92, 92, -1, 89, -1, -1, 89, -1, -1, -1, -1, 92, -1, 92, 92, 92, 92, 92, 92, -1, -1, 92, 95, -1, -1, 95, -1, -1, -1, 92, -1, 95, 95, -1, -1, -1, -1, 95, -1, 95, 95, 95, 95, 95, 95, 99, -1, 95, 99, 99, 95, -1, 99, -1, -1, -1, -1, -1, -1, -1, 99, -1, 99, 99, 99, 99, 99, 99, 88, -1, 99, 88, 109, -1, -1, -1, 109, 109, 99, 109, -1, 109, 109, 88, -1, 88, 88, 88, 88, 88, 88, 109, 101, 88, 109, 101, -1, 109, 88, 101, 109, -1, 109, -1, -1, 109, 109, 101, -1, 101, 101, 101, 101, 101, 101, 114, -1, 101, 114, -1, -1, -1, 114, -1, -1, -1, 101, -1, -1, -1, 114, -1, 114, 114, 114, 114, 114, 114, 72, -1, 114, -1, -1, 72, -1, 72, -1, 72, 72, 114, -1, -1, -1, -1, -1, -1, 91, 72, -1, 91, 72, 91, -1, 72, -1, -1, 72, -1, 72, -1, -1, 91, 72, 91, 91, 91, 91, 91, 91, 98, 46, 91, 98, -1, -1, -1, 98, -1, 46, 46, -1, -1, 46, 46, 98, -1, 98, 98, 98, 98, 98, 98, -1, -1, 98, -1, -1, 46, 46, 63, -1, -1, -1, -1, 46, 46, -1, 63, 63, -1, 70, 63, 63, -1, -1, 70, -1, 70, -1, 70, 70, -1, -1, -1, -1, -1, 63, 63, -1, -1, -1, -1, 71, 63, 63, 70, -1, 71, 70, 71, 70, 71, 71, 83, 70, -1, -1, -1, -1, -1, -1, 83, 83, -1, 104, 83, 83, 71, -1, 104, 71, 104, 71, 104, 104, -1, 71, -1, -1, -1, 83, 83, -1, -1, 11, -1, -1, 83, 83, 104, -1, -1, 104, 11, 104, 26, 11, 11, 104, -1, -1, -1, -1, -1, 26, -1, -1, 26, 26, -1, -1, 11, 11, 18, 18, 18, -1, -1, 11, 11, -1, -1, 26, 26, 18, 18, 18, -1, -1, 26, 26, -1, -1, 18, 19, 19, 19, 27, 27, 27, 29, 29, 29, -1, -1, 19, 19, 19, 27, 27, 27, 29, 29, 29, 19, -1, -1, 27, -1, -1, 29, 34, 34, 34, 35, 35, 35, 38, 38, 38, -1, -1, 34, 34, 34, 35, 35, 35, 38, 38, 38, 34, -1, -1, 35, -1, -1, 38, 47, 47, 47, 48, 48, 48, 49, 49, 49, -1, -1, 47, 47, 47, 48, 48, 48, 49, 49, 49, 47, -1, -1, 48, -1, -1, 49, 50, 50, 50, 51, 51, 51, 52, 52, 52, -1, -1, 50, 50, 50, 51, 51, 51, 52, 52, 52, 50, -1, -1, 51, -1, -1, 52, 53, 53, 53, 54, 54, 54, 55, 55, 55, -1, -1, 53, 53, 53, 54, 54, 54, 55, 55, 55, 53, -1, -1, 54, -1, -1, 55, 56, 56, 56, 57, 57, 57, 58, 58, 58, -1, -1, 56, 56, 56, 57, 57, 57, 58, 58, 58, 56, -1, -1, 57, -1, -1, 58, 59, 59, 59, 81, 81, 81, -1, -1, -1, -1, -1, 59, 59, 59, 81, 81, 81, -1, -1, -1, 59, -1, -1, 81, -1, -1, -1, -1, -1, -1, -1]
+_lr_action_value = [0, -41, 48, -3, -41, -41, -41, 63, -41, 11, -41, -41, -6, -11, -11, 14, -41, 23, -41, -41, -41, -41, -41, -41, -6, -54, -41, 47, 2, -41, -11, -41, -11, -42, -41, -41, -42, -42, -42, 48, -42, 25, -42, -42, -13, 24, -28, 3, -42, 39, -42, -42, -42, -42, -42, -42, 7, 4, -42, 26, 9, -42, -13, -42, 47, -43, -42, -42, -43, -43, -43, 48, -43, -28, -43, -43, -28, 24, -27, 14, -43, -4, -43, -43, -43, -43, -43, -43, -1, -2, -43, 63, 27, -43, 47, -43, 47, -44, -43, -43, -44, -44, -44, -28, -44, -27, -44, -44, -27, -8, -8, 47, -44, 37, -44, -44, -44, -44, -44, -44, 38, 43, -44, 14, 68, -44, 47, -44, 48, -47, -44, -44, -47, -47, -47, -27, -47, -8, -47, -47, 47, -7, -7, -9, -47, 46, -47, -47, -47, -47, -47, -47, -10, 47, -47, 83, -22, -47, 46, -47, 48, -46, -47, -47, -46, -46, -46, 77, -46, -7, -46, -46, 79, 82, -22, None, -46, None, -46, -46, -46, -46, -46, -46, None, 47, -46, -24, -24, -46, 42, -46, None, -35, -46, -46, -35, 59, -35, 24, -35, None, -35, -35, 41, None, -24, None, -35, None, -35, -35, -35, -35, -35, -35, None, 42, -35, -25, -25, -35, 80, -35, None, -36, 58, -35, -36, 59, -36, 41, -36, None, -36, -36, -12, None, -25, None, -36, None, -36, -36, -36, -36, -36, -36, None, 81, -36, -26, -26, -36, -12, -36, -5, -38, 58, -36, -38, -38, -38, 77, -38, None, -38, -38, -5, None, -26, None, -38, None, -38, -38, -38, -38, -38, -38, None, 47, -38, -23, -23, -38, None, -38, None, -39, -38, -38, -39, -39, -39, -13, -39, None, -39, -39, -12, None, -23, None, -39, None, -39, -39, -39, -39, -39, -39, None, -13, -39, 83, -22, -39, -12, -39, None, -45, -39, -39, -45, -45, -45, None, -45, None, -45, -45, None, None, -22, None, -45, None, -45, -45, -45, -45, -45, -45, None, None, -45, -24, -24, -45, None, -45, None, 48, -45, -45, 53, 59, -29, None, -29, None, -29, -29, None, None, -24, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, -29, -23, -23, -29, None, -29, None, -31, 58, -29, 53, 59, -31, None, -31, None, -31, -31, None, None, -23, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, -31, None, None, -31, None, -31, None, -35, 58, -31, -35, 59, -35, None, -35, None, -35, -35, None, None, None, None, -35, None, -35, -35, -35, -35, -35, -35, None, None, -35, None, None, -35, None, -35, None, -36, 58, -35, -36, 59, -36, None, -36, None, -36, -36, None, None, None, None, -36, None, -36, -36, -36, -36, -36, -36, None, None, -36, None, None, -36, None, -36, None, 48, 58, -36, 53, None, -29, None, -29, None, -29, -29, None, None, None, 48, 52, None, 57, 56, 50, 55, 54, 51, -21, -21, -29, -31, None, -29, 53, -29, -31, None, -31, -29, -31, -31, None, None, 47, None, 52, -21, 57, 56, 50, 55, 54, 51, 48, None, -31, 53, 59, -31, None, -31, None, -21, -21, -31, None, -21, -21, 52, None, 57, 56, 50, 55, 54, 51, 48, None, 47, 53, 59, -21, 47, -28, None, -21, 58, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, 48, None, 47, 53, 59, None, None, -27, None, None, 58, -28, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, 48, None, 47, 53, 59, None, None, None, None, None, 58, -27, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, 48, None, 47, 53, 59, 63, None, 46, None, None, 58, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, 48, None, None, 53, None, None, None, 58, None, -21, -21, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, 48, None, 47, 53, 59, -21, None, 77, None, None, None, None, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, 48, None, 47, 53, -33, None, None, None, 59, -33, 58, -33, None, -33, -33, 52, None, 57, 56, 50, 55, 54, 51, 50, 48, 47, 51, 53, None, -33, 46, -28, -33, None, -33, None, None, 58, -33, 52, None, 57, 56, 50, 55, 54, 51, 48, None, 47, 53, None, None, None, -27, None, None, None, -28, None, None, None, 52, None, 57, 56, 50, 55, 54, 51, -33, None, 47, None, None, -33, None, -33, None, -33, -33, -27, None, None, None, None, None, None, 48, 50, None, 53, 51, 63, None, -33, None, None, -33, None, -33, None, None, 52, -33, 57, 56, 50, 55, 54, 51, 48, 11, 47, 53, None, None, None, 77, None, -54, -54, None, None, 17, 18, 52, None, 57, 56, 50, 55, 54, 51, None, None, 47, None, None, -54, 20, 11, None, None, None, None, 19, 21, None, -54, -54, None, 48, 17, 18, None, None, -29, None, -29, None, -29, -29, None, None, None, None, None, -54, 20, None, None, None, None, -31, 19, 21, -29, None, -31, -29, -31, -29, -31, -31, 11, -29, None, None, None, None, None, None, -54, -54, None, 48, 17, 18, -31, None, -29, -31, -29, -31, -29, -29, None, -31, None, None, None, -54, 20, None, None, 11, None, None, 19, 21, -29, None, None, -29, -54, -29, 11, 17, 18, -29, None, None, None, None, None, -54, None, None, 17, 18, None, None, -54, 20, 34, 33, 30, None, None, 19, 21, None, None, -54, 20, 29, 35, 31, None, None, 19, 21, None, None, 32, 34, 33, 30, 34, 33, 30, 34, 33, 30, None, None, 29, 35, 31, 29, 35, 31, 29, 35, 31, 32, None, None, 32, None, None, 32, 34, 33, 30, 34, 33, 30, 34, 33, 30, None, None, 29, 35, 31, 29, 35, 31, 29, 35, 31, 32, None, None, 32, None, None, 32, 34, 33, 30, 34, 33, 30, 34, 33, 30, None, None, 29, 35, 31, 29, 35, 31, 29, 35, 31, 32, None, None, 32, None, None, 32, 34, 33, 30, 34, 33, 30, -48, -48, -48, None, None, 29, 35, 31, 29, 35, 31, -48, -48, -48, 32, None, None, 32, None, None, -48, -49, -49, -49, -50, -50, -50, -51, -51, -51, None, None, -49, -49, -49, -50, -50, -50, -51, -51, -51, -49, None, None, -50, None, None, -51, -52, -52, -52, -53, -53, -53, 34, 33, 30, None, None, -52, -52, -52, -53, -53, -53, 29, 35, 31, -52, None, None, -53, None, None, 32, 34, 33, 30, 34, 33, 30, None, None, None, None, None, 29, 35, 31, 29, 35, 31, None, None, None, 32, None, None, 32, None, None, None, None, None, None, None]
+_lr_goto_base = [13, 0, 0, 0, 49, 0, 5, 5, 0, 0, 0, 0, 23, 0, 0, 0, 0, 0, 52, 56, 0, 0, 0, 38, 0, 0, 14, 67, 0, 57, 0, 0, 0, 0, 71, 60, 0, 58, 41, 64, 0, 0, 0, 0, 0, 0, 23, 85, 87, 90, 35, 95, 0, 0, 0, 0, 0, 0, 75, 76, 0, 0, 0, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 82, 0, 41, 0, 0, 0, 0, 93, 94, 0, 95, 96, 0, 0, 98, 99, 0, 100, 101, 0, 102, 103, 0, 0, 104, 105, 106, 107, 0, 0, 0, 0, 0, 108, 109, 0]
+_lr_goto_check = [11, -1, 11, 11, 11, 11, 11, 11, 6, -1, 11, -1, -1, 7, 26, 11, 26, 26, 26, 26, 26, 26, 7, 46, 26, 46, 46, 46, 46, 46, 46, 0, 63, 46, 63, 63, 63, 63, 63, 63, 12, 83, 63, 83, 83, 83, 83, 83, 83, 50, 4, 83, 38, 38, 38, 38, 50, 38, 4, 4, 23, 38, 38, 18, 18, 18, 18, 19, 19, 19, 19, 29, 18, 18, 35, 37, 19, 19, 27, 27, 27, 27, 34, 34, 34, 34, 39, 27, 27, 58, 59, 34, 34, 81, 81, 81, 81, 47, 47, 47, 48, 48, 81, 81, 49, 47, 47, 48, 48, 51, 49, 49, 88, 89, 91, 92, 51, 95, 96, 98, 99, 101, 102, 105, 106, 107, 108, 114, 115, -1, -1, -1]
+_lr_goto_value = [86, None, 16, 86, 86, 86, 86, 86, 10, None, 86, None, None, 12, 93, 15, 44, 93, 93, 93, 93, 93, 13, 103, 93, 69, 103, 103, 103, 103, 103, 1, 112, 103, 78, 112, 112, 112, 112, 112, 22, 116, 112, 85, 116, 116, 116, 116, 116, 110, 5, 116, 66, 100, 100, 102, 73, 65, 6, 8, 40, 101, 102, 28, 87, 87, 89, 36, 90, 90, 92, 60, 88, 89, 62, 64, 91, 92, 45, 94, 94, 96, 61, 97, 97, 99, 67, 95, 96, 75, 76, 98, 99, 84, 113, 113, 115, 70, 104, 106, 71, 108, 114, 115, 109, 105, 106, 107, 108, 111, 72, 109, 49, 49, 49, 49, 74, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, 49, None, None, None]
+_lr_defaulted = [None, None, None, None, None, None, None, None, -4, -1, -2, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, -9, -10, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None]
 _lr_productions = [
   ("S' -> programa","S'",1,None,None,None),
-  ('programa -> PROGRAM ID PV bloco PF','programa',5,'p_programa','parser.py',54),
-  ('bloco -> declaracoes comando_composto','bloco',2,'p_bloco','parser.py',68),
-  ('declaracoes -> VAR declaracao_variaveis','declaracoes',2,'p_declaracoes','parser.py',73),
-  ('declaracoes -> empty','declaracoes',1,'p_declaracoes','parser.py',74),
-  ('declaracao_variaveis -> lista_id DP tipo PV declaracao_variaveis','declaracao_variaveis',5,'p_declaracao_variaveis','parser.py',79),
-  ('declaracao_variaveis -> lista_id DP tipo PV','declaracao_variaveis',4,'p_declaracao_variaveis','parser.py',80),
-  ('lista_id -> ID','lista_id',1,'p_lista_id','parser.py',87),
-  ('lista_id -> ID VIRG lista_id','lista_id',3,'p_lista_id','parser.py',88),
-  ('tipo -> INTEGER','tipo',1,'p_tipo','parser.py',96),
-  ('tipo -> BOOLEAN','tipo',1,'p_tipo','parser.py',97),
-  ('comando_composto -> BEGIN lista_comandos END','comando_composto',3,'p_comando_composto','parser.py',102),
-  ('lista_comandos -> comando','lista_comandos',1,'p_lista_comandos','parser.py',107),
-  ('lista_comandos -> comando PV lista_comandos','lista_comandos',3,'p_lista_comandos','parser.py',108),
-  ('lista_comandos -> comando PV','lista_comandos',2,'p_lista_comandos','parser.py',109),
-  ('comando -> atribuicao','comando',1,'p_comando','parser.py',114),
-  ('comando -> comando_condicional','comando',1,'p_comando','parser.py',115),
-  ('comando -> comando_enquanto','comando',1,'p_comando','parser.py',116),
-  ('comando -> comando_leitura','comando',1,'p_comando','parser.py',117),
-  ('comando -> comando_escrita','comando',1,'p_comando','parser.py',118),
-  ('comando -> comando_composto','comando',1,'p_comando','parser.py',119),
-  ('comando -> empty','comando',1,'p_comando','parser.py',120),
-  ('atribuicao -> ID DPIGUAL expressao','atribuicao',3,'p_atribuicao','parser.py',125),
-  ('comando_condicional -> IF expressao THEN comando','comando_condicional',4,'p_comando_condicional','parser.py',135),
-  ('comando_condicional -> IF expressao THEN comando ELSE comando','comando_condicional',6,'p_comando_condicional','parser.py',136),
-  ('comando_enquanto -> WHILE expressao DO comando','comando_enquanto',4,'p_comando_enquanto','parser.py',143),
-  ('comando_leitura -> READ EPAR lista_id DPAR','comando_leitura',4,'p_comando_leitura','parser.py',150),
-  ('comando_escrita -> WRITE EPAR lista_expressoes DPAR','comando_escrita',4,'p_comando_escrita','parser.py',158),
-  ('lista_expressoes -> expressao','lista_expressoes',1,'p_lista_expressoes','parser.py',166),
-  ('lista_expressoes -> expressao VIRG lista_expressoes','lista_expressoes',3,'p_lista_expressoes','parser.py',167),
-  ('expressao -> expressao OR expressao_and','expressao',3,'p_expressao_or','parser.py',179),
-  ('expressao -> expressao_and','expressao',1,'p_expressao_or','parser.py',180),
-  ('expressao_and -> expressao_and AND expressao_rel','expressao_and',3,'p_expressao_and','parser.py',190),
-  ('expressao_and -> expressao_rel','expressao_and',1,'p_expressao_and','parser.py',191),
-  ('expressao_rel -> soma relacao soma','expressao_rel',3,'p_expressao_rel','parser.py',201),
-  ('expressao_rel -> soma','expressao_rel',1,'p_expressao_rel','parser.py',202),
-  ('soma -> soma MAIS termo','soma',3,'p_soma','parser.py',218),
-  ('soma -> soma MENOS termo','soma',3,'p_soma','parser.py',219),
-  ('soma -> termo','soma',1,'p_soma','parser.py',220),
-  ('termo -> termo VEZES fator','termo',3,'p_termo','parser.py',232),
-  ('termo -> termo DIV fator','termo',3,'p_termo','parser.py',233),
-  ('termo -> fator','termo',1,'p_termo','parser.py',234),
-  ('fator -> ID','fator',1,'p_fator','parser.py',244),
-  ('fator -> NUMERO','fator',1,'p_fator','parser.py',245),
-  ('fator -> TRUE','fator',1,'p_fator','parser.py',246),
-  ('fator -> FALSE','fator',1,'p_fator','parser.py',247),
-  ('fator -> EPAR expressao DPAR','fator',3,'p_fator','parser.py',248),
-  ('fator -> NOT fator','fator',2,'p_fator','parser.py',249),
-  ('fator -> MENOS fator','fator',2,'p_fator','parser.py',250),
-  ('relacao -> IGUAL','relacao',1,'p_relacao','parser.py',275),
-  ('relacao -> DIFERENTE','relacao',1,'p_relacao','parser.py',276),
-  ('relacao -> MENORQUE','relacao',1,'p_relacao','parser.py',277),
-  ('relacao -> MENORIGUAL','relacao',1,'p_relacao','parser.py',278),
-  ('relacao -> MAIORQUE','relacao',1,'p_relacao','parser.py',279),
-  ('relacao -> MAIORIGUAL','relacao',1,'p_relacao','parser.py',280),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',285),
+  ('programa -> PROGRAM ID PV bloco PF','programa',5,'p_programa','parser.py',102),
+  ('bloco -> declaracoes comando_composto','bloco',2,'p_bloco','parser.py',108),
+  ('declaracoes -> VAR declaracao_variaveis','declaracoes',2,'p_declaracoes','parser.py',112),
+  ('declaracoes -> empty','declaracoes',1,'p_declaracoes','parser.py',113),
+  ('declaracao_variaveis -> declaracao_variaveis lista_id DP tipo PV','declaracao_variaveis',5,'p_declaracao_variaveis','parser.py',125),
+  ('declaracao_variaveis -> lista_id DP tipo PV','declaracao_variaveis',4,'p_declaracao_variaveis','parser.py',126),
+  ('lista_id -> lista_id VIRG ID','lista_id',3,'p_lista_id','parser.py',141),
+  ('lista_id -> ID','lista_id',1,'p_lista_id','parser.py',142),
+  ('tipo -> INTEGER','tipo',1,'p_tipo','parser.py',152),
+  ('tipo -> BOOLEAN','tipo',1,'p_tipo','parser.py',153),
+  ('comando_composto -> BEGIN lista_comandos END','comando_composto',3,'p_comando_composto','parser.py',157),
+  ('lista_comandos -> lista_comandos PV comando','lista_comandos',3,'p_lista_comandos','parser.py',161),
+  ('lista_comandos -> comando','lista_comandos',1,'p_lista_comandos','parser.py',162),
+  ('comando -> atribuicao','comando',1,'p_comando','parser.py',174),
+  ('comando -> comando_condicional','comando',1,'p_comando','parser.py',175),
+  ('comando -> comando_enquanto','comando',1,'p_comando','parser.py',176),
+  ('comando -> comando_leitura','comando',1,'p_comando','parser.py',177),
+  ('comando -> comando_escrita','comando',1,'p_comando','parser.py',178),
+  ('comando -> comando_composto','comando',1,'p_comando','parser.py',179),
+  ('comando -> empty','comando',1,'p_comando','parser.py',180),
+  ('atribuicao -> ID DPIGUAL expressao','atribuicao',3,'p_atribuicao','parser.py',185),
+  ('comando_condicional -> IF expressao THEN comando','comando_condicional',4,'p_comando_condicional','parser.py',194),
+  ('comando_condicional -> IF expressao THEN comando ELSE comando','comando_condicional',6,'p_comando_condicional','parser.py',195),
+  ('comando_enquanto -> WHILE expressao DO comando','comando_enquanto',4,'p_comando_enquanto','parser.py',202),
+  ('comando_leitura -> READ EPAR lista_id DPAR','comando_leitura',4,'p_comando_leitura','parser.py',208),
+  ('comando_escrita -> WRITE EPAR lista_expressoes DPAR','comando_escrita',4,'p_comando_escrita','parser.py',214),
+  ('lista_expressoes -> lista_expressoes VIRG expressao','lista_expressoes',3,'p_lista_expressoes','parser.py',221),
+  ('lista_expressoes -> expressao','lista_expressoes',1,'p_lista_expressoes','parser.py',222),
+  ('expressao -> expressao OR expressao_and','expressao',3,'p_expressao_or','parser.py',230),
+  ('expressao -> expressao_and','expressao',1,'p_expressao_or','parser.py',231),
+  ('expressao_and -> expressao_and AND expressao_rel','expressao_and',3,'p_expressao_and','parser.py',241),
+  ('expressao_and -> expressao_rel','expressao_and',1,'p_expressao_and','parser.py',242),
+  ('expressao_rel -> soma relacao soma','expressao_rel',3,'p_expressao_rel','parser.py',252),
+  ('expressao_rel -> soma','expressao_rel',1,'p_expressao_rel','parser.py',253),
+  ('soma -> soma MAIS termo','soma',3,'p_soma','parser.py',270),
+  ('soma -> soma MENOS termo','soma',3,'p_soma','parser.py',271),
+  ('soma -> termo','soma',1,'p_soma','parser.py',272),
+  ('termo -> termo VEZES fator','termo',3,'p_termo','parser.py',284),
+  ('termo -> termo DIV fator','termo',3,'p_termo','parser.py',285),
+  ('termo -> fator','termo',1,'p_termo','parser.py',286),
+  ('fator -> ID','fator',1,'p_fator','parser.py',296),
+  ('fator -> NUMERO','fator',1,'p_fator','parser.py',297),
+  ('fator -> TRUE','fator',1,'p_fator','parser.py',298),
+  ('fator -> FALSE','fator',1,'p_fator','parser.py',299),
+  ('fator -> EPAR expressao DPAR','fator',3,'p_fator','parser.py',300),
+  ('fator -> NOT fator','fator',2,'p_fator','parser.py',301),
+  ('fator -> MENOS fator','fator',2,'p_fator','parser.py',302),
+  ('relacao -> IGUAL','relacao',1,'p_relacao','parser.py',325),
+  ('relacao -> DIFERENTE','relacao',1,'p_relacao','parser.py',326),
+  ('relacao -> MENORQUE','relacao',1,'p_relacao','parser.py',327),
+  ('relacao -> MENORIGUAL','relacao',1,'p_relacao','parser.py',328),
+  ('relacao -> MAIORQUE','relacao',1,'p_relacao','parser.py',329),
+  ('relacao -> MAIORIGUAL','relacao',1,'p_relacao','parser.py',330),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',335),
 ]
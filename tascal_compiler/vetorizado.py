@@ -0,0 +1,362 @@
+# Execução vetorizada do Tascal: roda o mesmo programa (arvore.Programa) sobre um lote de
+# entradas de uma só vez, com NumPy. Cada variável é um vetor com um valor por "pista"
+# (uma execução do lote): os comandos em sequência viram operações sobre vetores inteiros,
+# e o if e o while usam máscaras com as pistas ativas, repetindo o laço até que nenhuma
+# pista continue nele. Cada write executado gera uma coluna de saída (máscara das pistas
+# que o executaram e os valores de cada expressão).
+# A semântica é a do interpretador da árvore, pista a pista: mesma saída, mesmos erros e
+# a mesma contagem de instruções. Os inteiros do Tascal não têm limite e os vetores usam
+# int64; uma pista que sairia dessa faixa (na entrada, numa constante ou numa operação) é
+# abandonada e executada de novo pelo interpretador da árvore no final
+# Requer o NumPy
+import io
+import numpy as np
+from tascal_compiler import arvore, interpretador
+from tascal_compiler.interpretador import ErroExecucao, LimiteInstrucoesExcedido, resolve_slots
+
+MINIMO, MAXIMO = -2 ** 63, 2 ** 63 - 1 # Faixa do int64
+AVALIA, DIREITA, APLICA = range(3) # Fases de um nó em ExecutorLote.avalia
+
+COMPARACOES = { # Operadores que não saem da faixa do int64
+    arvore.Igual: np.equal,
+    arvore.Diferente: np.not_equal,
+    arvore.Menor: np.less,
+    arvore.MenorIgual: np.less_equal,
+    arvore.Maior: np.greater,
+    arvore.MaiorIgual: np.greater_equal,
+}
+
+class Coluna: # Saída de um write executado: uma linha para cada pista marcada
+    __slots__ = ('linha', 'mascara', 'valores')
+
+    def __init__(self, linha, mascara, valores):
+        self.linha = linha # Linha do write no código-fonte
+        self.mascara = mascara # Vetor booleano: pistas que executaram o write
+        self.valores = valores # Um vetor por expressão do write
+
+    def textos(self): # Texto de cada expressão, por pista
+        textos = []
+        for valores in self.valores:
+            if valores.dtype == np.bool_:
+                textos.append(np.where(valores, "true", "false").tolist())
+            else:
+                textos.append([str(valor) for valor in valores.tolist()])
+        return textos
+
+class ResultadoLote: # Resultado da execução de um lote
+    def __init__(self, colunas, erros, instrucoes, refeitas):
+        self.colunas = colunas # Lista de Coluna, na ordem de execução
+        self.erros = erros # ErroExecucao (ou None) de cada pista
+        self.instrucoes = instrucoes # Instruções executadas por pista (como no interpretador da árvore)
+        self.refeitas = refeitas # Saída das pistas executadas pelo interpretador da árvore, por pista
+
+    def __len__(self):
+        return len(self.erros)
+
+    def saidas(self): # Texto da saída de cada pista, como o write do interpretador escreveria
+        linhas = [[] for _ in range(len(self))]
+        for coluna in self.colunas:
+            textos = coluna.textos()
+            for pista in np.flatnonzero(coluna.mascara).tolist():
+                linhas[pista].append(" ".join([texto[pista] for texto in textos]))
+        saidas = ["".join(linha + "\n" for linha in pista) for pista in linhas]
+        for pista, saida in self.refeitas.items():
+            saidas[pista] = saida
+        return saidas
+
+    def saida(self, pista): # Texto da saída de uma pista
+        if pista in self.refeitas:
+            return self.refeitas[pista]
+        linhas = []
+        for coluna in self.colunas:
+            if coluna.mascara[pista]:
+                linhas.append(" ".join([interpretador.formata_valor(valores[pista].item())
+                                        for valores in coluna.valores]) + "\n")
+        return "".join(linhas)
+
+def valores_entrada(entrada): # Valores de uma entrada: texto (separado por espaços/linhas) ou lista
+    return entrada.split() if isinstance(entrada, str) else list(entrada)
+
+class EntradaLote: # Valores de entrada de todas as pistas, já convertidos para cada tipo
+    def __init__(self, entradas):
+        self.valores = [valores_entrada(entrada) for entrada in entradas] # Valores originais, por pista
+        pistas = len(self.valores)
+        colunas = max([len(valores) for valores in self.valores], default=0)
+        self.tamanho = np.array([len(valores) for valores in self.valores], dtype=np.int64)
+        self.posicao = np.zeros(pistas, dtype=np.int64) # Próximo valor a ler de cada pista
+        self.inteiros = np.zeros((pistas, colunas), dtype=np.int64)
+        self.inteiro_valido = np.zeros((pistas, colunas), dtype=np.bool_)
+        self.booleanos = np.zeros((pistas, colunas), dtype=np.bool_)
+        self.booleano_valido = np.zeros((pistas, colunas), dtype=np.bool_)
+        self.grandes = np.zeros(pistas, dtype=np.bool_) # Pistas com inteiros fora do int64
+        for pista, valores in enumerate(self.valores):
+            for coluna, valor in enumerate(valores):
+                # Mesmas conversões de interpretador.Entrada.le
+                if valor is True or valor is False or valor in ("true", "false"):
+                    self.booleanos[pista, coluna] = valor is True or valor == "true"
+                    self.booleano_valido[pista, coluna] = True
+                    continue
+                if type(valor) is int:
+                    inteiro = valor
+                elif isinstance(valor, str):
+                    try:
+                        inteiro = int(valor)
+                    except ValueError:
+                        continue
+                else:
+                    continue
+                if MINIMO <= inteiro <= MAXIMO:
+                    self.inteiros[pista, coluna] = inteiro
+                    self.inteiro_valido[pista, coluna] = True
+                else:
+                    self.grandes[pista] = True
+
+class ExecutorLote: # Executa um programa sem erros de compilação sobre um lote de entradas
+    def __init__(self, programa, entradas, limite_instrucoes=None):
+        self.programa = programa
+        self.entradas = list(entradas)
+        self.tipos = resolve_slots(programa)
+        self.pistas = len(self.entradas)
+        self.entrada = EntradaLote(self.entradas)
+        self.limite_instrucoes = limite_instrucoes # None: sem limite
+        self.memoria = [np.zeros(self.pistas, dtype=np.bool_ if tipo == "boolean" else np.int64)
+                        for tipo in self.tipos] # Vetor de cada variável, por slot
+        self.instrucoes = np.zeros(self.pistas, dtype=np.int64)
+        self.vivas = np.ones(self.pistas, dtype=np.bool_) # Pistas sem erro e sem estouro do int64
+        self.refazer = self.entrada.grandes.copy() # Pistas a executar no interpretador da árvore
+        self.vivas &= ~self.refazer
+        if not constantes_cabem(programa.corpo):
+            self.refazer[:] = True
+            self.vivas[:] = False
+        self.erros = [None] * self.pistas
+        self.colunas = []
+
+        self.comandos = { # Função que executa cada tipo de comando
+            arvore.Bloco: self.bloco,
+            arvore.Atribuicao: self.atribuicao,
+            arvore.Se: self.se,
+            arvore.Enquanto: self.enquanto,
+            arvore.Leitura: self.leitura,
+            arvore.Escrita: self.escrita,
+        }
+        self.operacoes = { # Função que calcula cada operador a partir dos valores dos operandos
+            arvore.Nao: self.nao,
+            arvore.MenosUnario: self.menos_unario,
+            arvore.Ou: self.ou,
+            arvore.E: self.e,
+            arvore.Soma: self.soma,
+            arvore.Subtracao: self.subtracao,
+            arvore.Multiplicacao: self.multiplicacao,
+            arvore.Divisao: self.divisao,
+        }
+        for classe, operacao in COMPARACOES.items():
+            self.operacoes[classe] = self.comparacao(operacao)
+
+    def executa(self): # Executa o lote e devolve o ResultadoLote
+        if self.vivas.any():
+            with np.errstate(over='ignore'): # Pistas que estouram o int64 são refeitas
+                self.executa_comando(self.programa.corpo, self.vivas.copy())
+        refeitas = {}
+        for pista in np.flatnonzero(self.refazer).tolist():
+            refeitas[pista] = self.refaz(pista)
+        return ResultadoLote(self.colunas, self.erros, self.instrucoes, refeitas)
+
+    def refaz(self, pista): # Executa uma pista no interpretador da árvore; devolve a saída
+        entrada = self.entradas[pista]
+        saida = io.StringIO()
+        execucao = interpretador.Interpretador(
+            self.programa, io.StringIO(entrada) if isinstance(entrada, str) else entrada, saida,
+            self.limite_instrucoes)
+        try:
+            execucao.executa()
+        except ErroExecucao as e:
+            self.erros[pista] = e
+        self.instrucoes[pista] = execucao.instrucoes
+        return saida.getvalue()
+
+    # Erros e contagem de instruções
+
+    def erro(self, pistas, erro): # Interrompe as pistas marcadas com o mesmo erro
+        for pista in np.flatnonzero(pistas).tolist():
+            self.erros[pista] = erro
+        self.vivas &= ~pistas
+
+    def estouro(self, pistas): # Pistas que sairiam do int64: serão refeitas no interpretador da árvore
+        pistas = pistas & self.vivas
+        self.refazer |= pistas
+        self.vivas &= ~pistas
+
+    def conta_instrucao(self, no, ativas): # Conta uma instrução nas pistas ativas e aplica o limite
+        self.instrucoes += ativas
+        if self.limite_instrucoes is not None:
+            excedidas = ativas & (self.instrucoes > self.limite_instrucoes)
+            if excedidas.any():
+                self.erro(excedidas, LimiteInstrucoesExcedido(
+                    f"limite de {self.limite_instrucoes} instruções excedido", no.linha))
+                return ativas & ~excedidas
+        return ativas
+
+    def executa_comando(self, no, ativas):
+        ativas = ativas & self.vivas
+        if no is not None and ativas.any(): # None é o comando vazio
+            ativas = self.conta_instrucao(no, ativas)
+            if ativas.any():
+                self.comandos[type(no)](no, ativas)
+
+    def avalia(self, no, ativas): # Vetor com o valor da expressão; só as pistas ativas contam
+        # Em pós-ordem, com pilhas explícitas: uma expressão longa (x + x + ... + x) é uma árvore com a
+        # profundidade do número de termos, funda demais para a recursão
+        operacoes = self.operacoes
+        valores = [] # Valores das subexpressões já avaliadas
+        pendentes = [(no, ativas, AVALIA)] # Nós com as pistas em que contam e a fase de cada um
+        while pendentes:
+            no, ativas, fase = pendentes.pop()
+            tipo = type(no)
+            if fase == AVALIA:
+                if tipo is arvore.Variavel:
+                    valores.append(self.memoria[no.slot])
+                elif tipo is arvore.Numero or tipo is arvore.Booleano:
+                    valores.append(self.constante(no))
+                elif isinstance(no, arvore.Unaria):
+                    pendentes += ((no, ativas, APLICA), (no.operando, ativas, AVALIA))
+                elif tipo is arvore.Ou or tipo is arvore.E:
+                    pendentes += ((no, ativas, DIREITA), (no.esquerda, ativas, AVALIA))
+                else:
+                    pendentes += ((no, ativas, APLICA), (no.direita, ativas, AVALIA), (no.esquerda, ativas, AVALIA))
+            elif fase == DIREITA: # Curto-circuito: com o lado esquerdo no topo de valores, a direita
+                # só conta nas pistas em que a esquerda é false (or) ou true (and)
+                esquerda = valores[-1]
+                pendentes += ((no, ativas, APLICA),
+                              (no.direita, ativas & (esquerda if tipo is arvore.E else ~esquerda), AVALIA))
+            elif isinstance(no, arvore.Unaria):
+                valores[-1] = operacoes[tipo](no, ativas, valores[-1])
+            else:
+                b = valores.pop()
+                valores[-1] = operacoes[tipo](no, ativas, valores[-1], b)
+        return valores[0]
+
+    # Comandos
+
+    def bloco(self, no, ativas):
+        executa_comando = self.executa_comando
+        for comando in no.comandos:
+            executa_comando(comando, ativas)
+
+    def atribuicao(self, no, ativas):
+        valor = self.avalia(no.expressao, ativas)
+        ativas = ativas & self.vivas
+        self.memoria[no.slot] = np.where(ativas, valor, self.memoria[no.slot])
+
+    def se(self, no, ativas):
+        condicao = self.avalia(no.condicao, ativas)
+        ativas = ativas & self.vivas
+        self.executa_comando(no.entao, ativas & condicao)
+        self.executa_comando(no.senao, ativas & ~condicao)
+
+    def enquanto(self, no, ativas):
+        ativas = ativas & self.avalia(no.condicao, ativas)
+        while True:
+            ativas &= self.vivas
+            if not ativas.any():
+                break
+            self.executa_comando(no.corpo, ativas)
+            ativas = self.conta_instrucao(no, ativas & self.vivas) # Cada novo teste da condição conta
+            ativas = ativas & self.avalia(no.condicao, ativas)
+
+    def leitura(self, no, ativas):
+        entrada = self.entrada
+        for variavel in no.variaveis:
+            ativas = ativas & self.vivas
+            posicao = entrada.posicao
+            fim = ativas & (posicao >= entrada.tamanho)
+            if fim.any():
+                self.erro(fim, ErroExecucao(f"fim da entrada ao ler a variável '{variavel.nome}'", no.linha))
+                ativas = ativas & ~fim
+            indices = np.flatnonzero(ativas)
+            colunas = posicao[indices]
+            tipo = self.tipos[variavel.slot]
+            if tipo == "boolean":
+                valores, validos = entrada.booleanos[indices, colunas], entrada.booleano_valido[indices, colunas]
+            else:
+                valores, validos = entrada.inteiros[indices, colunas], entrada.inteiro_valido[indices, colunas]
+            for pista, coluna in zip(indices[~validos].tolist(), colunas[~validos].tolist()):
+                valor = entrada.valores[pista][coluna]
+                self.erros[pista] = ErroExecucao(f"valor '{interpretador.formata_valor(valor)}' inválido "
+                                                 f"para a variável '{variavel.nome}' ({tipo})", no.linha)
+                self.vivas[pista] = False
+            posicao[indices] += 1 # O valor inválido também é consumido, como no interpretador
+            self.memoria[variavel.slot][indices[validos]] = valores[validos]
+            ativas = ativas & self.vivas
+
+    def escrita(self, no, ativas):
+        valores = [self.avalia(expressao, ativas) for expressao in no.expressoes]
+        ativas = ativas & self.vivas
+        if ativas.any():
+            self.colunas.append(Coluna(no.linha, ativas, [np.broadcast_to(valor, (self.pistas,)).copy()
+                                                          for valor in valores]))
+
+    # Expressões: cada operador recebe os valores já avaliados dos operandos
+
+    def constante(self, no):
+        return np.bool_(no.valor) if type(no.valor) is bool else np.int64(no.valor)
+
+    def nao(self, no, ativas, operando):
+        return np.logical_not(operando)
+
+    def menos_unario(self, no, ativas, operando):
+        self.marca_estouro(ativas & (operando == MINIMO))
+        return np.negative(operando)
+
+    def ou(self, no, ativas, esquerda, direita): # A direita só foi avaliada nas pistas em que a esquerda é false
+        return esquerda | direita
+
+    def e(self, no, ativas, esquerda, direita): # A direita só foi avaliada nas pistas em que a esquerda é true
+        return esquerda & direita
+
+    def soma(self, no, ativas, a, b):
+        resultado = np.add(a, b)
+        self.marca_estouro(ativas & (((a ^ resultado) & (b ^ resultado)) < 0))
+        return resultado
+
+    def subtracao(self, no, ativas, a, b):
+        resultado = np.subtract(a, b)
+        self.marca_estouro(ativas & (((a ^ b) & (a ^ resultado)) < 0))
+        return resultado
+
+    def multiplicacao(self, no, ativas, a, b):
+        # Estimativa em ponto flutuante, com folga: pistas perto do limite também são refeitas
+        self.marca_estouro(ativas & (np.abs(np.multiply(a, b, dtype=np.float64)) >= 2.0 ** 62))
+        return np.multiply(a, b)
+
+    def divisao(self, no, ativas, a, b): # div do Pascal: trunca em direção a zero
+        zero = ativas & self.vivas & (b == 0)
+        if zero.any():
+            self.erro(zero, ErroExecucao("divisão por zero", no.linha))
+        self.marca_estouro(ativas & (a == MINIMO) & (b == -1))
+        b = np.where(b == 0, 1, b) # Divisor qualquer nas pistas que não contam
+        quociente, resto = np.divmod(a, b)
+        return quociente + ((resto != 0) & ((a < 0) != (b < 0))) # // arredonda para baixo
+
+    def comparacao(self, operacao): # Operador relacional
+        def compara(no, ativas, a, b):
+            return operacao(a, b)
+        return compara
+
+    def marca_estouro(self, pistas):
+        if pistas.any():
+            self.estouro(pistas)
+
+def constantes_cabem(no): # True se todas as constantes inteiras do comando cabem no int64
+    pendentes = [no]
+    while pendentes:
+        no = pendentes.pop()
+        if no is None:
+            continue
+        if isinstance(no, arvore.Numero) and not MINIMO <= no.valor <= MAXIMO:
+            return False
+        pendentes.extend(no.filhos())
+    return True
+
+def executa_lote(programa, entradas, limite_instrucoes=None): # Executa o programa sobre cada entrada
+    # entradas: lista com a entrada de cada pista, em texto ou como lista de valores
+    return ExecutorLote(programa, entradas, limite_instrucoes).executa()
@@ -64,7 +64,15 @@
 import re
 import types
 import sys
+import os
 import inspect
+import tempfile
+import threading
+from functools import partial
+
+# Version of the parsetab file format.  Tables written with a different
+# version are ignored and regenerated.
+__tabversion__ = '2022.10.27-2'
 
 #-----------------------------------------------------------------------------
 #                     === User configurable parameters ===
@@ -76,6 +84,7 @@ yaccdebug   = False            # Debugging mode.  If set, yacc generates a
                                # a 'parser.out' file in the current directory
 
 debug_file  = 'parser.out'     # Default name of the debugging file
+tab_module  = 'parsetab'       # Default name of the table module
 error_count = 3                # Number of symbols that must be shifted to leave recovery mode
 resultlimit = 40               # Size limit of results when running in debug mode.
 
@@ -116,6 +125,10 @@ class NullLogger(object):
 class YaccError(Exception):
     pass
 
+# Exception raised when a table file was written by a different version of yacc
+class VersionError(YaccError):
+    pass
+
 # Format the result message that the parser produces when running in debug mode.
 def format_result(r):
     repr_str = repr(r)
@@ -175,6 +188,7 @@ class YaccProduction:
         self.stack = stack
         self.lexer = None
         self.parser = None
+        self.context = None
 
     def __getitem__(self, n):
         if isinstance(n, slice):
@@ -221,17 +235,26 @@ class YaccProduction:
 # -----------------------------------------------------------------------------
 #                               == LRParser ==
 #
-# The LR Parsing engine.
+# The LR Parsing engine.  An LRParser only holds the parsing tables, which are
+# never written while parsing.  The state of each call to parse() lives in its
+# own ParseFrame, so any number of parses can share one LRParser at the same
+# time, in one or several threads, without locking.
 # -----------------------------------------------------------------------------
 
-class LRParser:
-    def __init__(self, lrtab, errorf):
-        self.productions = lrtab.lr_productions
-        self.action = lrtab.lr_action
-        self.goto = lrtab.lr_goto
-        self.errorfunc = errorf
-        self.set_defaulted_states()
+# The state of one call to LRParser.parse(): the state and symbol stacks, the
+# current state (as seen by the grammar rules and p_error()), the error recovery
+# flag and the token function of the lexer.
+class ParseFrame:
+    __slots__ = ('statestack', 'symstack', 'state', 'errorok', 'token')
+
+    def __init__(self):
+        sym = YaccSymbol()
+        sym.type = '$end'
+        self.statestack = [0]               # Stack of parsing states
+        self.symstack = [sym]               # Stack of grammar symbols
+        self.state = 0
         self.errorok = True
+        self.token = None
 
     def errok(self):
         self.errorok = True
@@ -244,6 +267,89 @@ class LRParser:
         self.symstack.append(sym)
         self.statestack.append(0)
 
+# Returns True if the error function takes the parse context as a second argument,
+# that is, if it is declared as p_error(p, context)
+def error_func_takes_context(errorf):
+    if errorf is None:
+        return False
+    ismethod = 1 if isinstance(errorf, types.MethodType) else 0
+    return errorf.__code__.co_argcount - ismethod == 2
+
+class LRParser:
+    def __init__(self, lrtab, errorf):
+        self.productions = lrtab.lr_productions
+        self.terminals = lrtab.lr_terminals
+        self.nonterminals = lrtab.lr_nonterminals
+        self.termids = {name: i for i, name in enumerate(self.terminals)}
+        ntids = {name: i for i, name in enumerate(self.nonterminals)}
+        self.prodgoto = [ntids.get(p.name, -1) for p in self.productions]
+        self.action_base = lrtab.lr_action_base
+        self.action_check = lrtab.lr_action_check
+        self.action_value = lrtab.lr_action_value
+        self.goto_base = lrtab.lr_goto_base
+        self.goto_check = lrtab.lr_goto_check
+        self.goto_value = lrtab.lr_goto_value
+        self.lr_defaulted = lrtab.lr_defaulted
+        self._action = lrtab.lr_action
+        self._goto = lrtab.lr_goto
+        self.errorfunc = errorf
+        self.errorcontext = error_func_takes_context(errorf)
+        self.set_defaulted_states()
+        self.frames = threading.local()     # Frames of the parses running in each thread
+
+    # The action and goto tables as dicts keyed by state and then by symbol name,
+    # decoded from the packed vectors the first time they are asked for.  The
+    # parsing engine itself only uses the packed vectors.
+    @property
+    def action(self):
+        if self._action is None:
+            self._action = self._unpack(self.action_base, self.action_check, self.action_value, self.terminals)
+        return self._action
+
+    @property
+    def goto(self):
+        if self._goto is None:
+            self._goto = self._unpack(self.goto_base, self.goto_check, self.goto_value, self.nonterminals)
+        return self._goto
+
+    @staticmethod
+    def _unpack(base, check, value, names):
+        table = {}
+        for st, b in enumerate(base):
+            table[st] = {name: value[b + i] for i, name in enumerate(names) if check[b + i] == st}
+        return table
+
+    # The frame of the innermost parse running in the calling thread.  errok(),
+    # restart() and the statestack, symstack, state, token and errorok attributes
+    # refer to it, so a grammar rule or p_error() that uses them acts on its own
+    # parse.
+    @property
+    def frame(self):
+        frames = getattr(self.frames, 'stack', None)
+        if not frames:
+            raise AttributeError('no parse is running in this thread')
+        return frames[-1]
+
+    # The frames of the parses running in the calling thread, innermost last
+    def framestack(self):
+        try:
+            return self.frames.stack
+        except AttributeError:
+            frames = self.frames.stack = []
+            return frames
+
+    statestack = property(lambda self: self.frame.statestack)
+    symstack = property(lambda self: self.frame.symstack)
+    state = property(lambda self: self.frame.state)
+    token = property(lambda self: self.frame.token)
+    errorok = property(lambda self: self.frame.errorok)
+
+    def errok(self):
+        self.frame.errok()
+
+    def restart(self):
+        self.frame.restart()
+
     # Defaulted state support.
     # This method identifies parser states where there is only one possible reduction action.
     # For such states, the parser can make a choose to make a rule reduction without consuming
@@ -252,14 +358,16 @@ class LRParser:
     # each other or change states (i.e., manipulation of scope, lexer states, etc.).
     #
     # See:  http://www.gnu.org/software/bison/manual/html_node/Default-Reductions.html#Default-Reductions
+    #
+    # The table builder records the reduction of each defaulted state (LRTable.lr_defaulted);
+    # defaulted_states maps those states to their reductions, and the parsing engine uses the
+    # same information as a list indexed by state, with None for the other states.
     def set_defaulted_states(self):
-        self.defaulted_states = {}
-        for state, actions in self.action.items():
-            rules = list(actions.values())
-            if len(rules) == 1 and rules[0] < 0:
-                self.defaulted_states[state] = rules[0]
+        self.defaulted = list(self.lr_defaulted)
+        self.defaulted_states = {state: rule for state, rule in enumerate(self.defaulted) if rule is not None}
 
     def disable_defaulted_states(self):
+        self.defaulted = [None] * len(self.lr_defaulted)
         self.defaulted_states = {}
 
     # parse().
@@ -269,52 +377,110 @@ class LRParser:
     # see the various rule reductions and parsing steps.  tracking turns on position
     # tracking.  In this mode, symbols will record the starting/ending line number and
     # character index.
+    #
+    # context is an arbitrary object owned by the caller (a symbol table, a list of
+    # diagnostics, ...).  It is made available to the grammar rules as p.context and
+    # is passed to p_error() as a second argument when p_error() accepts one, so
+    # several parses with different contexts can share one parser.
+    #
+    # tokens is an optional token source used instead of calling lexer.token():
+    # either any iterable of tokens (a list, a generator, a filtered or cached
+    # stream, ...) or the columnar arrays of lex.Lexer.tokenize_all().  Tokens are
+    # then pulled without a Python call per token, and the lexer, if given, is only
+    # made available to the grammar rules and p_error() as p.lexer.
+    #
+    # The parse state is kept in a new ParseFrame, pushed on the frames of the
+    # calling thread while the parse runs (a grammar rule may itself call parse()).
+    #
+    # parseframe() is the engine itself, written as a generator.  In push mode
+    # (see PushParser) it yields whenever it needs the next token, which is sent
+    # back to it; otherwise it never yields, and the first next() runs the whole
+    # parse and returns its result in StopIteration.
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False, context=None, tokens=None):
+        frames = self.framestack()
+        frame = ParseFrame()
+        frames.append(frame)
+        try:
+            next(self.parseframe(frame, input, lexer, debug, tracking, context, tokens))
+        except StopIteration as e:
+            return e.value
+        finally:
+            frames.pop()
 
-    def parse(self, input=None, lexer=None, debug=False, tracking=False):
+    def push_parser(self, lexer=None, debug=False, tracking=False, context=None):
+        return PushParser(self, lexer, debug, tracking, context)
+
+    def parseframe(self, frame, input, lexer, debug, tracking, context, tokens=None, push=False):
         # If debugging has been specified as a flag, turn it into a logging object
         if isinstance(debug, int) and debug:
             debug = PlyLogger(sys.stderr)
 
         lookahead = None                         # Current lookahead symbol
+        ltid = 0                                 # Terminal id of the lookahead symbol
         lookaheadstack = []                      # Stack of lookahead symbols
-        actions = self.action                    # Local reference to action table (to avoid lookup on self.)
-        goto    = self.goto                      # Local reference to goto table (to avoid lookup on self.)
+        termid  = self.termids.get               # Terminal ids by name
+        nterms  = len(self.terminals)            # Terminal id of token types the grammar doesn't know
+        errorid = termid('error')                # Terminal id of the error symbol
+        abase   = self.action_base               # Local references to the packed action table
+        acheck  = self.action_check              # (see LRTable.compress_tables(), to avoid lookup on self.)
+        avalue  = self.action_value
+        gbase   = self.goto_base                 # Local references to the packed goto table
+        gvalue  = self.goto_value
         prod    = self.productions               # Local reference to production list (to avoid lookup on self.)
-        defaulted_states = self.defaulted_states # Local reference to defaulted states
+        prodgoto = self.prodgoto                 # Nonterminal id of each production
+        defaulted = self.defaulted               # Reduction of each defaulted state, or None
         pslice  = YaccProduction(None)           # Production object passed to grammar rules
         errorcount = 0                           # Used during error recovery
 
         if debug:
             debug.info('PLY: PARSE DEBUG START')
 
-        # If no lexer was given, we will try to use the lex module
-        if not lexer:
+        # If no lexer or token source was given, we will try to use the lex module
+        if not lexer and tokens is None and not push:
             from . import lex
             lexer = lex.lexer
 
         # Set up the lexer and parser objects on pslice
         pslice.lexer = lexer
         pslice.parser = self
+        pslice.context = context
 
         # If input was supplied, pass to lexer
         if input is not None:
+            if tokens is not None:
+                raise ValueError('input and tokens cannot both be given')
             lexer.input(input)
 
-        # Set the token function
-        get_token = self.token = lexer.token
+        # Set the token function, or the columns the tokens are read from
+        columns = None
+        if push:
+            get_token = None                # Tokens are sent to the generator
+        elif tokens is None:
+            get_token = lexer.token
+        elif hasattr(tokens, 'typenames'):
+            # Columnar tokens: the terminal id of each token type is looked up
+            # once and the tokens are read straight from the arrays
+            columns = tokens
+            get_token = None
+            tnames = columns.typenames
+            tids = [termid(name, nterms) for name in tnames]
+            ttypes = columns.types
+            tvalues = columns.values
+            tvaluetable = columns.valuetable
+            tlineno = columns.lineno
+            tlexpos = columns.lexpos
+            ntokens = len(ttypes)
+            position = 0
+        else:
+            get_token = partial(next, iter(tokens), None)
+        frame.token = get_token
 
-        # Set up the state and symbol stacks
-        statestack = self.statestack = []   # Stack of parsing states
-        symstack = self.symstack = []       # Stack of grammar symbols
+        # The state and symbol stacks of the frame start with the start state (0,$end)
+        statestack = frame.statestack       # Stack of parsing states
+        symstack = frame.symstack           # Stack of grammar symbols
         pslice.stack = symstack             # Put in the production
         errtoken   = None                   # Err token
-
-        # The start state is assumed to be (0,$end)
-
-        statestack.append(0)
-        sym = YaccSymbol()
-        sym.type = '$end'
-        symstack.append(sym)
         state = 0
         while True:
             # Get the next symbol on the input.  If a lookahead symbol
@@ -324,21 +490,39 @@ class LRParser:
             if debug:
                 debug.debug('State  : %s', state)
 
-            if state not in defaulted_states:
+            t = defaulted[state]
+            if t is None:
                 if not lookahead:
-                    if not lookaheadstack:
-                        lookahead = get_token()     # Get the next token
-                    else:
+                    if lookaheadstack:
                         lookahead = lookaheadstack.pop()
-                    if not lookahead:
+                        ltid = termid(lookahead.type, nterms)
+                    elif columns is None:
+                        # Get the next token, or wait for it in push mode
+                        lookahead = get_token() if get_token is not None else (yield)
+                        if not lookahead:
+                            lookahead = YaccSymbol()
+                            lookahead.type = '$end'
+                        ltid = termid(lookahead.type, nterms)
+                    elif position < ntokens:
+                        code = ttypes[position]
+                        lookahead = YaccSymbol()
+                        lookahead.type = tnames[code]
+                        lookahead.value = tvaluetable[tvalues[position]]
+                        lookahead.lineno = tlineno[position]
+                        lookahead.lexpos = tlexpos[position]
+                        ltid = tids[code]
+                        position += 1
+                    else:
+                        if columns.error is not None:   # The lexer stopped here
+                            raise columns.error
                         lookahead = YaccSymbol()
                         lookahead.type = '$end'
+                        ltid = 0
 
                 # Check the action table
-                ltype = lookahead.type
-                t = actions[state].get(ltype)
+                i = abase[state] + ltid
+                t = avalue[i] if acheck[i] == state else None
             else:
-                t = defaulted_states[state]
                 if debug:
                     debug.debug('Defaulted state %s: Reduce using %d', state, -t)
 
@@ -378,10 +562,10 @@ class LRParser:
                         if plen:
                             debug.info('Action : Reduce rule [%s] with %s and goto state %d', p.str,
                                        '['+','.join([format_stack_entry(_v.value) for _v in symstack[-plen:]])+']',
-                                       goto[statestack[-1-plen]][pname])
+                                       gvalue[gbase[statestack[-1-plen]] + prodgoto[-t]])
                         else:
                             debug.info('Action : Reduce rule [%s] with %s and goto state %d', p.str, [],
-                                       goto[statestack[-1]][pname])
+                                       gvalue[gbase[statestack[-1]] + prodgoto[-t]])
 
                     if plen:
                         targ = symstack[-plen-1:]
@@ -405,13 +589,13 @@ class LRParser:
                         try:
                             # Call the grammar rule with our special slice object
                             del symstack[-plen:]
-                            self.state = state
+                            frame.state = state
                             p.callable(pslice)
                             del statestack[-plen:]
                             if debug:
                                 debug.info('Result : %s', format_result(pslice[0]))
                             symstack.append(sym)
-                            state = goto[statestack[-1]][pname]
+                            state = gvalue[gbase[statestack[-1]] + prodgoto[-t]]
                             statestack.append(state)
                         except SyntaxError:
                             # If an error was set. Enter error recovery state
@@ -422,16 +606,22 @@ class LRParser:
                             sym.type = 'error'
                             sym.value = 'error'
                             lookahead = sym
+                            ltid = errorid
                             errorcount = error_count
-                            self.errorok = False
+                            frame.errorok = False
 
                         continue
 
                     else:
 
                         if tracking:
-                            sym.lineno = lexer.lineno
-                            sym.lexpos = lexer.lexpos
+                            if tokens is None and not push:
+                                sym.lineno = lexer.lineno
+                                sym.lexpos = lexer.lexpos
+                            else:
+                                # No lexer position: use the one of the lookahead token
+                                sym.lineno = getattr(lookahead, 'lineno', 0)
+                                sym.lexpos = getattr(lookahead, 'lexpos', 0)
 
                         targ = [sym]
 
@@ -444,12 +634,12 @@ class LRParser:
 
                         try:
                             # Call the grammar rule with our special slice object
-                            self.state = state
+                            frame.state = state
                             p.callable(pslice)
                             if debug:
                                 debug.info('Result : %s', format_result(pslice[0]))
                             symstack.append(sym)
-                            state = goto[statestack[-1]][pname]
+                            state = gvalue[gbase[statestack[-1]] + prodgoto[-t]]
                             statestack.append(state)
                         except SyntaxError:
                             # If an error was set. Enter error recovery state
@@ -459,8 +649,9 @@ class LRParser:
                             sym.type = 'error'
                             sym.value = 'error'
                             lookahead = sym
+                            ltid = errorid
                             errorcount = error_count
-                            self.errorok = False
+                            frame.errorok = False
 
                         continue
 
@@ -490,22 +681,27 @@ class LRParser:
                 # the user defined p_error() function if this is the
                 # first syntax error.  This function is only called if
                 # errorcount == 0.
-                if errorcount == 0 or self.errorok:
+                if errorcount == 0 or frame.errorok:
                     errorcount = error_count
-                    self.errorok = False
+                    frame.errorok = False
                     errtoken = lookahead
                     if errtoken.type == '$end':
                         errtoken = None               # End of file!
                     if self.errorfunc:
                         if errtoken and not hasattr(errtoken, 'lexer'):
                             errtoken.lexer = lexer
-                        self.state = state
-                        tok = self.errorfunc(errtoken)
-                        if self.errorok:
+                        frame.state = state
+                        if self.errorcontext:
+                            tok = self.errorfunc(errtoken, context)
+                        else:
+                            tok = self.errorfunc(errtoken)
+                        if frame.errorok:
                             # User must have done some kind of panic
                             # mode recovery on their own.  The
                             # returned token is the next lookahead
                             lookahead = tok
+                            if tok:
+                                ltid = termid(tok.type, nterms)
                             errtoken = None
                             continue
                     else:
@@ -567,6 +763,7 @@ class LRParser:
                     t.value = lookahead
                     lookaheadstack.append(lookahead)
                     lookahead = t
+                    ltid = errorid
                 else:
                     sym = symstack.pop()
                     if tracking:
@@ -580,6 +777,56 @@ class LRParser:
             # If we'r here, something really bad happened
             raise RuntimeError('yacc: internal parser error!!!\n')
 
+# -----------------------------------------------------------------------------
+#                               == PushParser ==
+#
+# A parse driven by the caller, created by LRParser.push_parser().  Tokens are
+# pushed with feed() as they become available and finish() marks the end of
+# the input.  The parse keeps its ParseFrame (the LR stacks) between calls and
+# makes every reduction, with its grammar rule and p_error() calls, as soon as
+# the tokens it depends on have been fed, so a rule sees the same input and
+# stacks as in a parse() of the whole token stream.  Like parse(), feed() and
+# finish() may be called from any thread, and any number of push parses may
+# share one LRParser.
+# -----------------------------------------------------------------------------
+
+class PushParser:
+    def __init__(self, parser, lexer=None, debug=False, tracking=False, context=None):
+        self.parser = parser
+        self.frame = ParseFrame()
+        self.engine = parser.parseframe(self.frame, None, lexer, debug, tracking, context, None, True)
+        self.done = False                   # The parse has ended (accepted, abandoned or raised)
+        self.result = None                  # Value returned by the parse
+        self.send(None)                     # Run up to the first token
+
+    # Pushes the next token.  The parse runs until it needs another one
+    def feed(self, tok):
+        if self.done:
+            raise YaccError('the parse has already finished')
+        if not tok:
+            raise ValueError('a token is required; use finish() at the end of the input')
+        self.send(tok)
+
+    # Ends the input and returns the result of the parse
+    def finish(self):
+        while not self.done:
+            self.send(None)
+        return self.result
+
+    def send(self, tok):
+        frames = self.parser.framestack()
+        frames.append(self.frame)
+        try:
+            self.engine.send(tok)
+        except StopIteration as e:
+            self.done = True
+            self.result = e.value
+        except BaseException:
+            self.done = True
+            raise
+        finally:
+            frames.pop()
+
 # -----------------------------------------------------------------------------
 #                          === Grammar Representation ===
 #
@@ -682,6 +929,35 @@ class Production(object):
         if self.func:
             self.callable = pdict[self.func]
 
+# -----------------------------------------------------------------------------
+# class MiniProduction
+#
+# This class is a stripped down version of Production used when the parsing
+# tables are read from a table file.  It only contains the attributes that the
+# parsing engine needs.
+# -----------------------------------------------------------------------------
+
+class MiniProduction(object):
+    def __init__(self, str, name, len, func, file, line):
+        self.name     = name
+        self.len      = len
+        self.func     = func
+        self.callable = None
+        self.file     = file
+        self.line     = line
+        self.str      = str
+
+    def __str__(self):
+        return self.str
+
+    def __repr__(self):
+        return 'MiniProduction(%s)' % self.str
+
+    # Bind the production function name to a callable
+    def bind(self, pdict):
+        if self.func:
+            self.callable = pdict[self.func]
+
 # -----------------------------------------------------------------------------
 # class LRItem
 #
@@ -700,7 +976,8 @@ class Production(object):
 #       lr_next      Next LR item. Example, if we are ' expr -> expr . PLUS term'
 #                    then lr_next refers to 'expr -> expr PLUS . term'
 #       lr_index   - LR item index (location of the ".") in the prod list.
-#       lookaheads - LALR lookahead symbols for this item
+#       lookaheads - LALR lookahead symbols for this item, a bitset of terminals
+#                    for each state (see Grammar.number_terminals())
 #       len        - Length of the production (number of symbols on right hand side)
 #       lr_after    - List of all productions that immediately follow
 #       lr_before   - Grammar symbol immediately before
@@ -741,6 +1018,20 @@ def rightmost_terminal(symbols, terminals):
         i -= 1
     return None
 
+# -----------------------------------------------------------------------------
+# bitset_names()
+#
+# Returns the names of the symbols in a bitset, where bit i stands for names[i],
+# in increasing order of i.
+# -----------------------------------------------------------------------------
+def bitset_names(bits, names):
+    result = []
+    while bits:
+        low = bits & -bits
+        result.append(names[low.bit_length() - 1])
+        bits ^= low
+    return result
+
 # -----------------------------------------------------------------------------
 #                           === GRAMMAR CLASS ===
 #
@@ -779,6 +1070,15 @@ class Grammar(object):
 
         self.Follow       = {}      # A dictionary of precomputed FOLLOW(x) symbols
 
+        self.Termnames    = []      # Terminal names by number, with '$end' as 0 (see number_terminals)
+
+        self.Termbits     = {}      # A dictionary mapping terminal names to their bit (1 << number)
+
+        self.FirstBits    = {}      # FIRST(x) and FOLLOW(x) as bitsets of terminals
+        self.FollowBits   = {}
+
+        self.Nullable     = set()   # Nonterminals that can derive the empty string
+
         self.Precedence   = {}      # Precedence rules for each terminal. Contains tuples of the
                                     # form ('right',level) or ('nonassoc', level) or ('left',level)
 
@@ -788,6 +1088,9 @@ class Grammar(object):
 
         self.Start = None           # Starting symbol for the grammar
 
+        self.Passthrough = set()    # Numbers of the unit productions whose action only passes
+                                    # the value along (p[0] = p[1]).  Their reductions are
+                                    # removed from the tables (see LRTable.eliminate_unit_rules).
 
     def __len__(self):
         return len(self.Productions)
@@ -921,6 +1224,29 @@ class Grammar(object):
         self.Nonterminals[start].append(0)
         self.Start = start
 
+    # -----------------------------------------------------------------------------
+    # set_passthrough()
+    #
+    # Marks unit productions as pass-through.  Each entry is a rule written as in
+    # a docstring, such as 'expr : term', with a single nonterminal on the right
+    # hand side.  The action of a pass-through production must only copy the value
+    # (p[0] = p[1]), since the parser will no longer call it.
+    # -----------------------------------------------------------------------------
+
+    def set_passthrough(self, entries):
+        for entry in entries:
+            prodname, _, rhs = entry.partition(':')
+            prodname = prodname.strip()
+            syms = rhs.split()
+            for p in self.Prodnames.get(prodname, []):
+                if list(p.prod) == syms:
+                    break
+            else:
+                raise GrammarError('Pass-through rule %r is not a rule of the grammar' % entry)
+            if len(syms) != 1 or syms[0] not in self.Nonterminals:
+                raise GrammarError('Pass-through rule %r must have a single nonterminal on the right' % entry)
+            self.Passthrough.add(p.number)
+
     # -----------------------------------------------------------------------------
     # find_unreachable()
     #
@@ -1072,77 +1398,76 @@ class Grammar(object):
 
         return unused
 
+    # -------------------------------------------------------------------------
+    # number_terminals()
+    #
+    # Numbers the terminals, with '$end' as 0 and the others in sorted order.
+    # Sets of terminals are then Python ints used as bit vectors, with bit i
+    # set for terminal i (see bitset_names()).
+    # -------------------------------------------------------------------------
+    def number_terminals(self):
+        if not self.Termnames:
+            self.Termnames = ['$end'] + sorted(t for t in self.Terminals if t != '$end')
+            self.Termbits = {t: 1 << i for i, t in enumerate(self.Termnames)}
+        return self.Termbits
+
     # -------------------------------------------------------------------------
     # _first()
     #
     # Compute the value of FIRST1(beta) where beta is a tuple of symbols.
+    # Returns the terminals as a bitset and whether beta can derive empty.
     #
     # During execution of compute_first1, the result may be incomplete.
     # Afterward (e.g., when called from compute_follow()), it will be complete.
     # -------------------------------------------------------------------------
     def _first(self, beta):
-
-        # We are computing First(x1,x2,x3,...,xn)
-        result = []
+        result = 0
         for x in beta:
-            x_produces_empty = False
-
-            # Add all the non-<empty> symbols of First[x] to the result.
-            for f in self.First[x]:
-                if f == '<empty>':
-                    x_produces_empty = True
-                else:
-                    if f not in result:
-                        result.append(f)
-
-            if x_produces_empty:
-                # We have to consider the next x in beta,
-                # i.e. stay in the loop.
-                pass
-            else:
-                # We don't have to consider any further symbols in beta.
-                break
-        else:
-            # There was no 'break' from the loop,
-            # so x_produces_empty was true for all x in beta,
-            # so beta produces empty as well.
-            result.append('<empty>')
-
-        return result
+            result |= self.FirstBits[x]
+            if x not in self.Nullable:
+                return result, False
+        return result, True
 
     # -------------------------------------------------------------------------
     # compute_first()
     #
-    # Compute the value of FIRST1(X) for all symbols
+    # Compute the value of FIRST1(X) for all symbols.  The sets are kept as
+    # bitsets in FirstBits, with the nullable nonterminals in Nullable, and
+    # First has the same sets as lists of names, with '<empty>' for the
+    # nullable nonterminals.
     # -------------------------------------------------------------------------
     def compute_first(self):
         if self.First:
             return self.First
 
         # Terminals:
-        for t in self.Terminals:
-            self.First[t] = [t]
-
-        self.First['$end'] = ['$end']
+        self.FirstBits = dict(self.number_terminals())
 
         # Nonterminals:
 
         # Initialize to the empty set:
         for n in self.Nonterminals:
-            self.First[n] = []
+            self.FirstBits[n] = 0
 
         # Then propagate symbols until no change:
         while True:
             some_change = False
-            for n in self.Nonterminals:
-                for p in self.Prodnames[n]:
-                    for f in self._first(p.prod):
-                        if f not in self.First[n]:
-                            self.First[n].append(f)
-                            some_change = True
+            for p in self.Productions[1:]:
+                bits, empty = self._first(p.prod)
+                if bits & ~self.FirstBits[p.name]:
+                    self.FirstBits[p.name] |= bits
+                    some_change = True
+                if empty and p.name not in self.Nullable:
+                    self.Nullable.add(p.name)
+                    some_change = True
             if not some_change:
                 break
 
+        for x, bits in self.FirstBits.items():
+            self.First[x] = bitset_names(bits, self.Termnames)
+            if x in self.Nullable:
+                self.First[x].append('<empty>')
+
         return self.First
 
     # ---------------------------------------------------------------------
@@ -1150,7 +1475,8 @@ class Grammar(object):
     #
     # Computes all of the follow sets for every non-terminal symbol.  The
     # follow set is the set of all symbols that might follow a given
-    # non-terminal.  See the Dragon book, 2nd Ed. p. 189.
+    # non-terminal.  See the Dragon book, 2nd Ed. p. 189.  The sets are
+    # computed as bitsets, kept in FollowBits, and Follow has them as lists.
     # ---------------------------------------------------------------------
     def compute_follow(self, start=None):
         # If already computed, return the result
@@ -1162,37 +1488,38 @@ class Grammar(object):
             self.compute_first()
 
         # Add '$end' to the follow list of the start symbol
+        follow = self.FollowBits
         for k in self.Nonterminals:
-            self.Follow[k] = []
+            follow[k] = 0
 
         if not start:
             start = self.Productions[1].name
 
-        self.Follow[start] = ['$end']
+        follow[start] = self.Termbits['$end']
+
+        # Each nonterminal B in a production A -> alpha B beta gets FIRST(beta),
+        # and FOLLOW(A) too if beta can derive empty.  FIRST(beta) doesn't
+        # change, so it is computed once.
+        edges = []
+        for p in self.Productions[1:]:
+            for i, B in enumerate(p.prod):
+                if B in self.Nonterminals:
+                    bits, empty = self._first(p.prod[i+1:])
+                    follow[B] |= bits
+                    if empty and p.name != B:
+                        edges.append((p.name, B))
 
         while True:
             didadd = False
-            for p in self.Productions[1:]:
-                # Here is the production set
-                for i, B in enumerate(p.prod):
-                    if B in self.Nonterminals:
-                        # Okay. We got a non-terminal in a production
-                        fst = self._first(p.prod[i+1:])
-                        hasempty = False
-                        for f in fst:
-                            if f != '<empty>' and f not in self.Follow[B]:
-                                self.Follow[B].append(f)
-                                didadd = True
-                            if f == '<empty>':
-                                hasempty = True
-                        if hasempty or i == (len(p.prod)-1):
-                            # Add elements of follow(a) to follow(b)
-                            for f in self.Follow[p.name]:
-                                if f not in self.Follow[B]:
-                                    self.Follow[B].append(f)
-                                    didadd = True
+            for A, B in edges:
+                if follow[A] & ~follow[B]:
+                    follow[B] |= follow[A]
+                    didadd = True
             if not didadd:
                 break
+
+        for k, bits in follow.items():
+            self.Follow[k] = bitset_names(bits, self.Termnames)
         return self.Follow
 
 
@@ -1260,7 +1587,7 @@ class Grammar(object):
 #
 # Inputs:  X    - An input set
 #          R    - A relation
-#          FP   - Set-valued function
+#          FP   - Set-valued function, returning bitsets
 # ------------------------------------------------------------------------------
 
 def digraph(X, R, FP):
@@ -1285,9 +1612,7 @@ def traverse(x, N, stack, F, X, R, FP):
         if N[y] == 0:
             traverse(y, N, stack, F, X, R, FP)
         N[x] = min(N[x], N[y])
-        for a in F.get(y, []):
-            if a not in F[x]:
-                F[x].append(a)
+        F[x] |= F.get(y, 0)
     if N[x] == d:
         N[stack[-1]] = MAXINT
         F[stack[-1]] = F[x]
@@ -1300,17 +1625,88 @@ def traverse(x, N, stack, F, X, R, FP):
 class LALRError(YaccError):
     pass
 
+# -----------------------------------------------------------------------------
+# pack_rows()
+#
+# Packs the sparse rows of a table into a single vector by row displacement
+# (a comb vector).  rows is a list of {column: value} dicts, one per state.
+# Each row gets an offset base[state] such that its entries land on free slots
+# of value, so that row[col] is value[base[state] + col], and check[i] records
+# the state that owns slot i.  A lookup for a column that the row doesn't have
+# finds check[i] != state.  Rows are placed largest first, at the lowest offset
+# that fits, and the vectors are padded so that base[state] + col is always a
+# valid index for col < ncols.  The search jumps between the free slots for the
+# first column of the row, and rows with the same columns resume where the
+# previous one was placed, since the slots before it are still taken.
+# -----------------------------------------------------------------------------
+
+def pack_rows(rows, ncols):
+    base = [0] * len(rows)
+    check = []
+    value = []
+    taken = bytearray()               # taken[i] is 1 if slot i is used
+    tried = {}                        # columns of a row -> lowest offset not yet tried for them
+    for st in sorted(range(len(rows)), key=lambda st: -len(rows[st])):
+        row = sorted(rows[st].items())
+        if not row:
+            continue
+        first = row[0][0]
+        cols = tuple(col - first for col, v in row[1:])
+        i = tried.get((first, cols), 0) + first
+        while True:
+            # Next free slot for the first column, then check the others
+            j = taken.find(0, i)
+            i = j if j >= 0 else max(i, len(taken))
+            if i + ncols > len(taken):
+                taken.extend(bytes(i + ncols - len(taken)))
+            for col in cols:
+                if taken[i + col]:
+                    break
+            else:
+                break
+            i += 1
+        b = i - first
+        tried[(first, cols)] = b + 1
+        need = b + row[-1][0] + 1 - len(check)
+        if need > 0:
+            check.extend([-1] * need)
+            value.extend([None] * need)
+        for col, v in row:
+            check[b + col] = st
+            value[b + col] = v
+            taken[b + col] = 1
+        base[st] = b
+    need = max(base, default=0) + ncols - len(check)
+    if need > 0:
+        check.extend([-1] * need)
+        value.extend([None] * need)
+    return base, check, value
 
 # -----------------------------------------------------------------------------
 #                             == LRTable ==
 #
-# This class implements the LR table generation algorithm.  There are no
-# public methods.
+# This class implements the LR table generation algorithm.  The only public
+# methods are read_table() and write_table(), which load and save the tables
+# built for a grammar.  An LRTable created without a grammar is empty and is
+# meant to be filled in by read_table().  The tables are built as dicts keyed
+# by symbol name (lr_action, lr_goto) and then packed into integer-indexed
+# vectors (see compress_tables()), which is what the parsing engine uses and
+# what the table files store.
 # -----------------------------------------------------------------------------
 
 class LRTable:
-    def __init__(self, grammar, log=None):
+    def __init__(self, grammar=None, log=None):
         self.grammar = grammar
+        if grammar is None:
+            self.lr_action = None
+            self.lr_goto = None
+            self.lr_productions = None
+            self.lr_terminals = None
+            self.lr_nonterminals = None
+            self.lr_action_base = self.lr_action_check = self.lr_action_value = None
+            self.lr_goto_base = self.lr_goto_check = self.lr_goto_value = None
+            self.lr_defaulted = None
+            return
 
         # Set up the logger
         if not log:
@@ -1321,10 +1717,8 @@ class LRTable:
         self.lr_action     = {}        # Action table
         self.lr_goto       = {}        # Goto table
         self.lr_productions  = grammar.Productions    # Copy of grammar Production array
-        self.lr_goto_cache = {}        # Cache of computed gotos
-        self.lr0_cidhash   = {}        # Cache of closures
-
-        self._add_count    = 0         # Internal counter used to detect cycles
+        self.lr0_kernels   = {}        # Kernel of each LR(0) set -> set number
+        self.lr0_trans     = []        # LR(0) transitions, set number -> {symbol: set number}
 
         # Diagnostic information filled in by the table generator
         self.sr_conflict   = 0
@@ -1339,100 +1733,157 @@ class LRTable:
         self.grammar.compute_first()
         self.grammar.compute_follow()
         self.lr_parse_table()
+        self.compress_tables()
 
     # Bind all production function names to callable objects in pdict
     def bind_callables(self, pdict):
         for p in self.lr_productions:
             p.bind(pdict)
 
+    # -----------------------------------------------------------------------------
+    # read_table()
+    #
+    # Loads the parsing tables from a table module written by write_table() and
+    # returns the grammar signature that was recorded with them.  Raises
+    # ImportError if the module does not exist and VersionError if it was
+    # written by a different version of yacc.
+    # -----------------------------------------------------------------------------
+
+    def read_table(self, module):
+        if isinstance(module, types.ModuleType):
+            parsetab = module
+        else:
+            import importlib
+            parsetab = importlib.import_module(module)
+
+        if getattr(parsetab, '_tabversion', None) != __tabversion__:
+            raise VersionError('yacc table file version is out of date')
+
+        self.lr_action = None
+        self.lr_goto = None
+        self.lr_terminals = parsetab._lr_terminals
+        self.lr_nonterminals = parsetab._lr_nonterminals
+        self.lr_action_base = parsetab._lr_action_base
+        self.lr_action_check = parsetab._lr_action_check
+        self.lr_action_value = parsetab._lr_action_value
+        self.lr_goto_base = parsetab._lr_goto_base
+        self.lr_goto_check = parsetab._lr_goto_check
+        self.lr_goto_value = parsetab._lr_goto_value
+        self.lr_defaulted = parsetab._lr_defaulted
+
+        self.lr_productions = []
+        for p in parsetab._lr_productions:
+            self.lr_productions.append(MiniProduction(*p))
+
+        return parsetab._lr_signature
+
+    # -----------------------------------------------------------------------------
+    # write_table()
+    #
+    # Writes the packed LR parsing tables (see compress_tables()) and the
+    # productions to a Python module.  The module is written to
+    # a temporary file and then renamed over the final one, so several processes
+    # building the tables at the same time never see a partially written file.
+    # The temporary file has a unique name (mkstemp), so threads of one process
+    # do not share it either, and it is removed if writing fails.
+    # -----------------------------------------------------------------------------
+
+    def write_table(self, tabmodule, outputdir='', signature=''):
+        if isinstance(tabmodule, types.ModuleType):
+            raise IOError("Won't overwrite existing tabmodule")
+
+        basemodulename = tabmodule.split('.')[-1]
+        filename = os.path.join(outputdir, basemodulename) + '.py'
+
+        fd, tmpname = tempfile.mkstemp(dir=os.path.dirname(filename) or os.curdir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write('''
+# %s
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = %r
+
+_lr_method = %r
+
+_lr_signature = %r
+''' % (os.path.basename(filename), __tabversion__, 'LALR', signature))
+
+                for name in ('terminals', 'nonterminals', 'action_base', 'action_check', 'action_value',
+                             'goto_base', 'goto_check', 'goto_value', 'defaulted'):
+                    f.write('_lr_%s = %r\n' % (name, getattr(self, 'lr_' + name)))
+
+                # Write production table
+                f.write('_lr_productions = [\n')
+                for p in self.lr_productions:
+                    if p.func:
+                        f.write('  (%r,%r,%d,%r,%r,%d),\n' % (p.str, p.name, p.len,
+                                                              p.func, os.path.basename(p.file), p.line))
+                    else:
+                        f.write('  (%r,%r,%d,None,None,None),\n' % (str(p), p.name, p.len))
+                f.write(']\n')
+            os.chmod(tmpname, 0o644)    # mkstemp makes the file readable by its owner only
+            os.replace(tmpname, filename)
+        except BaseException:
+            os.remove(tmpname)
+            raise
+
     # Compute the LR(0) closure operation on I, where I is a set of LR(0) items.
+    # The nonterminals whose productions were already added are kept in a bitset.
 
     def lr0_closure(self, I):
-        self._add_count += 1
-
-        # Add everything in I to J
+        ntbits = self.lr0_ntbits
         J = I[:]
-        didadd = True
-        while didadd:
-            didadd = False
-            for j in J:
-                for x in j.lr_after:
-                    if getattr(x, 'lr0_added', 0) == self._add_count:
-                        continue
+        added = 0
+        for j in J:
+            if j.lr_after:
+                bit = ntbits[j.lr_after[0].name]
+                if not added & bit:
                     # Add B --> .G to J
-                    J.append(x.lr_next)
-                    x.lr0_added = self._add_count
-                    didadd = True
-
+                    added |= bit
+                    J.extend([x.lr_next for x in j.lr_after])
         return J
 
-    # Compute the LR(0) goto function goto(I,X) where I is a set
-    # of LR(0) items and X is a grammar symbol.   This function is written
-    # in a way that guarantees uniqueness of the generated goto sets
-    # (i.e. the same goto set will never be returned as two different Python
-    # objects).  With uniqueness, we can later do fast set comparisons using
-    # id(obj) instead of element-wise comparison.
-
-    def lr0_goto(self, I, x):
-        # First we look for a previously cached entry
-        g = self.lr_goto_cache.get((id(I), x))
-        if g:
-            return g
-
-        # Now we generate the goto set in a way that guarantees uniqueness
-        # of the result
-
-        s = self.lr_goto_cache.get(x)
-        if not s:
-            s = {}
-            self.lr_goto_cache[x] = s
-
-        gs = []
-        for p in I:
-            n = p.lr_next
-            if n and n.lr_before == x:
-                s1 = s.get(id(n))
-                if not s1:
-                    s1 = {}
-                    s[id(n)] = s1
-                gs.append(n)
-                s = s1
-        g = s.get('$end')
-        if not g:
-            if gs:
-                g = self.lr0_closure(gs)
-                s['$end'] = g
-            else:
-                s['$end'] = gs
-        self.lr_goto_cache[(id(I), x)] = g
-        return g
+    # Compute the LR(0) sets of items.  Each set is identified by its kernel,
+    # the items that goto(I,X) advances past X, so a kernel that was already
+    # seen is looked up in lr0_kernels instead of closed again.  The transitions
+    # are recorded in lr0_trans, where lr0_trans[i][X] is the number of the set
+    # goto(C[i],X).
 
-    # Compute the LR(0) sets of item function
     def lr0_items(self):
-        C = [self.lr0_closure([self.grammar.Productions[0].lr_next])]
-        i = 0
-        for I in C:
-            self.lr0_cidhash[id(I)] = i
-            i += 1
+        self.lr0_ntbits = {n: 1 << i for i, n in enumerate(self.grammar.Nonterminals)}
+        kernel = [self.grammar.Productions[0].lr_next]
+        C = [self.lr0_closure(kernel)]
+        self.lr0_kernels = {frozenset(kernel): 0}
+        self.lr0_trans = []
 
         # Loop over the items in C and each grammar symbols
-        i = 0
-        while i < len(C):
-            I = C[i]
-            i += 1
+        for I in C:
+            # Group the items by the symbol after the "."
+            kernels = {}
+            for p in I:
+                if p.lr_index < p.len - 1:
+                    kernels.setdefault(p.prod[p.lr_index+1], []).append(p.lr_next)
 
-            # Collect all of the symbols that could possibly be in the goto(I,X) sets
+            # New sets are numbered in the order in which the symbols appear
+            # in the productions of the items
             asyms = {}
             for ii in I:
                 for s in ii.usyms:
                     asyms[s] = None
 
+            trans = {}
             for x in asyms:
-                g = self.lr0_goto(I, x)
-                if not g or id(g) in self.lr0_cidhash:
+                kernel = kernels.get(x)
+                if not kernel:
                     continue
-                self.lr0_cidhash[id(g)] = len(C)
-                C.append(g)
+                key = frozenset(kernel)
+                j = self.lr0_kernels.get(key)
+                if j is None:
+                    j = self.lr0_kernels[key] = len(C)
+                    C.append(self.lr0_closure(kernel))
+                trans[x] = j
+            self.lr0_trans.append(trans)
 
         return C
 
@@ -1460,27 +1911,13 @@ class LRTable:
     # -----------------------------------------------------------------------------
     # compute_nullable_nonterminals()
     #
-    # Creates a dictionary containing all of the non-terminals that might produce
-    # an empty production.
+    # Returns the set of all of the non-terminals that might produce an empty
+    # production (computed with the FIRST sets).
     # -----------------------------------------------------------------------------
 
     def compute_nullable_nonterminals(self):
-        nullable = set()
-        num_nullable = 0
-        while True:
-            for p in self.grammar.Productions[1:]:
-                if p.len == 0:
-                    nullable.add(p.name)
-                    continue
-                for t in p.prod:
-                    if t not in nullable:
-                        break
-                else:
-                    nullable.add(p.name)
-            if len(nullable) == num_nullable:
-                break
-            num_nullable = len(nullable)
-        return nullable
+        self.grammar.compute_first()
+        return self.grammar.Nullable
 
     # -----------------------------------------------------------------------------
     # find_nonterminal_trans(C)
@@ -1495,13 +1932,10 @@ class LRTable:
 
     def find_nonterminal_transitions(self, C):
         trans = []
-        for stateno, state in enumerate(C):
-            for p in state:
-                if p.lr_index < p.len - 1:
-                    t = (stateno, p.prod[p.lr_index+1])
-                    if t[1] in self.grammar.Nonterminals:
-                        if t not in trans:
-                            trans.append(t)
+        for stateno, state_trans in enumerate(self.lr0_trans):
+            for N in state_trans:
+                if N in self.grammar.Nonterminals:
+                    trans.append((stateno, N))
         return trans
 
     # -----------------------------------------------------------------------------
@@ -1510,24 +1944,21 @@ class LRTable:
     # Computes the DR(p,A) relationships for non-terminal transitions.  The input
     # is a tuple (state,N) where state is a number and N is a nonterminal symbol.
     #
-    # Returns a list of terminals.
+    # Returns a bitset of terminals.
     # -----------------------------------------------------------------------------
 
     def dr_relation(self, C, trans, nullable):
         state, N = trans
-        terms = []
+        termbits = self.grammar.Termbits
+        terms = 0
 
-        g = self.lr0_goto(C[state], N)
-        for p in g:
-            if p.lr_index < p.len - 1:
-                a = p.prod[p.lr_index+1]
-                if a in self.grammar.Terminals:
-                    if a not in terms:
-                        terms.append(a)
+        for a in self.lr0_trans[self.lr0_trans[state][N]]:
+            if a in termbits:
+                terms |= termbits[a]
 
         # This extra bit is to handle the start state
         if state == 0 and N == self.grammar.Productions[0].prod[0]:
-            terms.append('$end')
+            terms |= termbits['$end']
 
         return terms
 
@@ -1539,18 +1970,9 @@ class LRTable:
 
     def reads_relation(self, C, trans, empty):
         # Look for empty transitions
-        rel = []
         state, N = trans
-
-        g = self.lr0_goto(C[state], N)
-        j = self.lr0_cidhash.get(id(g), -1)
-        for p in g:
-            if p.lr_index < p.len - 1:
-                a = p.prod[p.lr_index + 1]
-                if a in empty:
-                    rel.append((j, a))
-
-        return rel
+        j = self.lr0_trans[state][N]
+        return [(j, a) for a in self.lr0_trans[j] if a in empty]
 
     # -----------------------------------------------------------------------------
     # compute_lookback_includes()
@@ -1583,63 +2005,41 @@ class LRTable:
     def compute_lookback_includes(self, C, trans, nullable):
         lookdict = {}          # Dictionary of lookback relations
         includedict = {}       # Dictionary of include relations
+        lr0_trans = self.lr0_trans
+        Productions = self.grammar.Productions
 
-        # Make a dictionary of non-terminal transitions
-        dtrans = {}
-        for t in trans:
-            dtrans[t] = 1
+        # Make a set of non-terminal transitions
+        dtrans = set(trans)
 
         # Loop over all transitions and compute lookbacks and includes
         for state, N in trans:
             lookb = []
             includes = []
             for p in C[state]:
-                if p.name != N:
+                if p.name != N or p.lr_index != 0:
                     continue
 
-                # Okay, we have a name match.  We now follow the production all the way
+                # Okay, we have an item N -> . w.  We now follow the production all the way
                 # through the state machine until we get the . on the right hand side
-
-                lr_index = p.lr_index
+                prod = Productions[p.number].prod
                 j = state
-                while lr_index < p.len - 1:
-                    lr_index = lr_index + 1
-                    t = p.prod[lr_index]
-
+                for lr_index, t in enumerate(prod):
                     # Check to see if this symbol and state are a non-terminal transition
                     if (j, t) in dtrans:
                         # Yes.  Okay, there is some chance that this is an includes relation
                         # the only way to know for certain is whether the rest of the
                         # production derives empty
-
-                        li = lr_index + 1
-                        while li < p.len:
-                            if p.prod[li] in self.grammar.Terminals:
+                        for r in prod[lr_index+1:]:
+                            if r not in nullable:
                                 break      # No forget it
-                            if p.prod[li] not in nullable:
-                                break
-                            li = li + 1
                         else:
                             # Appears to be a relation between (j,t) and (state,N)
                             includes.append((j, t))
 
-                    g = self.lr0_goto(C[j], t)               # Go to next set
-                    j = self.lr0_cidhash.get(id(g), -1)      # Go to next state
+                    j = lr0_trans[j][t]                      # Go to next state
 
-                # When we get here, j is the final state, now we have to locate the production
-                for r in C[j]:
-                    if r.name != p.name:
-                        continue
-                    if r.len != p.len:
-                        continue
-                    i = 0
-                    # This look is comparing a production ". A B C" with "A B C ."
-                    while i < r.lr_index:
-                        if r.prod[i] != p.prod[i+1]:
-                            break
-                        i = i + 1
-                    else:
-                        lookb.append((j, r))
+                # When we get here, j is the final state, where the production is complete
+                lookb.append((j, Productions[p.number].lr_items[-1]))
             for i in includes:
                 if i not in includedict:
                     includedict[i] = []
@@ -1697,19 +2097,15 @@ class LRTable:
     #            followset         -  Computed follow set
     #
     # This function directly attaches the lookaheads to productions contained
-    # in the lookbacks set
+    # in the lookbacks set.  The lookaheads of an item in a state are a bitset.
     # -----------------------------------------------------------------------------
 
     def add_lookaheads(self, lookbacks, followset):
         for trans, lb in lookbacks.items():
+            f = followset.get(trans, 0)
             # Loop over productions in lookback
             for state, p in lb:
-                if state not in p.lookaheads:
-                    p.lookaheads[state] = []
-                f = followset.get(trans, [])
-                for a in f:
-                    if a not in p.lookaheads[state]:
-                        p.lookaheads[state].append(a)
+                p.lookaheads[state] = p.lookaheads.get(state, 0) | f
 
     # -----------------------------------------------------------------------------
     # add_lalr_lookaheads()
@@ -1745,6 +2141,7 @@ class LRTable:
     def lr_parse_table(self):
         Productions = self.grammar.Productions
         Precedence  = self.grammar.Precedence
+        Termnames   = self.grammar.Termnames
         goto   = self.lr_goto         # Goto array
         action = self.lr_action       # Action array
         log    = self.log             # Logger for output
@@ -1780,7 +2177,7 @@ class LRTable:
                             st_actionp['$end'] = p
                         else:
                             # We are at the end of a production.  Reduce!
-                            laheads = p.lookaheads[st]
+                            laheads = bitset_names(p.lookaheads[st], Termnames)
                             for a in laheads:
                                 actlist.append((a, p, 'reduce using rule %d (%s)' % (p.number, p)))
                                 r = st_action.get(a)
@@ -1838,8 +2235,7 @@ class LRTable:
                         i = p.lr_index
                         a = p.prod[i+1]       # Get symbol right after the "."
                         if a in self.grammar.Terminals:
-                            g = self.lr0_goto(I, a)
-                            j = self.lr0_cidhash.get(id(g), -1)
+                            j = self.lr0_trans[st].get(a, -1)
                             if j >= 0:
                                 # We are in a shift state
                                 actlist.append((a, p, 'shift and go to state %d' % j))
@@ -1911,8 +2307,7 @@ class LRTable:
                     if s in self.grammar.Nonterminals:
                         nkeys[s] = None
             for n in nkeys:
-                g = self.lr0_goto(I, n)
-                j = self.lr0_cidhash.get(id(g), -1)
+                j = self.lr0_trans[st].get(n, -1)
                 if j >= 0:
                     st_goto[n] = j
                     log.info('    %-30s shift and go to state %d', n, j)
@@ -1922,6 +2317,515 @@ class LRTable:
             goto[st] = st_goto
             st += 1
 
+        if self.grammar.Passthrough:
+            self.eliminate_unit_rules()
+
+    # -----------------------------------------------------------------------------
+    # eliminate_unit_rules()
+    #
+    # Removes the reductions by the pass-through unit productions A -> B of the
+    # grammar (Grammar.Passthrough) from the finished tables.  Reducing A -> B
+    # on top of state s only replaces the state goto[s][B] by goto[s][A] and keeps
+    # the value, so the parser can be sent to the right state directly:
+    #
+    #   - if goto[s][B] always reduces A -> B (a defaulted state), goto[s][B]
+    #     becomes whatever goto[s][A] becomes;
+    #   - if it reduces A -> B only on some lookaheads, goto[s][B] becomes a new
+    #     state with the actions of goto[s][B], where each of those reductions is
+    #     replaced by the action that goto[s][A] takes on the same lookahead
+    #     (skipping further pass-through reductions), and with the gotos of the
+    #     states whose actions it took.  If those gotos disagree, goto[s][B] is
+    #     left alone.
+    #
+    # New states with the same actions and gotos are shared, and the states that
+    # can no longer be reached are dropped and the others renumbered.  The only
+    # visible difference is that the symbol left on the stack keeps the type B.
+    # -----------------------------------------------------------------------------
+
+    def eliminate_unit_rules(self):
+        action = self.lr_action
+        goto = self.lr_goto
+        units = {-n: self.grammar.Productions[n].name for n in self.grammar.Passthrough}
+        orig_goto = {st: dict(st_goto) for st, st_goto in goto.items()}
+        merged = {}                   # (s, B) -> state that replaces goto[s][B]
+        shared = {}                   # (actions, gotos) of a new state -> state number
+        nstates = len(action)
+
+        def default(st):
+            rules = list(action[st].values())
+            if len(rules) == 1 and rules[0] is not None and rules[0] < 0:
+                return rules[0]
+            return None
+
+        # State that acts and its action on lookahead a, once nonterminal n is
+        # on top of state s, after the pass-through reductions
+        def follow(s, n, a):
+            while True:
+                st = orig_goto[s][n]
+                t = default(st)
+                if t is None:
+                    t = action[st].get(a)
+                if t not in units:
+                    return st, t
+                n = units[t]
+
+        def target(s, n):
+            key = (s, n)
+            if key in merged:
+                return merged[key]
+            st = orig_goto[s][n]
+            t = default(st)
+            if t in units:
+                new = target(s, units[t])
+            elif not any(v in units for v in action[st].values()):
+                new = st
+            else:
+                st_action = {}
+                st_goto = dict(orig_goto.get(st, {}))
+                new = None
+                for a, v in action[st].items():
+                    if v in units:
+                        final, v = follow(s, units[v], a)
+                        for g, j in orig_goto.get(final, {}).items():
+                            if st_goto.setdefault(g, j) != j:
+                                new = st
+                    st_action[a] = v
+                if new is None:
+                    content = (tuple(sorted(st_action.items())), tuple(sorted(st_goto.items())))
+                    new = shared.get(content)
+                    if new is None:
+                        new = shared[content] = len(action)
+                        action[new] = st_action
+                        orig_goto[new] = st_goto
+                        goto[new] = dict(st_goto)
+            merged[key] = new
+            return new
+
+        # Redirect every goto.  New states are appended while this runs, and get
+        # their gotos redirected too.
+        st = 0
+        while st < len(action):
+            st_goto = goto[st]
+            for n in st_goto:
+                st_goto[n] = target(st, n)
+            st += 1
+
+        # Drop the states that can no longer be reached and renumber the others
+        reached = {0}
+        stack = [0]
+        while stack:
+            st = stack.pop()
+            for j in list(action[st].values()) + list(goto[st].values()):
+                if j is not None and j > 0 and j not in reached:
+                    reached.add(j)
+                    stack.append(j)
+        number = {st: i for i, st in enumerate(sorted(reached))}
+        old_action, old_goto = dict(action), dict(goto)
+        action.clear()
+        goto.clear()
+        for st, i in number.items():
+            action[i] = {a: number[v] if v is not None and v > 0 else v for a, v in old_action[st].items()}
+            goto[i] = {n: number[j] for n, j in old_goto[st].items()}
+
+        self.log.info('')
+        self.log.info('Unit rule elimination: %d pass-through rules, %d states added, %d states dropped',
+                      len(units), len(old_action) - nstates, len(old_action) - len(action))
+
+    # -----------------------------------------------------------------------------
+    # compress_tables()
+    #
+    # Numbers the symbols and packs lr_action and lr_goto into integer-indexed
+    # vectors for the parsing engine, so that no symbol name is hashed on a
+    # shift or a reduction:
+    #
+    #   lr_terminals     - terminal names by id, with '$end' as 0.  A token type
+    #                      that isn't in the list gets id len(lr_terminals).
+    #   lr_nonterminals  - nonterminal names by id
+    #   lr_action_base, lr_action_check, lr_action_value
+    #                    - the action table packed by pack_rows().  The action of
+    #                      state s on terminal id a is lr_action_value[i], with
+    #                      i = lr_action_base[s] + a, if lr_action_check[i] == s,
+    #                      and an error otherwise.
+    #   lr_goto_base, lr_goto_check, lr_goto_value
+    #                    - the goto table, packed the same way.  The parser only
+    #                      asks for gotos that exist and doesn't need the check.
+    #   lr_defaulted     - for each state, the reduction it makes without reading
+    #                      a lookahead (the states whose only action is a
+    #                      reduction), or None
+    # -----------------------------------------------------------------------------
+
+    def compress_tables(self):
+        nstates = len(self.lr_action)
+        self.lr_terminals = list(self.grammar.Termnames)
+        self.lr_nonterminals = sorted(self.grammar.Nonterminals)
+        termids = {name: i for i, name in enumerate(self.lr_terminals)}
+        ntids = {name: i for i, name in enumerate(self.lr_nonterminals)}
+
+        rows = [{termids[a]: v for a, v in self.lr_action[st].items() if v is not None} for st in range(nstates)]
+        self.lr_action_base, self.lr_action_check, self.lr_action_value = pack_rows(rows, len(self.lr_terminals) + 1)
+        rows = [{ntids[n]: j for n, j in self.lr_goto[st].items()} for st in range(nstates)]
+        self.lr_goto_base, self.lr_goto_check, self.lr_goto_value = pack_rows(rows, len(self.lr_nonterminals))
+
+        self.lr_defaulted = []
+        for st in range(nstates):
+            rules = list(self.lr_action[st].values())
+            self.lr_defaulted.append(rules[0] if len(rules) == 1 and rules[0] is not None and rules[0] < 0 else None)
+
+# -----------------------------------------------------------------------------
+#                     === Specialized Parser Generation ===
+#
+# write_parser_module() emits a standalone Python module containing a parse
+# loop specialized to the tables of one grammar.  Terminals and nonterminals
+# are mapped to small integers, the action and goto tables become dense lists
+# indexed by those integers, and the p_ functions are bound directly from the
+# module that defines the grammar.  The generated parse() has no debug or
+# tracking branches but otherwise follows LRParser.parse() step for step,
+# including error recovery, so both produce the same results and call p_error()
+# at the same points.  errok() and restart() are not available to p_error()
+# in the generated loop.  Like LRParser.parse(), parse() can also read the
+# tokens from any iterable or from the columnar arrays of
+# lex.Lexer.tokenize_all() (tokens=), without calling the lexer once per token.
+# -----------------------------------------------------------------------------
+
+_specialized_parser_runtime = r'''
+class YaccSymbol:
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlineno', 'endlexpos', 'lexer')
+
+    def __str__(self):
+        return self.type
+
+    def __repr__(self):
+        return str(self)
+
+class YaccProduction:
+    __slots__ = ('slice', 'stack', 'lexer', 'parser', 'context')
+
+    def __getitem__(self, n):
+        if type(n) is int:
+            if n >= 0:
+                return self.slice[n].value
+            return self.stack[n].value
+        return [s.value for s in self.slice[n]]
+
+    def __setitem__(self, n, v):
+        self.slice[n].value = v
+
+    def __len__(self):
+        return len(self.slice)
+
+    def lineno(self, n):
+        return getattr(self.slice[n], 'lineno', 0)
+
+    def set_lineno(self, n, lineno):
+        self.slice[n].lineno = lineno
+
+    def linespan(self, n):
+        startline = getattr(self.slice[n], 'lineno', 0)
+        endline = getattr(self.slice[n], 'endlineno', startline)
+        return startline, endline
+
+    def lexpos(self, n):
+        return getattr(self.slice[n], 'lexpos', 0)
+
+    def set_lexpos(self, n, lexpos):
+        self.slice[n].lexpos = lexpos
+
+    def lexspan(self, n):
+        startpos = getattr(self.slice[n], 'lexpos', 0)
+        endpos = getattr(self.slice[n], 'endlexpos', startpos)
+        return startpos, endpos
+
+    def error(self):
+        raise SyntaxError
+
+def parse(input=None, lexer=None, context=None, tokens=None):
+    actions  = _lr_action
+    goto     = _lr_goto
+    defaulted_states = _lr_defaulted
+    termid   = _lr_terminal_ids.get
+    nterms   = _lr_unknown_terminal
+    pnames   = _lr_prod_names
+    plens    = _lr_prod_lens
+    pgoto    = _lr_prod_nonterminals
+    pfuncs   = _lr_prod_funcs
+
+    lookahead = None
+    ltid = 0
+    lookaheadstack = []
+    errorcount = 0
+    errorok = True
+
+    if not lexer and tokens is None:
+        raise ValueError('a lexer is required')
+    pslice = YaccProduction()
+    pslice.lexer = lexer
+    pslice.parser = None
+    pslice.context = context
+
+    if input is not None:
+        if tokens is not None:
+            raise ValueError('input and tokens cannot both be given')
+        lexer.input(input)
+    if tokens is None:
+        get_token = lexer.token
+    elif not hasattr(tokens, 'typenames'):
+        # Any iterable of tokens, pulled one by one as from lexer.token()
+        get_token = partial(next, iter(tokens), None)
+        tokens = None
+    else:
+        # Columnar tokens from lexer.tokenize_all(): the terminal id of each token
+        # type is looked up once and tokens are read straight from the arrays
+        tnames = tokens.typenames
+        tids = [termid(name, nterms) for name in tnames]
+        ttypes = tokens.types
+        tvalues = tokens.values
+        tvaluetable = tokens.valuetable
+        tlineno = tokens.lineno
+        tlexpos = tokens.lexpos
+        ntokens = len(ttypes)
+        position = 0
+
+    statestack = [0]
+    sym = YaccSymbol()
+    sym.type = '$end'
+    symstack = [sym]
+    pslice.stack = symstack
+    errtoken = None
+    state = 0
+    while True:
+        t = defaulted_states[state]
+        if t is None:
+            if lookahead is None:
+                if lookaheadstack:
+                    lookahead = lookaheadstack.pop()
+                    ltid = termid(lookahead.type, nterms)
+                elif tokens is None:
+                    lookahead = get_token()
+                    if not lookahead:
+                        lookahead = YaccSymbol()
+                        lookahead.type = '$end'
+                    ltid = termid(lookahead.type, nterms)
+                elif position < ntokens:
+                    code = ttypes[position]
+                    lookahead = YaccSymbol()
+                    lookahead.type = tnames[code]
+                    lookahead.value = tvaluetable[tvalues[position]]
+                    lookahead.lineno = tlineno[position]
+                    lookahead.lexpos = tlexpos[position]
+                    ltid = tids[code]
+                    position += 1
+                else:
+                    if tokens.error is not None: # The lexer stopped here
+                        raise tokens.error
+                    lookahead = YaccSymbol()
+                    lookahead.type = '$end'
+                    ltid = 0
+            t = actions[state][ltid]
+
+        if t is not None:
+            if t > 0:
+                statestack.append(t)
+                state = t
+                symstack.append(lookahead)
+                lookahead = None
+                if errorcount:
+                    errorcount -= 1
+                continue
+
+            if t < 0:
+                pn = -t
+                plen = plens[pn]
+                sym = YaccSymbol()
+                sym.type = pnames[pn]
+                sym.value = None
+
+                if plen:
+                    targ = symstack[-plen-1:]
+                    targ[0] = sym
+                    pslice.slice = targ
+                    try:
+                        del symstack[-plen:]
+                        pfuncs[pn](pslice)
+                        del statestack[-plen:]
+                        symstack.append(sym)
+                        state = goto[statestack[-1]][pgoto[pn]]
+                        statestack.append(state)
+                    except SyntaxError:
+                        lookaheadstack.append(lookahead)
+                        symstack.extend(targ[1:-1])
+                        statestack.pop()
+                        state = statestack[-1]
+                        sym.type = 'error'
+                        sym.value = 'error'
+                        lookahead = sym
+                        ltid = termid('error', nterms)
+                        errorcount = _error_count
+                        errorok = False
+                    continue
+                else:
+                    targ = [sym]
+                    pslice.slice = targ
+                    try:
+                        pfuncs[pn](pslice)
+                        symstack.append(sym)
+                        state = goto[statestack[-1]][pgoto[pn]]
+                        statestack.append(state)
+                    except SyntaxError:
+                        lookaheadstack.append(lookahead)
+                        statestack.pop()
+                        state = statestack[-1]
+                        sym.type = 'error'
+                        sym.value = 'error'
+                        lookahead = sym
+                        ltid = termid('error', nterms)
+                        errorcount = _error_count
+                        errorok = False
+                    continue
+
+            if t == 0:
+                n = symstack[-1]
+                return getattr(n, 'value', None)
+
+        if t is None:
+            if errorcount == 0 or errorok:
+                errorcount = _error_count
+                errorok = False
+                errtoken = lookahead
+                if errtoken.type == '$end':
+                    errtoken = None
+                if _errorfunc:
+                    if errtoken and not hasattr(errtoken, 'lexer'):
+                        errtoken.lexer = lexer
+                    if _errorcontext:
+                        _errorfunc(errtoken, context)
+                    else:
+                        _errorfunc(errtoken)
+                else:
+                    if errtoken:
+                        if hasattr(errtoken, 'lineno'):
+                            lineno = lookahead.lineno
+                        else:
+                            lineno = 0
+                        if lineno:
+                            sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                        else:
+                            sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                    else:
+                        sys.stderr.write('yacc: Parse error in input. EOF\n')
+                        return
+            else:
+                errorcount = _error_count
+
+            if len(statestack) <= 1 and lookahead.type != '$end':
+                lookahead = None
+                errtoken = None
+                state = 0
+                del lookaheadstack[:]
+                continue
+
+            if lookahead.type == '$end':
+                return
+
+            if lookahead.type != 'error':
+                sym = symstack[-1]
+                if sym.type == 'error':
+                    lookahead = None
+                    continue
+
+                t = YaccSymbol()
+                t.type = 'error'
+                if hasattr(lookahead, 'lineno'):
+                    t.lineno = t.endlineno = lookahead.lineno
+                if hasattr(lookahead, 'lexpos'):
+                    t.lexpos = t.endlexpos = lookahead.lexpos
+                t.value = lookahead
+                lookaheadstack.append(lookahead)
+                lookahead = t
+                ltid = termid('error', nterms)
+            else:
+                symstack.pop()
+                statestack.pop()
+                state = statestack[-1]
+
+            continue
+'''
+
+def write_parser_module(parser, module, outputdir='', grammarmodule=None, parsername='parser'):
+    if grammarmodule is None:
+        raise YaccError('write_parser_module() requires the name of the grammar module')
+
+    # Number the terminals and nonterminals.  '$end' is always terminal 0 and
+    # one extra column is reserved for token types the grammar doesn't know.
+    terminals = set()
+    for st_action in parser.action.values():
+        terminals.update(st_action)
+    terminals.discard('$end')
+    terminals.add('error')
+    terminals = ['$end'] + sorted(terminals)
+    termids = {name: i for i, name in enumerate(terminals)}
+
+    nonterminals = set()
+    for st_goto in parser.goto.values():
+        nonterminals.update(st_goto)
+    for p in parser.productions:
+        nonterminals.add(p.name)
+    nonterminals = sorted(nonterminals)
+    ntids = {name: i for i, name in enumerate(nonterminals)}
+
+    nstates = max(parser.action) + 1
+    action = []
+    goto = []
+    for st in range(nstates):
+        row = [None] * (len(terminals) + 1)
+        for name, v in parser.action.get(st, {}).items():
+            row[termids[name]] = v
+        action.append(row)
+        grow = [None] * len(nonterminals)
+        for name, v in parser.goto.get(st, {}).items():
+            grow[ntids[name]] = v
+        goto.append(grow)
+    defaulted = [parser.defaulted_states.get(st) for st in range(nstates)]
+
+    basemodulename = module.split('.')[-1]
+    filename = os.path.join(outputdir, basemodulename) + '.py'
+    tmpname = '%s.%d.tmp' % (filename, os.getpid())
+    with open(tmpname, 'w') as f:
+        f.write('# %s.py\n' % basemodulename)
+        f.write('# This file is automatically generated by yacc.write_parser_module(). Do not edit.\n')
+        f.write('# pylint: disable=W,C,R\n')
+        f.write('import sys\n')
+        f.write('import importlib\n')
+        f.write('from functools import partial\n\n')
+        f.write('_tabversion = %r\n' % __tabversion__)
+        f.write('_lr_signature = %r\n\n' % getattr(parser, 'signature', ''))
+        f.write('_grammar = importlib.import_module(%r)\n' % grammarmodule)
+        f.write('if getattr(getattr(_grammar, %r, None), %r, None) != _lr_signature:\n' % (parsername, 'signature'))
+        f.write('    raise ImportError(%r)\n\n' % ('%s is out of date with the grammar in %s' % (module, grammarmodule)))
+        f.write('_error_count = %d\n' % error_count)
+        f.write('_lr_terminal_ids = %r\n' % termids)
+        f.write('_lr_unknown_terminal = %d\n' % len(terminals))
+        f.write('_lr_action = [\n')
+        for row in action:
+            f.write('  %r,\n' % row)
+        f.write(']\n')
+        f.write('_lr_goto = [\n')
+        for row in goto:
+            f.write('  %r,\n' % row)
+        f.write(']\n')
+        f.write('_lr_defaulted = %r\n' % defaulted)
+        f.write('_lr_prod_names = %r\n' % [p.name for p in parser.productions])
+        f.write('_lr_prod_lens = %r\n' % [p.len for p in parser.productions])
+        f.write('_lr_prod_nonterminals = %r\n' % [ntids[p.name] for p in parser.productions])
+        f.write('_lr_prod_funcs = [\n')
+        for p in parser.productions:
+            f.write('  %s,   # %s\n' % ('_grammar.%s' % p.func if p.func else 'None', p.str))
+        f.write(']\n')
+        errorf = getattr(parser.errorfunc, '__name__', None)
+        f.write('_errorfunc = %s\n' % ('_grammar.%s' % errorf if errorf else 'None'))
+        f.write('_errorcontext = %r\n' % parser.errorcontext)
+        f.write(_specialized_parser_runtime)
+    os.replace(tmpname, filename)
+
 # -----------------------------------------------------------------------------
 #                            === INTROSPECTION ===
 #
@@ -1996,6 +2900,7 @@ class ParserReflect(object):
         self.start      = None
         self.error_func = None
         self.tokens     = None
+        self.passthrough = None
         self.modules    = set()
         self.grammar    = []
         self.error      = False
@@ -2011,6 +2916,7 @@ class ParserReflect(object):
         self.get_error_func()
         self.get_tokens()
         self.get_precedence()
+        self.get_passthrough()
         self.get_pfunctions()
 
     # Validate all of the information
@@ -2019,6 +2925,7 @@ class ParserReflect(object):
         self.validate_error_func()
         self.validate_tokens()
         self.validate_precedence()
+        self.validate_passthrough()
         self.validate_pfunctions()
         self.validate_modules()
         return self.error
@@ -2033,6 +2940,8 @@ class ParserReflect(object):
                 parts.append(''.join([''.join(p) for p in self.prec]))
             if self.tokens:
                 parts.append(' '.join(self.tokens))
+            if self.passthrough:
+                parts.append('|'.join(self.passthrough))
             for f in self.pfuncs:
                 if f[3]:
                     parts.append(f[3])
@@ -2107,8 +3016,8 @@ class ParserReflect(object):
             self.modules.add(module)
 
             argcount = self.error_func.__code__.co_argcount - ismethod
-            if argcount != 1:
-                self.log.error('%s:%d: p_error() requires 1 argument', efile, eline)
+            if argcount not in (1, 2):
+                self.log.error('%s:%d: p_error() requires 1 argument (or 2 to receive the parse context)', efile, eline)
                 self.error = True
 
     # Get the tokens map
@@ -2180,6 +3089,23 @@ class ParserReflect(object):
                     preclist.append((term, assoc, level+1))
         self.preclist = preclist
 
+    # Get the pass-through unit rules (if any)
+    def get_passthrough(self):
+        self.passthrough = self.pdict.get('passthrough')
+
+    # Validate the pass-through unit rules
+    def validate_passthrough(self):
+        if self.passthrough:
+            if not isinstance(self.passthrough, (list, tuple)):
+                self.log.error('passthrough must be a list or tuple')
+                self.error = True
+                return
+            for rule in self.passthrough:
+                if not isinstance(rule, str):
+                    self.log.error('passthrough items must be strings')
+                    self.error = True
+                    return
+
     # Get all p_functions from the grammar
     def get_pfunctions(self):
         p_functions = []
@@ -2268,8 +3194,9 @@ class ParserReflect(object):
 # Build a parser
 # -----------------------------------------------------------------------------
 
-def yacc(*, debug=yaccdebug, module=None, start=None,
-         check_recursion=True, optimize=False, debugfile=debug_file,
+def yacc(*, debug=yaccdebug, module=None, start=None, passthrough=None,
+         check_recursion=True, optimize=False, write_tables=True,
+         tabmodule=tab_module, outputdir=None, debugfile=debug_file,
          debuglog=None, errorlog=None):
 
     # Reference to the parsing method of the last built parser
@@ -2292,10 +3219,27 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
     else:
         pdict = get_caller_module_dict(2)
 
+    # If no output directory is set, the tables are written next to the module
+    # that defines the grammar
+    if outputdir is None:
+        srcfile = pdict.get('__file__')
+        outputdir = os.path.dirname(srcfile) if srcfile else ''
+
+    # Determine if the module is package of a package or not.
+    # If so, fix the tabmodule setting so that tables load correctly
+    pkg = pdict.get('__package__')
+    if pkg and isinstance(tabmodule, str):
+        if '.' not in tabmodule:
+            tabmodule = pkg + '.' + tabmodule
+
     # Set start symbol if it's specified directly using an argument
     if start is not None:
         pdict['start'] = start
 
+    # Set the pass-through unit rules if they're specified directly using an argument
+    if passthrough is not None:
+        pdict['passthrough'] = passthrough
+
     # Collect parser information from the dictionary
     pinfo = ParserReflect(pdict, log=errorlog)
     pinfo.get_all()
@@ -2303,6 +3247,28 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
     if pinfo.error:
         raise YaccError('Unable to build parser')
 
+    # Check signature against table files (if any).  When the cached tables were
+    # built from exactly this grammar, grammar validation and table construction
+    # are skipped entirely.
+    signature = pinfo.signature()
+
+    try:
+        lr = LRTable()
+        read_signature = lr.read_table(tabmodule)
+        if read_signature == signature:
+            try:
+                lr.bind_callables(pinfo.pdict)
+                parser = LRParser(lr, pinfo.error_func)
+                parser.signature = signature
+                parse = parser.parse
+                return parser
+            except Exception as e:
+                errorlog.warning('There was a problem loading the table file: %r', e)
+    except VersionError as e:
+        errorlog.warning(str(e))
+    except ImportError:
+        pass
+
     if debuglog is None:
         if debug:
             try:
@@ -2353,6 +3319,13 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
         errorlog.error(str(e))
         errors = True
 
+    # Mark the pass-through unit rules, whose reductions are removed from the tables
+    try:
+        grammar.set_passthrough(pinfo.passthrough or ())
+    except GrammarError as e:
+        errorlog.error(str(e))
+        errors = True
+
     if errors:
         raise YaccError('Unable to build parser')
 
@@ -2474,9 +3447,19 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
                 errorlog.warning('Rule (%s) is never reduced', rejected)
                 warned_never.append(rejected)
 
+    # Write the table file if requested
+    if write_tables:
+        try:
+            lr.write_table(tabmodule, outputdir, signature)
+            if tabmodule in sys.modules:
+                del sys.modules[tabmodule]
+        except IOError as e:
+            errorlog.warning("Couldn't create %r. %s" % (tabmodule, e))
+
     # Build the parser
     lr.bind_callables(pinfo.pdict)
     parser = LRParser(lr, pinfo.error_func)
+    parser.signature = signature
 
     parse = parser.parse
     return parser